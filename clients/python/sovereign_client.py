@@ -53,9 +53,18 @@ Usage:
         print(f"Fees: {receipt.financial_trace.fees}")
         print(f"Net: {receipt.financial_trace.net_amount}")
         print(f"Ledger committed: {receipt.financial_trace.ledger_committed}")
+    
+    # Bulk submission over one pooled connection (NDJSON batch endpoint)
+    with SovereignClient(base_url="http://localhost:8000") as client:
+        results = client.submit_many(requests, batch_size=100)
+    
+    # Pipelined batches from asyncio code
+    async with AsyncSovereignClient(base_url="http://localhost:8000") as client:
+        results = await client.submit_many(requests, batch_size=100, max_in_flight=4)
 """
 
-from typing import Optional, Dict, Any, List
+import asyncio
+from typing import Optional, Dict, Any, Iterator, List, Sequence
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from decimal import Decimal
@@ -66,6 +75,9 @@ __version__ = "2.0.0"
 __api_version__ = "2.0.0"
 __contract_hash__ = "caaf8739eae14f80ed7e2369459cc4b1b97c9f1acb7a5f5a5321fb63372cf5d6"
 
+BATCH_PATH = "/v1/transactions/batch"
+MAX_BATCH_SIZE = 1000           # Server-side limit per batch request
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # EXCEPTIONS
@@ -178,6 +190,28 @@ class ShipmentData:
     telemetry: TelemetryData = field(default_factory=TelemetryData)
 
 
+@dataclass
+class SovereignTransactionRequest:
+    """
+    Complete Sovereign Transaction Request
+    One item for submit_batch() / submit_many().
+    """
+    user_data: UserData
+    payment_data: PaymentData
+    shipment_data: ShipmentData
+    
+    def to_payload(self) -> Dict[str, Any]:
+        """Serialize to the Trinity contract JSON shape."""
+        return {
+            "user_data": asdict(self.user_data),
+            "payment_data": asdict(self.payment_data),
+            "shipment_data": {
+                "manifest": asdict(self.shipment_data.manifest),
+                "telemetry": asdict(self.shipment_data.telemetry)
+            }
+        }
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # v2.0 FINANCIAL MODELS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -294,11 +328,157 @@ class StatsResponse:
     controller_version: str
 
 
+@dataclass
+class BatchItemResult:
+    """
+    Outcome of one transaction submitted through the batch endpoint.
+    
+    Exactly one of receipt / error is set. Settlement failures arrive as
+    a PaymentRequiredError in `error` instead of being raised, so one
+    underfunded payer does not hide the rest of the batch.
+    """
+    index: int
+    status_code: int
+    receipt: Optional[TransactionReceipt] = None
+    error: Optional[SovereignClientError] = None
+    
+    @property
+    def ok(self) -> bool:
+        """Check if the transaction produced a receipt (FINALIZED or ABORTED)."""
+        return self.receipt is not None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SHARED CLIENT CORE
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _SovereignClientBase:
+    """Configuration, payload building and response parsing shared by both clients."""
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 10
+    ):
+        """
+        Initialize Sovereign Client.
+        
+        Args:
+            base_url: Sovereign Server URL (default: http://localhost:8000)
+            timeout: Request timeout in seconds
+            headers: Additional headers to include in requests
+            max_connections: Size of the keep-alive connection pool
+        """
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._headers = {
+            "Content-Type": "application/json",
+            "User-Agent": f"SovereignClient/{__version__}",
+            **(headers or {})
+        }
+    
+    def _limits(self) -> httpx.Limits:
+        """Pool limits: keep every connection alive between requests."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections
+        )
+    
+    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
+        """Handle response and raise appropriate exceptions."""
+        if response.status_code == 200:
+            return response.json()
+        
+        if response.status_code == 402:
+            # v2.0: Payment Required - gates passed but settlement failed
+            data = response.json()
+            raise self._payment_required(data.get("detail", {}))
+        
+        if response.status_code == 422:
+            data = response.json()
+            raise ValidationError(f"Validation error: {data}")
+        
+        if response.status_code >= 500:
+            raise ServerError(f"Server error: {response.status_code}")
+        
+        raise SovereignClientError(f"Unexpected response: {response.status_code}")
+    
+    @staticmethod
+    def _payment_required(detail: Dict[str, Any]) -> PaymentRequiredError:
+        """Build a PaymentRequiredError from a settlement failure detail."""
+        return PaymentRequiredError(
+            message=f"Settlement failed: {detail.get('reason', 'Unknown')}",
+            transaction_id=detail.get("transaction_id"),
+            reason=detail.get("reason"),
+            gates_passed=detail.get("gates_passed", True)
+        )
+    
+    @staticmethod
+    def _parse_receipt(data: Dict[str, Any]) -> TransactionReceipt:
+        """Build a TransactionReceipt from response JSON."""
+        # Parse financial_trace if present (v2.0)
+        financial_trace = None
+        if "financial_trace" in data and data["financial_trace"]:
+            financial_trace = FinancialTrace(**data["financial_trace"])
+        
+        return TransactionReceipt(
+            transaction_id=data["transaction_id"],
+            timestamp=data["timestamp"],
+            status=data["status"],
+            finalized=data["finalized"],
+            gates=data["gates"],
+            controller=data["controller"],
+            version=data["version"],
+            transaction_hash=data.get("transaction_hash"),
+            blame=data.get("blame"),
+            financial_trace=financial_trace,
+            participants=data.get("participants"),
+            value=data.get("value"),
+            attestation=data.get("attestation"),
+            invariants_enforced=data.get("invariants_enforced")
+        )
+    
+    def _parse_batch_line(self, line: str, offset: int = 0) -> BatchItemResult:
+        """Parse one NDJSON line of a batch response (index shifted by offset)."""
+        data = json.loads(line)
+        status_code = data["status_code"]
+        result = BatchItemResult(index=offset + data["index"], status_code=status_code)
+        
+        if status_code == 200:
+            result.receipt = self._parse_receipt(data["receipt"])
+        elif status_code == 402:
+            result.error = self._payment_required(data.get("error", {}))
+        else:
+            result.error = ServerError(f"Server error: {status_code}")
+        return result
+    
+    @staticmethod
+    def _batch_payload(requests: Sequence[SovereignTransactionRequest]) -> Dict[str, Any]:
+        """Serialize a batch for POST /v1/transactions/batch."""
+        if not 1 <= len(requests) <= MAX_BATCH_SIZE:
+            raise ValueError(f"Batch must hold 1-{MAX_BATCH_SIZE} transactions, got {len(requests)}")
+        return {"transactions": [request.to_payload() for request in requests]}
+    
+    @staticmethod
+    def _chunks(
+        requests: Sequence[SovereignTransactionRequest],
+        batch_size: int
+    ) -> Iterator[Sequence[SovereignTransactionRequest]]:
+        """Split requests into batches of at most batch_size."""
+        if not 1 <= batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be 1-{MAX_BATCH_SIZE}, got {batch_size}")
+        for start in range(0, len(requests), batch_size):
+            yield requests[start:start + batch_size]
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # SOVEREIGN CLIENT
 # ══════════════════════════════════════════════════════════════════════════════
 
-class SovereignClient:
+class SovereignClient(_SovereignClientBase):
     """
     ChainBridge Sovereign Server Python Client v2.0
     
@@ -309,7 +489,8 @@ class SovereignClient:
       - Automatic serialization/deserialization
       - Financial trace extraction
       - 402 Payment Required handling
-      - Async support via httpx
+      - One pooled keep-alive connection set for the client's lifetime
+      - Batch submission over the NDJSON batch endpoint
     
     Example:
         client = SovereignClient("http://localhost:8000")
@@ -338,13 +519,17 @@ class SovereignClient:
         
         if receipt.is_finalized:
             print(f"Fees: {receipt.financial_trace.total_fees}")
+        
+        client.close()
     """
     
     def __init__(
         self,
         base_url: str = "http://localhost:8000",
         timeout: float = 30.0,
-        headers: Optional[Dict[str, str]] = None
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 10,
+        http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize Sovereign Client.
@@ -353,53 +538,32 @@ class SovereignClient:
             base_url: Sovereign Server URL (default: http://localhost:8000)
             timeout: Request timeout in seconds
             headers: Additional headers to include in requests
+            max_connections: Size of the keep-alive connection pool
+            http_client: Pre-configured httpx.Client to use instead (not closed by close())
         """
-        self.base_url = base_url.rstrip("/")
-        self.timeout = timeout
-        self._headers = {
-            "Content-Type": "application/json",
-            "User-Agent": f"SovereignClient/{__version__}",
-            **(headers or {})
-        }
+        super().__init__(base_url, timeout, headers, max_connections)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(timeout=self.timeout, limits=self._limits())
     
-    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
-        """Make HTTP request with error handling."""
-        url = f"{self.base_url}{path}"
-        
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                headers=self._headers,
-                **kwargs
-            )
-        
-        return response
+    def __enter__(self) -> "SovereignClient":
+        return self
     
-    def _handle_response(self, response: httpx.Response) -> Dict[str, Any]:
-        """Handle response and raise appropriate exceptions."""
-        if response.status_code == 200:
-            return response.json()
-        
-        if response.status_code == 402:
-            # v2.0: Payment Required - gates passed but settlement failed
-            data = response.json()
-            detail = data.get("detail", {})
-            raise PaymentRequiredError(
-                message=f"Settlement failed: {detail.get('reason', 'Unknown')}",
-                transaction_id=detail.get("transaction_id"),
-                reason=detail.get("reason"),
-                gates_passed=detail.get("gates_passed", True)
-            )
-        
-        if response.status_code == 422:
-            data = response.json()
-            raise ValidationError(f"Validation error: {data}")
-        
-        if response.status_code >= 500:
-            raise ServerError(f"Server error: {response.status_code}")
-        
-        raise SovereignClientError(f"Unexpected response: {response.status_code}")
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Close the pooled connections."""
+        if self._owns_client:
+            self._client.close()
+    
+    def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Make HTTP request over the pooled connection."""
+        return self._client.request(
+            method=method,
+            url=f"{self.base_url}{path}",
+            headers=self._headers,
+            **kwargs
+        )
     
     # ──────────────────────────────────────────────────────────────────────────
     # PUBLIC API
@@ -466,40 +630,55 @@ class SovereignClient:
             ValidationError: Request validation failed (422)
             ServerError: Server error (5xx)
         """
-        # Build request payload
-        payload = {
-            "user_data": asdict(user_data),
-            "payment_data": asdict(payment_data),
-            "shipment_data": {
-                "manifest": asdict(shipment_data.manifest),
-                "telemetry": asdict(shipment_data.telemetry)
-            }
-        }
-        
+        payload = SovereignTransactionRequest(user_data, payment_data, shipment_data).to_payload()
         response = self._request("POST", "/v1/transaction", json=payload)
-        data = self._handle_response(response)
+        return self._parse_receipt(self._handle_response(response))
+    
+    def submit_batch(self, requests: Sequence[SovereignTransactionRequest]) -> Iterator[BatchItemResult]:
+        """
+        Submit up to 1000 transactions in one request.
         
-        # Parse financial_trace if present (v2.0)
-        financial_trace = None
-        if "financial_trace" in data and data["financial_trace"]:
-            financial_trace = FinancialTrace(**data["financial_trace"])
+        Results are yielded as the server streams them, in completion
+        order; use BatchItemResult.index to match them to requests.
         
-        return TransactionReceipt(
-            transaction_id=data["transaction_id"],
-            timestamp=data["timestamp"],
-            status=data["status"],
-            finalized=data["finalized"],
-            gates=data["gates"],
-            controller=data["controller"],
-            version=data["version"],
-            transaction_hash=data.get("transaction_hash"),
-            blame=data.get("blame"),
-            financial_trace=financial_trace,
-            participants=data.get("participants"),
-            value=data.get("value"),
-            attestation=data.get("attestation"),
-            invariants_enforced=data.get("invariants_enforced")
-        )
+        Raises:
+            ValidationError: Any item failed schema validation (422)
+            ServerError: Server error (5xx)
+        """
+        payload = self._batch_payload(requests)
+        with self._client.stream(
+            "POST", f"{self.base_url}{BATCH_PATH}", headers=self._headers, json=payload
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                self._handle_response(response)
+            for line in response.iter_lines():
+                if line:
+                    yield self._parse_batch_line(line)
+    
+    def submit_many(
+        self,
+        requests: Sequence[SovereignTransactionRequest],
+        batch_size: int = 100
+    ) -> List[BatchItemResult]:
+        """
+        Submit any number of transactions as consecutive batches.
+        
+        Args:
+            requests: Transactions to submit
+            batch_size: Transactions per batch request (1-1000)
+        
+        Returns:
+            One BatchItemResult per request, in request order
+        """
+        results: List[Optional[BatchItemResult]] = [None] * len(requests)
+        offset = 0
+        for batch in self._chunks(requests, batch_size):
+            for result in self.submit_batch(batch):
+                result.index += offset
+                results[result.index] = result
+            offset += len(batch)
+        return results
     
     # ──────────────────────────────────────────────────────────────────────────
     # CONVENIENCE METHODS
@@ -519,6 +698,150 @@ class SovereignClient:
         return health.version
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# ASYNC SOVEREIGN CLIENT
+# ══════════════════════════════════════════════════════════════════════════════
+
+class AsyncSovereignClient(_SovereignClientBase):
+    """
+    asyncio counterpart of SovereignClient over a pooled httpx.AsyncClient.
+    
+    submit_many() pipelines batches: up to max_in_flight batch requests
+    share the connection pool at once, so the server is processing one
+    batch while the previous one is still streaming back.
+    
+    Example:
+        async with AsyncSovereignClient("http://localhost:8000") as client:
+            results = await client.submit_many(requests, batch_size=100)
+            finalized = [r.receipt for r in results if r.ok and r.receipt.is_finalized]
+    """
+    
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: float = 30.0,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: int = 10,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize Async Sovereign Client.
+        
+        Args:
+            base_url: Sovereign Server URL (default: http://localhost:8000)
+            timeout: Request timeout in seconds
+            headers: Additional headers to include in requests
+            max_connections: Size of the keep-alive connection pool
+            http_client: Pre-configured httpx.AsyncClient to use instead (not closed by aclose())
+        """
+        super().__init__(base_url, timeout, headers, max_connections)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.AsyncClient(timeout=self.timeout, limits=self._limits())
+    
+    async def __aenter__(self) -> "AsyncSovereignClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled connections."""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Make HTTP request over the pooled connection."""
+        return await self._client.request(
+            method=method,
+            url=f"{self.base_url}{path}",
+            headers=self._headers,
+            **kwargs
+        )
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # PUBLIC API
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    async def health(self) -> HealthResponse:
+        """Check server health."""
+        response = await self._request("GET", "/health")
+        return HealthResponse(**self._handle_response(response))
+    
+    async def stats(self) -> StatsResponse:
+        """Get transaction statistics."""
+        response = await self._request("GET", "/v1/stats")
+        return StatsResponse(**self._handle_response(response))
+    
+    async def submit_transaction(
+        self,
+        user_data: UserData,
+        payment_data: PaymentData,
+        shipment_data: ShipmentData
+    ) -> TransactionReceipt:
+        """Submit one transaction (see SovereignClient.submit_transaction)."""
+        payload = SovereignTransactionRequest(user_data, payment_data, shipment_data).to_payload()
+        response = await self._request("POST", "/v1/transaction", json=payload)
+        return self._parse_receipt(self._handle_response(response))
+    
+    async def submit_batch(
+        self,
+        requests: Sequence[SovereignTransactionRequest],
+        offset: int = 0
+    ) -> List[BatchItemResult]:
+        """
+        Submit up to 1000 transactions in one request.
+        
+        Args:
+            requests: Transactions in this batch
+            offset: Added to every result index (position of the batch in a larger run)
+        
+        Returns:
+            BatchItemResults in completion order
+        """
+        payload = self._batch_payload(requests)
+        async with self._client.stream(
+            "POST", f"{self.base_url}{BATCH_PATH}", headers=self._headers, json=payload
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                self._handle_response(response)
+            return [
+                self._parse_batch_line(line, offset)
+                async for line in response.aiter_lines() if line
+            ]
+    
+    async def submit_many(
+        self,
+        requests: Sequence[SovereignTransactionRequest],
+        batch_size: int = 100,
+        max_in_flight: int = 4
+    ) -> List[BatchItemResult]:
+        """
+        Submit any number of transactions as pipelined batches.
+        
+        Args:
+            requests: Transactions to submit
+            batch_size: Transactions per batch request (1-1000)
+            max_in_flight: Batch requests outstanding at once
+        
+        Returns:
+            One BatchItemResult per request, in request order
+        """
+        results: List[Optional[BatchItemResult]] = [None] * len(requests)
+        in_flight = asyncio.Semaphore(max_in_flight)
+        
+        async def run(batch: Sequence[SovereignTransactionRequest], offset: int):
+            async with in_flight:
+                for result in await self.submit_batch(batch, offset):
+                    results[result.index] = result
+        
+        await asyncio.gather(*[
+            run(batch, number * batch_size)
+            for number, batch in enumerate(self._chunks(requests, batch_size))
+        ])
+        return results
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # MODULE-LEVEL CONVENIENCE
 # ══════════════════════════════════════════════════════════════════════════════
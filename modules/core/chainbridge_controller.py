@@ -47,9 +47,11 @@ TRAINING SIGNAL:
   "A decision without action is hallucination. The Ledger makes it real."
 """
 
+import asyncio
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
@@ -115,9 +117,17 @@ class ChainBridgeController:
     
     INV-INT-001: Financial execution CANNOT occur if any Gate is closed.
     INV-INT-002: A successful API response implies a committed Ledger entry.
+    
+    process_transaction() evaluates the gates in sequence on the calling
+    thread. process_transaction_async() evaluates them concurrently on a
+    gate thread pool and runs settlement on a single settlement thread,
+    so an async server never blocks its event loop.
     """
     
-    def __init__(self):
+    # Blame order: the first failing gate in this order is blamed
+    GATE_ORDER = ("biometric", "aml", "customs")
+    
+    def __init__(self, gate_workers: int = 8):
         self.agent_id = "GID-00"
         self.agent_name = "Benson"
         self.version = "2.0.0"
@@ -143,6 +153,11 @@ class ChainBridgeController:
         self.transactions_finalized = 0
         self.transactions_aborted = 0
         
+        # Async path: gates run concurrently, settlement is serialised
+        # (the Ledger is not thread-safe) on one thread
+        self._gate_executor = ThreadPoolExecutor(max_workers=gate_workers, thread_name_prefix="trinity-gate")
+        self._settlement_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trinity-settle")
+        
         logger.info("╔══════════════════════════════════════════════════════════════╗")
         logger.info("║        CHAINBRIDGE CONTROLLER v2.0.0 INITIALIZED             ║")
         logger.info("║              TRINITY GATES + INVISIBLE BANK ONLINE           ║")
@@ -255,7 +270,7 @@ class ChainBridgeController:
         
         logger.info(f"[BANK] Funded account {account_id} with {amount} {currency}")
         return self.ledger.get_account(account_id)
-        
+    
     def process_transaction(
         self,
         user_data: Dict[str, Any],
@@ -272,7 +287,7 @@ class ChainBridgeController:
             user_data: Identity verification data for BiometricGate
             payment_data: Financial transaction data for AMLGate
             shipment_data: Cargo/logistics data for SmartCustomsGate
-            
+        
         Returns:
             TransactionReceipt with unified decision and blame assignment
         """
@@ -367,6 +382,79 @@ class ChainBridgeController:
         # ══════════════════════════════════════════════════════════════════════
         return self._finalize_transaction(tx_id, gate_results, user_data, payment_data, shipment_data)
     
+    async def process_transaction_async(
+        self,
+        user_data: Dict[str, Any],
+        payment_data: Dict[str, Any],
+        shipment_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Process a sovereign transaction with the three gates evaluated concurrently.
+        
+        Gates are awaited in GATE_ORDER, so blame assignment matches
+        process_transaction(): the first gate in order that fails is
+        blamed, and gates after it are cancelled (if not yet started) and
+        reported as not evaluated. Settlement runs only after every gate
+        passed (INV-INT-001), on the settlement thread.
+        
+        Returns:
+            TransactionReceipt identical in shape to process_transaction()
+        """
+        loop = asyncio.get_running_loop()
+        tx_id = f"TRINITY-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S%f')}"
+        self.transactions_processed += 1
+        
+        logger.info(f"[TRINITY] {tx_id}: gates BIOMETRIC ∥ AML ∥ CUSTOMS (concurrent)")
+        
+        manifest = shipment_data.get("manifest", shipment_data)
+        telemetry = shipment_data.get("telemetry", {})
+        
+        pending = {
+            "biometric": loop.run_in_executor(self._gate_executor, self.bio_gate.process, user_data),
+            "aml": loop.run_in_executor(self._gate_executor, self.aml_gate.process, payment_data),
+            "customs": loop.run_in_executor(self._gate_executor, self.customs_gate.process, manifest, telemetry),
+        }
+        gate_results = {name: None for name in self.GATE_ORDER}
+        
+        try:
+            for name in self.GATE_ORDER:
+                result = await pending.pop(name)
+                gate_results[name] = result
+                
+                if not self._gate_passed(name, result):
+                    blame_gate = name.upper()
+                    logger.error(f"[TRINITY] ❌ {blame_gate} GATE FAILED: {result['reason']}")
+                    return await loop.run_in_executor(
+                        self._settlement_executor,
+                        self._abort_transaction, tx_id, gate_results, blame_gate, result["reason"]
+                    )
+                
+                logger.info(f"[TRINITY] ✅ {name.upper()} GATE PASSED")
+        finally:
+            # Short-circuit: later gates are not needed once blame is decided
+            for future in pending.values():
+                future.cancel()
+        
+        # INV-INT-001: only reached when every gate passed
+        return await loop.run_in_executor(
+            self._settlement_executor,
+            self._finalize_transaction, tx_id, gate_results, user_data, payment_data, shipment_data
+        )
+    
+    @staticmethod
+    def _gate_passed(gate: str, result: Dict[str, Any]) -> bool:
+        """Whether a gate result opens the gate."""
+        if gate == "biometric":
+            return result["decision"] == BioDecision.VERIFY.value
+        if gate == "aml":
+            return result["decision"] == AMLDecision.APPROVE.value
+        return result["decision"] == GateDecision.RELEASE.value
+    
+    def shutdown(self):
+        """Release the async path's worker threads."""
+        self._gate_executor.shutdown(wait=False, cancel_futures=True)
+        self._settlement_executor.shutdown(wait=True)
+    
     def _abort_transaction(
         self,
         tx_id: str,
@@ -508,7 +596,7 @@ class ChainBridgeController:
             # Authorize (reserve funds)
             intent = self.settlement.authorize(intent.intent_id)
             logger.info(f"[BANK] Authorization successful: {intent.status.value}")
-            
+        
         except InsufficientFundsError as e:
             logger.error(f"[BANK] ❌ Authorization failed - insufficient funds: {e}")
             return self._abort_financial(tx_id, gate_results, "SETTLEMENT", str(e))
@@ -522,7 +610,7 @@ class ChainBridgeController:
         try:
             intent = self.settlement.capture(intent.intent_id)
             logger.info(f"[BANK] Payment captured: {intent.status.value}")
-            
+        
         except Exception as e:
             # If capture fails, void the authorization
             logger.error(f"[BANK] ❌ Capture failed, voiding authorization: {e}")
@@ -556,7 +644,7 @@ class ChainBridgeController:
                 self.ledger.post_transaction(fee_txn.transaction_id)
                 
                 logger.info(f"[BANK] Fee recorded: {total_fees} {currency} → FEE-REVENUE")
-                
+            
             except Exception as e:
                 # Fee recording failed - this is non-fatal but should be logged
                 logger.warning(f"[BANK] ⚠️ Fee recording failed (non-fatal): {e}")
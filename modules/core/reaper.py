@@ -11,6 +11,7 @@
 ║    2. Adaptive thresholds based on observed heartbeat patterns               ║
 ║    3. Distinction between "suspected" and "convicted" failures               ║
 ║    4. Grey failure detection (slow but not dead nodes)                       ║
+║    5. Columnar mode: NumPy phi sweep over thousands of nodes at once         ║
 ║                                                                              ║
 ║  Algorithm based on: Hayashibara et al. "The Phi Accrual Failure Detector"   ║
 ║  (IEEE SRDS 2004)                                                            ║
@@ -27,7 +28,15 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Any, Callable
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Any, Callable
+
+# NumPy is optional; only the columnar mode needs it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -46,6 +55,10 @@ MAX_SAMPLES = 1000                       # Maximum samples to keep
 INITIAL_MEAN_MS = 1000                   # Initial mean estimate
 INITIAL_STDDEV_MS = 200                  # Initial stddev estimate
 
+# Columnar mode
+INITIAL_CAPACITY = 1024                  # Node slots allocated up front (doubles on demand)
+PHI_FLOOR_P = 1e-10                      # Smallest p_later, caps phi at 10
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # ARRIVAL WINDOW - HEARTBEAT TRACKING
@@ -123,6 +136,195 @@ class ArrivalWindow:
         return self.sample_count >= MIN_SAMPLES
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# COLUMNAR ARRIVAL WINDOWS - MANY NODES, ONE SET OF ARRAYS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _erfc(x: "np.ndarray") -> "np.ndarray":
+    """
+    Vectorised complementary error function.
+    
+    Chebyshev fit from Numerical Recipes (erfcc), fractional error
+    < 1.2e-7 everywhere - far below what moves phi across a threshold.
+    """
+    z = np.abs(x)
+    t = 1.0 / (1.0 + 0.5 * z)
+    r = t * np.exp(
+        -z * z - 1.26551223 + t * (1.00002368 + t * (0.37409196 + t * (0.09678418
+        + t * (-0.18628806 + t * (0.27886807 + t * (-1.13520398 + t * (1.48851587
+        + t * (-0.82215223 + t * 0.17087277))))))))
+    )
+    return np.where(x >= 0, r, 2.0 - r)
+
+
+class ColumnarWindows:
+    """
+    Arrival statistics for many nodes held in NumPy columns.
+    
+    Each node owns a slot; last arrival, running mean/variance and the
+    (capped) sample count live in parallel arrays indexed by slot. The
+    statistics are the same Welford updates as ArrivalWindow, applied
+    to a whole batch of heartbeats at once, and phi for every node is
+    one vectorised expression.
+    
+    Not thread-safe: the owning Reaper serialises access with its lock.
+    """
+    
+    def __init__(self, capacity: int = INITIAL_CAPACITY, max_samples: int = MAX_SAMPLES):
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("Columnar Reaper requires numpy (pip install numpy)")
+        self._max_samples = max_samples
+        self._slots: Dict[str, int] = {}
+        self._node_ids: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._allocate(max(capacity, 1))
+    
+    def _allocate(self, capacity: int) -> None:
+        """Grow every column to capacity slots."""
+        def grow(column, fill, dtype):
+            new = np.full(capacity, fill, dtype=dtype)
+            if column is not None:
+                new[:len(column)] = column
+            return new
+        
+        self.last_arrival = grow(getattr(self, "last_arrival", None), np.nan, np.float64)
+        self.mean = grow(getattr(self, "mean", None), INITIAL_MEAN_MS, np.float64)
+        self.variance = grow(getattr(self, "variance", None), INITIAL_STDDEV_MS ** 2, np.float64)
+        self.count = grow(getattr(self, "count", None), 0, np.int64)
+        self.active = grow(getattr(self, "active", None), False, bool)
+        self.convicted = grow(getattr(self, "convicted", None), False, bool)
+        self._node_ids.extend([None] * (capacity - len(self._node_ids)))
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._slots
+    
+    @property
+    def size(self) -> int:
+        """Slots in use or previously used (the high-water mark)."""
+        return len(self._slots) + len(self._free)
+    
+    def node_ids(self) -> List[str]:
+        """Monitored node IDs."""
+        return list(self._slots)
+    
+    def node_id(self, slot: int) -> str:
+        return self._node_ids[slot]
+    
+    def get_slot(self, node_id: str) -> Optional[int]:
+        return self._slots.get(node_id)
+    
+    def add(self, node_id: str) -> int:
+        """Slot for node_id, allocating one if needed."""
+        slot = self._slots.get(node_id)
+        if slot is not None:
+            return slot
+        if self._free:
+            slot = self._free.pop()
+        else:
+            slot = self.size
+            if slot >= len(self.active):
+                self._allocate(2 * len(self.active))
+        self._slots[node_id] = slot
+        self._node_ids[slot] = node_id
+        self.active[slot] = True
+        return slot
+    
+    def slots_for(self, node_ids: Iterable[str]) -> "np.ndarray":
+        """Slots for node_ids (registering unknown nodes)."""
+        return np.fromiter((self.add(node_id) for node_id in node_ids), dtype=np.int64)
+    
+    def remove(self, node_id: str) -> None:
+        """Release a node's slot and reset its statistics."""
+        slot = self._slots.pop(node_id, None)
+        if slot is None:
+            return
+        self._node_ids[slot] = None
+        self.last_arrival[slot] = np.nan
+        self.mean[slot] = INITIAL_MEAN_MS
+        self.variance[slot] = INITIAL_STDDEV_MS ** 2
+        self.count[slot] = 0
+        self.active[slot] = False
+        self.convicted[slot] = False
+        self._free.append(slot)
+    
+    def record(self, slots: "np.ndarray", arrivals: "np.ndarray") -> None:
+        """
+        Record heartbeats, in order, for possibly repeated slots.
+        
+        Heartbeats for the same node are applied in input order: the
+        batch is split into rounds holding at most one heartbeat per
+        node, and each round is one vectorised update.
+        """
+        if len(slots) == 0:
+            return
+        order = np.argsort(slots, kind="stable")
+        sorted_slots = slots[order]
+        starts = np.flatnonzero(np.r_[True, sorted_slots[1:] != sorted_slots[:-1]])
+        group_start = np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        rank = np.arange(len(order)) - group_start
+        
+        for r in range(int(rank.max()) + 1):
+            picked = order[rank == r]
+            self._record_unique(slots[picked], arrivals[picked])
+    
+    def _record_unique(self, slots: "np.ndarray", arrivals: "np.ndarray") -> None:
+        """Welford update for heartbeats on distinct slots."""
+        previous = self.last_arrival[slots]
+        has_previous = ~np.isnan(previous)
+        updated = slots[has_previous]
+        interval = arrivals[has_previous] - previous[has_previous]
+        
+        n = np.minimum(self.count[updated] + 1, self._max_samples)
+        mean = self.mean[updated]
+        variance = self.variance[updated]
+        delta = interval - mean
+        new_mean = mean + delta / n
+        new_variance = variance + (delta * (interval - new_mean) - variance) / n
+        first = n == 1
+        new_mean[first] = interval[first]
+        new_variance[first] = 0.0
+        
+        self.count[updated] = n
+        self.mean[updated] = new_mean
+        self.variance[updated] = new_variance
+        self.last_arrival[slots] = arrivals
+    
+    def mean_at(self, slots) -> "np.ndarray":
+        """Mean inter-arrival time in ms (initial estimate until sampled)."""
+        return np.where(self.count[slots] > 0, self.mean[slots], INITIAL_MEAN_MS)
+    
+    def stddev_at(self, slots) -> "np.ndarray":
+        """Stddev of inter-arrival time in ms (initial estimate below 2 samples)."""
+        return np.where(
+            self.count[slots] >= 2,
+            np.sqrt(np.maximum(self.variance[slots], 1.0)),
+            INITIAL_STDDEV_MS,
+        )
+    
+    def phi(self, now_ms: float, slots=None) -> "np.ndarray":
+        """
+        Phi for the given slots (default: every slot up to size).
+        
+        Same formula as Reaper.compute_phi; unused slots, nodes without
+        a heartbeat and heartbeats from the future all give phi = 0.
+        """
+        if slots is None:
+            slots = slice(0, self.size)
+        last = self.last_arrival[slots]
+        t_diff = now_ms - last
+        z = (t_diff - self.mean_at(slots)) / self.stddev_at(slots)
+        
+        with np.errstate(invalid="ignore"):
+            p_later = 0.5 * _erfc(z / math.sqrt(2))
+            p_later = np.where(z < -5, 1.0, np.where(z > 5, PHI_FLOOR_P, p_later))
+            phi = -np.log10(np.maximum(p_later, PHI_FLOOR_P))
+            phi[np.isnan(last) | (t_diff < 0) | ~self.active[slots]] = 0.0
+        return phi
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # NODE STATUS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -191,6 +393,14 @@ class Reaper:
             
         # Get all suspected nodes
         suspects = reaper.get_suspects()
+    
+    Columnar mode (columnar=True) keeps every node's statistics in NumPy
+    arrays instead of one ArrivalWindow per node, for clusters with
+    thousands of monitored nodes:
+    
+        reaper = Reaper(columnar=True)
+        reaper.heartbeat_batch(node_ids, arrival_times_ms)
+        suspects, convicted = reaper.sweep()
     """
     
     def __init__(
@@ -200,7 +410,9 @@ class Reaper:
         phi_zombie: float = PHI_ZOMBIE,
         on_suspect: Optional[Callable[[str, float], None]] = None,
         on_convict: Optional[Callable[[str, float], None]] = None,
-        on_recover: Optional[Callable[[str], None]] = None
+        on_recover: Optional[Callable[[str], None]] = None,
+        columnar: bool = False,
+        capacity: int = INITIAL_CAPACITY,
     ):
         """
         Initialize the Reaper.
@@ -212,6 +424,8 @@ class Reaper:
             on_suspect: Callback when node becomes suspect
             on_convict: Callback when node is convicted
             on_recover: Callback when suspected node recovers
+            columnar: Keep statistics in NumPy columns (requires numpy)
+            capacity: Initial node slots in columnar mode
         """
         self._phi_convict = phi_convict
         self._phi_suspect = phi_suspect
@@ -222,26 +436,43 @@ class Reaper:
         self._on_recover = on_recover
         
         self._windows: Dict[str, ArrivalWindow] = {}
+        self._columns: Optional[ColumnarWindows] = ColumnarWindows(capacity) if columnar else None
         self._convictions: Dict[str, float] = {}  # node_id -> conviction time
-        self._lock = threading.Lock()
+        # Re-entrant: check_and_convict builds the status while holding it
+        self._lock = threading.RLock()
         
         # Statistics
         self._total_heartbeats = 0
         self._total_convictions = 0
         self._total_recoveries = 0
         
+    @property
+    def is_columnar(self) -> bool:
+        """True if statistics are kept in NumPy columns."""
+        return self._columns is not None
+    
     def register_node(self, node_id: str) -> None:
         """Register a node for monitoring."""
         with self._lock:
-            if node_id not in self._windows:
+            if self._columns is not None:
+                self._columns.add(node_id)
+            elif node_id not in self._windows:
                 self._windows[node_id] = ArrivalWindow()
                 
     def unregister_node(self, node_id: str) -> None:
         """Stop monitoring a node."""
         with self._lock:
+            if self._columns is not None:
+                self._columns.remove(node_id)
             self._windows.pop(node_id, None)
             self._convictions.pop(node_id, None)
             
+    def _node_ids(self) -> List[str]:
+        if self._columns is not None:
+            return self._columns.node_ids()
+        return list(self._windows.keys())
+    
+
     def heartbeat(self, node_id: str, arrival_time: Optional[float] = None) -> None:
         """
         Record a heartbeat from a node.
@@ -250,6 +481,10 @@ class Reaper:
             node_id: The node sending the heartbeat
             arrival_time: Override arrival time (ms), defaults to now
         """
+        if self._columns is not None:
+            self.heartbeat_batch([node_id], [arrival_time or time.time() * 1000])
+            return
+        
         with self._lock:
             if node_id not in self._windows:
                 self._windows[node_id] = ArrivalWindow()
@@ -267,6 +502,49 @@ class Reaper:
                 if self._on_recover:
                     self._on_recover(node_id)
                     
+    def heartbeat_batch(
+        self,
+        node_ids: Sequence[str],
+        arrival_times: Optional[Sequence[float]] = None,
+    ) -> None:
+        """
+        Record many heartbeats at once.
+        
+        In columnar mode this is one vectorised statistics update (per
+        repeat of a node within the batch); otherwise each heartbeat is
+        recorded in turn.
+        
+        Args:
+            node_ids: Nodes sending heartbeats, in arrival order
+            arrival_times: Arrival time (ms) per heartbeat, defaults to now
+        """
+        if arrival_times is None:
+            arrival_times = [time.time() * 1000] * len(node_ids)
+        if len(arrival_times) != len(node_ids):
+            raise ValueError("node_ids and arrival_times must have the same length")
+        
+        if self._columns is None:
+            for node_id, arrival_time in zip(node_ids, arrival_times):
+                self.heartbeat(node_id, arrival_time)
+            return
+        
+        with self._lock:
+            columns = self._columns
+            slots = columns.slots_for(node_ids)
+            columns.record(slots, np.asarray(arrival_times, dtype=np.float64))
+            self._total_heartbeats += len(slots)
+            
+            # Check for recovery
+            recovered = [columns.node_id(slot) for slot in np.unique(slots[columns.convicted[slots]])]
+            for node_id in recovered:
+                del self._convictions[node_id]
+                columns.convicted[columns.get_slot(node_id)] = False
+            self._total_recoveries += len(recovered)
+        
+        if self._on_recover:
+            for node_id in recovered:
+                self._on_recover(node_id)
+                    
     def compute_phi(self, node_id: str, now: Optional[float] = None) -> float:
         """
         Compute phi (suspicion level) for a node.
@@ -284,6 +562,12 @@ class Reaper:
         now_ms = now or time.time() * 1000
         
         with self._lock:
+            if self._columns is not None:
+                slot = self._columns.get_slot(node_id)
+                if slot is None:
+                    return 0.0
+                return float(self._columns.phi(now_ms, np.array([slot]))[0])
+            
             if node_id not in self._windows:
                 return 0.0
                 
@@ -326,6 +610,14 @@ class Reaper:
             
     def get_status(self, node_id: str) -> NodeStatus:
         """Get current status for a node."""
+        if self._columns is not None:
+            with self._lock:
+                slot = self._columns.get_slot(node_id)
+                if slot is None:
+                    return NodeStatus(node_id=node_id)
+                phi = self._columns.phi(time.time() * 1000, np.array([slot]))
+                return self._column_status(np.array([slot]), phi)[0]
+        
         phi = self.compute_phi(node_id)
         
         with self._lock:
@@ -369,6 +661,8 @@ class Reaper:
                     
             if phi >= self._phi_convict and not was_convicted:
                 self._convictions[node_id] = time.time() * 1000
+                if self._columns is not None:
+                    self._columns.convicted[self._columns.get_slot(node_id)] = True
                 self._total_convictions += 1
                 if self._on_convict:
                     self._on_convict(node_id, phi)
@@ -376,8 +670,114 @@ class Reaper:
                 
         return None
         
+    def sweep(self, now: Optional[float] = None) -> Tuple[List[str], List[str]]:
+        """
+        Check every node in one pass and convict those over threshold.
+        
+        Equivalent to check_and_convict() on each node: on_suspect fires
+        for every unconvicted node at or over the suspect threshold, and
+        on_convict for each new conviction. In columnar mode phi for all
+        nodes is a single vectorised computation.
+        
+        Args:
+            now: Evaluation time (ms), defaults to now
+        
+        Returns:
+            Tuple of (suspected but not convicted node IDs, convicted node IDs)
+        """
+        now_ms = now or time.time() * 1000
+        
+        if self._columns is None:
+            for node_id in self._node_ids():
+                self._check_at(node_id, now_ms)
+            with self._lock:
+                convicted = list(self._convictions)
+                suspects = [
+                    node_id for node_id in self._windows
+                    if node_id not in self._convictions
+                    and self.compute_phi(node_id, now_ms) >= self._phi_suspect
+                ]
+            return suspects, convicted
+        
+        with self._lock:
+            columns = self._columns
+            phi = columns.phi(now_ms)
+            was_convicted = columns.convicted[:columns.size]
+            warned = np.flatnonzero((phi >= self._phi_suspect) & ~was_convicted)
+            newly = np.flatnonzero((phi >= self._phi_convict) & ~was_convicted)
+            
+            for slot in newly:
+                self._convictions[columns.node_id(slot)] = now_ms
+            columns.convicted[newly] = True
+            self._total_convictions += len(newly)
+            
+            suspect_slots = np.flatnonzero((phi >= self._phi_suspect) & ~columns.convicted[:columns.size])
+            suspects = [columns.node_id(slot) for slot in suspect_slots]
+            convicted = list(self._convictions)
+            warned_ids = [(columns.node_id(slot), float(phi[slot])) for slot in warned]
+            newly_ids = [(columns.node_id(slot), float(phi[slot])) for slot in newly]
+        
+        if self._on_suspect:
+            for node_id, node_phi in warned_ids:
+                self._on_suspect(node_id, node_phi)
+        if self._on_convict:
+            for node_id, node_phi in newly_ids:
+                self._on_convict(node_id, node_phi)
+        return suspects, convicted
+    
+    def _check_at(self, node_id: str, now_ms: float) -> None:
+        """check_and_convict() evaluated at a fixed time (windowed mode)."""
+        phi = self.compute_phi(node_id, now_ms)
+        with self._lock:
+            if node_id in self._convictions:
+                return
+            if phi >= self._phi_suspect and self._on_suspect:
+                self._on_suspect(node_id, phi)
+            if phi >= self._phi_convict:
+                self._convictions[node_id] = now_ms
+                self._total_convictions += 1
+                if self._on_convict:
+                    self._on_convict(node_id, phi)
+    
+    def _column_status(self, slots: "np.ndarray", phi: "np.ndarray") -> List[NodeStatus]:
+        """NodeStatus for columnar slots, given their phi values."""
+        columns = self._columns
+        means = columns.mean_at(slots)
+        stddevs = columns.stddev_at(slots)
+        statuses = []
+        for slot, node_phi, mean, stddev in zip(slots.tolist(), phi.tolist(), means.tolist(), stddevs.tolist()):
+            node_id = columns.node_id(slot)
+            last = columns.last_arrival[slot]
+            statuses.append(NodeStatus(
+                node_id=node_id,
+                phi=node_phi,
+                is_alive=node_phi < self._phi_convict,
+                is_suspect=node_phi >= self._phi_suspect,
+                is_zombie=self._phi_zombie <= node_phi < self._phi_convict,
+                is_convicted=node_id in self._convictions or node_phi >= self._phi_convict,
+                last_heartbeat_ms=None if math.isnan(last) else float(last),
+                heartbeat_count=int(columns.count[slot]),
+                mean_interval_ms=mean,
+                stddev_interval_ms=stddev,
+            ))
+        return statuses
+    
+    def _column_select(self, mask_for: Callable[["np.ndarray"], "np.ndarray"]) -> List[NodeStatus]:
+        """Statuses of columnar nodes whose phi satisfies mask_for(phi)."""
+        with self._lock:
+            columns = self._columns
+            phi = columns.phi(time.time() * 1000)
+            slots = np.flatnonzero(mask_for(phi) & columns.active[:columns.size])
+            return self._column_status(slots, phi[slots])
+    
     def get_suspects(self) -> List[NodeStatus]:
         """Get all suspected (but not convicted) nodes."""
+        if self._columns is not None:
+            return self._column_select(
+                lambda phi: (phi >= self._phi_suspect) & (phi < self._phi_convict)
+                & ~self._columns.convicted[:len(phi)]
+            )
+        
         suspects = []
         with self._lock:
             node_ids = list(self._windows.keys())
@@ -402,6 +802,9 @@ class Reaper:
         
     def get_zombies(self) -> List[NodeStatus]:
         """Get all zombie (grey failure) nodes."""
+        if self._columns is not None:
+            return self._column_select(lambda phi: (phi >= self._phi_zombie) & (phi < self._phi_convict))
+        
         zombies = []
         with self._lock:
             node_ids = list(self._windows.keys())
@@ -415,6 +818,10 @@ class Reaper:
         
     def get_all_status(self) -> Dict[str, NodeStatus]:
         """Get status for all monitored nodes."""
+        if self._columns is not None:
+            statuses = self._column_select(lambda phi: np.ones(len(phi), dtype=bool))
+            return {status.node_id: status for status in statuses}
+        
         with self._lock:
             node_ids = list(self._windows.keys())
             
@@ -424,7 +831,8 @@ class Reaper:
         """Get detector statistics."""
         with self._lock:
             return {
-                "monitored_nodes": len(self._windows),
+                "mode": "columnar" if self._columns is not None else "windowed",
+                "monitored_nodes": len(self._node_ids()),
                 "convicted_nodes": len(self._convictions),
                 "total_heartbeats": self._total_heartbeats,
                 "total_convictions": self._total_convictions,
@@ -619,6 +1027,61 @@ def _self_test() -> bool:
     except Exception as e:
         print(f"  ❌ FAILED: {e}")
         
+    # Test 7: Columnar mode
+    tests_total += 1
+    print("\n[TEST 7] Columnar Mode...")
+    try:
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy not installed")
+        
+        convicted_nodes = []
+        recovered_nodes = []
+        windowed = Reaper()
+        columnar = Reaper(
+            columnar=True, capacity=2,
+            on_convict=lambda node_id, phi: convicted_nodes.append(node_id),
+            on_recover=recovered_nodes.append,
+        )
+        
+        base_time = time.time() * 1000
+        intervals = [100, 95, 110, 105, 98, 102, 108, 97, 103, 101]
+        node_ids, arrivals = [], []
+        for node in ["alpha", "beta", "gamma", "delta"]:
+            t = base_time
+            for interval in intervals:
+                windowed.heartbeat(node, t)
+                node_ids.append(node)
+                arrivals.append(t)
+                t += interval
+        columnar.heartbeat_batch(node_ids, arrivals)
+        
+        # Same statistics and phi as the per-node windows
+        for delay in (0, 150, 400, 2000):
+            now = base_time + sum(intervals) + delay
+            for node in ["alpha", "delta"]:
+                assert abs(windowed.compute_phi(node, now) - columnar.compute_phi(node, now)) < 1e-6
+        status = columnar.get_status("beta")
+        assert status.heartbeat_count == windowed.get_status("beta").heartbeat_count
+        assert abs(status.mean_interval_ms - windowed.get_status("beta").mean_interval_ms) < 1e-9
+        
+        # Only alpha keeps heartbeating; one sweep convicts the rest
+        last = base_time + sum(intervals)
+        columnar.heartbeat_batch(["alpha"], [last + 1900])
+        suspects, convicted = columnar.sweep(last + 2000)
+        assert suspects == [] and sorted(convicted) == ["beta", "delta", "gamma"]
+        assert sorted(convicted_nodes) == sorted(convicted)
+        
+        columnar.heartbeat_batch(["gamma"], [last + 2100])
+        assert recovered_nodes == ["gamma"]
+        assert columnar.get_stats()["convicted_nodes"] == 2
+        
+        print(f"  Convicted in one sweep: {sorted(convicted)}")
+        print(f"  Recovered: {recovered_nodes}")
+        print("  ✅ PASSED: Columnar phi matches per-node windows")
+        tests_passed += 1
+    except Exception as e:
+        print(f"  ❌ FAILED: {e}")
+        
     # Summary
     print("\n" + "=" * 60)
     print(f"                RESULTS: {tests_passed}/{tests_total} PASSED")
@@ -632,7 +1095,47 @@ def _self_test() -> bool:
     return tests_passed == tests_total
 
 
+def _benchmark(node_count: int = 10_000, rounds: int = 10) -> None:
+    """Compare per-node windows with columnar mode at cluster scale."""
+    print(f"\nReaper benchmark: {node_count} nodes, {rounds} heartbeat rounds")
+    node_ids = [f"node_{i}" for i in range(node_count)]
+    base_time = time.time() * 1000
+    now = base_time + rounds * 1000 + 900
+    
+    for label, reaper in (("windowed", Reaper()), ("columnar", Reaper(columnar=True))):
+        start = time.perf_counter()
+        for r in range(rounds + 1):
+            # Jittered 1s heartbeats; every 100th node misses the last round
+            batch = node_ids if r < rounds else [n for i, n in enumerate(node_ids) if i % 100]
+            arrivals = [base_time + r * 1000 + (i * 7 + r * 13) % 100 for i in range(len(batch))]
+            reaper.heartbeat_batch(batch, arrivals)
+        ingest = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        reaper.sweep(now)
+        sweep = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        reaper.get_suspects()
+        suspects = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        reaper.get_all_status()
+        all_status = time.perf_counter() - start
+        
+        heartbeats = reaper.get_stats()["total_heartbeats"]
+        print(
+            f"  {label:9s} ingest {heartbeats / ingest:>12,.0f} hb/s | "
+            f"sweep {sweep * 1000:8.1f} ms | get_suspects {suspects * 1000:8.1f} ms | "
+            f"get_all_status {all_status * 1000:8.1f} ms"
+        )
+
+
 if __name__ == "__main__":
     import sys
+    if "--benchmark" in sys.argv:
+        from modules.core.reaper import _benchmark as benchmark
+        benchmark()
+        sys.exit(0)
     success = _self_test()
     sys.exit(0 if success else 1)
@@ -15,7 +15,7 @@ The Data Module ensures:
   - Root hash consistency
 
 Components:
-  - merkle.py: The Fingerprint (SHA-256 Merkle Trees)
+  - merkle.py: The Fingerprint (SHA-256 Merkle Trees, incremental Sparse Merkle Tree)
   - replication.py: The Bridge (Raft Log → Ledger State)
 
 INVARIANTS:
@@ -29,7 +29,7 @@ TRAINING SIGNAL:
 __version__ = "3.2.0"
 __phase__ = "THE_MESH"
 
-from .merkle import MerkleTree, MerkleProof
+from .merkle import MerkleTree, MerkleProof, SparseMerkleTree, SparseMerkleProof, StateRootStrategy
 from .replication import ReplicationEngine, StateSnapshot
 from .sharding import TenantShard, ShardManager, ShardConfig, ShardState
 from .schemas import (
@@ -38,12 +38,15 @@ from .schemas import (
 )
 from .sxt_bridge import (
     SxTBridge, SxTConfig, AsyncAnchor, AnchorRequest, AnchorState,
-    create_sxt_bridge,
+    AnchorJournal, create_sxt_bridge,
 )
 
 __all__ = [
     "MerkleTree",
     "MerkleProof",
+    "SparseMerkleTree",
+    "SparseMerkleProof",
+    "StateRootStrategy",
     "ReplicationEngine",
     "StateSnapshot",
     # P920 Sharding
@@ -55,6 +58,7 @@ __all__ = [
     "SxTBridge",
     "SxTConfig",
     "AsyncAnchor",
+    "AnchorJournal",
     "AnchorRequest",
     "AnchorState",
     "create_sxt_bridge",
@@ -13,6 +13,7 @@ The Merkle module provides:
   - SHA-256 based Merkle Tree construction
   - Efficient state root computation
   - Inclusion proof generation and verification
+  - Incremental Sparse Merkle Tree for per-account state updates
   - Deterministic hashing for consistency
 
 INVARIANTS:
@@ -35,6 +36,11 @@ Usage:
     
     # Verify proof
     is_valid = MerkleTree.verify_proof("Bob:200", proof, root)
+    
+    # Incremental state tree (O(log N) per update)
+    sparse = SparseMerkleTree()
+    sparse.update("Alice", 100)
+    root = sparse.root_hash
 """
 
 import hashlib
@@ -335,10 +341,307 @@ class MerkleTree:
         return f"MerkleTree(root={self._root_hash[:16]}..., leaves={len(self._leaves)})"
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# SPARSE MERKLE TREE
+# ══════════════════════════════════════════════════════════════════════════════
+
+KEY_BITS = 256
+ZERO_NODE = bytes(32)           # Hash of an empty subtree
+LEAF_PREFIX = b"\x00"           # Domain separation: leaf nodes
+BRANCH_PREFIX = b"\x01"         # Domain separation: branch nodes
+
+
+class _SparseLeaf:
+    """Leaf of a sparse Merkle tree (one key/value pair)."""
+    
+    __slots__ = ("path", "key", "value", "hash")
+    
+    def __init__(self, key: str, value: str):
+        key_digest = hashlib.sha256(key.encode("utf-8")).digest()
+        self.path = int.from_bytes(key_digest, "big")
+        self.key = key
+        self.value = value
+        self.hash = hashlib.sha256(LEAF_PREFIX + key_digest + value.encode("utf-8")).digest()
+
+
+class _SparseBranch:
+    """Branch of a sparse Merkle tree (at least two leaves below)."""
+    
+    __slots__ = ("left", "right", "hash")
+    
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.hash = _branch_hash(left, right)
+
+
+def _branch_hash(left, right) -> bytes:
+    """Hash two children (None = empty subtree)."""
+    return hashlib.sha256(
+        BRANCH_PREFIX
+        + (left.hash if left is not None else ZERO_NODE)
+        + (right.hash if right is not None else ZERO_NODE)
+    ).digest()
+
+
+def _path_bit(path: int, depth: int) -> int:
+    """Bit of a key path at a given depth (0 = most significant)."""
+    return (path >> (KEY_BITS - 1 - depth)) & 1
+
+
+@dataclass
+class SparseMerkleProof:
+    """
+    Proof of inclusion in a Sparse Merkle Tree.
+    
+    Sibling hashes are ordered root → leaf; the leaf sits at
+    depth len(siblings) along the SHA-256 path of its key.
+    """
+    
+    key: str
+    value: str
+    siblings: List[str]
+    root_hash: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to dictionary."""
+        return {
+            "key": self.key,
+            "value": self.value,
+            "siblings": self.siblings,
+            "root_hash": self.root_hash
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SparseMerkleProof":
+        """Deserialize from dictionary."""
+        return cls(
+            key=data["key"],
+            value=data["value"],
+            siblings=list(data["siblings"]),
+            root_hash=data["root_hash"]
+        )
+
+
+class SparseMerkleTree:
+    """
+    Incremental SHA-256 Sparse Merkle Tree keyed by hash(key).
+    
+    INV-DATA-001: The root depends only on the set of (key, value) pairs,
+    never on insertion order, so every node computes the same root.
+    
+    The tree is compacted:
+      - An empty subtree hashes to ZERO_NODE
+      - A subtree holding one leaf hashes to that leaf
+      - Branches exist only where two or more keys share a path prefix
+    
+    Updating a key rehashes only the O(log N) branches on its path.
+    """
+    
+    def __init__(self):
+        """Initialize empty Sparse Merkle Tree."""
+        self._root = None
+        self._leaves: Dict[str, _SparseLeaf] = {}
+    
+    @property
+    def root_hash(self) -> str:
+        """Get the Merkle root hash."""
+        if self._root is None:
+            return EMPTY_HASH
+        return self._root.hash.hex()
+    
+    @property
+    def leaf_count(self) -> int:
+        """Get number of leaves."""
+        return len(self._leaves)
+    
+    def __len__(self) -> int:
+        return len(self._leaves)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._leaves
+    
+    def get(self, key: str) -> Optional[str]:
+        """Get the value stored for a key (None if absent)."""
+        leaf = self._leaves.get(key)
+        return leaf.value if leaf is not None else None
+    
+    def update(self, key: str, value: Any) -> str:
+        """
+        Insert or replace a key, or delete it when value is None.
+        
+        Args:
+            key: Leaf key (e.g. account ID)
+            value: Leaf value (stringified), or None to delete
+            
+        Returns:
+            New root hash
+        """
+        if value is None:
+            return self.delete(key)
+        
+        leaf = _SparseLeaf(key, str(value))
+        self._root = self._insert(self._root, 0, leaf)
+        self._leaves[key] = leaf
+        return self.root_hash
+    
+    def delete(self, key: str) -> str:
+        """
+        Remove a key (no-op if absent).
+        
+        Returns:
+            New root hash
+        """
+        leaf = self._leaves.pop(key, None)
+        if leaf is not None:
+            self._root = self._remove(self._root, 0, leaf.path)
+        return self.root_hash
+    
+    def build_from_dict(self, state: Dict[str, Any]) -> str:
+        """
+        Rebuild the tree from a state dictionary.
+        
+        Args:
+            state: Dictionary of key → value
+            
+        Returns:
+            Root hash
+        """
+        self._root = None
+        self._leaves = {}
+        for key, value in state.items():
+            self.update(key, value)
+        return self.root_hash
+    
+    def _insert(self, node, depth: int, leaf: _SparseLeaf):
+        """Insert leaf below node, returning the new subtree."""
+        if node is None:
+            return leaf
+        
+        if isinstance(node, _SparseLeaf):
+            if node.path == leaf.path:
+                return leaf
+            return self._split(node, leaf, depth)
+        
+        if _path_bit(leaf.path, depth):
+            node.right = self._insert(node.right, depth + 1, leaf)
+        else:
+            node.left = self._insert(node.left, depth + 1, leaf)
+        node.hash = _branch_hash(node.left, node.right)
+        return node
+    
+    @staticmethod
+    def _split(existing: _SparseLeaf, leaf: _SparseLeaf, depth: int) -> _SparseBranch:
+        """Create the branch chain separating two leaves below depth."""
+        diverge = KEY_BITS - (existing.path ^ leaf.path).bit_length()
+        
+        if _path_bit(leaf.path, diverge):
+            node = _SparseBranch(existing, leaf)
+        else:
+            node = _SparseBranch(leaf, existing)
+        
+        # Single-child branches down to the shared prefix length
+        for d in range(diverge - 1, depth - 1, -1):
+            if _path_bit(leaf.path, d):
+                node = _SparseBranch(None, node)
+            else:
+                node = _SparseBranch(node, None)
+        return node
+    
+    def _remove(self, node, depth: int, path: int):
+        """Remove the leaf at path below node, returning the new subtree."""
+        if isinstance(node, _SparseLeaf):
+            return None if node.path == path else node
+        
+        if _path_bit(path, depth):
+            node.right = self._remove(node.right, depth + 1, path)
+        else:
+            node.left = self._remove(node.left, depth + 1, path)
+        
+        # Collapse: a lone leaf moves up to keep the tree canonical
+        if node.left is None and isinstance(node.right, _SparseLeaf):
+            return node.right
+        if node.right is None and isinstance(node.left, _SparseLeaf):
+            return node.left
+        
+        node.hash = _branch_hash(node.left, node.right)
+        return node
+    
+    def generate_proof(self, key: str) -> SparseMerkleProof:
+        """
+        Generate inclusion proof for a key.
+        
+        Raises:
+            KeyError: If key is not in the tree
+        """
+        leaf = self._leaves.get(key)
+        if leaf is None:
+            raise KeyError(f"Key not in tree: {key}")
+        
+        siblings = []
+        node = self._root
+        depth = 0
+        while isinstance(node, _SparseBranch):
+            if _path_bit(leaf.path, depth):
+                sibling, node = node.left, node.right
+            else:
+                sibling, node = node.right, node.left
+            siblings.append((sibling.hash if sibling is not None else ZERO_NODE).hex())
+            depth += 1
+        
+        return SparseMerkleProof(
+            key=key,
+            value=leaf.value,
+            siblings=siblings,
+            root_hash=self.root_hash
+        )
+    
+    @staticmethod
+    def verify_proof(
+        key: str,
+        value: Any,
+        proof: SparseMerkleProof,
+        expected_root: Optional[str] = None
+    ) -> bool:
+        """
+        Verify an inclusion proof.
+        
+        Args:
+            key: Leaf key
+            value: Expected leaf value
+            proof: SparseMerkleProof to verify
+            expected_root: Optional root to verify against (uses proof.root_hash if None)
+            
+        Returns:
+            True if proof is valid
+        """
+        leaf = _SparseLeaf(key, str(value))
+        current = leaf.hash
+        
+        for depth in range(len(proof.siblings) - 1, -1, -1):
+            sibling = bytes.fromhex(proof.siblings[depth])
+            if _path_bit(leaf.path, depth):
+                current = hashlib.sha256(BRANCH_PREFIX + sibling + current).digest()
+            else:
+                current = hashlib.sha256(BRANCH_PREFIX + current + sibling).digest()
+        
+        target_root = expected_root if expected_root else proof.root_hash
+        return current.hex() == target_root
+    
+    def __repr__(self) -> str:
+        return f"SparseMerkleTree(root={self.root_hash[:16]}..., leaves={len(self._leaves)})"
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # STATE ROOT CALCULATOR
 # ══════════════════════════════════════════════════════════════════════════════
 
+class StateRootStrategy:
+    """Supported state root constructions."""
+    
+    SORTED = "sorted"               # Full MerkleTree rebuild over sorted accounts
+    SPARSE = "sparse"               # Incremental SparseMerkleTree keyed by hash(account)
+
 class StateRootCalculator:
     """
     Calculates deterministic state root from account balances.
@@ -372,6 +675,17 @@ class StateRootCalculator:
         tree = MerkleTree()
         return tree.build(leaves)
     
+    @staticmethod
+    def calculate_sparse_root(balances: Dict[str, int]) -> str:
+        """
+        Calculate sparse state root from account balances.
+        
+        Order-independent: matches an incrementally maintained
+        SparseMerkleTree holding the same balances.
+        """
+        tree = SparseMerkleTree()
+        return tree.build_from_dict(balances)
+    
     @staticmethod
     def calculate_root_with_proof(
         balances: Dict[str, int],
@@ -416,7 +730,7 @@ def _self_test():
     print("=" * 70)
     
     # Test 1: Basic tree construction
-    print("\n[1/6] Testing basic tree construction...")
+    print("\n[1/8] Testing basic tree construction...")
     tree = MerkleTree()
     leaves = ["Alice:100", "Bob:200", "Carol:300", "Dave:400"]
     root = tree.build(leaves)
@@ -430,7 +744,7 @@ def _self_test():
     print(f"      ✓ Height: {tree.height}")
     
     # Test 2: Determinism
-    print("\n[2/6] Testing determinism (INV-DATA-001)...")
+    print("\n[2/8] Testing determinism (INV-DATA-001)...")
     tree2 = MerkleTree()
     root2 = tree2.build(leaves)
     
@@ -445,7 +759,7 @@ def _self_test():
     print(f"      ✓ Different order → different root: VERIFIED")
     
     # Test 3: Proof generation
-    print("\n[3/6] Testing proof generation...")
+    print("\n[3/8] Testing proof generation...")
     proof = tree.generate_proof(1)  # Bob's proof
     
     assert proof.leaf_index == 1
@@ -456,7 +770,7 @@ def _self_test():
     print(f"      ✓ Proof has {len(proof.proof_hashes)} hashes")
     
     # Test 4: Proof verification
-    print("\n[4/6] Testing proof verification...")
+    print("\n[4/8] Testing proof verification...")
     is_valid = MerkleTree.verify_proof("Bob:200", proof)
     assert is_valid, "Valid proof should verify"
     
@@ -468,7 +782,7 @@ def _self_test():
     print(f"      ✓ Tampered data rejected: True")
     
     # Test 5: State root calculation
-    print("\n[5/6] Testing state root calculation...")
+    print("\n[5/8] Testing state root calculation...")
     balances = {
         "ACCT-001": 1000,
         "ACCT-002": 2000,
@@ -485,7 +799,7 @@ def _self_test():
     print(f"      ✓ Deterministic across nodes: VERIFIED")
     
     # Test 6: Odd number of leaves
-    print("\n[6/6] Testing odd number of leaves...")
+    print("\n[6/8] Testing odd number of leaves...")
     tree_odd = MerkleTree()
     root_odd = tree_odd.build(["A", "B", "C"])
     
@@ -500,6 +814,38 @@ def _self_test():
     print(f"      ✓ Odd leaves handled correctly")
     print(f"      ✓ All proofs valid for odd tree")
     
+    # Test 7: Sparse tree order independence and incremental updates
+    print("\n[7/8] Testing sparse tree determinism (INV-DATA-001)...")
+    sparse1 = SparseMerkleTree()
+    sparse2 = SparseMerkleTree()
+    for account in sorted(balances):
+        sparse1.update(account, balances[account])
+    for account in reversed(sorted(balances)):
+        sparse2.update(account, balances[account])
+    
+    assert sparse1.root_hash == sparse2.root_hash, "Insertion order must not matter"
+    assert sparse1.root_hash == StateRootCalculator.calculate_sparse_root(balances)
+    
+    root_before = sparse1.root_hash
+    sparse1.update("ACCT-004", 42)
+    assert sparse1.root_hash != root_before, "New account should change root"
+    sparse1.delete("ACCT-004")
+    assert sparse1.root_hash == root_before, "Delete should restore previous root"
+    
+    print(f"      ✓ Sparse root: {sparse1.root_hash[:32]}...")
+    print("      ✓ Insertion order independent: VERIFIED")
+    print("      ✓ Insert/delete round-trip: VERIFIED")
+    
+    # Test 8: Sparse tree proofs
+    print("\n[8/8] Testing sparse tree proofs...")
+    for account, balance in balances.items():
+        proof = sparse1.generate_proof(account)
+        assert SparseMerkleTree.verify_proof(account, balance, proof), f"Proof for {account} should verify"
+        assert not SparseMerkleTree.verify_proof(account, balance + 1, proof), "Tampered value should fail"
+    
+    print("      ✓ All sparse proofs valid")
+    print("      ✓ Tampered values rejected")
+    
     print("\n" + "=" * 70)
     print("ALL TESTS PASSED ✅")
     print("=" * 70)
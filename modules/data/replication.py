@@ -46,7 +46,9 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .merkle import MerkleTree, MerkleProof, StateRootCalculator, EMPTY_HASH
+from .merkle import (
+    MerkleProof, SparseMerkleTree, StateRootCalculator, StateRootStrategy, EMPTY_HASH,
+)
 
 __version__ = "3.0.0"
 
@@ -85,6 +87,9 @@ class StateSnapshot:
     # Merkle tree data (optional, for full snapshots)
     merkle_leaves: Optional[List[str]] = None
     
+    # State root construction used for state_root
+    root_strategy: str = StateRootStrategy.SPARSE
+    
     def to_dict(self) -> Dict[str, Any]:
         """Serialize to dictionary."""
         return {
@@ -96,7 +101,8 @@ class StateSnapshot:
             "balances": self.balances,
             "account_count": self.account_count,
             "total_balance": self.total_balance,
-            "merkle_leaves": self.merkle_leaves
+            "merkle_leaves": self.merkle_leaves,
+            "root_strategy": self.root_strategy
         }
     
     @classmethod
@@ -111,7 +117,9 @@ class StateSnapshot:
             balances=data["balances"],
             account_count=data["account_count"],
             total_balance=data["total_balance"],
-            merkle_leaves=data.get("merkle_leaves")
+            merkle_leaves=data.get("merkle_leaves"),
+            # Snapshots written before P340 incremental roots used sorted roots
+            root_strategy=data.get("root_strategy", StateRootStrategy.SORTED)
         )
     
     def save(self, path: str):
@@ -155,6 +163,10 @@ class ReplicationEngine:
     
     INV-DATA-001: State root must match across all nodes at same index.
     INV-DATA-002: Each log entry is atomically applied.
+    
+    By default the state root is kept in a SparseMerkleTree, so applying
+    an entry rehashes only the paths of the accounts it touches. All
+    nodes in a federation must use the same root strategy.
     """
     
     def __init__(
@@ -162,7 +174,8 @@ class ReplicationEngine:
         node_id: str = "NODE-0",
         initial_balances: Optional[Dict[str, int]] = None,
         on_state_change: Optional[Callable[[str], None]] = None,
-        persistence_path: Optional[str] = None
+        persistence_path: Optional[str] = None,
+        root_strategy: str = StateRootStrategy.SPARSE
     ):
         """
         Initialize replication engine.
@@ -172,8 +185,14 @@ class ReplicationEngine:
             initial_balances: Starting account balances
             on_state_change: Callback when state root changes
             persistence_path: Path for snapshots
+            root_strategy: StateRootStrategy.SPARSE (incremental, default)
+                           or StateRootStrategy.SORTED (full rebuild)
         """
+        if root_strategy not in (StateRootStrategy.SPARSE, StateRootStrategy.SORTED):
+            raise ValueError(f"Unknown root strategy: {root_strategy}")
+        
         self.node_id = node_id
+        self.root_strategy = root_strategy
         self.persistence_path = persistence_path
         self.on_state_change = on_state_change
         
@@ -183,8 +202,8 @@ class ReplicationEngine:
         self._last_applied_term = 0
         
         # Merkle tree for current state
-        self._merkle_tree = MerkleTree()
-        self._state_root = self._calculate_state_root()
+        self._state_tree = SparseMerkleTree()
+        self._state_root = self._rebuild_state_root()
         
         # Applied entries log (for debugging/verification)
         self._applied_entries: List[Dict[str, Any]] = []
@@ -231,9 +250,36 @@ class ReplicationEngine:
         return sum(self._balances.values())
     
     def _calculate_state_root(self) -> str:
-        """Calculate Merkle root from current balances."""
+        """Calculate Merkle root from current balances (full recomputation)."""
+        if self.root_strategy == StateRootStrategy.SPARSE:
+            return StateRootCalculator.calculate_sparse_root(self._balances)
         return StateRootCalculator.calculate_root(self._balances)
     
+    def _rebuild_state_root(self) -> str:
+        """Rebuild the state tree from current balances and return its root."""
+        if self.root_strategy == StateRootStrategy.SPARSE:
+            return self._state_tree.build_from_dict(self._balances)
+        return StateRootCalculator.calculate_root(self._balances)
+    
+    def _update_state_root(self, accounts: Dict[str, Optional[int]]) -> str:
+        """Refresh the state root after the given accounts changed."""
+        if self.root_strategy == StateRootStrategy.SPARSE:
+            for account in accounts:
+                self._state_tree.update(account, self._balances.get(account))
+            return self._state_tree.root_hash
+        return StateRootCalculator.calculate_root(self._balances)
+    
+    @staticmethod
+    def _touched_accounts(command: Dict[str, Any]) -> List[str]:
+        """Accounts a command may modify."""
+        cmd_type = command.get("type", CommandType.NOOP)
+        if cmd_type == CommandType.TRANSFER:
+            return [command["from"], command["to"]]
+        if cmd_type in (CommandType.DEPOSIT, CommandType.WITHDRAW,
+                        CommandType.CREATE_ACCOUNT, CommandType.CLOSE_ACCOUNT):
+            return [command["account"]]
+        return []
+    
     # ──────────────────────────────────────────────────────────────────────────
     # LOG APPLICATION
     # ──────────────────────────────────────────────────────────────────────────
@@ -261,11 +307,13 @@ class ReplicationEngine:
         if index != self._last_applied_index + 1:
             return False, f"Index gap: expected {self._last_applied_index + 1}, got {index}", self._state_root
         
-        # Save state for rollback
-        old_balances = self._balances.copy()
+        # Save touched accounts for rollback (None = did not exist)
+        saved: Dict[str, Optional[int]] = {}
         old_root = self._state_root
         
         try:
+            saved = {acct: self._balances.get(acct) for acct in self._touched_accounts(command)}
+            
             # Apply command based on type
             cmd_type = command.get("type", CommandType.NOOP)
             result_msg = ""
@@ -289,8 +337,8 @@ class ReplicationEngine:
             self._last_applied_index = index
             self._last_applied_term = term
             
-            # Recalculate state root
-            self._state_root = self._calculate_state_root()
+            # Update state root for touched accounts
+            self._state_root = self._update_state_root(saved)
             
             # Record in history
             self._root_history.append((index, self._state_root))
@@ -312,8 +360,14 @@ class ReplicationEngine:
             return True, result_msg, self._state_root
             
         except Exception as e:
-            # Rollback on failure
-            self._balances = old_balances
+            # Rollback on failure (tree leaves too, or later roots diverge)
+            for acct, balance in saved.items():
+                if balance is None:
+                    self._balances.pop(acct, None)
+                else:
+                    self._balances[acct] = balance
+                if self.root_strategy == StateRootStrategy.SPARSE:
+                    self._state_tree.update(acct, balance)
             self._state_root = old_root
             
             logger.error(f"[{self.node_id}] Failed to apply index {index}: {e}")
@@ -460,7 +514,8 @@ class ReplicationEngine:
             balances=self._balances.copy(),
             account_count=len(self._balances),
             total_balance=sum(self._balances.values()),
-            merkle_leaves=merkle_leaves
+            merkle_leaves=merkle_leaves,
+            root_strategy=self.root_strategy
         )
     
     def restore_from_snapshot(self, snapshot: StateSnapshot):
@@ -469,12 +524,17 @@ class ReplicationEngine:
         
         Used for crash recovery or new node sync.
         """
+        if snapshot.root_strategy != self.root_strategy:
+            raise ValueError(f"Snapshot root strategy mismatch! "
+                           f"Expected: {self.root_strategy} "
+                           f"Snapshot: {snapshot.root_strategy}")
+        
         self._balances = snapshot.balances.copy()
         self._last_applied_index = snapshot.last_applied_index
         self._last_applied_term = snapshot.last_applied_term
         
-        # Recalculate and verify root
-        calculated_root = self._calculate_state_root()
+        # Rebuild and verify root
+        calculated_root = self._rebuild_state_root()
         
         if calculated_root != snapshot.state_root:
             raise ValueError(f"Snapshot state root mismatch! "
@@ -498,6 +558,7 @@ class ReplicationEngine:
             "last_applied_index": self._last_applied_index,
             "last_applied_term": self._last_applied_term,
             "state_root": self._state_root,
+            "root_strategy": self.root_strategy,
             "account_count": len(self._balances),
             "total_balance": sum(self._balances.values()),
             "applied_entries": len(self._applied_entries)
@@ -515,7 +576,7 @@ def _self_test():
     print("=" * 70)
     
     # Test 1: Engine initialization
-    print("\n[1/6] Testing engine initialization...")
+    print("\n[1/7] Testing engine initialization...")
     initial_balances = {"ALICE": 1000, "BOB": 500}
     engine1 = ReplicationEngine(node_id="NODE-1", initial_balances=initial_balances)
     engine2 = ReplicationEngine(node_id="NODE-2", initial_balances=initial_balances)
@@ -527,7 +588,7 @@ def _self_test():
     print(f"      ✓ Initial roots match: {engine1.state_root[:32]}...")
     
     # Test 2: Apply transfer
-    print("\n[2/6] Testing transfer application...")
+    print("\n[2/7] Testing transfer application...")
     cmd = {"type": CommandType.TRANSFER, "from": "ALICE", "to": "BOB", "amount": 100}
     
     success1, msg1, root1 = engine1.apply_log_entry(1, 1, cmd)
@@ -545,7 +606,7 @@ def _self_test():
     print(f"      ✓ Roots match: {root1[:32]}...")
     
     # Test 3: Apply multiple commands
-    print("\n[3/6] Testing multiple commands (INV-DATA-001)...")
+    print("\n[3/7] Testing multiple commands (INV-DATA-001)...")
     commands = [
         {"type": CommandType.DEPOSIT, "account": "CAROL", "amount": 300},
         {"type": CommandType.TRANSFER, "from": "BOB", "to": "CAROL", "amount": 50},
@@ -565,7 +626,7 @@ def _self_test():
     print(f"      ✓ INV-DATA-001 VERIFIED: Roots match at all indices")
     
     # Test 4: Atomic rollback on failure
-    print("\n[4/6] Testing atomic rollback (INV-DATA-002)...")
+    print("\n[4/7] Testing atomic rollback (INV-DATA-002)...")
     root_before = engine1.state_root
     
     # Try invalid transfer (insufficient funds)
@@ -582,7 +643,7 @@ def _self_test():
     print(f"      ✓ INV-DATA-002 VERIFIED: Atomic application")
     
     # Test 5: Snapshot creation and restore
-    print("\n[5/6] Testing snapshot creation and restore...")
+    print("\n[5/7] Testing snapshot creation and restore...")
     snapshot = engine1.create_snapshot(include_merkle=True)
     
     assert snapshot.state_root == engine1.state_root
@@ -600,7 +661,7 @@ def _self_test():
     print(f"      ✓ Roots match after restore")
     
     # Test 6: State comparison
-    print("\n[6/6] Testing state comparison...")
+    print("\n[6/7] Testing state comparison...")
     matches, msg = engine1.compare_state(engine2.state_root, engine2.last_applied_index)
     assert matches, "Same commands should produce same state"
     
@@ -613,6 +674,29 @@ def _self_test():
     print(f"      ✓ State comparison at same index: MATCH")
     print(f"      ✓ Divergence detection working")
     
+    # Test 7: Incremental sparse root vs full recomputation
+    print("\n[7/7] Testing incremental state root...")
+    sorted_engine = ReplicationEngine(
+        node_id="NODE-4",
+        initial_balances=initial_balances,
+        root_strategy=StateRootStrategy.SORTED
+    )
+    sparse_engine = ReplicationEngine(node_id="NODE-5", initial_balances=initial_balances)
+    
+    for i, cmd in enumerate(commands + [{"type": CommandType.CLOSE_ACCOUNT, "account": "CAROL"}], start=1):
+        sorted_engine.apply_log_entry(i, 1, cmd)
+        sparse_engine.apply_log_entry(i, 1, cmd)
+        assert sparse_engine.verify_state_root(sparse_engine._calculate_state_root())
+        assert sparse_engine.state_root == StateRootCalculator.calculate_sparse_root(
+            sparse_engine.get_all_balances()
+        ), f"Incremental root should match full recomputation at index {i}"
+    
+    assert sorted_engine.get_all_balances() == sparse_engine.get_all_balances()
+    assert sorted_engine.state_root == StateRootCalculator.calculate_root(sorted_engine.get_all_balances())
+    
+    print("      ✓ Incremental root matches full recomputation at every index")
+    print("      ✓ Sorted and sparse strategies agree on balances")
+    
     print("\n" + "=" * 70)
     print("ALL TESTS PASSED ✅")
     print("=" * 70)
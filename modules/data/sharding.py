@@ -9,8 +9,10 @@ isolated directory (from GaaS P900). Databases use WAL mode for
 durability and are encrypted at rest with AES-256-GCM.
 
 Architecture:
-    ShardManager (Registry)
+    ShardManager (Registry, LRU-bounded open-shard cache)
         └── TenantShard (SQLite + Encryption)
+                ├── writer connection (serialised by the shard lock)
+                ├── read connection pool (concurrent WAL readers)
                 └── shard_{tenant_id}.db (File)
 
 Invariants:
@@ -24,14 +26,19 @@ from __future__ import annotations
 
 import os
 import json
+import time
+import queue
 import sqlite3
 import hashlib
 import threading
 import secrets
 import struct
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Optional, List, Any, Union
+from typing import Dict, Optional, List, Any, Union, Iterable, Iterator, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 from contextlib import contextmanager
@@ -68,6 +75,7 @@ class ShardConfig:
     wal_mode: bool = True
     busy_timeout_ms: int = 5000
     cache_size_kb: int = 2048
+    read_pool_size: int = 4     # Read-only connections (WAL mode only)
     
     def __post_init__(self):
         self.data_dir = Path(self.data_dir)
@@ -212,6 +220,7 @@ class TenantShard:
     - WAL mode for crash safety (INV-DATA-004)
     - Optional AES-256-GCM encryption at rest
     - Thread-safe connection management
+    - Pooled read-only connections that never wait on the writer lock
     
     Usage:
         shard = TenantShard(config)
@@ -223,6 +232,11 @@ class TenantShard:
         shard.close()
     """
     
+    # Bulk write / streaming read defaults
+    BULK_CHUNK_SIZE = 1000
+    BULK_ENCRYPT_WORKERS = 4
+    ITER_PAGE_SIZE = 500
+    
     # Default schema for sovereign state
     DEFAULT_SCHEMA = """
         -- Ledger entries
@@ -266,6 +280,16 @@ class TenantShard:
         self._lock = threading.RLock()
         self._encryption: Optional[ShardEncryption] = None
         
+        # Read connection pool (WAL allows readers alongside the writer)
+        self._readers: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_generation = 0
+        self._pool_lock = threading.Lock()
+        
+        # Usage tracking for the ShardManager cache
+        self._in_use = 0
+        self.last_used = time.monotonic()
+        
         # Statistics
         self._stats = {
             "opens": 0,
@@ -273,6 +297,9 @@ class TenantShard:
             "reads": 0,
             "writes": 0,
             "errors": 0,
+            "lock_wait_ms": 0.0,
+            "read_wait_ms": 0.0,
+            "bulk_rows": 0,
         }
         
         logger.info(f"[SHARD] Created shard for tenant {self.tenant_id}")
@@ -328,7 +355,7 @@ class TenantShard:
                 
                 logger.info(f"[SHARD] Opened {self.tenant_id} at {self.config.shard_path}")
                 return True
-                
+            
             except sqlite3.DatabaseError as e:
                 logger.error(f"[SHARD] Database error opening {self.tenant_id}: {e}")
                 self.state = ShardState.CORRUPTED
@@ -403,9 +430,16 @@ class TenantShard:
         
         logger.info(f"[SHARD] Initialized schema for {self.tenant_id}")
     
+    @property
+    def is_busy(self) -> bool:
+        """True while a transaction or read cursor is open."""
+        return self._in_use > 0
+    
     def close(self):
         """Close the shard database."""
         with self._lock:
+            self._close_readers()
+            
             if self._conn:
                 try:
                     # Checkpoint WAL before closing
@@ -433,37 +467,137 @@ class TenantShard:
         
         Commits on success, rolls back on exception.
         """
-        if self.state != ShardState.OPEN:
-            raise RuntimeError(f"Shard not open (state: {self.state})")
+        self._touch(+1)
+        try:
+            start = time.perf_counter()
+            with self._lock:
+                self._stats["lock_wait_ms"] += (time.perf_counter() - start) * 1000
+                # Checked under the lock: a concurrent close() nulls _conn
+                self._check_open()
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                
+                try:
+                    yield cursor
+                    self._conn.commit()
+                    self._stats["writes"] += 1
+                except Exception:
+                    self._conn.rollback()
+                    self._stats["errors"] += 1
+                    raise
+                finally:
+                    cursor.close()
+        finally:
+            self._touch(-1)
+    
+    @contextmanager
+    def read_cursor(self):
+        """
+        Context manager for read-only queries.
         
-        with self._lock:
-            cursor = self._conn.cursor()
-            cursor.execute("BEGIN IMMEDIATE")
+        In WAL mode the cursor comes from the read pool and does not take
+        the writer lock; readers see the last committed state.
+        """
+        self._touch(+1)
+        try:
+            if not self.config.wal_mode or self.config.read_pool_size <= 0:
+                with self._lock:
+                    self._check_open()
+                    cursor = self._conn.cursor()
+                    try:
+                        yield cursor
+                        self._stats["reads"] += 1
+                    finally:
+                        cursor.close()
+                return
             
+            # Pool readers never touch _conn; a close() bumps the reader
+            # generation, so a stale connection is dropped, not used
+            conn, generation = self._acquire_reader()
+            with self._pool_lock:
+                stale = generation != self._reader_generation or self.state != ShardState.OPEN
+            if stale:
+                self._release_reader(conn, generation)
+                raise RuntimeError(f"Shard not open (state: {self.state})")
+            cursor = conn.cursor()
             try:
                 yield cursor
-                self._conn.commit()
-                self._stats["writes"] += 1
-            except Exception:
-                self._conn.rollback()
-                self._stats["errors"] += 1
-                raise
+                with self._pool_lock:
+                    self._stats["reads"] += 1
             finally:
                 cursor.close()
+                self._release_reader(conn, generation)
+        finally:
+            self._touch(-1)
     
-    @contextmanager
-    def read_cursor(self):
-        """Context manager for read-only queries."""
-        if self.state != ShardState.OPEN:
+    def _check_open(self):
+        """Raise unless the shard is open (call with self._lock held)."""
+        if self.state != ShardState.OPEN or self._conn is None:
             raise RuntimeError(f"Shard not open (state: {self.state})")
+    
+    def _touch(self, delta: int):
+        """Track in-flight operations and last use (for cache eviction)."""
+        with self._pool_lock:
+            self._in_use += delta
+            self.last_used = time.monotonic()
+    
+    def _acquire_reader(self) -> tuple[sqlite3.Connection, int]:
+        """Take an idle read connection, opening one if the pool has room."""
+        try:
+            return self._readers.get_nowait(), self._reader_generation
+        except queue.Empty:
+            pass
         
-        with self._lock:
-            cursor = self._conn.cursor()
+        with self._pool_lock:
+            create = self._reader_count < self.config.read_pool_size
+            if create:
+                self._reader_count += 1
+            generation = self._reader_generation
+        
+        if create:
             try:
-                yield cursor
-                self._stats["reads"] += 1
-            finally:
-                cursor.close()
+                conn = sqlite3.connect(
+                    str(self.config.shard_path),
+                    check_same_thread=False,
+                    isolation_level=None,
+                )
+                conn.execute(f"PRAGMA busy_timeout={self.config.busy_timeout_ms}")
+                conn.execute("PRAGMA query_only=ON")
+                return conn, generation
+            except Exception:
+                with self._pool_lock:
+                    self._reader_count -= 1
+                raise
+        
+        # Pool exhausted: wait for a reader to be released
+        start = time.perf_counter()
+        conn = self._readers.get(timeout=self.config.busy_timeout_ms / 1000.0)
+        with self._pool_lock:
+            self._stats["read_wait_ms"] += (time.perf_counter() - start) * 1000
+        return conn, generation
+    
+    def _release_reader(self, conn: sqlite3.Connection, generation: int):
+        """Return a read connection to the pool (closing it if the shard closed)."""
+        with self._pool_lock:
+            stale = generation != self._reader_generation or self.state != ShardState.OPEN
+            if stale:
+                self._reader_count = max(0, self._reader_count - 1)
+        if stale:
+            conn.close()
+        else:
+            self._readers.put(conn)
+    
+    def _close_readers(self):
+        """Close idle read connections; busy ones close on release."""
+        with self._pool_lock:
+            self._reader_generation += 1
+            while True:
+                try:
+                    conn = self._readers.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+                self._reader_count = max(0, self._reader_count - 1)
     
     # === High-Level API ===
     
@@ -479,11 +613,7 @@ class TenantShard:
         Returns:
             Entry ID
         """
-        # Encrypt payload if encryption is enabled
-        if self._encryption:
-            payload_bytes = self._encryption.encrypt_value(payload)
-        else:
-            payload_bytes = json.dumps(payload).encode('utf-8')
+        payload_bytes = self._encode_payload(payload)
         
         with self.transaction() as cursor:
             cursor.execute("""
@@ -497,6 +627,81 @@ class TenantShard:
             ))
             return cursor.lastrowid
     
+    def write_ledger_many(
+        self,
+        entries: Iterable[Tuple],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        encrypt_workers: int = BULK_ENCRYPT_WORKERS,
+    ) -> List[Tuple[int, int]]:
+        """
+        Write many ledger entries in chunked transactions.
+        
+        Args:
+            entries: (entry_type, payload) or (entry_type, payload, signature) tuples
+            chunk_size: Entries per transaction (one commit per chunk)
+            encrypt_workers: Threads encrypting payloads ahead of the writer
+        
+        Returns:
+            (first_id, last_id) of each committed chunk, in order
+        """
+        return list(self.write_ledger_stream(entries, chunk_size, encrypt_workers))
+    
+    def write_ledger_stream(
+        self,
+        entries: Iterable[Tuple],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        encrypt_workers: int = BULK_ENCRYPT_WORKERS,
+    ) -> Iterator[Tuple[int, int]]:
+        """
+        Stream ledger entries into the shard, yielding each chunk's ID range
+        as it commits. Payloads of the next chunk are encoded (and
+        AES-GCM encrypted, which releases the GIL) in a thread pool while
+        the current chunk is inserted with executemany.
+        
+        Memory use is bounded by two chunks regardless of input length.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        
+        iterator = iter(entries)
+        with ThreadPoolExecutor(max_workers=max(1, encrypt_workers),
+                                thread_name_prefix=f"shard-{self.tenant_id}-enc") as pool:
+            prepared = None
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if chunk:
+                    futures = [pool.submit(self._encode_payload, entry[1]) for entry in chunk]
+                if prepared is not None:
+                    yield self._insert_chunk(*prepared)
+                if not chunk:
+                    break
+                prepared = (chunk, futures)
+    
+    def _insert_chunk(self, chunk: List[Tuple], futures: List[Future]) -> Tuple[int, int]:
+        """Insert one encoded chunk in a single transaction."""
+        rows = []
+        for entry, future in zip(chunk, futures):
+            if len(entry) not in (2, 3):
+                raise ValueError(f"Ledger entry must be (entry_type, payload[, signature]), got {len(entry)} fields")
+            rows.append((
+                datetime.now(timezone.utc).isoformat(),
+                entry[0],
+                future.result(),
+                entry[2] if len(entry) == 3 else None,
+            ))
+        
+        with self.transaction() as cursor:
+            cursor.executemany("""
+                INSERT INTO ledger (timestamp, entry_type, payload, signature)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            # AUTOINCREMENT ids are contiguous under the writer lock
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+        
+        self._stats["bulk_rows"] += len(rows)
+        return (last_id - len(rows) + 1, last_id)
+    
     def read_ledger(self, entry_id: int = None, entry_type: str = None, limit: int = 100) -> List[Dict]:
         """
         Read ledger entries.
@@ -522,30 +727,81 @@ class TenantShard:
             
             rows = cursor.fetchall()
         
-        entries = []
-        for row in rows:
-            entry = {
-                "id": row[0],
-                "timestamp": row[1],
-                "entry_type": row[2],
-                "signature": row[4],
-                "created_at": row[5],
-            }
+        return [self._decode_row(row) for row in rows]
+    
+    def iter_ledger(
+        self,
+        entry_type: str = None,
+        after_id: Optional[int] = None,
+        reverse: bool = False,
+        page_size: int = ITER_PAGE_SIZE,
+    ) -> Iterator[Dict]:
+        """
+        Stream ledger entries in id order using keyset pagination.
+        
+        Each page is a separate short read (WHERE id > last_seen LIMIT n),
+        so no cursor is held between pages and the cost per page does not
+        grow with the position in the ledger.
+        
+        Args:
+            entry_type: Filter by type (optional)
+            after_id: Start after this id (before it when reverse=True)
+            reverse: Newest first
+            page_size: Rows fetched per query
+        """
+        op, order = ("<", "DESC") if reverse else (">", "ASC")
+        last_seen = after_id
+        
+        while True:
+            clauses, params = [], []
+            if last_seen is not None:
+                clauses.append(f"id {op} ?")
+                params.append(last_seen)
+            if entry_type:
+                clauses.append("entry_type = ?")
+                params.append(entry_type)
+            where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
             
-            # Decrypt payload if encrypted
-            payload_bytes = row[3]
-            if self._encryption:
-                try:
-                    entry["payload"] = self._encryption.decrypt_value(payload_bytes)
-                except ValueError:
-                    entry["payload"] = None
-                    entry["decryption_error"] = True
-            else:
-                entry["payload"] = json.loads(payload_bytes.decode('utf-8'))
+            with self.read_cursor() as cursor:
+                cursor.execute(f"SELECT * FROM ledger {where}ORDER BY id {order} LIMIT ?",
+                               (*params, page_size))
+                rows = cursor.fetchall()
             
-            entries.append(entry)
+            for row in rows:
+                yield self._decode_row(row)
+            
+            if len(rows) < page_size:
+                return
+            last_seen = rows[-1][0]
+    
+    def _encode_payload(self, payload: Any) -> bytes:
+        """Serialize (and encrypt, if enabled) a payload."""
+        if self._encryption:
+            return self._encryption.encrypt_value(payload)
+        return json.dumps(payload).encode('utf-8')
+    
+    def _decode_row(self, row: Tuple) -> Dict:
+        """Convert a ledger row into an entry dict, decrypting the payload."""
+        entry = {
+            "id": row[0],
+            "timestamp": row[1],
+            "entry_type": row[2],
+            "signature": row[4],
+            "created_at": row[5],
+        }
+        
+        # Decrypt payload if encrypted
+        payload_bytes = row[3]
+        if self._encryption:
+            try:
+                entry["payload"] = self._encryption.decrypt_value(payload_bytes)
+            except ValueError:
+                entry["payload"] = None
+                entry["decryption_error"] = True
+        else:
+            entry["payload"] = json.loads(payload_bytes.decode('utf-8'))
         
-        return entries
+        return entry
     
     def set_config(self, key: str, value: Any):
         """Set a configuration value."""
@@ -581,6 +837,7 @@ class TenantShard:
         """Get shard statistics."""
         stats = dict(self._stats)
         stats["state"] = self.state.value
+        stats["read_connections"] = self._reader_count
         stats["path"] = str(self.config.shard_path)
         stats["encrypted"] = self._encryption is not None
         
@@ -622,29 +879,52 @@ class ShardManager:
     - Each tenant gets exactly one shard
     - Shards are properly isolated (INV-DATA-003)
     - Shards can be opened/closed on demand
+    - At most max_open_shards shards are open (LRU eviction)
+    - Shards idle for idle_timeout_s are closed (WAL checkpointed)
     - Automatic cleanup on shutdown
     
+    Evicted shards are closed. Shards with an open transaction or read
+    cursor are never evicted; use_shard() pins the shard under the
+    manager lock so it cannot be evicted between lookup and use. A
+    handle from get_shard() is unpinned and may be closed by another
+    thread's eviction before it is used.
+    
     Usage:
         manager = ShardManager(base_dir="/data/shards")
         
-        shard = manager.get_shard("tenant-001")
-        shard.write_ledger("transaction", {"amount": 100})
+        with manager.use_shard("tenant-001") as shard:
+            shard.write_ledger("transaction", {"amount": 100})
         
         manager.close_all()
     """
     
+    IDLE_SWEEP_INTERVAL_S = 5.0
+    
     def __init__(
         self,
         base_dir: str = "/tmp/chainbridge_shards",
         use_encryption: bool = True,
         log_dir: str = None,
+        max_open_shards: int = 1024,
+        idle_timeout_s: Optional[float] = 300.0,
+        read_pool_size: int = 4,
     ):
         self.base_dir = Path(base_dir)
         self.use_encryption = use_encryption
         self.log_dir = Path(log_dir) if log_dir else self.base_dir / "logs"
+        self.max_open_shards = max_open_shards
+        self.idle_timeout_s = idle_timeout_s
+        self.read_pool_size = read_pool_size
         
-        self._shards: Dict[str, TenantShard] = {}
+        # Open shards, least recently used first
+        self._shards: OrderedDict[str, TenantShard] = OrderedDict()
         self._lock = threading.RLock()
+        self._last_idle_sweep = time.monotonic()
+        
+        # Cache statistics
+        self._evictions = 0
+        self._idle_evictions = 0
+        self._manager_lock_wait_ms = 0.0
         
         # Initialize directories
         self.base_dir.mkdir(parents=True, exist_ok=True)
@@ -666,37 +946,116 @@ class ShardManager:
         Raises:
             ValueError: If shard doesn't exist and create=False
         """
+        start = time.perf_counter()
         with self._lock:
-            # Return existing shard
-            if tenant_id in self._shards:
-                shard = self._shards[tenant_id]
-                if shard.state != ShardState.OPEN:
-                    shard.open(create=create)
-                return shard
-            
-            # Create new shard
-            config = ShardConfig(
-                tenant_id=tenant_id,
-                data_dir=self.base_dir / tenant_id,
-                use_encryption=self.use_encryption,
-            )
-            
-            shard = TenantShard(config)
-            
-            if not shard.open(create=create):
-                if not create:
-                    raise ValueError(f"Shard not found for tenant {tenant_id}")
-                raise RuntimeError(f"Failed to create shard for tenant {tenant_id}")
-            
-            self._shards[tenant_id] = shard
-            
-            # Log shard creation
-            self._log_event("SHARD_OPENED", tenant_id, {
-                "path": str(config.shard_path),
-                "encrypted": self.use_encryption,
-            })
-            
+            self._manager_lock_wait_ms += (time.perf_counter() - start) * 1000
+            return self._get_shard_locked(tenant_id, create)
+    
+    @contextmanager
+    def use_shard(self, tenant_id: str, create: bool = True):
+        """
+        Context manager yielding an open shard that stays pinned (and so
+        cannot be evicted) until the block exits.
+        
+        Usage:
+            with manager.use_shard("tenant-001") as shard:
+                shard.write_ledger("transaction", {"amount": 100})
+        """
+        start = time.perf_counter()
+        with self._lock:
+            self._manager_lock_wait_ms += (time.perf_counter() - start) * 1000
+            shard = self._get_shard_locked(tenant_id, create)
+            shard._touch(+1)
+        try:
+            yield shard
+        finally:
+            shard._touch(-1)
+    
+    def _get_shard_locked(self, tenant_id: str, create: bool) -> TenantShard:
+        """Look up, reopen or create a shard (caller holds self._lock)."""
+        if time.monotonic() - self._last_idle_sweep >= self.IDLE_SWEEP_INTERVAL_S:
+            self.evict_idle()
+        
+        # Return existing shard
+        if tenant_id in self._shards:
+            shard = self._shards[tenant_id]
+            self._shards.move_to_end(tenant_id)
+            if shard.state != ShardState.OPEN:
+                shard.open(create=create)
+            shard.last_used = time.monotonic()
             return shard
+        
+        # Create new shard
+        config = ShardConfig(
+            tenant_id=tenant_id,
+            data_dir=self.base_dir / tenant_id,
+            use_encryption=self.use_encryption,
+            read_pool_size=self.read_pool_size,
+        )
+        
+        shard = TenantShard(config)
+        
+        if not shard.open(create=create):
+            if not create:
+                raise ValueError(f"Shard not found for tenant {tenant_id}")
+            raise RuntimeError(f"Failed to create shard for tenant {tenant_id}")
+        
+        self._shards[tenant_id] = shard
+        
+        # Log shard creation
+        self._log_event("SHARD_OPENED", tenant_id, {
+            "path": str(config.shard_path),
+            "encrypted": self.use_encryption,
+        })
+        
+        self._evict_over_capacity()
+        
+        return shard
+    
+    def _evict_over_capacity(self):
+        """Close least recently used idle shards beyond max_open_shards."""
+        excess = len(self._shards) - self.max_open_shards
+        if excess <= 0:
+            return
+        
+        # Never evict the most recently used shard (just handed out)
+        for tenant_id in list(self._shards.keys())[:-1]:
+            if excess <= 0:
+                break
+            if self._shards[tenant_id].is_busy:
+                continue
+            self._evict(tenant_id, "lru")
+            self._evictions += 1
+            excess -= 1
+    
+    def evict_idle(self, idle_timeout_s: Optional[float] = None) -> int:
+        """
+        Close shards not used for idle_timeout_s seconds.
+        
+        Returns:
+            Number of shards closed
+        """
+        timeout = self.idle_timeout_s if idle_timeout_s is None else idle_timeout_s
+        if timeout is None:
+            return 0
+        
+        with self._lock:
+            self._last_idle_sweep = time.monotonic()
+            cutoff = self._last_idle_sweep - timeout
+            idle = [
+                tenant_id for tenant_id, shard in self._shards.items()
+                if shard.last_used <= cutoff and not shard.is_busy
+            ]
+            for tenant_id in idle:
+                self._evict(tenant_id, "idle")
+            self._idle_evictions += len(idle)
+            return len(idle)
+    
+    def _evict(self, tenant_id: str, reason: str):
+        """Close a cached shard (close() checkpoints the WAL)."""
+        shard = self._shards.pop(tenant_id)
+        shard.close()
+        logger.debug(f"[SHARD_MANAGER] Evicted {tenant_id} ({reason})")
     
     def close_shard(self, tenant_id: str):
         """Close a specific tenant's shard."""
@@ -800,10 +1159,17 @@ class ShardManager:
         with self._lock:
             total = {
                 "shard_count": len(self._shards),
+                "open_shards": len(self._shards),
+                "max_open_shards": self.max_open_shards,
+                "evictions": self._evictions,
+                "idle_evictions": self._idle_evictions,
+                "manager_lock_wait_ms": self._manager_lock_wait_ms,
                 "total_size_bytes": 0,
                 "total_reads": 0,
                 "total_writes": 0,
                 "total_errors": 0,
+                "total_lock_wait_ms": 0.0,
+                "total_read_wait_ms": 0.0,
             }
             
             for shard in self._shards.values():
@@ -812,6 +1178,8 @@ class ShardManager:
                 total["total_writes"] += stats.get("writes", 0)
                 total["total_errors"] += stats.get("errors", 0)
                 total["total_size_bytes"] += stats.get("size_bytes", 0)
+                total["total_lock_wait_ms"] += stats.get("lock_wait_ms", 0.0)
+                total["total_read_wait_ms"] += stats.get("read_wait_ms", 0.0)
             
             return total
 
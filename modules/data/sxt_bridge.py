@@ -23,6 +23,9 @@ ARCHITECTURE:
                             │  (ZK Verified)   │
                             └──────────────────┘
 
+Queued anchors are journaled to SQLite (SxTConfig.journal_path) and
+replayed after a restart.
+
 INVARIANTS:
   INV-DATA-005 (Ledger Mirroring): Every finalized tx MUST have SxT record
   INV-DATA-006 (Proof Finality): SxT Record is ultimate arbiter of history
@@ -39,8 +42,10 @@ import queue
 import hashlib
 import logging
 import secrets
+import sqlite3
 import threading
 import uuid
+from collections import OrderedDict
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -100,14 +105,21 @@ class SxTConfig:
     namespace: str = "chainbridge"
     
     # Performance settings
-    batch_size: int = 100
-    flush_interval_ms: int = 1000
+    batch_size: int = 100           # Max requests per batch_insert
+    flush_interval_ms: int = 1000   # Max wait for a batch to fill
     max_retry_attempts: int = 3
     retry_backoff_ms: int = 500
     
     # Queue settings
     queue_max_size: int = 10000
-    worker_count: int = 2
+    worker_count: int = 2           # Max batches in flight on the anchor loop
+    
+    # Durable journal (None = in-memory only, queued anchors lost on restart)
+    journal_path: Optional[str] = None
+    
+    # Retention of finished requests (memory and journal)
+    completed_ttl_s: float = 3600.0
+    completed_max_entries: int = 10000
     
     # Signing key (Ed25519)
     signing_key_path: Optional[str] = None
@@ -147,6 +159,7 @@ class AnchorRequest:
     attempts: int = 0
     last_error: Optional[str] = None
     proof_id: Optional[str] = None
+    finished_at: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -158,6 +171,7 @@ class AnchorRequest:
             "attempts": self.attempts,
             "last_error": self.last_error,
             "proof_id": self.proof_id,
+            "finished_at": self.finished_at,
         }
 
 
@@ -242,6 +256,10 @@ class MockSxTClient(SxTClientBase):
         # Simulate network latency
         await asyncio.sleep(self.insert_latency_ms / 1000.0)
         
+        return (True, self._store(schema), None)
+    
+    def _store(self, schema: TransactionSchema) -> str:
+        """Store a record and its mock proof, returning the proof_id."""
         with self._lock:
             # Store the record
             self.records[schema.tx_id] = schema
@@ -265,18 +283,18 @@ class MockSxTClient(SxTClientBase):
             self.proofs[schema.tx_id] = proof
             
             logger.debug(f"[MockSxT] Inserted tx={schema.tx_id}, proof={proof_id}")
-            return (True, proof_id, None)
+            return proof_id
     
     async def batch_insert(
         self, 
         schemas: List[TransactionSchema]
     ) -> List[Tuple[str, bool, Optional[str]]]:
-        """Mock batch insert."""
-        results = []
-        for schema in schemas:
-            success, proof_id, error = await self.insert_transaction(schema)
-            results.append((schema.tx_id, success, proof_id))
-        return results
+        """Mock batch insert (one simulated round trip for the whole batch)."""
+        import asyncio
+        
+        await asyncio.sleep(self.insert_latency_ms / 1000.0)
+        
+        return [(schema.tx_id, True, self._store(schema)) for schema in schemas]
     
     async def get_proof(self, tx_id: str) -> Optional[ProofReceipt]:
         """Get mock proof."""
@@ -366,13 +384,72 @@ class LiveSxTClient(SxTClientBase):
         self, 
         schemas: List[TransactionSchema]
     ) -> List[Tuple[str, bool, Optional[str]]]:
-        """Batch insert via SxT API."""
-        # SxT supports batch operations via SQL
-        results = []
-        for schema in schemas:
-            success, proof_id, error = await self.insert_transaction(schema)
-            results.append((schema.tx_id, success, proof_id))
-        return results
+        """
+        Batch insert via SxT API (one multi-row INSERT per batch).
+        
+        Transport and HTTP errors mark every row as not inserted.
+        
+        Raises:
+            ValueError: If SxT accepts the batch but does not return a
+                proof id for every row
+        """
+        if not schemas:
+            return []
+        
+        session = await self._get_session()
+        
+        url = f"{self.config.api_endpoint}/sql/dml"
+        
+        # Build one multi-row INSERT with per-row parameter names
+        columns = list(schemas[0].to_dict().keys())
+        parameters: Dict[str, Any] = {}
+        rows = []
+        for row, schema in enumerate(schemas):
+            data = schema.to_dict()
+            rows.append("(" + ", ".join(f":{k}_{row}" for k in columns) + ")")
+            parameters.update({f"{k}_{row}": data[k] for k in columns})
+        
+        sql = f"""
+            INSERT INTO {self.config.namespace}.chainbridge_transactions 
+            ({", ".join(columns)}) VALUES {", ".join(rows)}
+        """
+        
+        payload = {
+            "resourceId": f"{self.config.namespace}.chainbridge_transactions",
+            "sqlText": sql,
+            "parameters": parameters,
+        }
+        
+        result = None
+        try:
+            async with session.post(url, json=payload) as resp:
+                if resp.status == 200:
+                    result = await resp.json()
+                else:
+                    error = await resp.text()
+                    logger.error(f"SxT batch insert failed: {resp.status} - {error}")
+        except Exception:
+            logger.exception("SxT batch insert exception")
+        
+        if result is None:
+            return [(schema.tx_id, False, None) for schema in schemas]
+        
+        # One proof per row, or a single proof covering the whole statement
+        proof_ids = result.get("proofIds")
+        if proof_ids is None and result.get("proofId") is not None:
+            proof_ids = [result["proofId"]] * len(schemas)
+        if (
+            not isinstance(proof_ids, list)
+            or len(proof_ids) != len(schemas)
+            or any(proof_id is None for proof_id in proof_ids)
+        ):
+            raise ValueError(
+                f"SxT batch insert returned no proof id for some of {len(schemas)} rows: {proof_ids!r}"
+            )
+        return [
+            (schema.tx_id, True, proof_id)
+            for schema, proof_id in zip(schemas, proof_ids)
+        ]
     
     async def get_proof(self, tx_id: str) -> Optional[ProofReceipt]:
         """Get proof from SxT."""
@@ -426,6 +503,202 @@ class LiveSxTClient(SxTClientBase):
             self._session = None
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# ANCHOR JOURNAL (DURABLE QUEUE)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class AnchorJournal:
+    """
+    Durable record of anchor request state transitions (SQLite, WAL mode).
+    
+    Every enqueued request is written before it is queued; batch results
+    are written in one transaction before completion callbacks fire. On
+    restart, requests that never reached ANCHORED or FAILED are replayed.
+    Delivery is at-least-once: a request in flight at a crash is resent.
+    
+    Finished rows are expired by age (completed_ttl_s) and count
+    (completed_max_entries) so the journal does not grow without bound.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS anchor_requests (
+            request_id TEXT PRIMARY KEY,
+            tenant_id TEXT NOT NULL,
+            tx_data TEXT NOT NULL,
+            state TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            proof_id TEXT,
+            finished_at REAL
+        );
+        
+        CREATE INDEX IF NOT EXISTS idx_anchor_state ON anchor_requests(state);
+        CREATE INDEX IF NOT EXISTS idx_anchor_finished ON anchor_requests(finished_at);
+    """
+    
+    TERMINAL_STATES = (AnchorState.ANCHORED.value, AnchorState.FAILED.value)
+    
+    def __init__(self, path: Union[str, Path], synchronous: str = "NORMAL"):
+        """
+        Initialize the journal.
+        
+        Args:
+            path: SQLite database file
+            synchronous: SQLite synchronous pragma. NORMAL survives process
+                crashes; FULL also survives power loss at higher enqueue cost.
+        """
+        self.path = Path(path)
+        self.synchronous = synchronous
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        
+        # Statistics
+        self._stats = {
+            "writes": 0,
+            "replayed": 0,
+            "expired": 0,
+        }
+    
+    @property
+    def is_open(self) -> bool:
+        return self._conn is not None
+    
+    def open(self):
+        """Open (creating if needed) the journal database."""
+        with self._lock:
+            if self._conn is not None:
+                return
+            
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path),
+                check_same_thread=False,  # We manage our own locking
+                isolation_level=None,  # Autocommit for explicit transaction control
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            self._conn.executescript(self.SCHEMA)
+    
+    def close(self):
+        """Checkpoint the WAL and close the journal."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                self._conn.close()
+                self._conn = None
+    
+    def record_enqueued(self, request: AnchorRequest):
+        """Write a newly enqueued (or rejected) request."""
+        row = (
+            request.request_id,
+            request.tenant_id,
+            json.dumps(request.tx_data, sort_keys=True, default=str),
+            request.state.value,
+            request.created_at,
+            request.attempts,
+            request.last_error,
+            request.proof_id,
+            request.finished_at,
+        )
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO anchor_requests VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._stats["writes"] += 1
+    
+    def record_transitions(self, requests: List[AnchorRequest]):
+        """Write the current state of several requests in one transaction."""
+        if not requests:
+            return
+        rows = [
+            (r.state.value, r.attempts, r.last_error, r.proof_id, r.finished_at, r.request_id)
+            for r in requests
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "UPDATE anchor_requests SET state = ?, attempts = ?, last_error = ?, "
+                    "proof_id = ?, finished_at = ? WHERE request_id = ?",
+                    rows,
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._stats["writes"] += 1
+    
+    def unacknowledged(self) -> List[AnchorRequest]:
+        """Requests that never reached a terminal state, oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM anchor_requests WHERE state NOT IN (?, ?) ORDER BY created_at",
+                self.TERMINAL_STATES,
+            ).fetchall()
+        requests = [self._from_row(row) for row in rows]
+        self._stats["replayed"] += len(requests)
+        return requests
+    
+    def get(self, request_id: str) -> Optional[AnchorRequest]:
+        """Look up a request by id."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM anchor_requests WHERE request_id = ?", (request_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+    
+    def expire(self, ttl_s: float, max_entries: int) -> int:
+        """
+        Delete finished requests older than ttl_s, then the oldest finished
+        requests beyond max_entries. Unfinished requests are never expired.
+        
+        Returns:
+            Number of rows deleted
+        """
+        cutoff = time.time() - ttl_s
+        with self._lock:
+            deleted = self._conn.execute(
+                "DELETE FROM anchor_requests WHERE state IN (?, ?) AND finished_at < ?",
+                (*self.TERMINAL_STATES, cutoff),
+            ).rowcount
+            deleted += self._conn.execute(
+                "DELETE FROM anchor_requests WHERE request_id IN ("
+                "  SELECT request_id FROM anchor_requests WHERE state IN (?, ?)"
+                "  ORDER BY finished_at DESC LIMIT -1 OFFSET ?)",
+                (*self.TERMINAL_STATES, max_entries),
+            ).rowcount
+            self._stats["expired"] += deleted
+        return deleted
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get journal statistics, including row counts by state."""
+        with self._lock:
+            counts = dict(self._conn.execute(
+                "SELECT state, COUNT(*) FROM anchor_requests GROUP BY state"
+            ).fetchall()) if self._conn else {}
+        return {**self._stats, "rows": counts}
+    
+    @staticmethod
+    def _from_row(row: Tuple) -> AnchorRequest:
+        request_id, tenant_id, tx_data, state, created_at, attempts, last_error, proof_id, finished_at = row
+        return AnchorRequest(
+            request_id=request_id,
+            tenant_id=tenant_id,
+            tx_data=json.loads(tx_data),
+            state=AnchorState(state),
+            created_at=created_at,
+            attempts=attempts,
+            last_error=last_error,
+            proof_id=proof_id,
+            finished_at=finished_at,
+        )
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # ASYNC ANCHOR WORKER (PRODUCER/CONSUMER)
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -435,33 +708,53 @@ class AsyncAnchor:
     Asynchronous anchoring worker using producer/consumer pattern.
     
     Transactions are queued for anchoring without blocking the main
-    settlement thread. Workers process the queue in batches.
+    settlement thread. A single long-lived event loop micro-batches the
+    queue: it drains up to batch_size requests (waiting at most
+    flush_interval_ms for a batch to fill) and submits each batch with
+    one batch_insert call. Up to worker_count batches are in flight at
+    once. Failed requests are retried individually with backoff.
+    
+    With a journal (config.journal_path), every state transition is
+    persisted and unfinished requests are replayed on start(). Finished
+    requests are kept for completed_ttl_s / completed_max_entries.
     
     GOAL: <50ms overhead on main thread.
     """
     
+    JOURNAL_EXPIRE_INTERVAL_S = 1.0
+    
     def __init__(
         self, 
         config: SxTConfig,
         client: Optional[SxTClientBase] = None,
         on_anchor_complete: Optional[Callable[[AnchorRequest], None]] = None,
+        journal: Optional[AnchorJournal] = None,
     ):
         self.config = config
         self.client = client or MockSxTClient(config)
         self.on_anchor_complete = on_anchor_complete
         
+        # Durable journal
+        if journal is None and config.journal_path:
+            journal = AnchorJournal(config.journal_path)
+        self.journal = journal
+        if self.journal is not None:
+            self.journal.open()  # Requests enqueued before start() are journaled too
+        self._last_expire = 0.0
+        
         # Task queue
         self._queue: queue.Queue[AnchorRequest] = queue.Queue(
             maxsize=config.queue_max_size
         )
         
-        # Tracking
+        # Tracking (finished requests in finish order, bounded)
         self._pending: Dict[str, AnchorRequest] = {}
-        self._completed: Dict[str, AnchorRequest] = {}
-        self._failed: Dict[str, AnchorRequest] = {}
+        self._completed: OrderedDict[str, AnchorRequest] = OrderedDict()
+        self._failed: OrderedDict[str, AnchorRequest] = OrderedDict()
         
-        # Worker threads
+        # Event loop thread (one loop for the client's whole lifetime)
         self._workers: List[threading.Thread] = []
+        self._loop = None
         self._running = False
         self._lock = threading.Lock()
         
@@ -471,6 +764,19 @@ class AsyncAnchor:
             "anchored": 0,
             "failed": 0,
             "total_latency_ms": 0.0,
+            # Batching
+            "batches": 0,
+            "batched_requests": 0,
+            "max_batch_size": 0,
+            "inflight_batches": 0,
+            # Retries / backpressure
+            "retried": 0,
+            "rejected": 0,
+            "queue_high_watermark": 0,
+            # Journal / retention
+            "replayed": 0,
+            "expired": 0,
+            "journal_errors": 0,
         }
         
         # PII Hasher
@@ -480,41 +786,78 @@ class AsyncAnchor:
             self._pii_hasher = None
     
     def start(self):
-        """Start the worker threads."""
+        """Start the anchoring event loop thread."""
         if self._running:
             return
         
         self._running = True
         
-        for i in range(self.config.worker_count):
-            worker = threading.Thread(
-                target=self._worker_loop,
-                name=f"SxTAnchor-{i}",
-                daemon=True,
-            )
-            worker.start()
-            self._workers.append(worker)
+        if self.journal is not None:
+            self.journal.open()
+            self._replay()
         
-        logger.info(f"AsyncAnchor started with {self.config.worker_count} workers")
+        worker = threading.Thread(
+            target=self._worker_loop,
+            name="SxTAnchor-loop",
+            daemon=True,
+        )
+        worker.start()
+        self._workers.append(worker)
+        
+        logger.info(
+            f"AsyncAnchor started (batch_size={self.config.batch_size}, "
+            f"max_inflight={self.config.worker_count})"
+        )
     
     def stop(self, timeout: float = 5.0):
-        """Stop all worker threads."""
+        """Stop the event loop after in-flight batches complete."""
         self._running = False
         
-        # Signal workers to stop
-        for _ in self._workers:
-            try:
-                self._queue.put_nowait(None)  # Poison pill
-            except queue.Full:
-                pass
+        # Wake the collector
+        try:
+            self._queue.put_nowait(None)  # Poison pill
+        except queue.Full:
+            pass
         
-        # Wait for workers
+        # Wait for the loop thread
         for worker in self._workers:
             worker.join(timeout=timeout)
         
+        stopped = not any(worker.is_alive() for worker in self._workers)
         self._workers.clear()
+        
+        # Unfinished requests stay in the journal for replay on next start
+        if self.journal is not None and stopped:
+            self.journal.close()
+        
         logger.info("AsyncAnchor stopped")
     
+    def _replay(self):
+        """Re-queue requests the journal holds as unfinished."""
+        replayed = 0
+        for request in self.journal.unacknowledged():
+            with self._lock:
+                known = self._pending.get(request.request_id)
+            if known is not None:
+                if known.state == AnchorState.QUEUED:
+                    continue  # Still on the queue (enqueued before start)
+                request = known  # Retry timer died with a previous loop
+            request.state = AnchorState.QUEUED
+            try:
+                self._queue.put_nowait(request)
+            except queue.Full:
+                # Stays unfinished in the journal; replayed on a later start
+                logger.warning("Anchor queue full during replay; deferring remaining requests")
+                break
+            with self._lock:
+                self._pending[request.request_id] = request
+            replayed += 1
+        
+        if replayed:
+            with self._lock:
+                self.metrics["replayed"] += replayed
+            logger.info(f"AsyncAnchor replayed {replayed} unfinished requests from journal")
+    
     def enqueue(
         self, 
         tenant_id: str, 
@@ -540,24 +883,34 @@ class AsyncAnchor:
             request_id=request_id,
             tenant_id=tenant_id,
             tx_data=tx_data,
-            state=AnchorState.PENDING,
+            state=AnchorState.QUEUED,
         )
         
+        # Track (and journal) before queueing so a fast batch cannot complete it first
+        with self._lock:
+            self._pending[request_id] = request
+        self._journal_enqueued(request)
+        
         try:
             self._queue.put_nowait(request)
-            request.state = AnchorState.QUEUED
             
             with self._lock:
-                self._pending[request_id] = request
                 self.metrics["queued"] += 1
-            
+                depth = self._queue.qsize()
+                if depth > self.metrics["queue_high_watermark"]:
+                    self.metrics["queue_high_watermark"] = depth
+        
         except queue.Full:
             logger.error("Anchor queue full! Transaction may not be anchored.")
             request.state = AnchorState.FAILED
             request.last_error = "Queue full"
+            request.finished_at = time.time()
+            self._journal_transitions([request])
             with self._lock:
-                self._failed[request_id] = request
+                self._pending.pop(request_id, None)
+                self._retain(self._failed, request)
                 self.metrics["failed"] += 1
+                self.metrics["rejected"] += 1
         
         elapsed_ms = (time.perf_counter() - start) * 1000
         logger.debug(f"Enqueue completed in {elapsed_ms:.2f}ms")
@@ -573,104 +926,284 @@ class AsyncAnchor:
                 return self._completed[request_id]
             if request_id in self._failed:
                 return self._failed[request_id]
+        if self.journal is not None and self.journal.is_open:
+            return self.journal.get(request_id)
         return None
     
+    def get_backpressure(self) -> Dict[str, Any]:
+        """Get queue depth and batching pressure indicators."""
+        with self._lock:
+            return {
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self.config.queue_max_size,
+                "queue_high_watermark": self.metrics["queue_high_watermark"],
+                "inflight_batches": self.metrics["inflight_batches"],
+                "max_inflight_batches": self.config.worker_count,
+                "rejected": self.metrics["rejected"],
+                "avg_batch_size": (
+                    self.metrics["batched_requests"] / max(1, self.metrics["batches"])
+                ),
+            }
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # EVENT LOOP
+    # ──────────────────────────────────────────────────────────────────────────
+    
     def _worker_loop(self):
-        """Main worker loop (runs in thread)."""
+        """Event loop thread entry point."""
         import asyncio
         
-        # Each worker gets its own event loop
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
+        self._loop = loop
         
         try:
+            loop.run_until_complete(self._collect())
+        except Exception as e:
+            logger.exception(f"Anchor loop error: {e}")
+        finally:
+            self._loop = None
+            loop.close()
+    
+    async def _collect(self):
+        """Drain the queue into batches and dispatch them."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max(1, self.config.worker_count))
+        inflight = set()
+        
+        # Blocking queue reads happen off the loop so batches keep progressing
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="SxTAnchor-drain") as drain:
             while self._running:
+                await slots.acquire()
+                batch = await loop.run_in_executor(drain, self._drain_batch)
+                
+                if not batch:
+                    slots.release()
+                    continue
+                
+                task = loop.create_task(self._process_batch(batch))
+                inflight.add(task)
+                
+                def _done(t, _task=task):
+                    inflight.discard(_task)
+                    slots.release()
+                
+                task.add_done_callback(_done)
+            
+            if inflight:
+                await asyncio.gather(*inflight, return_exceptions=True)
+    
+    def _drain_batch(self) -> List[AnchorRequest]:
+        """
+        Collect up to batch_size requests (runs in the drain thread).
+        
+        Blocks briefly for the first request, then waits at most
+        flush_interval_ms for the batch to fill.
+        """
+        try:
+            first = self._queue.get(timeout=0.1)
+        except queue.Empty:
+            return []
+        if first is None:  # Poison pill
+            return []
+        
+        batch = [first]
+        deadline = time.monotonic() + self.config.flush_interval_ms / 1000.0
+        
+        while len(batch) < self.config.batch_size:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._running:
+                    break
                 try:
-                    # Get from queue with timeout
-                    request = self._queue.get(timeout=0.1)
-                    
-                    if request is None:  # Poison pill
-                        break
-                    
-                    # Process the request
-                    loop.run_until_complete(self._process_request(request))
-                    
+                    request = self._queue.get(timeout=remaining)
                 except queue.Empty:
-                    continue
-                except Exception as e:
-                    logger.exception(f"Worker error: {e}")
-        finally:
-            loop.close()
+                    break
+            if request is None:  # Poison pill
+                break
+            batch.append(request)
+        
+        return batch
     
-    async def _process_request(self, request: AnchorRequest):
-        """Process a single anchor request."""
+    async def _process_batch(self, batch: List[AnchorRequest]):
+        """Anchor a batch of requests with a single batch_insert call."""
         start = time.perf_counter()
-        request.state = AnchorState.SENDING
-        request.attempts += 1
+        
+        with self._lock:
+            self.metrics["batches"] += 1
+            self.metrics["batched_requests"] += len(batch)
+            self.metrics["max_batch_size"] = max(self.metrics["max_batch_size"], len(batch))
+            self.metrics["inflight_batches"] += 1
+        
+        # Build schemas; a request that cannot be built fails on its own
+        sendable: List[AnchorRequest] = []
+        schemas: List[TransactionSchema] = []
+        settled: List[AnchorRequest] = []
+        for request in batch:
+            request.state = AnchorState.SENDING
+            request.attempts += 1
+            try:
+                schemas.append(self._build_schema(request))
+                sendable.append(request)
+            except Exception as e:
+                logger.exception(f"Anchor processing error: {e}")
+                self._settle(request, AnchorState.FAILED, error=str(e))
+                settled.append(request)
         
         try:
-            # Build the schema
-            schema = self._build_schema(request)
-            
-            # Send to SxT
-            success, proof_id, error = await self.client.insert_transaction(schema)
-            
-            if success:
-                request.state = AnchorState.ANCHORED
-                request.proof_id = proof_id
+            if sendable:
+                try:
+                    results = await self.client.batch_insert(schemas)
+                    if len(results) != len(schemas):
+                        raise RuntimeError(
+                            f"batch_insert returned {len(results)} results for {len(schemas)} records"
+                        )
+                    batch_error = None
+                except Exception as e:
+                    logger.exception("Anchor batch error")
+                    results = [(schema.tx_id, False, None) for schema in schemas]
+                    batch_error = str(e)
                 
+                elapsed_ms = (time.perf_counter() - start) * 1000
                 with self._lock:
-                    self._pending.pop(request.request_id, None)
-                    self._completed[request.request_id] = request
-                    self.metrics["anchored"] += 1
-                
-                logger.info(f"Anchored tx={schema.tx_id}, proof={proof_id}")
+                    self.metrics["total_latency_ms"] += elapsed_ms * len(sendable)
                 
-            else:
-                # Retry logic
-                if request.attempts < self.config.max_retry_attempts:
-                    request.state = AnchorState.RETRYING
-                    request.last_error = error
-                    
-                    # Back off and re-queue
-                    await asyncio.sleep(
-                        self.config.retry_backoff_ms / 1000.0 * request.attempts
-                    )
-                    self._queue.put_nowait(request)
-                    
-                else:
-                    # Max retries exceeded
-                    request.state = AnchorState.FAILED
-                    request.last_error = error
-                    
-                    with self._lock:
-                        self._pending.pop(request.request_id, None)
-                        self._failed[request.request_id] = request
-                        self.metrics["failed"] += 1
-                    
-                    logger.error(f"Anchor failed after {request.attempts} attempts: {error}")
+                for request, (tx_id, success, proof_id) in zip(sendable, results):
+                    if success:
+                        request.proof_id = proof_id
+                        self._settle(request, AnchorState.ANCHORED)
+                        logger.debug(f"Anchored tx={tx_id}, proof={proof_id}")
+                    else:
+                        self._plan_retry(request, batch_error or f"SxT rejected tx={tx_id}")
+                    settled.append(request)
             
-        except Exception as e:
-            logger.exception(f"Anchor processing error: {e}")
-            request.state = AnchorState.FAILED
-            request.last_error = str(e)
+            # One journal write for the whole batch, before any callback fires
+            self._journal_transitions(settled)
             
+            for request in settled:
+                if request.state == AnchorState.RETRYING:
+                    delay = self.config.retry_backoff_ms / 1000.0 * request.attempts
+                    self._loop.call_later(delay, self._requeue, request)
+                else:
+                    self._finish(request)
+            
+            self._maybe_expire()
+        finally:
+            with self._lock:
+                self.metrics["inflight_batches"] -= 1
+    
+    def _plan_retry(self, request: AnchorRequest, error: str):
+        """Mark one failed request for a backoff retry, or fail it for good."""
+        request.last_error = error
+        
+        if request.attempts >= self.config.max_retry_attempts or self._loop is None:
+            logger.error(f"Anchor failed after {request.attempts} attempts: {error}")
+            self._settle(request, AnchorState.FAILED, error=error)
+            return
+        
+        request.state = AnchorState.RETRYING
+        with self._lock:
+            self.metrics["retried"] += 1
+    
+    def _requeue(self, request: AnchorRequest):
+        """Put a retrying request back on the queue (runs on the loop)."""
+        try:
+            self._queue.put_nowait(request)
+            request.state = AnchorState.QUEUED
+        except queue.Full:
             with self._lock:
-                self._pending.pop(request.request_id, None)
-                self._failed[request.request_id] = request
+                self.metrics["rejected"] += 1
+            self._settle(request, AnchorState.FAILED, error="Queue full on retry")
+            self._journal_transitions([request])
+            self._finish(request)
+    
+    @staticmethod
+    def _settle(request: AnchorRequest, state: AnchorState, error: Optional[str] = None):
+        """Set a request's terminal state."""
+        request.state = state
+        request.finished_at = time.time()
+        if error is not None:
+            request.last_error = error
+    
+    def _finish(self, request: AnchorRequest):
+        """Retire a settled request and fire the completion callback."""
+        with self._lock:
+            self._pending.pop(request.request_id, None)
+            if request.state == AnchorState.ANCHORED:
+                self._retain(self._completed, request)
+                self.metrics["anchored"] += 1
+            else:
+                self._retain(self._failed, request)
                 self.metrics["failed"] += 1
         
-        finally:
-            elapsed_ms = (time.perf_counter() - start) * 1000
+        # Callback if provided
+        if self.on_anchor_complete:
+            try:
+                self.on_anchor_complete(request)
+            except Exception:
+                logger.exception("Anchor callback error")
+    
+    def _retain(self, finished: OrderedDict, request: AnchorRequest):
+        """Keep a finished request, evicting by count and TTL (caller holds _lock)."""
+        finished[request.request_id] = request
+        
+        while len(finished) > self.config.completed_max_entries:
+            finished.popitem(last=False)
+            self.metrics["expired"] += 1
+        
+        cutoff = time.time() - self.config.completed_ttl_s
+        while finished:
+            oldest = next(iter(finished.values()))
+            if (oldest.finished_at or 0.0) >= cutoff:
+                break
+            finished.popitem(last=False)
+            self.metrics["expired"] += 1
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # JOURNAL
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    def _journal_enqueued(self, request: AnchorRequest):
+        """Journal a new request (errors degrade to in-memory tracking)."""
+        if self.journal is None or not self.journal.is_open:
+            return
+        try:
+            self.journal.record_enqueued(request)
+        except sqlite3.Error as e:
+            logger.error(f"Anchor journal write failed: {e}")
             with self._lock:
-                self.metrics["total_latency_ms"] += elapsed_ms
-            
-            # Callback if provided
-            if self.on_anchor_complete:
-                try:
-                    self.on_anchor_complete(request)
-                except Exception:
-                    logger.exception("Anchor callback error")
+                self.metrics["journal_errors"] += 1
+    
+    def _journal_transitions(self, requests: List[AnchorRequest]):
+        """Journal state transitions for a group of requests."""
+        if self.journal is None or not self.journal.is_open or not requests:
+            return
+        try:
+            self.journal.record_transitions(requests)
+        except sqlite3.Error as e:
+            logger.error(f"Anchor journal write failed: {e}")
+            with self._lock:
+                self.metrics["journal_errors"] += 1
+    
+    def _maybe_expire(self):
+        """Expire finished journal rows at most once per interval."""
+        if self.journal is None or not self.journal.is_open:
+            return
+        now = time.monotonic()
+        if now - self._last_expire < self.JOURNAL_EXPIRE_INTERVAL_S:
+            return
+        self._last_expire = now
+        try:
+            self.journal.expire(self.config.completed_ttl_s, self.config.completed_max_entries)
+        except sqlite3.Error as e:
+            logger.error(f"Anchor journal expiry failed: {e}")
+            with self._lock:
+                self.metrics["journal_errors"] += 1
     
     def _build_schema(self, request: AnchorRequest) -> TransactionSchema:
         """Build TransactionSchema from raw tx_data with PII hashing."""
@@ -762,6 +1295,7 @@ class SxTBridge:
         """
         self.config = config or SxTConfig()
         self._signing_key = signing_key
+        self._node_id: Optional[str] = None     # Derived from signing_key on first sign
         
         # Create client
         if use_mock:
@@ -806,6 +1340,7 @@ class SxTBridge:
         tenant_id: str,
         tx_data: Dict[str, Any],
         callback: Optional[Callable[[AnchorRequest], None]] = None,
+        canonical: Optional[bytes] = None,
     ) -> str:
         """
         Anchor a transaction to SxT.
@@ -825,16 +1360,26 @@ class SxTBridge:
                 - state_root_after: Post-transaction state root
                 - ...other fields
             callback: Optional callback when anchoring completes
+            canonical: tx_data already serialized by canonical_bytes(),
+                if the caller has it; must encode tx_data exactly
             
         Returns:
             request_id for tracking
+            
+        Raises:
+            RuntimeError: If the bridge is not started
+            ValueError: If canonical does not encode tx_data
         """
         if not self._started:
             raise RuntimeError("SxTBridge not started. Call start() first.")
         
+        # Never sign bytes that say something other than tx_data
+        if canonical is not None and canonical != self.canonical_bytes(tx_data):
+            raise ValueError("canonical bytes do not encode tx_data")
+        
         # Sign the transaction if we have a key
         if self._signing_key and "node_signature" not in tx_data:
-            tx_data = self._sign_transaction(tx_data)
+            tx_data = self._sign_transaction(tx_data, canonical)
         
         # Enqueue for anchoring
         request_id = self._anchor.enqueue(tenant_id, tx_data)
@@ -854,6 +1399,7 @@ class SxTBridge:
         """Get anchoring metrics."""
         return {
             **self._anchor.metrics,
+            **self._anchor.get_backpressure(),
             "avg_latency_ms": (
                 self._anchor.metrics["total_latency_ms"] / 
                 max(1, self._anchor.metrics["anchored"])
@@ -884,29 +1430,43 @@ class SxTBridge:
         """Get the ZK-Proof for a transaction."""
         return await self._client.get_proof(tx_id)
     
-    def _sign_transaction(self, tx_data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def canonical_bytes(tx_data: Dict[str, Any]) -> bytes:
+        """Canonical encoding of transaction data, as signed by the bridge."""
+        return json.dumps(tx_data, sort_keys=True, separators=(',', ':')).encode()
+    
+    def _sign_transaction(
+        self,
+        tx_data: Dict[str, Any],
+        canonical: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
         """Sign transaction data with Ed25519 key."""
         if not CRYPTO_AVAILABLE or not self._signing_key:
             return tx_data
         
-        # Create canonical representation
-        canonical = json.dumps(tx_data, sort_keys=True, separators=(',', ':'))
-        
-        # Sign
-        signature = self._signing_key.sign(canonical.encode())
+        # Sign the canonical representation
+        if canonical is None:
+            canonical = self.canonical_bytes(tx_data)
+        signature = self._signing_key.sign(canonical)
         
         # Add signature
         tx_data = tx_data.copy()
         tx_data["node_signature"] = signature.hex()
-        tx_data["node_id"] = hashlib.sha256(
-            self._signing_key.public_key().public_bytes(
-                encoding=serialization.Encoding.Raw,
-                format=serialization.PublicFormat.Raw
-            )
-        ).hexdigest()[:16]
+        tx_data["node_id"] = self._get_node_id()
         
         return tx_data
     
+    def _get_node_id(self) -> str:
+        """Short node ID from the signing key's public key (computed once)."""
+        if self._node_id is None:
+            self._node_id = hashlib.sha256(
+                self._signing_key.public_key().public_bytes(
+                    encoding=serialization.Encoding.Raw,
+                    format=serialization.PublicFormat.Raw
+                )
+            ).hexdigest()[:16]
+        return self._node_id
+    
     def _on_anchor_complete(self, request: AnchorRequest):
         """Internal callback when anchor completes."""
         with self._lock:
@@ -952,6 +1512,7 @@ __all__ = [
     "AsyncAnchor",
     "AnchorRequest",
     "AnchorState",
+    "AnchorJournal",
     # Clients
     "SxTClientBase",
     "MockSxTClient",
@@ -13,7 +13,8 @@ The Asset Factory enables:
   - Native Asset creation (RWA, Stablecoins, Loyalty Points)
   - Controlled issuance (Only authorized entities can mint)
   - Compliance features (Freeze, Clawback)
-  - Supply conservation enforcement
+  - Supply conservation enforcement (O(1) per operation, with an
+    optional full-scan audit)
 
 INVARIANTS:
   INV-ECON-003 (Conservation of Supply): Total Supply = Sum(Balances)
@@ -322,12 +323,28 @@ class AssetFactory:
     INVARIANTS:
       INV-ECON-003: Total Supply = Sum(Balances)
       INV-ECON-004: Issuer can Freeze the Asset
+    
+    Every balance change goes through _credit/_debit, which maintain a
+    per-ticker running sum of balances and an index of holders with a
+    positive balance. INV-ECON-003 is then checked in O(1) per operation
+    against the running sum; audit_supply() re-derives the sums from
+    every account and can run periodically (audit_interval) or on demand.
     """
     
-    def __init__(self, registry: Optional[AssetRegistry] = None):
+    def __init__(self, registry: Optional[AssetRegistry] = None, audit_interval: int = 0):
+        """
+        Args:
+            registry: Asset registry (a new one by default)
+            audit_interval: Run the full-scan audit for a ticker every N
+                balance-changing operations on it (0 disables)
+        """
         self.registry = registry or AssetRegistry()
         self._accounts: Dict[str, AssetAccount] = {}  # "address:ticker" -> Account
         self._transfers: List[AssetTransfer] = []
+        self._balance_totals: Dict[str, int] = {}  # ticker -> Sum(Balances)
+        self._holders: Dict[str, Dict[str, AssetAccount]] = {}  # ticker -> address -> Account (balance > 0)
+        self._audit_interval = audit_interval
+        self._ops_since_audit: Dict[str, int] = {}
         
     def _get_account_key(self, address: str, ticker: str) -> str:
         """Generate unique key for account lookup."""
@@ -345,6 +362,20 @@ class AssetFactory:
             
         return self._accounts[key]
         
+    def _credit(self, account: AssetAccount, amount: int) -> None:
+        """Increase a balance, keeping the ticker aggregates in step."""
+        if account.balance <= 0 < account.balance + amount:
+            self._holders.setdefault(account.ticker, {})[account.address] = account
+        account.balance += amount
+        self._balance_totals[account.ticker] = self._balance_totals.get(account.ticker, 0) + amount
+        
+    def _debit(self, account: AssetAccount, amount: int) -> None:
+        """Decrease a balance, keeping the ticker aggregates in step."""
+        account.balance -= amount
+        self._balance_totals[account.ticker] = self._balance_totals.get(account.ticker, 0) - amount
+        if account.balance <= 0:
+            self._holders.get(account.ticker, {}).pop(account.address, None)
+            
     def _validate_asset_active(self, asset: Asset) -> None:
         """Validate asset is active (not frozen)."""
         if asset.status == AssetStatus.FROZEN:
@@ -359,22 +390,67 @@ class AssetFactory:
         """
         Verify INV-ECON-003: Total Supply = Sum(Balances).
         
+        Compares against the running balance sum, so this is O(1); the
+        full scan runs here only when audit_interval is due.
+        
         Returns True if conservation holds.
         """
+        ticker = ticker.upper()
         asset = self.registry.get(ticker)
-        
-        # Sum all balances for this ticker
-        total_balance = sum(
-            acc.balance for acc in self._accounts.values()
-            if acc.ticker == ticker.upper()
-        )
+        total_balance = self._balance_totals.get(ticker, 0)
         
         if total_balance != asset.total_supply:
             logger.error(f"❌ SUPPLY MISMATCH: {ticker} supply={asset.total_supply}, balances={total_balance}")
             return False
             
+        if self._audit_interval:
+            ops = self._ops_since_audit.get(ticker, 0) + 1
+            if ops >= self._audit_interval:
+                self._ops_since_audit[ticker] = 0
+                return self.audit_supply(ticker)[ticker]
+            self._ops_since_audit[ticker] = ops
+            
         return True
         
+    def audit_supply(self, ticker: Optional[str] = None) -> Dict[str, bool]:
+        """
+        Full-scan audit of INV-ECON-003 and the ticker aggregates.
+        
+        Re-sums every account balance (O(total accounts)) and checks it
+        against both the asset's total supply and the running sum, and
+        that the holder index lists exactly the positive balances.
+        
+        Args:
+            ticker: Audit one ticker (default: every registered asset)
+            
+        Returns:
+            Dict of ticker -> True if all checks hold
+        """
+        tickers = [ticker.upper()] if ticker else [asset.ticker for asset in self.registry.list_assets()]
+        scanned: Dict[str, int] = {t: 0 for t in tickers}
+        holders: Dict[str, Set[str]] = {t: set() for t in tickers}
+        
+        for account in self._accounts.values():
+            if account.ticker in scanned:
+                scanned[account.ticker] += account.balance
+                if account.balance > 0:
+                    holders[account.ticker].add(account.address)
+                    
+        results = {}
+        for t in tickers:
+            supply = self.registry.get(t).total_supply
+            running = self._balance_totals.get(t, 0)
+            indexed = set(self._holders.get(t, {}))
+            ok = scanned[t] == supply == running and indexed == holders[t]
+            if not ok:
+                logger.error(
+                    f"❌ SUPPLY AUDIT FAILED: {t} supply={supply}, balances={scanned[t]}, "
+                    f"running={running}, holders={len(holders[t])}, indexed={len(indexed)}"
+                )
+            results[t] = ok
+            
+        return results
+        
     # ══════════════════════════════════════════════════════════════════════════
     # ASSET CREATION
     # ══════════════════════════════════════════════════════════════════════════
@@ -469,7 +545,7 @@ class AssetFactory:
         
         # Mint: increase supply and balance atomically
         asset.total_supply += amount
-        account.balance += amount
+        self._credit(account, amount)
         account.last_activity = time.time()
         
         # Verify invariant
@@ -537,7 +613,7 @@ class AssetFactory:
             
         # Burn: decrease supply and balance atomically
         asset.total_supply -= amount
-        account.balance -= amount
+        self._debit(account, amount)
         account.last_activity = time.time()
         
         # Verify invariant
@@ -609,8 +685,8 @@ class AssetFactory:
             )
             
         # Transfer: debit and credit atomically
-        from_account.balance -= amount
-        to_account.balance += amount
+        self._debit(from_account, amount)
+        self._credit(to_account, amount)
         from_account.last_activity = time.time()
         to_account.last_activity = time.time()
         
@@ -752,8 +828,8 @@ class AssetFactory:
             raise AssetError(f"No balance to clawback from {from_addr}")
             
         # Forcible transfer
-        from_account.balance -= actual_amount
-        issuer_account.balance += actual_amount
+        self._debit(from_account, actual_amount)
+        self._credit(issuer_account, actual_amount)
         
         # Verify invariant
         assert self._verify_supply_conservation(ticker), "INV-ECON-003 violated!"
@@ -798,12 +874,10 @@ class AssetFactory:
     def get_holders(self, ticker: str) -> List[Tuple[str, int]]:
         """Get all holders of a ticker with their balances."""
         ticker = ticker.upper()
-        holders = []
-        
-        for account in self._accounts.values():
-            if account.ticker == ticker and account.balance > 0:
-                holders.append((account.address, account.balance))
-                
+        holders = [
+            (account.address, account.balance)
+            for account in self._holders.get(ticker, {}).values()
+        ]
         return sorted(holders, key=lambda x: x[1], reverse=True)
         
     def get_transfers(self, ticker: Optional[str] = None) -> List[AssetTransfer]:
@@ -950,6 +1024,27 @@ def _self_test() -> bool:
     except Exception as e:
         print(f"  ❌ FAILED: {e}")
         
+    # Test 9: Running aggregates and full-scan audit
+    tests_total += 1
+    print("\n[TEST 9] Supply Aggregates and Audit...")
+    try:
+        audited = AssetFactory(audit_interval=2)
+        audited.create_asset("PTS", "Points", decimals=0, issuer="ISSUER")
+        audited.mint("PTS", amount=100, to="ALICE")
+        audited.transfer("PTS", "ALICE", "BOB", 100)
+        audited.transfer("PTS", "BOB", "CAROL", 40)
+        
+        assert audited.get_holders("PTS") == [("BOB", 60), ("CAROL", 40)]
+        assert audited.audit_supply() == {"PTS": True}
+        
+        # A balance changed behind the factory's back is caught by the audit
+        audited.get_account("CAROL", "PTS").balance += 1
+        assert audited.audit_supply("PTS") == {"PTS": False}
+        print("  ✅ PASSED: Holder index and audit agree; tampering detected")
+        tests_passed += 1
+    except Exception as e:
+        print(f"  ❌ FAILED: {e}")
+        
     # Summary
     print("\n" + "=" * 70)
     print(f"                    RESULTS: {tests_passed}/{tests_total} PASSED")
@@ -963,7 +1058,37 @@ def _self_test() -> bool:
     return tests_passed == tests_total
 
 
+def _benchmark(holder_counts: Tuple[int, ...] = (10_000, 100_000, 1_000_000), transfers: int = 20_000) -> None:
+    """Transfers/sec with O(1) conservation checks vs the full-scan audit."""
+    logging.disable(logging.INFO)
+    print(f"\nAssetFactory benchmark: {transfers} transfers per run")
+    for holders in holder_counts:
+        factory = AssetFactory()
+        factory.create_asset("BENCH", "Benchmark", decimals=0, issuer="ISSUER")
+        for i in range(holders):
+            factory.mint("BENCH", amount=1_000, to=f"HOLDER_{i}")
+            
+        start = time.perf_counter()
+        for i in range(transfers):
+            factory.transfer("BENCH", f"HOLDER_{i % holders}", f"HOLDER_{(i * 7919 + 1) % holders}", 1)
+        elapsed = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        assert factory.audit_supply("BENCH") == {"BENCH": True}
+        scan = time.perf_counter() - start
+        
+        print(
+            f"  {holders:>9,} holders: {transfers / elapsed:>9,.0f} transfers/s | "
+            f"full scan {scan * 1000:8.1f} ms (≈ {1 / scan:>7,.1f} transfers/s when scanned per transfer)"
+        )
+    logging.disable(logging.NOTSET)
+
+
 if __name__ == "__main__":
     import sys
+    if "--benchmark" in sys.argv:
+        from modules.economy.assets import _benchmark as benchmark
+        benchmark()
+        sys.exit(0)
     success = _self_test()
     sys.exit(0 if success else 1)
@@ -25,6 +25,8 @@ from modules.finance.ledger import (
     Entry,
     Transaction,
     TransactionStatus,
+    LedgerBatch,
+    ChainCheckpoint,
     LedgerError,
     InsufficientFundsError,
     BalanceViolationError,
@@ -82,6 +84,8 @@ __all__ = [
     "Entry",
     "Transaction",
     "TransactionStatus",
+    "LedgerBatch",
+    "ChainCheckpoint",
     # Ledger Exceptions
     "LedgerError",
     "InsufficientFundsError",
@@ -11,6 +11,21 @@ CORE PRINCIPLES:
 3. Precision: All math uses Decimal (NEVER floats)
 4. Atomicity: Transactions either fully commit or fully rollback
 
+Bulk postings (post_batch / transfer_batch) are validated against the
+net per-account change of the whole batch, applied all-or-nothing, and
+added to the hash chain as a single link over the Merkle root of the
+member transaction hashes.
+
+Chain audits are incremental: each successful verification leaves a
+ChainCheckpoint (position, chain head and a rolling digest of every link
+hash), and verify_chain_integrity(incremental=True) only re-hashes what
+was posted after it. verify_chain_parallel() re-hashes the full chain in
+segments on a process pool and stitches the segment boundaries.
+
+Ledger(compact=True) keeps balances as integer cents in array columns
+and spills posted transactions to an append-only, memory-mapped journal
+(see store.py) instead of keeping every Transaction object resident.
+
 INVARIANTS:
 - INV-FIN-001: Conservation of Value
 - INV-FIN-002: Immutability of Posted Entries
@@ -23,9 +38,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 import hashlib
 import json
+import os
 import uuid
 
 
@@ -193,7 +209,7 @@ class Account:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Entry:
     """
     A single debit or credit entry in the ledger.
@@ -218,6 +234,32 @@ class Entry:
         if self.amount < 0:
             raise NegativeAmountError(self.amount)
     
+    @classmethod
+    def quantized(
+        cls,
+        entry_id: str,
+        transaction_id: str,
+        account_id: str,
+        amount: Decimal,
+        is_debit: bool,
+        created_at: datetime,
+        description: str = "",
+    ) -> "Entry":
+        """
+        Build an entry from an amount the caller has already validated
+        and quantized, skipping __post_init__ (used by bulk posting).
+        """
+        entry = cls.__new__(cls)
+        entry.entry_id = entry_id
+        entry.transaction_id = transaction_id
+        entry.account_id = account_id
+        entry.amount = amount
+        entry.is_debit = is_debit
+        entry.created_at = created_at
+        entry.description = description
+        entry.metadata = {}
+        return entry
+    
     @property
     def entry_type(self) -> str:
         """Return 'debit' or 'credit'."""
@@ -236,9 +278,23 @@ class Entry:
             "description": self.description,
             "metadata": self.metadata,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Entry":
+        """Rebuild an entry from to_dict() output."""
+        return cls(
+            entry_id=data["entry_id"],
+            transaction_id=data["transaction_id"],
+            account_id=data["account_id"],
+            amount=Decimal(data["amount"]),
+            is_debit=data["is_debit"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            description=data["description"],
+            metadata=data["metadata"],
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     An atomic unit of value transfer containing balanced entries.
@@ -255,6 +311,7 @@ class Transaction:
     previous_hash: str = ""  # Hash chain link
     transaction_hash: str = ""  # This transaction's hash
     metadata: Dict = field(default_factory=dict)
+    batch_id: Optional[str] = None  # Set when posted as part of a LedgerBatch
     
     def add_entry(self, account_id: str, amount: Decimal, is_debit: bool, 
                   description: str = "", metadata: Dict = None) -> Entry:
@@ -318,6 +375,37 @@ class Transaction:
         serialized = json.dumps(data, sort_keys=True)
         return hashlib.sha256(serialized.encode()).hexdigest()
     
+    def compute_member_hash(self) -> str:
+        """
+        Compute SHA-256 hash of this transaction as a batch member.
+        
+        Covers the same fields as compute_hash() but length-prefixes each
+        one ("<len>:<value>") instead of building and key-sorting the
+        nested entry dicts, which is several times cheaper. Batch members
+        are chained through the batch's Merkle root, so this is their
+        transaction_hash.
+        """
+        created_at = self.created_at.isoformat()
+        fields = [
+            self.transaction_id,
+            self.description,
+            self.reference,
+            created_at,
+            self.previous_hash,
+        ]
+        for e in self.entries:
+            fields += (
+                e.entry_id,
+                e.account_id,
+                str(e.amount),
+                "D" if e.is_debit else "C",
+                created_at if e.created_at == self.created_at else e.created_at.isoformat(),
+                e.description,
+                json.dumps(e.metadata, sort_keys=True) if e.metadata else "{}",
+            )
+        serialized = "".join([f"{len(f)}:{f}" for f in fields])
+        return hashlib.sha256(serialized.encode()).hexdigest()
+    
     def to_dict(self) -> Dict:
         """Serialize transaction for JSON."""
         return {
@@ -334,7 +422,256 @@ class Transaction:
             "previous_hash": self.previous_hash,
             "transaction_hash": self.transaction_hash,
             "metadata": self.metadata,
+            "batch_id": self.batch_id,
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Transaction":
+        """Rebuild a transaction from to_dict() output."""
+        return cls(
+            transaction_id=data["transaction_id"],
+            entries=[Entry.from_dict(e) for e in data["entries"]],
+            status=TransactionStatus(data["status"]),
+            description=data["description"],
+            reference=data["reference"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            posted_at=datetime.fromisoformat(data["posted_at"]) if data["posted_at"] else None,
+            previous_hash=data["previous_hash"],
+            transaction_hash=data["transaction_hash"],
+            metadata=data["metadata"],
+            batch_id=data.get("batch_id"),
+        )
+
+
+def _merkle_root(hashes: Sequence[str]) -> str:
+    """
+    Merkle root over hex digests (pairs hashed as sha256(left + right),
+    odd levels padded by duplicating the last node).
+    """
+    level = list(hashes)
+    if not level:
+        return hashlib.sha256(b"").hexdigest()
+    while len(level) > 1:
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        level = [
+            hashlib.sha256((level[i] + level[i + 1]).encode()).hexdigest()
+            for i in range(0, len(level), 2)
+        ]
+    return level[0]
+
+
+@dataclass
+class LedgerBatch:
+    """
+    A group of transactions posted atomically as one hash-chain link.
+    
+    Every member's previous_hash is the chain head before the batch; the
+    batch hash commits to that head and the Merkle root of the member
+    transaction hashes, and becomes the new chain head.
+    """
+    batch_id: str
+    transaction_ids: List[str] = field(default_factory=list)
+    description: str = ""
+    previous_hash: str = ""
+    merkle_root: str = ""
+    batch_hash: str = ""
+    posted_at: Optional[datetime] = None
+    
+    def compute_hash(self) -> str:
+        """Compute SHA-256 hash of this batch link."""
+        data = {
+            "batch_id": self.batch_id,
+            "description": self.description,
+            "transaction_count": len(self.transaction_ids),
+            "merkle_root": self.merkle_root,
+            "previous_hash": self.previous_hash,
+        }
+        serialized = json.dumps(data, sort_keys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+    
+    def to_dict(self) -> Dict:
+        """Serialize batch for JSON."""
+        return {
+            "batch_id": self.batch_id,
+            "transaction_ids": self.transaction_ids,
+            "description": self.description,
+            "previous_hash": self.previous_hash,
+            "merkle_root": self.merkle_root,
+            "batch_hash": self.batch_hash,
+            "posted_at": self.posted_at.isoformat() if self.posted_at else None,
+        }
+
+
+@dataclass
+class ChainCheckpoint:
+    """
+    Verified-up-to marker left by a successful chain audit.
+    
+    position counts posted transactions (always a link boundary) and
+    last_hash is the chain head there. digest folds every link hash from
+    genesis onwards as sha256(digest + link_hash), so a later full audit
+    can tell whether the history behind the checkpoint was rewritten.
+    """
+    position: int = 0
+    last_hash: str = ""
+    digest: str = ""
+    links: int = 0
+    verified_at: Optional[datetime] = None
+    
+    def to_dict(self) -> Dict:
+        """Serialize checkpoint for JSON."""
+        return {
+            "position": self.position,
+            "last_hash": self.last_hash,
+            "digest": self.digest,
+            "links": self.links,
+            "verified_at": self.verified_at.isoformat() if self.verified_at else None,
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ChainCheckpoint":
+        """Rebuild a checkpoint from to_dict() output."""
+        return cls(
+            position=data["position"],
+            last_hash=data["last_hash"],
+            digest=data["digest"],
+            links=data["links"],
+            verified_at=datetime.fromisoformat(data["verified_at"]) if data["verified_at"] else None,
+        )
+
+
+# =============================================================================
+# CHAIN VERIFICATION
+# =============================================================================
+
+def _fold_digest(digest: str, link_hash: str) -> str:
+    """Extend a rolling chain digest by one link hash."""
+    return hashlib.sha256((digest + link_hash).encode()).hexdigest()
+
+
+def _verify_links(
+    links: Iterable[Tuple[Optional[LedgerBatch], int]],
+    transactions: Iterator[Transaction],
+    expected_hash: str,
+    on_link: Callable[[str, Optional[LedgerBatch], int], Optional[str]],
+) -> Optional[str]:
+    """
+    Verify a run of consecutive chain links.
+    
+    Args:
+        links: (batch, member count) per link; batch is None for a
+            single transaction (count 1)
+        transactions: The posted transactions of those links, in order
+        expected_hash: previous_hash the first link must carry
+        on_link: Called with (link_hash, batch, count) after each link
+            verifies; a returned message aborts the run
+        
+    Returns:
+        None if every link verified, otherwise the failure message
+    """
+    for batch, count in links:
+        if batch is None:
+            txn = next(transactions, None)
+            if txn is None:
+                return "Chain truncated: posted transaction missing"
+            if txn.batch_id is not None:
+                return f"Chain broken at {txn.transaction_id}: unknown batch {txn.batch_id}"
+            if txn.previous_hash != expected_hash:
+                return f"Chain broken at {txn.transaction_id}: previous_hash mismatch"
+            if txn.compute_hash() != txn.transaction_hash:
+                return f"Chain broken at {txn.transaction_id}: transaction_hash mismatch"
+            expected_hash = txn.transaction_hash
+        else:
+            members = [txn for txn in (next(transactions, None) for _ in range(count)) if txn is not None]
+            if [member.transaction_id for member in members] != batch.transaction_ids:
+                return f"Chain broken at batch {batch.batch_id}: member order mismatch"
+            if batch.previous_hash != expected_hash:
+                return f"Chain broken at batch {batch.batch_id}: previous_hash mismatch"
+            
+            member_hashes = []
+            for member in members:
+                if member.batch_id != batch.batch_id or member.previous_hash != expected_hash:
+                    return f"Chain broken at {member.transaction_id}: previous_hash mismatch"
+                if member.compute_member_hash() != member.transaction_hash:
+                    return f"Chain broken at {member.transaction_id}: transaction_hash mismatch"
+                member_hashes.append(member.transaction_hash)
+            
+            if _merkle_root(member_hashes) != batch.merkle_root:
+                return f"Chain broken at batch {batch.batch_id}: merkle_root mismatch"
+            if batch.compute_hash() != batch.batch_hash:
+                return f"Chain broken at batch {batch.batch_id}: batch_hash mismatch"
+            expected_hash = batch.batch_hash
+        
+        error = on_link(expected_hash, batch, count)
+        if error:
+            return error
+    return None
+
+
+# Ledger being audited, inherited by forked verify_chain_parallel() workers
+_forked_ledger: Optional["Ledger"] = None
+
+
+def _verify_segment(
+    links: List[Tuple[Optional[LedgerBatch], int]],
+    transactions: Sequence,
+    journal_path: Optional[str],
+) -> Tuple[Optional[str], str, List[str]]:
+    """
+    Process-pool worker for verify_chain_parallel().
+    
+    transactions are journal offsets to decode from journal_path
+    (compact ledgers), a range of chain positions in the forked ledger,
+    or the Transaction objects themselves. The segment's first link is
+    checked against its own previous_hash; the caller stitches that to
+    the previous segment's last link hash.
+    
+    Returns:
+        (error or None, first link's previous_hash, link hashes)
+    """
+    if journal_path is not None:
+        from modules.finance.store import read_postings
+        transactions = list(read_postings(journal_path, transactions))
+    elif isinstance(transactions, range):
+        ledger = _forked_ledger
+        transactions = [ledger.transactions[ledger.posted_transactions[p]] for p in transactions]
+    first_batch = links[0][0]
+    start_hash = first_batch.previous_hash if first_batch else transactions[0].previous_hash
+    
+    link_hashes: List[str] = []
+    error = _verify_links(
+        links, iter(transactions), start_hash,
+        lambda link_hash, batch, count: link_hashes.append(link_hash),
+    )
+    return error, start_hash, link_hashes
+
+
+class _ChainTally:
+    """Running position, head, rolling digest and counts over verified links."""
+    
+    def __init__(self, base: ChainCheckpoint, reference: Optional[ChainCheckpoint] = None):
+        self.position = base.position
+        self.last_hash = base.last_hash
+        self.digest = base.digest
+        self.links = base.links
+        self.batches = 0
+        self.reference = reference  # Earlier checkpoint to re-check on the way
+    
+    def add(self, link_hash: str, batch: Optional[LedgerBatch], count: int) -> Optional[str]:
+        """Account for one verified link; returns a message on checkpoint mismatch."""
+        self.position += count
+        self.links += 1
+        self.batches += batch is not None
+        self.last_hash = link_hash
+        self.digest = _fold_digest(self.digest, link_hash)
+        
+        reference = self.reference
+        if reference is not None and self.position == reference.position and (
+            self.digest != reference.digest or link_hash != reference.last_hash
+        ):
+            return f"Checkpoint mismatch at position {reference.position}: verified history was rewritten"
+        return None
 
 
 # =============================================================================
@@ -354,14 +691,39 @@ class Ledger:
     INVARIANTS:
     - INV-FIN-001: Sum(Debits) == Sum(Credits) for every transaction
     - INV-FIN-002: Posted entries are immutable
+    
+    STORAGE:
+    By default everything is held in memory. With compact=True, accounts
+    live in integer-cent columns and posted transactions are written to
+    an append-only journal file and read back (memory-mapped) on demand;
+    lookups then return fresh copies of posted transactions.
     """
     
-    def __init__(self, ledger_id: str = None):
-        """Initialize a new ledger."""
+    def __init__(self, ledger_id: str = None, compact: bool = False, journal_path: str = None):
+        """
+        Initialize a new ledger.
+        
+        Args:
+            ledger_id: Ledger identifier (auto-generated if not provided)
+            compact: Use the columnar account store and on-disk journal
+            journal_path: Journal file for compact mode (a temporary file
+                removed by close() if not provided)
+        """
         self.ledger_id = ledger_id or str(uuid.uuid4())
-        self.accounts: Dict[str, Account] = {}
-        self.transactions: Dict[str, Transaction] = {}
-        self.posted_transactions: List[str] = []  # Ordered list for hash chain
+        self.journal = None
+        if compact:
+            from modules.finance.store import ColumnarAccounts, TransactionJournal
+            self.journal = TransactionJournal(journal_path)
+            self.accounts = ColumnarAccounts()
+            self.transactions = self.journal.transactions
+            self.posted_transactions = self.journal.posted
+        else:
+            self.accounts: Dict[str, Account] = {}
+            self.transactions: Dict[str, Transaction] = {}
+            self.posted_transactions: List[str] = []  # Ordered list for hash chain
+        self.batches: Dict[str, LedgerBatch] = {}
+        self._batch_starts: Dict[int, str] = {}  # Chain position -> batch ID
+        self.checkpoint: Optional[ChainCheckpoint] = None  # Last successful chain audit
         self.genesis_hash: str = self._compute_genesis_hash()
         self.last_hash: str = self.genesis_hash
         self.created_at: datetime = datetime.now(timezone.utc)
@@ -370,6 +732,11 @@ class Ledger:
         self._total_debits_posted: Decimal = Decimal("0.00")
         self._total_credits_posted: Decimal = Decimal("0.00")
     
+    def close(self) -> None:
+        """Release the journal (compact mode); a no-op otherwise."""
+        if self.journal is not None:
+            self.journal.close()
+    
     def _compute_genesis_hash(self) -> str:
         """Compute the genesis block hash."""
         genesis_data = {
@@ -423,7 +790,7 @@ class Ledger:
         )
         
         self.accounts[account_id] = account
-        return account
+        return self.accounts[account_id]
     
     def get_account(self, account_id: str) -> Account:
         """Get an account by ID."""
@@ -613,6 +980,190 @@ class Ledger:
         # Post and return
         return self.post_transaction(txn.transaction_id)
     
+    def post_batch(self, transaction_ids: Sequence[str], description: str = "") -> LedgerBatch:
+        """
+        Post many pending transactions atomically as one batch.
+        
+        Every transaction must be balanced (INV-FIN-001). Funds are checked
+        once per account against the net change of the whole batch, so
+        offsetting obligations net out (an account may go negative part
+        way through the batch as long as it does not end negative). Either
+        every transaction is posted or, on any error, none is and no
+        balance changes.
+        
+        Args:
+            transaction_ids: IDs of pending transactions, in chain order
+            description: Batch description
+            
+        Returns:
+            The posted LedgerBatch
+            
+        Raises:
+            BalanceViolationError: If any transaction's debits != credits
+            InsufficientFundsError: If any account would end negative
+            AccountNotFoundError: If any entry references unknown account
+        """
+        transactions = []
+        seen = set()
+        for transaction_id in transaction_ids:
+            transaction = self.transactions.get(transaction_id)
+            if transaction is None:
+                raise LedgerError(f"Transaction {transaction_id} not found")
+            if transaction.status == TransactionStatus.POSTED:
+                raise ImmutabilityViolationError(transaction_id)
+            if transaction.status != TransactionStatus.PENDING:
+                raise LedgerError(f"Transaction {transaction_id} is {transaction.status.value}")
+            if transaction_id in seen:
+                raise LedgerError(f"Transaction {transaction_id} appears twice in batch")
+            seen.add(transaction_id)
+            transactions.append(transaction)
+        
+        return self._post_batch(transactions, description)
+    
+    def transfer_batch(
+        self,
+        transfers: Iterable[Tuple[str, str, Decimal]],
+        description: str = "",
+        reference: str = "",
+    ) -> LedgerBatch:
+        """
+        Convenience method: post many A→B transfers as one batch.
+        
+        Each (from_account, to_account, amount) becomes a two-entry
+        transaction exactly like transfer(), but the transactions share
+        one timestamp, are numbered under the batch ID ("<batch_id>:<n>",
+        entries "<batch_id>:<n>:0|1") instead of drawing a uuid4 each,
+        and are posted with post_batch() semantics. Nothing is recorded
+        in the ledger if the batch is rejected.
+        
+        Args:
+            transfers: (from_account, to_account, amount) triples
+            description: Batch description
+            reference: External reference applied to every transaction
+            
+        Returns:
+            The posted LedgerBatch
+        """
+        now = datetime.now(timezone.utc)
+        cents = Decimal("0.01")
+        batch_id = str(uuid.uuid4())
+        transactions = []
+        
+        for n, (from_account, to_account, amount) in enumerate(transfers):
+            if not isinstance(amount, Decimal):
+                amount = Decimal(str(amount))
+            if amount <= 0:
+                raise NegativeAmountError(amount)
+            amount = amount.quantize(cents, rounding=ROUND_HALF_UP)
+            
+            transaction_id = f"{batch_id}:{n}"
+            transactions.append(Transaction(
+                transaction_id=transaction_id,
+                entries=[
+                    Entry.quantized(f"{transaction_id}:0", transaction_id, to_account, amount, True,
+                                    now, f"Received from {from_account}"),
+                    Entry.quantized(f"{transaction_id}:1", transaction_id, from_account, amount, False,
+                                    now, f"Sent to {to_account}"),
+                ],
+                description=f"Transfer {amount} from {from_account} to {to_account}",
+                reference=reference,
+                created_at=now,
+            ))
+        
+        return self._post_batch(transactions, description, batch_id)
+    
+    def _post_batch(
+        self,
+        transactions: List[Transaction],
+        description: str,
+        batch_id: Optional[str] = None,
+    ) -> LedgerBatch:
+        """Validate and apply a batch (see post_batch)."""
+        if not transactions:
+            raise LedgerError("Cannot post empty batch")
+        
+        # VALIDATION PASS: per-transaction balance, per-account net change
+        net_changes: Dict[str, Decimal] = {}
+        debit_sign: Dict[str, bool] = {}
+        batch_debits = Decimal("0.00")
+        batch_credits = Decimal("0.00")
+        
+        for transaction in transactions:
+            if not transaction.entries:
+                raise LedgerError(f"Cannot post empty transaction {transaction.transaction_id}")
+            
+            debits = Decimal("0.00")
+            credits = Decimal("0.00")
+            for entry in transaction.entries:
+                account_id = entry.account_id
+                increases = debit_sign.get(account_id)
+                if increases is None:
+                    increases = self.get_account(account_id).debit_increases_balance()
+                    debit_sign[account_id] = increases
+                
+                if entry.is_debit:
+                    debits += entry.amount
+                else:
+                    credits += entry.amount
+                change = entry.amount if entry.is_debit == increases else -entry.amount
+                net_changes[account_id] = net_changes.get(account_id, Decimal("0.00")) + change
+            
+            # INVARIANT CHECK: INV-FIN-001 - Conservation of Value
+            if debits != credits:
+                transaction.status = TransactionStatus.FAILED
+                raise BalanceViolationError(debits, credits)
+            batch_debits += debits
+            batch_credits += credits
+        
+        # Check for negative balances (where not allowed)
+        for account_id, change in net_changes.items():
+            account = self.accounts[account_id]
+            if account.balance + change < 0 and not account.allow_negative:
+                raise InsufficientFundsError(
+                    account_id,
+                    required=abs(change),
+                    available=account.balance
+                )
+        
+        # COMMIT PASS: one net update per account (atomic)
+        for account_id, change in net_changes.items():
+            account = self.accounts[account_id]
+            account.balance = (account.balance + change).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        
+        # Update hash chain: members hang off the current head, the batch
+        # link commits to their Merkle root
+        batch = LedgerBatch(
+            batch_id=batch_id or str(uuid.uuid4()),
+            description=description,
+            previous_hash=self.last_hash,
+        )
+        posted_at = datetime.now(timezone.utc)
+        member_hashes = []
+        for transaction in transactions:
+            transaction.previous_hash = batch.previous_hash
+            transaction.batch_id = batch.batch_id
+            transaction.transaction_hash = transaction.compute_member_hash()
+            transaction.status = TransactionStatus.POSTED
+            transaction.posted_at = posted_at
+            member_hashes.append(transaction.transaction_hash)
+            batch.transaction_ids.append(transaction.transaction_id)
+        
+        batch.merkle_root = _merkle_root(member_hashes)
+        batch.batch_hash = batch.compute_hash()
+        batch.posted_at = posted_at
+        self.last_hash = batch.batch_hash
+        self.batches[batch.batch_id] = batch
+        for transaction in transactions:
+            self.transactions[transaction.transaction_id] = transaction
+        self._batch_starts[len(self.posted_transactions)] = batch.batch_id
+        self.posted_transactions.extend(batch.transaction_ids)
+        
+        # Update audit totals
+        self._total_debits_posted += batch_debits
+        self._total_credits_posted += batch_credits
+        
+        return batch
+    
     def reverse_transaction(
         self,
         transaction_id: str,
@@ -665,9 +1216,10 @@ class Ledger:
         # Post the reversal
         self.post_transaction(reversal.transaction_id)
         
-        # Mark original as reversed
+        # Mark original as reversed (stored back for journaled ledgers)
         original.status = TransactionStatus.REVERSED
         original.metadata["reversed_by"] = reversal.transaction_id
+        self.transactions[transaction_id] = original
         
         return reversal
     
@@ -675,31 +1227,151 @@ class Ledger:
     # AUDIT & VERIFICATION
     # =========================================================================
     
-    def verify_chain_integrity(self) -> Tuple[bool, str]:
+    def _chain_links(self, start: int, stop: int) -> Iterator[Tuple[Optional[LedgerBatch], int]]:
+        """(batch or None, transaction count) for each chain link in [start, stop)."""
+        position = start
+        while position < stop:
+            batch = self.batches.get(self._batch_starts.get(position))
+            count = len(batch.transaction_ids) if batch is not None else 1
+            yield batch, count
+            position += count
+    
+    def _close_audit(self, tally: _ChainTally, start: int, total: int) -> Tuple[bool, str]:
+        """Check the verified run ends at the chain head and move the checkpoint there."""
+        if tally.last_hash != self.last_hash:
+            return False, "Chain broken at head: last_hash does not match the final link"
+        
+        self.checkpoint = ChainCheckpoint(
+            position=total,
+            last_hash=tally.last_hash,
+            digest=tally.digest,
+            links=tally.links,
+            verified_at=datetime.now(timezone.utc),
+        )
+        if start:
+            message = f"Chain valid: {total - start} new transactions verified since checkpoint ({total} total)"
+        else:
+            message = f"Chain valid: {total} transactions verified"
+        if tally.batches:
+            message += f" ({tally.batches} batches)"
+        return True, message
+    
+    def verify_chain_integrity(self, incremental: bool = False) -> Tuple[bool, str]:
         """
-        Verify the hash chain integrity of all posted transactions.
+        Verify the hash chain integrity of posted transactions.
+        
+        A full audit re-hashes the chain from genesis and re-checks the
+        previous checkpoint's digest on the way. An incremental audit
+        resumes from the last checkpoint and only re-hashes transactions
+        posted since, trusting the history behind it. Either way a
+        successful audit moves the checkpoint to the chain head.
         
+        Args:
+            incremental: Resume from the last checkpoint (full audit if none)
+            
         Returns:
             (is_valid, message)
         """
-        if not self.posted_transactions:
+        total = len(self.posted_transactions)
+        if not total:
             return True, "No transactions to verify"
         
-        expected_hash = self.genesis_hash
+        checkpoint = self.checkpoint
+        if incremental and checkpoint is not None:
+            if checkpoint.position > total:
+                return False, f"Checkpoint at {checkpoint.position} is beyond the chain ({total} transactions)"
+            tally = _ChainTally(checkpoint)
+        else:
+            genesis = ChainCheckpoint(last_hash=self.genesis_hash, digest=self.genesis_hash)
+            tally = _ChainTally(genesis, reference=checkpoint)
         
-        for txn_id in self.posted_transactions:
-            txn = self.transactions[txn_id]
-            
-            if txn.previous_hash != expected_hash:
-                return False, f"Chain broken at {txn_id}: previous_hash mismatch"
-            
-            computed_hash = txn.compute_hash()
-            if computed_hash != txn.transaction_hash:
-                return False, f"Chain broken at {txn_id}: transaction_hash mismatch"
+        start = tally.position
+        transactions = (self.transactions[self.posted_transactions[p]] for p in range(start, total))
+        error = _verify_links(self._chain_links(start, total), transactions, tally.last_hash, tally.add)
+        if error:
+            return False, error
+        return self._close_audit(tally, start, total)
+    
+    def verify_chain_parallel(self, workers: Optional[int] = None, min_segment: int = 5_000) -> Tuple[bool, str]:
+        """
+        Full chain audit with the hashing spread over a process pool.
+        
+        The chain is cut at link boundaries into one segment per worker.
+        Each worker verifies its segment against the segment's own first
+        previous_hash and returns the link hashes; the boundaries are then
+        stitched (each segment must start from the previous segment's last
+        hash), the rolling digest folded and the checkpoint moved exactly
+        as verify_chain_integrity() does. Workers are forked where the
+        platform allows and read the ledger they inherit; compact ledgers
+        send journal offsets and workers read the journal file. Only
+        otherwise are the transactions themselves pickled to the workers.
+        
+        Args:
+            workers: Process count (default: CPU count)
+            min_segment: Fewest transactions worth a process; chains too
+                short for two segments are audited sequentially
             
-            expected_hash = txn.transaction_hash
+        Returns:
+            (is_valid, message)
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        import multiprocessing
+        global _forked_ledger
         
-        return True, f"Chain valid: {len(self.posted_transactions)} transactions verified"
+        total = len(self.posted_transactions)
+        segment_count = min(workers or os.cpu_count() or 1, total // max(min_segment, 1))
+        if segment_count < 2:
+            return self.verify_chain_integrity()
+        
+        # Cut at link boundaries into roughly equal transaction counts
+        segments: List[Tuple[int, int, List[Tuple[Optional[LedgerBatch], int]]]] = []
+        segment_start, segment_links, position = 0, [], 0
+        for link in self._chain_links(0, total):
+            segment_links.append(link)
+            position += link[1]
+            if position >= total * (len(segments) + 1) / segment_count:
+                segments.append((segment_start, position, segment_links))
+                segment_start, segment_links = position, []
+        if segment_links:
+            segments.append((segment_start, position, segment_links))
+        
+        journal_path = None
+        if self.journal is not None:
+            self.journal.flush()
+            journal_path = self.journal.path
+        fork = journal_path is None and "fork" in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork") if fork else None
+        
+        _forked_ledger = self if fork else None
+        try:
+            with ProcessPoolExecutor(max_workers=len(segments), mp_context=context) as pool:
+                futures = []
+                for start, stop, links in segments:
+                    if journal_path is not None:
+                        payload = self.journal.posting_offsets(start, stop)
+                    elif fork:
+                        payload = range(start, stop)
+                    else:
+                        payload = [self.transactions[t] for t in self.posted_transactions[start:stop]]
+                    futures.append(pool.submit(_verify_segment, links, payload, journal_path))
+                results = [future.result() for future in futures]
+        finally:
+            _forked_ledger = None
+        
+        genesis = ChainCheckpoint(last_hash=self.genesis_hash, digest=self.genesis_hash)
+        tally = _ChainTally(genesis, reference=self.checkpoint)
+        for (start, _, links), (error, start_hash, link_hashes) in zip(segments, results):
+            if error:
+                return False, error
+            if start_hash != tally.last_hash:
+                return False, f"Chain broken at segment boundary {start}: previous_hash mismatch"
+            for (batch, count), link_hash in zip(links, link_hashes):
+                error = tally.add(link_hash, batch, count)
+                if error:
+                    return False, error
+        
+        is_valid, message = self._close_audit(tally, 0, total)
+        return is_valid, f"{message} in {len(segments)} segments" if is_valid else message
     
     def verify_conservation(self) -> Tuple[bool, str]:
         """
@@ -722,7 +1394,7 @@ class Ledger:
     
     def get_audit_summary(self) -> Dict:
         """Generate a comprehensive audit summary."""
-        is_chain_valid, chain_message = self.verify_chain_integrity()
+        is_chain_valid, chain_message = self.verify_chain_integrity(incremental=True)
         is_balanced, balance_message = self.verify_conservation()
         
         return {
@@ -738,6 +1410,7 @@ class Ledger:
             "chain_integrity": {
                 "valid": is_chain_valid,
                 "message": chain_message,
+                "checkpoint": self.checkpoint.to_dict() if self.checkpoint else None,
             },
             "conservation_of_value": {
                 "valid": is_balanced,
@@ -758,9 +1431,144 @@ class Ledger:
             "last_hash": self.last_hash,
             "accounts": {k: v.to_dict() for k, v in self.accounts.items()},
             "transactions": {k: v.to_dict() for k, v in self.transactions.items()},
-            "posted_transactions": self.posted_transactions,
+            "posted_transactions": list(self.posted_transactions),
+            "batches": {k: v.to_dict() for k, v in self.batches.items()},
+            "checkpoint": self.checkpoint.to_dict() if self.checkpoint else None,
             "audit_totals": {
                 "total_debits": str(self._total_debits_posted),
                 "total_credits": str(self._total_credits_posted),
             },
         }
+
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def _benchmark(transfer_count: int = 50_000, account_count: int = 1_000) -> None:
+    """
+    Posting throughput: transfer() one at a time vs transfer_batch().
+    
+    Expect roughly 3-4x, not 10x: the chain commits to every member, so
+    each transfer still costs a Transaction, two Entry objects and a
+    SHA-256 member hash, which is most of what remains.
+    """
+    import time
+    
+    def fresh_ledger() -> Ledger:
+        ledger = Ledger()
+        ledger.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING", allow_negative=True)
+        for i in range(account_count):
+            ledger.create_account(f"Wallet {i}", AccountType.ASSET, account_id=f"ACC-{i}")
+            ledger.transfer("FUNDING", f"ACC-{i}", Decimal("1000.00"))
+        return ledger
+    
+    transfers = [
+        (f"ACC-{i % account_count}", f"ACC-{(i * 7919 + 1) % account_count}", Decimal("1.25"))
+        for i in range(transfer_count)
+    ]
+    print(f"Ledger benchmark: {transfer_count} transfers across {account_count} accounts")
+    
+    ledger = fresh_ledger()
+    start = time.perf_counter()
+    for from_account, to_account, amount in transfers:
+        ledger.transfer(from_account, to_account, amount)
+    single = time.perf_counter() - start
+    
+    ledger = fresh_ledger()
+    start = time.perf_counter()
+    ledger.transfer_batch(transfers, description="Benchmark netting")
+    batched = time.perf_counter() - start
+    assert ledger.verify_chain_integrity()[0] and ledger.verify_conservation()[0]
+    
+    print(f"  transfer()       {transfer_count / single:>10,.0f} txn/s")
+    print(f"  transfer_batch() {transfer_count / batched:>10,.0f} txn/s ({single / batched:.1f}x)")
+
+
+def _peak_growth(compact: bool, transaction_count: int) -> Tuple[int, int]:
+    """Peak RSS growth and journal size from posting transaction_count transfers."""
+    import resource
+    import sys
+    
+    def peak_rss() -> int:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    
+    ledger = Ledger(compact=compact)
+    ledger.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING", allow_negative=True)
+    for i in range(100):
+        ledger.create_account(f"Wallet {i}", AccountType.ASSET, account_id=f"ACC-{i}")
+        ledger.transfer("FUNDING", f"ACC-{i}", Decimal("1000000.00"))
+    
+    before = peak_rss()
+    for i in range(transaction_count):
+        ledger.transfer(f"ACC-{i % 100}", f"ACC-{(i * 37 + 1) % 100}", Decimal("1.25"))
+    growth = peak_rss() - before
+    journal_bytes = ledger.journal.nbytes() if ledger.journal else 0
+    ledger.close()
+    return growth, journal_bytes
+
+
+def _memory_benchmark(transaction_count: int = 200_000) -> None:
+    """Resident memory per 1M posted transactions, in-memory vs compact."""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    scale = 1_000_000 / transaction_count
+    print(f"Ledger memory: {transaction_count} transfers, scaled to 1M")
+    for label, compact in (("memory", False), ("compact", True)):
+        # Fresh process per mode so peak RSS is not shared
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            growth, journal_bytes = pool.submit(_peak_growth, compact, transaction_count).result()
+        print(
+            f"  {label:8s} RSS {growth * scale / 2**20:>8,.0f} MiB per 1M txn"
+            + (f" | journal {journal_bytes * scale / 2**20:,.0f} MiB on disk" if journal_bytes else "")
+        )
+
+
+def _audit_benchmark(transaction_count: int = 200_000, new_count: int = 1_000) -> None:
+    """Chain audit time: full, incremental after new activity, and parallel full."""
+    import time
+    
+    ledger = Ledger()
+    ledger.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING", allow_negative=True)
+    for i in range(100):
+        ledger.create_account(f"Wallet {i}", AccountType.ASSET, account_id=f"ACC-{i}")
+    
+    def post(count: int) -> None:
+        for i in range(0, count, 1_000):
+            ledger.transfer_batch(
+                [("FUNDING", f"ACC-{j % 100}", Decimal("1.25")) for j in range(i, min(i + 1_000, count))]
+            )
+    
+    post(transaction_count)
+    print(f"Ledger audit: {transaction_count} posted, {new_count} new since checkpoint, {os.cpu_count()} CPUs")
+    
+    start = time.perf_counter()
+    assert ledger.verify_chain_integrity()[0]
+    full = time.perf_counter() - start
+    
+    post(new_count)
+    start = time.perf_counter()
+    assert ledger.verify_chain_integrity(incremental=True)[0]
+    incremental = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    is_valid, message = ledger.verify_chain_parallel()
+    assert is_valid, message
+    parallel = time.perf_counter() - start
+    
+    print(f"  full          {full * 1000:>10,.1f} ms")
+    print(f"  incremental   {incremental * 1000:>10,.1f} ms ({full / incremental:,.0f}x)")
+    print(f"  parallel full {parallel * 1000:>10,.1f} ms ({message})")
+
+
+if __name__ == "__main__":
+    import sys
+    # Run the package copy of the module: store.py imports it by name
+    from modules.finance import ledger
+    if "--memory" in sys.argv:
+        ledger._memory_benchmark()
+    elif "--audit" in sys.argv:
+        ledger._audit_benchmark()
+    else:
+        ledger._benchmark()
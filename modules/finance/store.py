@@ -0,0 +1,451 @@
+"""
+ChainBridge Ledger Storage
+==========================
+
+Compact storage backend for the double-entry Ledger, selected with
+Ledger(compact=True). The public Ledger API is unchanged; only where
+state lives differs:
+
+- ColumnarAccounts: balances as integer cents in an array column indexed
+  by account slot, with the other account fields in parallel columns.
+  Lookups return Account views that read and write the columns.
+- TransactionJournal: posted transactions are appended to a journal file
+  and dropped from memory. The file is memory-mapped for reads, so
+  verify_chain_integrity and reversals decode transactions on demand.
+
+JOURNAL FORMAT:
+Each record is <u32 payload length><u16 id length><u8 kind><id><payload>,
+and payload is compact JSON. Kind "P" is a posting (chain order) holding
+the transaction's to_dict(); kind "U" is a later update of a posted
+transaction holding only its unhashed fields (status, metadata), e.g.
+after a reversal. Hashed content is only ever read from the posting
+record (INV-FIN-002), so the journal is strictly append-only.
+
+PAC: PAC-FIN-P200-INVISIBLE-BANK-INIT
+"""
+
+from array import array
+from collections.abc import Mapping, MutableMapping, Sequence
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Iterator, List, Optional
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from modules.finance.ledger import (
+    Account, AccountType, Transaction, TransactionStatus,
+    ImmutabilityViolationError, LedgerError,
+)
+
+
+_CENT = Decimal("0.01")
+_ACCOUNT_TYPES = list(AccountType)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_FLAG_ACTIVE = 1
+_FLAG_ALLOW_NEGATIVE = 2
+
+_HEADER = struct.Struct("<IHc")
+_KIND_POSTED = b"P"
+_KIND_UPDATE = b"U"
+
+
+# =============================================================================
+# COLUMNAR ACCOUNTS
+# =============================================================================
+
+def _to_cents(amount: Decimal) -> int:
+    """Decimal amount -> integer minor units (cents)."""
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def _column_property(column: str, doc: str) -> property:
+    """Read/write property for a plain per-slot column."""
+    def getter(self):
+        return getattr(self._store, column)[self._slot]
+    
+    def setter(self, value):
+        getattr(self._store, column)[self._slot] = value
+    
+    return property(getter, setter, doc=doc)
+
+
+class AccountView(Account):
+    """
+    An Account whose fields live in a ColumnarAccounts slot.
+    
+    Behaves like Account (same methods, equality and to_dict); reads
+    and writes go straight to the columns, so every view of a slot
+    sees the same balance.
+    """
+    
+    def __init__(self, store: "ColumnarAccounts", slot: int):
+        self._store = store
+        self._slot = slot
+    
+    account_id = property(lambda self: self._store.account_ids[self._slot], doc="Account ID")
+    name = _column_property("names", "Human-readable name")
+    currency = _column_property("currencies", "ISO currency code")
+    
+    @property
+    def balance(self) -> Decimal:
+        """Balance, stored as integer cents."""
+        return Decimal(self._store.balances[self._slot]).scaleb(-2)
+    
+    @balance.setter
+    def balance(self, value: Decimal) -> None:
+        self._store.balances[self._slot] = _to_cents(value)
+    
+    @property
+    def account_type(self) -> AccountType:
+        return _ACCOUNT_TYPES[self._store.types[self._slot]]
+    
+    @account_type.setter
+    def account_type(self, value: AccountType) -> None:
+        self._store.types[self._slot] = _ACCOUNT_TYPES.index(value)
+    
+    @property
+    def created_at(self) -> datetime:
+        return _EPOCH + timedelta(microseconds=self._store.created_us[self._slot])
+    
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._store.created_us[self._slot] = (value - _EPOCH) // timedelta(microseconds=1)
+    
+    @property
+    def is_active(self) -> bool:
+        return bool(self._store.flags[self._slot] & _FLAG_ACTIVE)
+    
+    @is_active.setter
+    def is_active(self, value: bool) -> None:
+        self._store.set_flag(self._slot, _FLAG_ACTIVE, value)
+    
+    @property
+    def allow_negative(self) -> bool:
+        return bool(self._store.flags[self._slot] & _FLAG_ALLOW_NEGATIVE)
+    
+    @allow_negative.setter
+    def allow_negative(self, value: bool) -> None:
+        self._store.set_flag(self._slot, _FLAG_ALLOW_NEGATIVE, value)
+    
+    @property
+    def metadata(self) -> Dict:
+        metadata = self._store.metadata[self._slot]
+        if metadata is None:
+            metadata = self._store.metadata[self._slot] = {}
+        return metadata
+    
+    @metadata.setter
+    def metadata(self, value: Dict) -> None:
+        self._store.metadata[self._slot] = value or None
+
+
+class ColumnarAccounts(Mapping):
+    """
+    Account store with one array column per field, indexed by slot.
+    
+    Drop-in for Ledger.accounts: account_id -> Account (an AccountView).
+    Accounts are never removed, so slots are dense.
+    """
+    
+    def __init__(self):
+        self._slots: Dict[str, int] = {}
+        self.account_ids: List[str] = []
+        self.balances = array("q")       # Integer cents
+        self.types = bytearray()         # Index into AccountType
+        self.flags = bytearray()         # _FLAG_ACTIVE | _FLAG_ALLOW_NEGATIVE
+        self.created_us = array("q")     # Microseconds since the epoch
+        self.names: List[str] = []
+        self.currencies: List[str] = []
+        self.metadata: List[Optional[Dict]] = []
+    
+    def __setitem__(self, account_id: str, account: Account) -> None:
+        """Store an account's fields (a new slot, or overwrite an existing one)."""
+        slot = self._slots.get(account_id)
+        if slot is None:
+            slot = len(self.account_ids)
+            self._slots[account_id] = slot
+            self.account_ids.append(account_id)
+            self.balances.append(0)
+            self.types.append(0)
+            self.flags.append(0)
+            self.created_us.append(0)
+            self.names.append("")
+            self.currencies.append("")
+            self.metadata.append(None)
+        
+        view = AccountView(self, slot)
+        view.name = account.name
+        view.account_type = account.account_type
+        view.currency = account.currency
+        view.balance = account.balance
+        view.created_at = account.created_at
+        view.is_active = account.is_active
+        view.allow_negative = account.allow_negative
+        view.metadata = account.metadata
+    
+    def __getitem__(self, account_id: str) -> AccountView:
+        return AccountView(self, self._slots[account_id])
+    
+    def __contains__(self, account_id) -> bool:
+        return account_id in self._slots
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.account_ids)
+    
+    def __len__(self) -> int:
+        return len(self.account_ids)
+    
+    def set_flag(self, slot: int, flag: int, value: bool) -> None:
+        """Set or clear one bit of a slot's flags."""
+        if value:
+            self.flags[slot] |= flag
+        else:
+            self.flags[slot] &= ~flag & 0xFF
+    
+    def nbytes(self) -> int:
+        """Approximate bytes held by the numeric columns."""
+        return (
+            self.balances.itemsize * len(self.balances)
+            + self.created_us.itemsize * len(self.created_us)
+            + len(self.types) + len(self.flags)
+        )
+
+
+# =============================================================================
+# TRANSACTION JOURNAL
+# =============================================================================
+
+def _decode(view, offset: int) -> Dict:
+    """Payload of the record at offset."""
+    payload_len, key_len, _ = _HEADER.unpack_from(view, offset)
+    start = offset + _HEADER.size + key_len
+    return json.loads(view[start:start + payload_len])
+
+
+def read_postings(path: str, offsets: Sequence) -> Iterator[Transaction]:
+    """
+    Decode posting records straight from a journal file, read-only.
+    
+    Used by chain verification workers in other processes. Only the
+    original posting is read (later status/metadata updates are not
+    hashed), so the caller must flush() the journal first.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for offset in offsets:
+                yield Transaction.from_dict(_decode(view, offset))
+
+
+class TransactionJournal:
+    """
+    Append-only journal of posted transactions.
+    
+    In memory it keeps only the pending transactions, one file offset
+    per posted transaction (chain order) and an ID -> posting index map.
+    Exposes two views for the Ledger:
+    
+    - transactions: mapping of every transaction ID to its Transaction
+      (pending ones from memory, posted ones decoded from the journal)
+    - posted: sequence of posted transaction IDs in chain order; append()
+      and extend() move transactions from pending to the journal
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self._owns_file = path is None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="ledger-", suffix=".journal")
+            os.close(fd)
+        self.path = path
+        self._file = open(path, "a+b")
+        if self._file.tell():
+            raise LedgerError(f"Journal {path} is not empty")
+        
+        self._size = 0
+        self._map: Optional[mmap.mmap] = None
+        self._offsets = array("Q")            # Posting records, chain order
+        self._index: Dict[str, int] = {}      # Transaction ID -> posting number
+        self._updates: Dict[str, int] = {}    # Transaction ID -> latest update offset
+        self._pending: Dict[str, Transaction] = {}
+        
+        self.transactions = JournaledTransactions(self)
+        self.posted = PostedTransactions(self)
+    
+    def close(self) -> None:
+        """Close the journal (and delete it if it was a temporary file)."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if not self._file.closed:
+            self._file.close()
+            if self._owns_file:
+                os.unlink(self.path)
+    
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+    
+    def _write(self, kind: bytes, transaction_id: str, data: Dict) -> int:
+        """Append one record; returns its offset."""
+        key = transaction_id.encode()
+        payload = json.dumps(data, separators=(",", ":")).encode()
+        offset = self._size
+        self._file.write(_HEADER.pack(len(payload), len(key), kind))
+        self._file.write(key)
+        self._file.write(payload)
+        self._size += _HEADER.size + len(key) + len(payload)
+        return offset
+    
+    def append(self, transaction_id: str) -> None:
+        """Move a posted transaction from pending to the journal."""
+        transaction = self._pending.get(transaction_id)
+        if transaction is None or transaction.status != TransactionStatus.POSTED:
+            raise LedgerError(f"Transaction {transaction_id} is not a pending posted transaction")
+        if transaction_id in self._index:
+            raise ImmutabilityViolationError(transaction_id)
+        
+        self._offsets.append(self._write(_KIND_POSTED, transaction_id, transaction.to_dict()))
+        self._index[transaction_id] = len(self._offsets) - 1
+        del self._pending[transaction_id]
+    
+    def update(self, transaction: Transaction) -> None:
+        """
+        Record a changed posted transaction (status, metadata).
+        
+        Raises:
+            ImmutabilityViolationError: If the hashed content changed
+        """
+        transaction_id = transaction.transaction_id
+        stored = self.get(transaction_id)
+        hash_of = Transaction.compute_member_hash if stored.batch_id else Transaction.compute_hash
+        if hash_of(transaction) != stored.transaction_hash or transaction.batch_id != stored.batch_id:
+            raise ImmutabilityViolationError(transaction_id)
+        self._updates[transaction_id] = self._write(_KIND_UPDATE, transaction_id, {
+            "status": transaction.status.value,
+            "metadata": transaction.metadata,
+        })
+    
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+    
+    def _view(self) -> mmap.mmap:
+        """Memory map covering everything written so far."""
+        if self._map is None or len(self._map) < self._size:
+            self._file.flush()
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        return self._map
+    
+    def _read(self, offset: int) -> Dict:
+        return _decode(self._view(), offset)
+    
+    def _read_id(self, offset: int) -> str:
+        view = self._view()
+        _, key_len, _ = _HEADER.unpack_from(view, offset)
+        start = offset + _HEADER.size
+        return view[start:start + key_len].decode()
+    
+    def get(self, transaction_id: str) -> Optional[Transaction]:
+        """Decode a posted transaction (with its latest update), or None."""
+        number = self._index.get(transaction_id)
+        if number is None:
+            return None
+        data = self._read(self._offsets[number])
+        update = self._updates.get(transaction_id)
+        if update is not None:
+            data.update(self._read(update))
+        return Transaction.from_dict(data)
+    
+    def posted_id(self, number: int) -> str:
+        """ID of the number-th posted transaction."""
+        return self._read_id(self._offsets[number])
+    
+    def posting_offsets(self, start: int, stop: int) -> array:
+        """File offsets of postings start..stop-1 (for read_postings)."""
+        return self._offsets[start:stop]
+    
+    def flush(self) -> None:
+        """Push buffered records to the file so other processes can read them."""
+        self._file.flush()
+    
+    def __len__(self) -> int:
+        return len(self._offsets)
+    
+    def nbytes(self) -> int:
+        """Size of the journal file."""
+        return self._size
+
+
+class JournaledTransactions(MutableMapping):
+    """Ledger.transactions view over a TransactionJournal."""
+    
+    def __init__(self, journal: TransactionJournal):
+        self._journal = journal
+    
+    def __getitem__(self, transaction_id: str) -> Transaction:
+        transaction = self._journal._pending.get(transaction_id)
+        if transaction is None:
+            transaction = self._journal.get(transaction_id)
+            if transaction is None:
+                raise KeyError(transaction_id)
+        return transaction
+    
+    def __setitem__(self, transaction_id: str, transaction: Transaction) -> None:
+        if transaction_id in self._journal._index:
+            self._journal.update(transaction)
+        else:
+            self._journal._pending[transaction_id] = transaction
+    
+    def __delitem__(self, transaction_id: str) -> None:
+        if transaction_id in self._journal._index:
+            raise ImmutabilityViolationError(transaction_id)
+        del self._journal._pending[transaction_id]
+    
+    def __contains__(self, transaction_id) -> bool:
+        return transaction_id in self._journal._pending or transaction_id in self._journal._index
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from list(self._journal._pending)
+        yield from self._journal._index
+    
+    def __len__(self) -> int:
+        return len(self._journal._pending) + len(self._journal)
+
+
+class PostedTransactions(Sequence):
+    """Ledger.posted_transactions view over a TransactionJournal."""
+    
+    def __init__(self, journal: TransactionJournal):
+        self._journal = journal
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._journal.posted_id(i) for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("posted transaction index out of range")
+        return self._journal.posted_id(position)
+    
+    def __len__(self) -> int:
+        return len(self._journal)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._journal._index)
+    
+    def __contains__(self, transaction_id) -> bool:
+        return transaction_id in self._journal._index
+    
+    def append(self, transaction_id: str) -> None:
+        self._journal.append(transaction_id)
+    
+    def extend(self, transaction_ids) -> None:
+        for transaction_id in transaction_ids:
+            self._journal.append(transaction_id)
@@ -70,14 +70,13 @@ class GaaSPersistence:
         Creates or opens the tenant's shard and records
         initialization in the audit log.
         """
-        shard = self._shard_manager.get_shard(tenant_id, create=True)
-        
-        # Record initialization
-        shard.write_ledger("TENANT_INIT", {
-            "tenant_id": tenant_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "event": "persistence_initialized",
-        })
+        with self._shard_manager.use_shard(tenant_id, create=True) as shard:
+            # Record initialization
+            shard.write_ledger("TENANT_INIT", {
+                "tenant_id": tenant_id,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "event": "persistence_initialized",
+            })
         
         logger.info(f"[GAAS_PERSIST] Initialized tenant {tenant_id}")
         return shard
@@ -92,23 +91,23 @@ class GaaSPersistence:
         
         Returns the entry ID.
         """
-        shard = self._shard_manager.get_shard(tenant_id)
-        return shard.write_ledger(entry_type, payload, signature)
+        with self._shard_manager.use_shard(tenant_id) as shard:
+            return shard.write_ledger(entry_type, payload, signature)
     
     def read_entries(self, tenant_id: str, entry_type: str = None, limit: int = 100) -> list:
         """Read ledger entries for a tenant."""
-        shard = self._shard_manager.get_shard(tenant_id)
-        return shard.read_ledger(entry_type=entry_type, limit=limit)
+        with self._shard_manager.use_shard(tenant_id) as shard:
+            return shard.read_ledger(entry_type=entry_type, limit=limit)
     
     def set_config(self, tenant_id: str, key: str, value: Any):
         """Set a configuration value for a tenant."""
-        shard = self._shard_manager.get_shard(tenant_id)
-        shard.set_config(key, value)
+        with self._shard_manager.use_shard(tenant_id) as shard:
+            shard.set_config(key, value)
     
     def get_config(self, tenant_id: str, key: str, default: Any = None) -> Any:
         """Get a configuration value for a tenant."""
-        shard = self._shard_manager.get_shard(tenant_id)
-        return shard.get_config(key, default)
+        with self._shard_manager.use_shard(tenant_id) as shard:
+            return shard.get_config(key, default)
     
     def checkpoint_tenant(self, tenant_id: str):
         """
@@ -117,13 +116,12 @@ class GaaSPersistence:
         Ensures all data is flushed to disk (WAL checkpoint).
         """
         try:
-            shard = self._shard_manager.get_shard(tenant_id, create=False)
-            
-            # Record checkpoint
-            shard.write_ledger("CHECKPOINT", {
-                "tenant_id": tenant_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-            })
+            with self._shard_manager.use_shard(tenant_id, create=False) as shard:
+                # Record checkpoint
+                shard.write_ledger("CHECKPOINT", {
+                    "tenant_id": tenant_id,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                })
             
             # Close shard (triggers WAL checkpoint)
             self._shard_manager.close_shard(tenant_id)
@@ -139,13 +137,12 @@ class GaaSPersistence:
         Used after respawn to confirm INV-DATA-004.
         """
         try:
-            shard = self._shard_manager.get_shard(tenant_id, create=False)
-            
-            # Get integrity check
-            integrity = shard.verify_integrity()
-            
-            # Check for initialization entry
-            entries = shard.read_ledger(entry_type="TENANT_INIT", limit=1)
+            with self._shard_manager.use_shard(tenant_id, create=False) as shard:
+                # Get integrity check
+                integrity = shard.verify_integrity()
+                
+                # Check for initialization entry
+                entries = shard.read_ledger(entry_type="TENANT_INIT", limit=1)
             has_init = len(entries) > 0
             
             return {
@@ -21,10 +21,12 @@ The Mesh Layer enables Sovereign Nodes to:
 
 Components:
   - networking.py: The Listener (mTLS server, peer connections)
+  - wire.py: The Tongue (canonical binary framing for MeshMessage)
   - discovery.py: The Gossip (SWIM-lite protocol, peer discovery)
   - identity.py: The Seal (Ed25519 keys, signature verification) [P305]
   - trust.py: The Gatekeeper (trust registry, ban propagation) [P305]
   - consensus.py: The Parliament (Raft leader election, log replication) [P310]
+  - raft_log.py: The Archive (append-only segmented Raft log) [P310]
   - topology.py: The Map (network state, routing)
   - attestation.py: The Chain (cross-node proofs)
 
@@ -44,11 +46,13 @@ TRAINING SIGNAL:
 __version__ = "3.0.0"
 __phase__ = "THE_MESH"
 
-from .networking import MeshNode, PeerConnection, MeshConfig
+from .networking import MeshNode, PeerConnection, MeshConfig, OverflowPolicy, DispatchOverflow
+from .wire import WireError
 from .discovery import GossipProtocol, PeerRegistry, DiscoveryEvent
 from .identity import NodeIdentity, IdentityManager
 from .trust import TrustRegistry, BanProof, TrustLevel, BanReason
-from .consensus import ConsensusEngine, RaftState, LogEntry, ClusterSimulator
+from .consensus import ConsensusEngine, RaftState, LogEntry, ClusterSimulator, LogStorage
+from .raft_log import SegmentedLogStore
 from .explorer import MeshExplorer, NodeStatus, NetworkTopology, HealthReport, NodeRole, NodeHealth
 
 __all__ = [
@@ -56,6 +60,9 @@ __all__ = [
     "MeshNode",
     "PeerConnection",
     "MeshConfig",
+    "OverflowPolicy",
+    "DispatchOverflow",
+    "WireError",
     # Discovery (P300)
     "GossipProtocol",
     "PeerRegistry",
@@ -73,6 +80,8 @@ __all__ = [
     "RaftState",
     "LogEntry",
     "ClusterSimulator",
+    "LogStorage",
+    "SegmentedLogStore",
     # Explorer (P330)
     "MeshExplorer",
     "NodeStatus",
@@ -13,6 +13,11 @@ The Consensus Engine provides:
   - Leader Election via RequestVote RPC
   - Log Replication via AppendEntries RPC
   - Crash-safe Term and Vote persistence
+  - Append-only segmented log storage with group commit
+  - Optional proposal batching (many proposals, one round, one fsync)
+  - Log compaction at state machine snapshots (ReplicationEngine)
+  - InstallSnapshot RPC and conflict-term backtracking for fast catch-up
+  - Concurrent per-peer replication with pipelined, size-capped AppendEntries
   - Heartbeat-based failure detection
 
 INVARIANTS:
@@ -52,6 +57,8 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .raft_log import SegmentedLogStore, DEFAULT_SEGMENT_MAX_BYTES
+
 __version__ = "3.0.0"
 
 logger = logging.getLogger(__name__)
@@ -153,6 +160,29 @@ class AppendEntriesResponse:
     success: bool
     follower_id: str
     match_index: int  # Highest index known to be replicated
+    conflict_term: int = 0   # Term of the conflicting entry (0 = log too short)
+    conflict_index: int = 0  # First index of conflict_term (or follower's next index)
+
+
+@dataclass
+class InstallSnapshotRequest:
+    """InstallSnapshot RPC request (one chunk of a serialized snapshot)."""
+    term: int
+    leader_id: str
+    last_included_index: int
+    last_included_term: int
+    offset: int     # Character offset of this chunk in the snapshot JSON
+    data: str       # Chunk of the snapshot JSON
+    done: bool      # True for the final chunk
+
+
+@dataclass
+class InstallSnapshotResponse:
+    """InstallSnapshot RPC response."""
+    term: int
+    success: bool
+    follower_id: str
+    bytes_received: int
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -189,6 +219,13 @@ class PersistentState:
         )
 
 
+class LogStorage:
+    """Supported persistent log formats."""
+    
+    SEGMENTED = "segmented"         # Append-only binary segments, group commit (default)
+    JSON = "json"                   # Legacy: whole PersistentState rewritten per save
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # CONSENSUS ENGINE
 # ══════════════════════════════════════════════════════════════════════════════
@@ -212,13 +249,29 @@ class ConsensusEngine:
     ELECTION_TIMEOUT_MIN_MS = 300
     ELECTION_TIMEOUT_MAX_MS = 500
     
+    # Proposal batching
+    PROPOSAL_BATCH_MAX = 1024       # Max entries coalesced into one round
+    PROPOSAL_BATCH_WINDOW_MS = 0    # Extra wait to gather proposals (0 = one loop turn)
+    
+    # Replication
+    MAX_ENTRIES_PER_RPC = 256       # Entries carried by one AppendEntries
+    MAX_INFLIGHT_RPCS = 4           # Pipelined AppendEntries per peer awaiting a response
+    MAX_CATCHUP_ROUNDS = 8          # Back-to-back AppendEntries retries after a rejection
+    SNAPSHOT_CHUNK_SIZE = 64 * 1024 # Characters of snapshot JSON per InstallSnapshot RPC
+    
     def __init__(
         self,
         node_id: str,
         peers: List[str],
         persistence_path: Optional[str] = None,
         on_commit: Optional[Callable[[LogEntry], None]] = None,
-        on_state_change: Optional[Callable[[RaftState], None]] = None
+        on_state_change: Optional[Callable[[RaftState], None]] = None,
+        storage: str = LogStorage.SEGMENTED,
+        batch_proposals: bool = False,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        snapshot_provider: Optional[Callable[[], Any]] = None,
+        on_install_snapshot: Optional[Callable[[Dict[str, Any]], None]] = None,
+        snapshot_threshold: int = 0
     ):
         """
         Initialize consensus engine.
@@ -229,15 +282,43 @@ class ConsensusEngine:
             persistence_path: Directory for persistent state
             on_commit: Callback when entry is committed
             on_state_change: Callback when state changes
+            storage: LogStorage.SEGMENTED (default) or LogStorage.JSON (legacy)
+            batch_proposals: Coalesce concurrent proposals into one
+                             AppendEntries round and one fsync
+            segment_max_bytes: Log segment rotation size
+            snapshot_provider: Returns a state machine snapshot at the last
+                               applied index (e.g. ReplicationEngine.create_snapshot)
+            on_install_snapshot: Restores the state machine from a snapshot
+                                 dict (received from the leader or on restart)
+            snapshot_threshold: Compact once this many applied entries are
+                                retained in the log (0 = manual compact_log only)
         """
+        if storage not in (LogStorage.SEGMENTED, LogStorage.JSON):
+            raise ValueError(f"Unknown log storage: {storage}")
+        
         self.node_id = node_id
         self.peers = list(peers)
         self.persistence_path = persistence_path
         self.on_commit = on_commit
         self.on_state_change = on_state_change
+        self.storage = storage
+        self.batch_proposals = batch_proposals
+        self.segment_max_bytes = segment_max_bytes
+        self.snapshot_provider = snapshot_provider
+        self.on_install_snapshot = on_install_snapshot
+        self.snapshot_threshold = snapshot_threshold
         
         # Persistent state (survives crashes)
         self._persistent = PersistentState()
+        self._log_store: Optional[SegmentedLogStore] = None
+        self._saved_meta: Optional[Tuple[int, Optional[str]]] = None
+        
+        # Compaction: log holds entries after _snapshot_index only
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._snapshot_index = 0
+        self._snapshot_term = 0
+        self._snapshot_buffer: List[str] = []
+        self._snapshot_buffer_size = 0
         
         # Volatile state (all servers)
         self._state = RaftState.FOLLOWER
@@ -259,6 +340,16 @@ class ConsensusEngine:
         self._rpc_handlers: Dict[str, Callable] = {}
         self._send_rpc: Optional[Callable] = None
         
+        # Per-peer replication tasks (leader only)
+        self._replicators: Dict[str, asyncio.Task] = {}
+        self._replicate_again: Set[str] = set()
+        self._replication_progress = asyncio.Event()
+        
+        # Proposal batching (leader only)
+        self._proposal_queue: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._proposal_flush_task: Optional[asyncio.Task] = None
+        self._proposal_batches = 0
+        
         # Load persistent state
         self._load_state()
     
@@ -300,20 +391,51 @@ class ConsensusEngine:
     
     @property
     def log(self) -> List[LogEntry]:
-        """Get the log entries."""
+        """Get the log entries retained after the last snapshot."""
         return self._persistent.log
     
+    @property
+    def snapshot_index(self) -> int:
+        """Last log index covered by the current snapshot (0 if none)."""
+        return self._snapshot_index
+    
+    @property
+    def latest_snapshot(self) -> Optional[Dict[str, Any]]:
+        """The current snapshot (StateSnapshot dict), if any."""
+        return self._snapshot
+    
     @property
     def last_log_index(self) -> int:
         """Index of last log entry (0 if empty)."""
-        return len(self._persistent.log)
+        return self._snapshot_index + len(self._persistent.log)
     
     @property
     def last_log_term(self) -> int:
         """Term of last log entry (0 if empty)."""
         if self._persistent.log:
             return self._persistent.log[-1].term
-        return 0
+        return self._snapshot_term
+    
+    def _term_at(self, index: int) -> Optional[int]:
+        """Term of the entry at index (None if compacted or beyond the log)."""
+        if index == self._snapshot_index:
+            return self._snapshot_term
+        if index < self._snapshot_index or index > self.last_log_index:
+            return None
+        return self._persistent.log[index - self._snapshot_index - 1].term
+    
+    def _entry_at(self, index: int) -> LogEntry:
+        """Entry at index (must be retained in the log)."""
+        return self._persistent.log[index - self._snapshot_index - 1]
+    
+    def _last_index_of_term(self, term: int) -> int:
+        """Last log index holding term (0 if none)."""
+        for entry in reversed(self._persistent.log):
+            if entry.term == term:
+                return entry.index
+            if entry.term < term:
+                return 0
+        return self._snapshot_index if self._snapshot_term == term else 0
     
     # ──────────────────────────────────────────────────────────────────────────
     # STATE TRANSITIONS
@@ -502,47 +624,135 @@ class ConsensusEngine:
         
         self._last_heartbeat = time.time()
         
-        for peer in self.peers:
-            await self._send_append_entries(peer)
+        await self._replicate_to_peers()
     
-    async def _send_append_entries(self, peer: str):
-        """Send AppendEntries RPC to a peer."""
-        if self._state != RaftState.LEADER:
+    async def _replicate_to_peers(self):
+        """
+        Run one replication round against every peer concurrently.
+        
+        Returns once a quorum of peers has acknowledged the current last
+        log index (or every peer's round has finished), so commit latency
+        tracks the median follower. Slower peers keep replicating in
+        their own tasks.
+        """
+        if not self.peers:
+            self._try_advance_commit_index()
             return
         
-        next_idx = self._next_index.get(peer, 1)
-        prev_idx = next_idx - 1
-        prev_term = 0
+        target = self.last_log_index
+        needed = self.quorum_size - 1
+        tasks = [self._kick_peer(peer) for peer in self.peers]
         
-        if prev_idx > 0 and prev_idx <= len(self._persistent.log):
-            prev_term = self._persistent.log[prev_idx - 1].term
+        while self._state == RaftState.LEADER:
+            acked = sum(1 for peer in self.peers if self._match_index.get(peer, 0) >= target)
+            if acked >= needed or all(task.done() for task in tasks):
+                return
+            self._replication_progress.clear()
+            await self._replication_progress.wait()
+    
+    def _kick_peer(self, peer: str) -> asyncio.Task:
+        """Start (or re-arm) the replication task for a peer."""
+        task = self._replicators.get(peer)
+        if task is not None and not task.done():
+            self._replicate_again.add(peer)
+            return task
         
-        # Get entries to send
-        entries = self._persistent.log[prev_idx:]
+        task = asyncio.ensure_future(self._replicate_peer(peer))
+        task.add_done_callback(lambda _: self._replication_progress.set())
+        self._replicators[peer] = task
+        return task
+    
+    async def _replicate_peer(self, peer: str):
+        """Replication task for one peer: repeat while new work arrives."""
+        try:
+            while True:
+                self._replicate_again.discard(peer)
+                await self._send_append_entries(peer)
+                if peer not in self._replicate_again or self._state != RaftState.LEADER:
+                    return
+        except Exception as e:
+            logger.error(f"[{self.node_id}] Replication to {peer} failed: {e}")
+    
+    async def _send_append_entries(self, peer: str):
+        """
+        Bring one peer up to date with pipelined AppendEntries RPCs.
         
-        request = AppendEntriesRequest(
-            term=self.current_term,
-            leader_id=self.node_id,
-            prev_log_index=prev_idx,
-            prev_log_term=prev_term,
-            entries=entries,
-            leader_commit=self._commit_index
-        )
+        Each RPC carries at most MAX_ENTRIES_PER_RPC entries; up to
+        MAX_INFLIGHT_RPCS are outstanding at once, with next_index
+        advanced optimistically as each is sent. A rejection moves
+        next_index back a whole term (conflict_term hint) and is retried
+        immediately; peers behind the snapshot are sent InstallSnapshot.
+        Always sends at least one RPC, which doubles as the heartbeat.
+        """
+        inflight: Set[asyncio.Future] = set()
+        outcome = {"rejections": 0, "failed": False}
+        sent = False
         
-        if self._send_rpc:
-            try:
-                response = await self._send_rpc(peer, "AppendEntries", {
-                    "term": request.term,
-                    "leader_id": request.leader_id,
-                    "prev_log_index": request.prev_log_index,
-                    "prev_log_term": request.prev_log_term,
-                    "entries": [e.to_dict() for e in request.entries],
-                    "leader_commit": request.leader_commit
-                })
-                if response:
-                    await self._handle_append_entries_response(peer, response)
-            except Exception as e:
-                logger.debug(f"[{self.node_id}] Failed to send AppendEntries to {peer}: {e}")
+        while self._state == RaftState.LEADER and self._send_rpc and not outcome["failed"]:
+            next_idx = self._next_index.get(peer, 1)
+            caught_up = next_idx > self.last_log_index
+            
+            if inflight and (caught_up or next_idx <= self._snapshot_index or
+                             len(inflight) >= self.MAX_INFLIGHT_RPCS):
+                # Window full or nothing new to send: wait for a response
+                done, inflight = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                continue
+            
+            if outcome["rejections"] >= self.MAX_CATCHUP_ROUNDS or (caught_up and sent):
+                break
+            
+            if next_idx <= self._snapshot_index:
+                # Entries the peer needs were compacted away
+                if not await self._send_install_snapshot(peer):
+                    break
+                continue
+            
+            prev_idx = next_idx - 1
+            start = prev_idx - self._snapshot_index
+            
+            request = AppendEntriesRequest(
+                term=self.current_term,
+                leader_id=self.node_id,
+                prev_log_index=prev_idx,
+                prev_log_term=self._term_at(prev_idx) or 0,
+                entries=self._persistent.log[start:start + self.MAX_ENTRIES_PER_RPC],
+                leader_commit=self._commit_index
+            )
+            
+            # Optimistic advance so the next batch can be pipelined
+            self._next_index[peer] = next_idx + len(request.entries)
+            sent = True
+            inflight.add(asyncio.ensure_future(self._append_entries_rpc(peer, request, outcome)))
+        
+        if inflight:
+            await asyncio.wait(inflight)
+    
+    async def _append_entries_rpc(self, peer: str, request: AppendEntriesRequest, outcome: Dict[str, Any]):
+        """Send one AppendEntries RPC and process its response."""
+        try:
+            response = await self._send_rpc(peer, "AppendEntries", {
+                "term": request.term,
+                "leader_id": request.leader_id,
+                "prev_log_index": request.prev_log_index,
+                "prev_log_term": request.prev_log_term,
+                "entries": [e.to_dict() for e in request.entries],
+                "leader_commit": request.leader_commit
+            })
+        except Exception as e:
+            logger.debug(f"[{self.node_id}] Failed to send AppendEntries to {peer}: {e}")
+            response = None
+        
+        if not response:
+            # Undo the optimistic advance; retry on the next round
+            outcome["failed"] = True
+            if self._next_index.get(peer, 1) > request.prev_log_index + 1:
+                self._next_index[peer] = max(request.prev_log_index + 1, self._match_index.get(peer, 0) + 1)
+            return
+        
+        if await self._handle_append_entries_response(peer, response):
+            outcome["rejections"] += 1
+        elif not response.get("success"):
+            outcome["failed"] = True
     
     def handle_append_entries(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -565,6 +775,8 @@ class ConsensusEngine:
         
         success = False
         match_index = 0
+        conflict_term = 0
+        conflict_index = 0
         
         if req.term >= self.current_term:
             # Valid leader contact - reset election timeout
@@ -576,96 +788,262 @@ class ConsensusEngine:
                 self._transition_to(RaftState.FOLLOWER)
             
             # Check log consistency
-            if req.prev_log_index == 0:
-                # First entry, always matches
+            if req.prev_log_index <= self._snapshot_index:
+                # First entry or inside our snapshot: committed, always matches
                 success = True
-            elif req.prev_log_index <= len(self._persistent.log):
+            elif req.prev_log_index <= self.last_log_index:
                 # Check term of previous entry
-                if self._persistent.log[req.prev_log_index - 1].term == req.prev_log_term:
+                if self._term_at(req.prev_log_index) == req.prev_log_term:
                     success = True
+                else:
+                    # Conflict hint: first index of the conflicting term
+                    conflict_term = self._term_at(req.prev_log_index)
+                    conflict_index = req.prev_log_index
+                    while (conflict_index - 1 > self._snapshot_index and
+                           self._term_at(conflict_index - 1) == conflict_term):
+                        conflict_index -= 1
+            else:
+                # Log too short
+                conflict_index = self.last_log_index + 1
             
             if success:
                 # Append new entries (handle conflicts)
-                insert_idx = req.prev_log_index
+                new_entries: List[LogEntry] = []
                 
                 for entry in req.entries:
-                    if insert_idx < len(self._persistent.log):
+                    if entry.index <= self._snapshot_index:
+                        # Already covered by our snapshot
+                        continue
+                    if entry.index <= self.last_log_index:
                         # Check for conflict
-                        if self._persistent.log[insert_idx].term != entry.term:
+                        if self._term_at(entry.index) != entry.term:
                             # Delete conflicting entry and all following
-                            self._persistent.log = self._persistent.log[:insert_idx]
-                            self._persistent.log.append(entry)
+                            self._truncate_log(entry.index)
+                            new_entries.append(entry)
                         # Else: entry already present, skip
                     else:
-                        self._persistent.log.append(entry)
-                    insert_idx += 1
+                        new_entries.append(entry)
                 
+                self._append_log(new_entries)
                 self._save_state()
-                match_index = len(self._persistent.log)
+                match_index = max(req.prev_log_index + len(req.entries), self._snapshot_index)
                 
                 # Update commit index
                 if req.leader_commit > self._commit_index:
-                    self._commit_index = min(req.leader_commit, len(self._persistent.log))
+                    self._commit_index = max(self._commit_index, min(req.leader_commit, match_index))
                     self._apply_committed_entries()
         
         return {
             "term": self.current_term,
             "success": success,
             "follower_id": self.node_id,
-            "match_index": match_index
+            "match_index": match_index,
+            "conflict_term": conflict_term,
+            "conflict_index": conflict_index
         }
     
-    async def _handle_append_entries_response(self, peer: str, response: Dict[str, Any]):
-        """Handle AppendEntries response."""
+    async def _handle_append_entries_response(self, peer: str, response: Dict[str, Any]) -> bool:
+        """
+        Handle AppendEntries response.
+        
+        Returns:
+            True if next_index moved back and the peer should be retried now
+        """
         resp = AppendEntriesResponse(
             term=response["term"],
             success=response["success"],
             follower_id=response.get("follower_id", peer),
-            match_index=response.get("match_index", 0)
+            match_index=response.get("match_index", 0),
+            conflict_term=response.get("conflict_term") or 0,
+            conflict_index=response.get("conflict_index") or 0
         )
         
         # Step down if higher term
         if resp.term > self.current_term:
             self._step_down(resp.term)
-            return
+            return False
         
         if self._state != RaftState.LEADER:
-            return
+            return False
+        
+        self._replication_progress.set()
         
         if resp.success:
-            # Update match_index and next_index
-            self._match_index[peer] = resp.match_index
-            self._next_index[peer] = resp.match_index + 1
+            # Update match_index; next_index may already be ahead (pipelined)
+            self._match_index[peer] = max(self._match_index.get(peer, 0), resp.match_index)
+            self._next_index[peer] = max(self._next_index.get(peer, 1), resp.match_index + 1)
             
             # Try to advance commit index
             self._try_advance_commit_index()
+            return False
+        
+        old_next = self._next_index.get(peer, 1)
+        if old_next <= 1:
+            return False
+        
+        if resp.conflict_index:
+            # Skip the whole conflicting term in one step
+            new_next = resp.conflict_index
+            if resp.conflict_term:
+                last_of_term = self._last_index_of_term(resp.conflict_term)
+                if last_of_term:
+                    new_next = last_of_term + 1
         else:
-            # Decrement next_index and retry
-            if self._next_index.get(peer, 1) > 1:
-                self._next_index[peer] = self._next_index.get(peer, 1) - 1
+            # Follower without conflict hints: decrement
+            new_next = old_next - 1
+        
+        self._next_index[peer] = max(1, min(new_next, old_next - 1))
+        return True
+    
+    async def _send_install_snapshot(self, peer: str) -> bool:
+        """
+        Stream the current snapshot to a peer in InstallSnapshot chunks.
+        
+        Returns:
+            True if the peer installed the snapshot
+        """
+        if self._snapshot is None:
+            return False
+        
+        data = json.dumps(self._snapshot, separators=(",", ":"))
+        last_included_index = self._snapshot_index
+        offset = 0
+        
+        while True:
+            chunk = data[offset:offset + self.SNAPSHOT_CHUNK_SIZE]
+            done = offset + len(chunk) >= len(data)
+            
+            try:
+                response = await self._send_rpc(peer, "InstallSnapshot", {
+                    "term": self.current_term,
+                    "leader_id": self.node_id,
+                    "last_included_index": last_included_index,
+                    "last_included_term": self._snapshot_term,
+                    "offset": offset,
+                    "data": chunk,
+                    "done": done
+                })
+            except Exception as e:
+                logger.debug(f"[{self.node_id}] Failed to send InstallSnapshot to {peer}: {e}")
+                return False
+            
+            if not response:
+                return False
+            
+            resp = InstallSnapshotResponse(
+                term=response["term"],
+                success=response["success"],
+                follower_id=response.get("follower_id", peer),
+                bytes_received=response.get("bytes_received", 0)
+            )
+            
+            if resp.term > self.current_term:
+                self._step_down(resp.term)
+                return False
+            if self._state != RaftState.LEADER or not resp.success:
+                return False
+            
+            offset += len(chunk)
+            if done:
+                break
+        
+        logger.info(f"[{self.node_id}] Installed snapshot at index {last_included_index} on {peer}")
+        self._match_index[peer] = max(self._match_index.get(peer, 0), last_included_index)
+        self._next_index[peer] = last_included_index + 1
+        self._replication_progress.set()
+        self._try_advance_commit_index()
+        return True
+    
+    def handle_install_snapshot(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle incoming InstallSnapshot RPC (one chunk).
+        
+        Chunks are buffered until done; the snapshot then replaces the
+        state machine and every log entry it covers.
+        """
+        req = InstallSnapshotRequest(
+            term=request["term"],
+            leader_id=request["leader_id"],
+            last_included_index=request["last_included_index"],
+            last_included_term=request["last_included_term"],
+            offset=request["offset"],
+            data=request["data"],
+            done=request["done"]
+        )
+        
+        def reply(success: bool) -> Dict[str, Any]:
+            return {
+                "term": self.current_term,
+                "success": success,
+                "follower_id": self.node_id,
+                "bytes_received": self._snapshot_buffer_size
+            }
+        
+        if req.term < self.current_term:
+            return reply(False)
+        
+        if req.term > self.current_term:
+            self._step_down(req.term)
+        
+        self._reset_election_timeout()
+        self._current_leader = req.leader_id
+        if self._state == RaftState.CANDIDATE:
+            self._transition_to(RaftState.FOLLOWER)
+        
+        if req.offset == 0:
+            self._snapshot_buffer = []
+            self._snapshot_buffer_size = 0
+        elif req.offset != self._snapshot_buffer_size:
+            return reply(False)
+        
+        self._snapshot_buffer.append(req.data)
+        self._snapshot_buffer_size += len(req.data)
+        
+        if not req.done:
+            return reply(True)
+        
+        snapshot = json.loads("".join(self._snapshot_buffer))
+        self._snapshot_buffer = []
+        self._snapshot_buffer_size = 0
+        
+        if req.last_included_index <= self._commit_index:
+            # Stale: we already have everything the snapshot covers
+            return reply(True)
+        
+        self._install_snapshot(snapshot, req.last_included_index, req.last_included_term)
+        
+        if self.on_install_snapshot:
+            self.on_install_snapshot(snapshot)
+        
+        self._commit_index = max(self._commit_index, req.last_included_index)
+        self._last_applied = max(self._last_applied, req.last_included_index)
+        
+        logger.info(f"[{self.node_id}] Installed snapshot from {req.leader_id} "
+                   f"at index {req.last_included_index}")
+        return reply(True)
     
     def _try_advance_commit_index(self):
         """
         Try to advance commit index based on replication status.
         
+        The quorum match index is the quorum_size-th highest match index
+        (counting the leader's own log), found in O(peers).
+        
         INV-CON-001: Only commit entries from current term by counting replicas.
         """
         if self._state != RaftState.LEADER:
             return
         
-        # Find the highest index replicated to a majority
-        for n in range(self._commit_index + 1, len(self._persistent.log) + 1):
-            # Count replicas (including self)
-            replicas = 1  # Self
-            for peer in self.peers:
-                if self._match_index.get(peer, 0) >= n:
-                    replicas += 1
-            
-            # Check if majority and current term
-            if replicas >= self.quorum_size:
-                if self._persistent.log[n - 1].term == self.current_term:
-                    self._commit_index = n
-                    logger.info(f"[{self.node_id}] Committed index {n}")
+        # Highest index replicated to a majority (including self)
+        matches = [self.last_log_index] + [self._match_index.get(peer, 0) for peer in self.peers]
+        matches.sort(reverse=True)
+        n = matches[self.quorum_size - 1]
+        
+        # Terms never decrease along the log, so if index n is not from
+        # the current term no earlier uncommitted index is either
+        if n > self._commit_index and self._term_at(n) == self.current_term:
+            self._commit_index = n
+            logger.info(f"[{self.node_id}] Committed index {n}")
         
         self._apply_committed_entries()
     
@@ -673,12 +1051,78 @@ class ConsensusEngine:
         """Apply committed entries to state machine."""
         while self._last_applied < self._commit_index:
             self._last_applied += 1
-            entry = self._persistent.log[self._last_applied - 1]
+            entry = self._entry_at(self._last_applied)
             
             logger.debug(f"[{self.node_id}] Applying entry {entry.index}: {entry.command}")
             
             if self.on_commit:
                 self.on_commit(entry)
+        
+        if (self.snapshot_threshold and self.snapshot_provider and
+                self._last_applied - self._snapshot_index >= self.snapshot_threshold):
+            self.compact_log(self.snapshot_provider())
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # LOG COMPACTION
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    def compact_log(self, snapshot: Any) -> int:
+        """
+        Discard log entries covered by a state machine snapshot.
+        
+        Args:
+            snapshot: ReplicationEngine.create_snapshot() result (or its
+                      to_dict()); last_applied_index must be applied here
+            
+        Returns:
+            Number of log entries discarded
+            
+        Raises:
+            ValueError: If the snapshot is ahead of this node or its term
+                        does not match the log
+        """
+        data = snapshot.to_dict() if hasattr(snapshot, "to_dict") else dict(snapshot)
+        index = data["last_applied_index"]
+        term = data["last_applied_term"]
+        
+        if index <= self._snapshot_index:
+            return 0
+        if index > self._last_applied:
+            raise ValueError(f"Snapshot index {index} is beyond last applied {self._last_applied}")
+        if self._term_at(index) != term:
+            raise ValueError(f"Snapshot term {term} does not match log term "
+                           f"{self._term_at(index)} at index {index}")
+        
+        discarded = index - self._snapshot_index
+        self._install_snapshot(data, index, term)
+        
+        logger.info(f"[{self.node_id}] Compacted log through index {index} "
+                   f"({discarded} entries, {len(self._persistent.log)} retained)")
+        return discarded
+    
+    def _install_snapshot(self, snapshot: Dict[str, Any], index: int, term: int):
+        """
+        Make snapshot the base of the log.
+        
+        Entries after index are kept only if the log agrees with the
+        snapshot at index; otherwise the whole log is discarded.
+        """
+        if self._term_at(index) == term:
+            del self._persistent.log[:index - self._snapshot_index]
+        else:
+            self._persistent.log = []
+            if self._log_store:
+                self._log_store.truncate_suffix(self._log_store.first_index or 1)
+        
+        self._snapshot = snapshot
+        self._snapshot_index = index
+        self._snapshot_term = term
+        
+        # Snapshot is durable before any log segment is removed
+        self._save_snapshot()
+        if self._log_store:
+            self._log_store.truncate_prefix(index)
+        self._save_state()
     
     # ──────────────────────────────────────────────────────────────────────────
     # CLIENT INTERFACE
@@ -695,27 +1139,88 @@ class ConsensusEngine:
             Tuple of (success, message)
         """
         if self._state != RaftState.LEADER:
-            if self._current_leader:
-                return False, f"Not leader. Current leader: {self._current_leader}"
-            return False, "Not leader. No leader known."
+            return False, self._not_leader_message()
+        
+        if self.batch_proposals:
+            return await self._enqueue_proposal(command)
         
         # Append to log
         entry = LogEntry(
-            index=len(self._persistent.log) + 1,
+            index=self.last_log_index + 1,
             term=self.current_term,
             command=command
         )
-        self._persistent.log.append(entry)
+        self._append_log([entry])
         self._save_state()
         
         logger.info(f"[{self.node_id}] Proposed command at index {entry.index}")
         
-        # Send AppendEntries to all peers
-        for peer in self.peers:
-            await self._send_append_entries(peer)
+        # Replicate to all peers concurrently
+        await self._replicate_to_peers()
         
         return True, f"Command proposed at index {entry.index}"
     
+    def _not_leader_message(self) -> str:
+        """Rejection message for proposals on a non-leader."""
+        if self._current_leader:
+            return f"Not leader. Current leader: {self._current_leader}"
+        return "Not leader. No leader known."
+    
+    async def _enqueue_proposal(self, command: Dict[str, Any]) -> Tuple[bool, str]:
+        """Queue a proposal for the next batch and wait for it to be sent."""
+        future = asyncio.get_running_loop().create_future()
+        self._proposal_queue.append((command, future))
+        
+        if self._proposal_flush_task is None or self._proposal_flush_task.done():
+            self._proposal_flush_task = asyncio.ensure_future(self._flush_proposals())
+        
+        return await future
+    
+    async def _flush_proposals(self):
+        """
+        Drain queued proposals in batches.
+        
+        Each batch is appended to the log, persisted with a single fsync
+        and replicated with a single AppendEntries round.
+        """
+        # Let concurrent proposers join the batch
+        await asyncio.sleep(self.PROPOSAL_BATCH_WINDOW_MS / 1000)
+        
+        while self._proposal_queue:
+            batch = self._proposal_queue[:self.PROPOSAL_BATCH_MAX]
+            del self._proposal_queue[:self.PROPOSAL_BATCH_MAX]
+            
+            if self._state != RaftState.LEADER:
+                message = self._not_leader_message()
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result((False, message))
+                continue
+            
+            try:
+                first_index = self.last_log_index + 1
+                entries = [
+                    LogEntry(index=first_index + i, term=self.current_term, command=command)
+                    for i, (command, _) in enumerate(batch)
+                ]
+                self._append_log(entries)
+                self._save_state()
+                self._proposal_batches += 1
+                
+                logger.info(f"[{self.node_id}] Proposed {len(entries)} commands at indices "
+                           f"{first_index}-{entries[-1].index}")
+                
+                # Replicate to all peers concurrently
+                await self._replicate_to_peers()
+                
+                for entry, (_, future) in zip(entries, batch):
+                    if not future.done():
+                        future.set_result((True, f"Command proposed at index {entry.index}"))
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+    
     # ──────────────────────────────────────────────────────────────────────────
     # MAIN LOOP
     # ──────────────────────────────────────────────────────────────────────────
@@ -733,6 +1238,14 @@ class ConsensusEngine:
     async def stop(self):
         """Stop the consensus engine."""
         self._running = False
+        if self._proposal_flush_task and not self._proposal_flush_task.done():
+            await self._proposal_flush_task
+        for task in self._replicators.values():
+            task.cancel()
+        self._replicators.clear()
+        if self._log_store:
+            self._log_store.sync()
+            self._log_store.close()
         logger.info(f"[{self.node_id}] Stopping consensus engine")
     
     async def _run_loop(self):
@@ -797,6 +1310,8 @@ class ConsensusEngine:
             return self.handle_request_vote(params)
         elif method == "AppendEntries":
             return self.handle_append_entries(params)
+        elif method == "InstallSnapshot":
+            return self.handle_install_snapshot(params)
         else:
             logger.warning(f"[{self.node_id}] Unknown RPC method: {method}")
             return {"error": f"Unknown method: {method}"}
@@ -805,29 +1320,150 @@ class ConsensusEngine:
     # PERSISTENCE
     # ──────────────────────────────────────────────────────────────────────────
     
+    def _append_log(self, entries: List[LogEntry]):
+        """Append entries to the in-memory log and the log store (unsynced)."""
+        if not entries:
+            return
+        self._persistent.log.extend(entries)
+        if self._log_store:
+            self._log_store.append(entries)
+    
+    def _truncate_log(self, index: int):
+        """Delete the entry at index and all following entries."""
+        del self._persistent.log[index - self._snapshot_index - 1:]
+        if self._log_store:
+            self._log_store.truncate_suffix(index)
+    
     def _save_state(self):
-        """Save persistent state to disk."""
+        """
+        Save persistent state to disk.
+        
+        Segmented storage: rewrites term/vote metadata only when changed,
+        then syncs every log record appended since the last save with a
+        single fsync (group commit).
+        """
         if not self.persistence_path:
             return
         
-        path = Path(self.persistence_path) / f"{self.node_id}_state.json"
+        if self.storage == LogStorage.JSON:
+            path = Path(self.persistence_path) / f"{self.node_id}_state.json"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(path, "w") as f:
+                json.dump(self._persistent.to_dict(), f, indent=2)
+            return
+        
+        meta = (self._persistent.current_term, self._persistent.voted_for)
+        if meta != self._saved_meta:
+            self._write_meta()
+            self._saved_meta = meta
+        
+        self._log_store.sync()
+    
+    def _save_snapshot(self):
+        """Atomically persist the current snapshot."""
+        if not self.persistence_path or self._snapshot is None:
+            return
+        
+        path = Path(self.persistence_path) / f"{self.node_id}_snapshot.json"
         path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
         
-        with open(path, "w") as f:
-            json.dump(self._persistent.to_dict(), f, indent=2)
+        with open(tmp_path, "w") as f:
+            json.dump(self._snapshot, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    
+    def _load_snapshot(self):
+        """Load the persisted snapshot and restore the state machine from it."""
+        path = Path(self.persistence_path) / f"{self.node_id}_snapshot.json"
+        if not path.exists():
+            return
+        
+        with open(path, "r") as f:
+            self._snapshot = json.load(f)
+        
+        self._snapshot_index = self._snapshot["last_applied_index"]
+        self._snapshot_term = self._snapshot["last_applied_term"]
+        self._commit_index = self._snapshot_index
+        self._last_applied = self._snapshot_index
+        
+        # Drop entries the snapshot already covers
+        retained = [e for e in self._persistent.log if e.index > self._snapshot_index]
+        if retained and retained[0].index != self._snapshot_index + 1:
+            raise ValueError(f"Log gap after snapshot: expected index {self._snapshot_index + 1}, "
+                           f"found {retained[0].index}")
+        self._persistent.log = retained
+        
+        if self.on_install_snapshot:
+            self.on_install_snapshot(self._snapshot)
+        
+        logger.info(f"[{self.node_id}] Loaded snapshot at index {self._snapshot_index}")
+    
+    def _write_meta(self):
+        """Atomically persist current term and vote."""
+        path = Path(self.persistence_path) / f"{self.node_id}_meta.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        
+        with open(tmp_path, "w") as f:
+            json.dump({
+                "current_term": self._persistent.current_term,
+                "voted_for": self._persistent.voted_for
+            }, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
     
     def _load_state(self):
         """Load persistent state from disk."""
         if not self.persistence_path:
             return
         
-        path = Path(self.persistence_path) / f"{self.node_id}_state.json"
+        base = Path(self.persistence_path)
+        legacy_path = base / f"{self.node_id}_state.json"
         
-        if path.exists():
-            with open(path, "r") as f:
-                data = json.load(f)
-                self._persistent = PersistentState.from_dict(data)
-            
+        if self.storage == LogStorage.JSON:
+            if legacy_path.exists():
+                with open(legacy_path, "r") as f:
+                    data = json.load(f)
+                    self._persistent = PersistentState.from_dict(data)
+                
+                logger.info(f"[{self.node_id}] Loaded state: term={self.current_term}, "
+                           f"log_length={len(self._persistent.log)}")
+            self._load_snapshot()
+            return
+        
+        self._log_store = SegmentedLogStore(
+            str(base / f"{self.node_id}_log"),
+            segment_max_bytes=self.segment_max_bytes
+        )
+        entries = self._log_store.load()
+        meta_path = base / f"{self.node_id}_meta.json"
+        
+        if meta_path.exists():
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            self._persistent = PersistentState(
+                current_term=meta.get("current_term", 0),
+                voted_for=meta.get("voted_for"),
+                log=[LogEntry.from_dict(e) for e in entries]
+            )
+            self._saved_meta = (self._persistent.current_term, self._persistent.voted_for)
+        elif legacy_path.exists() and not entries:
+            # One-time migration from the legacy JSON state file
+            with open(legacy_path, "r") as f:
+                self._persistent = PersistentState.from_dict(json.load(f))
+            self._log_store.append(self._persistent.log)
+            self._save_state()
+            logger.info(f"[{self.node_id}] Migrated {legacy_path.name} to segmented log")
+        else:
+            self._persistent = PersistentState(log=[LogEntry.from_dict(e) for e in entries])
+        
+        self._load_snapshot()
+        
+        if self._persistent.log or self.current_term:
             logger.info(f"[{self.node_id}] Loaded state: term={self.current_term}, "
                        f"log_length={len(self._persistent.log)}")
     
@@ -846,8 +1482,13 @@ class ConsensusEngine:
             "commit_index": self._commit_index,
             "last_applied": self._last_applied,
             "log_length": len(self._persistent.log),
+            "last_log_index": self.last_log_index,
+            "snapshot_index": self._snapshot_index,
             "cluster_size": self.cluster_size,
-            "quorum_size": self.quorum_size
+            "quorum_size": self.quorum_size,
+            "storage": self.storage,
+            "proposal_batches": self._proposal_batches,
+            "log_store": self._log_store.get_stats() if self._log_store else None
         }
 
 
@@ -862,8 +1503,14 @@ class ClusterSimulator:
     Provides in-memory RPC routing between nodes.
     """
     
-    def __init__(self, node_ids: List[str]):
-        """Initialize cluster simulator."""
+    def __init__(self, node_ids: List[str], **engine_kwargs):
+        """
+        Initialize cluster simulator.
+        
+        Args:
+            node_ids: Node IDs to create
+            **engine_kwargs: Extra ConsensusEngine arguments for every node
+        """
         self.node_ids = node_ids
         self.nodes: Dict[str, ConsensusEngine] = {}
         self._network_enabled: Dict[str, bool] = {}  # For partitioning
@@ -871,7 +1518,7 @@ class ClusterSimulator:
         # Create nodes
         for node_id in node_ids:
             peers = [n for n in node_ids if n != node_id]
-            engine = ConsensusEngine(node_id=node_id, peers=peers)
+            engine = ConsensusEngine(node_id=node_id, peers=peers, **engine_kwargs)
             engine.set_rpc_sender(self._make_rpc_sender(node_id))
             self.nodes[node_id] = engine
             self._network_enabled[node_id] = True
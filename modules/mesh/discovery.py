@@ -41,6 +41,7 @@ Usage:
 
 import asyncio
 import hashlib
+import heapq
 import json
 import logging
 import random
@@ -194,105 +195,207 @@ class Member:
 # PEER REGISTRY
 # ══════════════════════════════════════════════════════════════════════════════
 
+class MemberIndex:
+    """
+    Array of members with O(1) add, remove and uniform random sampling.
+    
+    Removal swaps the last member into the vacated slot, so the array
+    stays dense and random.sample() over its index range needs no scan.
+    """
+    
+    def __init__(self):
+        self._items: List[Member] = []
+        self._positions: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def __contains__(self, peer_id: str) -> bool:
+        return peer_id in self._positions
+    
+    def __iter__(self):
+        return iter(self._items)
+    
+    def put(self, member: Member):
+        """Insert a member, or replace the entry with the same peer_id."""
+        position = self._positions.get(member.peer_id)
+        if position is None:
+            self._positions[member.peer_id] = len(self._items)
+            self._items.append(member)
+        else:
+            self._items[position] = member
+    
+    def discard(self, peer_id: str):
+        """Remove a member if present (swap-remove)."""
+        position = self._positions.pop(peer_id, None)
+        if position is None:
+            return
+        last = self._items.pop()
+        if position < len(self._items):
+            self._items[position] = last
+            self._positions[last.peer_id] = position
+    
+    def sample(self, k: int, exclude: Optional[Set[str]] = None) -> List[Member]:
+        """Up to k distinct random members not in exclude, in O(k + |exclude|)."""
+        excluded = sum(1 for peer_id in exclude if peer_id in self._positions) if exclude else 0
+        k = min(k, len(self._items) - excluded)
+        if k <= 0:
+            return []
+        picks = random.sample(range(len(self._items)), min(k + excluded, len(self._items)))
+        chosen = [self._items[i] for i in picks if not exclude or self._items[i].peer_id not in exclude]
+        return chosen[:k]
+
+
 class PeerRegistry:
     """
     Central registry of known peers.
     
     Maintains the membership list and provides query methods.
     INV-NET-002: Topology Awareness
+    
+    Members are indexed by status (one MemberIndex per MemberStatus), so
+    status queries touch only matching members and random sampling is
+    O(k). Probe targets come from a shuffled round-robin over alive
+    members (SWIM 4.3): every member is probed once per cycle, new
+    members are slotted in at a random point of the current cycle.
+    
+    The status index is authoritative: callers that flip a Member's
+    status directly must follow with update_status().
     """
     
     def __init__(self):
         self._members: Dict[str, Member] = {}
-        self._lock = asyncio.Lock()
+        self._by_status: Dict[MemberStatus, MemberIndex] = {status: MemberIndex() for status in MemberStatus}
+        self._indexed_status: Dict[str, MemberStatus] = {}
+        self._probe_order: List[str] = []
+        self._probe_cursor = 0
+        self._probe_pending: Set[str] = set()     # Ids in _probe_order at or after the cursor
         self._event_log: List[DiscoveryEvent] = []
         self._max_event_log = 1000
     
+    def _index(self, member: Member):
+        """(Re)file a member under its current status."""
+        old_status = self._indexed_status.get(member.peer_id)
+        if old_status is not None and old_status != member.status:
+            self._by_status[old_status].discard(member.peer_id)
+        self._by_status[member.status].put(member)
+        self._indexed_status[member.peer_id] = member.status
+        if member.status == MemberStatus.ALIVE and old_status != MemberStatus.ALIVE:
+            self._schedule_probe(member.peer_id)
+    
+    def _schedule_probe(self, peer_id: str):
+        """Insert a peer at a random position in the rest of this probe cycle."""
+        # Still ahead of the cursor (e.g. alive -> suspect -> alive this cycle)
+        if peer_id in self._probe_pending:
+            return
+        self._probe_pending.add(peer_id)
+        self._probe_order.append(peer_id)
+        slot = random.randint(self._probe_cursor, len(self._probe_order) - 1)
+        self._probe_order[slot], self._probe_order[-1] = self._probe_order[-1], self._probe_order[slot]
+    
     async def add_member(self, member: Member) -> bool:
         """Add or update a member in the registry."""
-        async with self._lock:
-            existing = self._members.get(member.peer_id)
-            
-            if existing:
-                # Update if newer incarnation
-                if member.incarnation >= existing.incarnation:
-                    self._members[member.peer_id] = member
-                    return True
-                return False
-            else:
+        existing = self._members.get(member.peer_id)
+        
+        if existing:
+            # Update if newer incarnation
+            if member.incarnation >= existing.incarnation:
                 self._members[member.peer_id] = member
-                self._log_event(DiscoveryEvent.create(
-                    DiscoveryEventType.PEER_DISCOVERED,
-                    member.peer_id,
-                    host=member.host,
-                    port=member.port
-                ))
+                self._index(member)
                 return True
+            return False
+        else:
+            self._members[member.peer_id] = member
+            self._index(member)
+            self._log_event(DiscoveryEvent.create(
+                DiscoveryEventType.PEER_DISCOVERED,
+                member.peer_id,
+                host=member.host,
+                port=member.port
+            ))
+            return True
     
     async def remove_member(self, peer_id: str, reason: str = "left"):
         """Remove a member from the registry."""
-        async with self._lock:
-            if peer_id in self._members:
-                del self._members[peer_id]
-                self._log_event(DiscoveryEvent.create(
-                    DiscoveryEventType.PEER_LEFT if reason == "left" else DiscoveryEventType.PEER_FAILED,
-                    peer_id,
-                    reason=reason
-                ))
+        if peer_id in self._members:
+            del self._members[peer_id]
+            self._by_status[self._indexed_status.pop(peer_id)].discard(peer_id)
+            self._log_event(DiscoveryEvent.create(
+                DiscoveryEventType.PEER_LEFT if reason == "left" else DiscoveryEventType.PEER_FAILED,
+                peer_id,
+                reason=reason
+            ))
     
     async def get_member(self, peer_id: str) -> Optional[Member]:
         """Get a member by ID."""
-        async with self._lock:
-            return self._members.get(peer_id)
+        return self._members.get(peer_id)
     
     async def get_alive_members(self) -> List[Member]:
         """Get all alive members."""
-        async with self._lock:
-            return [m for m in self._members.values() if m.is_alive]
+        return list(self._by_status[MemberStatus.ALIVE])
     
     async def get_suspect_members(self) -> List[Member]:
         """Get all suspect members."""
-        async with self._lock:
-            return [m for m in self._members.values() if m.is_suspect]
+        return list(self._by_status[MemberStatus.SUSPECT])
     
     async def get_all_members(self) -> List[Member]:
         """Get all members regardless of status."""
-        async with self._lock:
-            return list(self._members.values())
+        return list(self._members.values())
     
     async def get_random_members(self, k: int, exclude: Optional[Set[str]] = None) -> List[Member]:
         """Get k random alive members."""
-        async with self._lock:
-            candidates = [
-                m for m in self._members.values()
-                if m.is_alive and (not exclude or m.peer_id not in exclude)
-            ]
-            return random.sample(candidates, min(k, len(candidates)))
+        return self._by_status[MemberStatus.ALIVE].sample(k, exclude)
+    
+    def count(self, status: MemberStatus) -> int:
+        """Number of members with a status."""
+        return len(self._by_status[status])
+    
+    async def next_probe_target(self, exclude: Optional[Set[str]] = None) -> Optional[Member]:
+        """
+        Next alive member in round-robin probe order.
+        
+        Members that died or left since the cycle was shuffled are skipped;
+        an exhausted cycle is reshuffled from the alive index (O(n) once
+        per n probes).
+        """
+        alive = self._by_status[MemberStatus.ALIVE]
+        for _ in range(2):
+            while self._probe_cursor < len(self._probe_order):
+                peer_id = self._probe_order[self._probe_cursor]
+                self._probe_cursor += 1
+                self._probe_pending.discard(peer_id)
+                if peer_id in alive and not (exclude and peer_id in exclude):
+                    return self._members[peer_id]
+            self._probe_order = [m.peer_id for m in alive]
+            random.shuffle(self._probe_order)
+            self._probe_cursor = 0
+            self._probe_pending = set(self._probe_order)
+        return None
     
     async def update_status(self, peer_id: str, status: MemberStatus):
         """Update a member's status."""
-        async with self._lock:
-            member = self._members.get(peer_id)
-            if member:
-                old_status = member.status
-                member.update_status(status)
-                
-                # Log status change
-                if status == MemberStatus.SUSPECT:
-                    self._log_event(DiscoveryEvent.create(
-                        DiscoveryEventType.PEER_SUSPECTED,
-                        peer_id
-                    ))
-                elif status == MemberStatus.DEAD:
-                    self._log_event(DiscoveryEvent.create(
-                        DiscoveryEventType.PEER_FAILED,
-                        peer_id
-                    ))
-                elif status == MemberStatus.ALIVE and old_status == MemberStatus.SUSPECT:
-                    self._log_event(DiscoveryEvent.create(
-                        DiscoveryEventType.PEER_RECOVERED,
-                        peer_id
-                    ))
+        member = self._members.get(peer_id)
+        if member:
+            old_status = self._indexed_status[peer_id]
+            member.update_status(status)
+            self._index(member)
+            
+            # Log status change
+            if status == MemberStatus.SUSPECT:
+                self._log_event(DiscoveryEvent.create(
+                    DiscoveryEventType.PEER_SUSPECTED,
+                    peer_id
+                ))
+            elif status == MemberStatus.DEAD:
+                self._log_event(DiscoveryEvent.create(
+                    DiscoveryEventType.PEER_FAILED,
+                    peer_id
+                ))
+            elif status == MemberStatus.ALIVE and old_status == MemberStatus.SUSPECT:
+                self._log_event(DiscoveryEvent.create(
+                    DiscoveryEventType.PEER_RECOVERED,
+                    peer_id
+                ))
     
     def _log_event(self, event: DiscoveryEvent):
         """Log a discovery event."""
@@ -302,24 +405,18 @@ class PeerRegistry:
     
     async def get_recent_events(self, limit: int = 100) -> List[DiscoveryEvent]:
         """Get recent discovery events."""
-        async with self._lock:
-            return self._event_log[-limit:]
+        return self._event_log[-limit:]
     
     async def get_topology_snapshot(self) -> Dict[str, Any]:
         """Get a snapshot of current topology."""
-        async with self._lock:
-            alive = [m for m in self._members.values() if m.is_alive]
-            suspect = [m for m in self._members.values() if m.is_suspect]
-            dead = [m for m in self._members.values() if m.is_dead]
-            
-            return {
-                "total_members": len(self._members),
-                "alive_count": len(alive),
-                "suspect_count": len(suspect),
-                "dead_count": len(dead),
-                "members": [m.to_dict() for m in self._members.values()],
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+        return {
+            "total_members": len(self._members),
+            "alive_count": self.count(MemberStatus.ALIVE),
+            "suspect_count": self.count(MemberStatus.SUSPECT),
+            "dead_count": self.count(MemberStatus.DEAD),
+            "members": [m.to_dict() for m in self._members.values()],
+            "timestamp": datetime.now(timezone.utc).isoformat()
+        }
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -341,6 +438,12 @@ class GossipConfig:
     
     # Limits
     max_transmissions: int = 10        # Max times to propagate update
+    max_pending_updates: int = 1024    # Queued updates (one per peer) before eviction
+    max_updates_per_message: int = 64  # Updates piggybacked per GOSSIP message
+
+
+# SWIM precedence at equal incarnation: dead overrides suspect overrides alive
+UPDATE_PRECEDENCE = {"alive": 0, "suspect": 1, "dead": 2}
 
 
 class GossipProtocol:
@@ -391,8 +494,8 @@ class GossipProtocol:
         self._on_peer_leave: List[Callable] = []
         self._on_peer_suspect: List[Callable] = []
         
-        # Updates to disseminate
-        self._pending_updates: List[Dict[str, Any]] = []
+        # Updates to disseminate (latest per peer_id)
+        self._pending_updates: Dict[str, Dict[str, Any]] = {}
         
         # Metrics
         self.metrics = {
@@ -474,46 +577,47 @@ class GossipProtocol:
         """Main SWIM protocol loop."""
         while self._running:
             await asyncio.sleep(self.config.protocol_period_ms / 1000)
-            
-            self._protocol_round += 1
-            self.metrics["protocol_rounds"] += 1
-            
-            # Get a random alive member to probe
-            members = await self.registry.get_random_members(1, exclude={self.node_id})
-            if not members:
-                continue
-            
-            target = members[0]
-            
-            # Phase 1: Direct ping
-            ack_received = await self._direct_ping(target)
+            await self._run_protocol_period()
+    
+    async def _run_protocol_period(self):
+        """One protocol period: probe the next member, then disseminate."""
+        self._protocol_round += 1
+        self.metrics["protocol_rounds"] += 1
+        
+        # Next alive member in round-robin probe order
+        target = await self.registry.next_probe_target(exclude={self.node_id})
+        if not target:
+            return
+        
+        # Phase 1: Direct ping
+        ack_received = await self._direct_ping(target)
+        
+        if ack_received:
+            target.mark_alive()
+            await self.registry.update_status(target.peer_id, MemberStatus.ALIVE)
+        else:
+            # Phase 2: Indirect ping via K members
+            ack_received = await self._indirect_ping(target)
             
             if ack_received:
                 target.mark_alive()
                 await self.registry.update_status(target.peer_id, MemberStatus.ALIVE)
             else:
-                # Phase 2: Indirect ping via K members
-                ack_received = await self._indirect_ping(target)
-                
-                if ack_received:
-                    target.mark_alive()
-                    await self.registry.update_status(target.peer_id, MemberStatus.ALIVE)
-                else:
-                    # Mark as suspect
-                    if target.is_alive:
-                        logger.warning(f"Peer {target.peer_id} is now SUSPECT")
-                        await self.registry.update_status(target.peer_id, MemberStatus.SUSPECT)
-                        self.metrics["members_suspected"] += 1
-                        
-                        # Queue update for dissemination
-                        self._queue_update({
-                            "type": "suspect",
-                            "peer_id": target.peer_id,
-                            "incarnation": target.incarnation
-                        })
-            
-            # Disseminate pending updates
-            await self._disseminate_updates()
+                # Mark as suspect
+                if target.is_alive:
+                    logger.warning(f"Peer {target.peer_id} is now SUSPECT")
+                    await self.registry.update_status(target.peer_id, MemberStatus.SUSPECT)
+                    self.metrics["members_suspected"] += 1
+                    
+                    # Queue update for dissemination
+                    self._queue_update({
+                        "type": "suspect",
+                        "peer_id": target.peer_id,
+                        "incarnation": target.incarnation
+                    })
+        
+        # Disseminate pending updates
+        await self._disseminate_updates()
     
     async def _direct_ping(self, target: Member) -> bool:
         """Send direct ping to target."""
@@ -535,7 +639,7 @@ class GossipProtocol:
                 target.last_pong_received = time.time()
                 return True
             return False
-            
+        
         except asyncio.TimeoutError:
             target.missed_pings += 1
             return False
@@ -574,7 +678,7 @@ class GossipProtocol:
             
             # If any intermediary got a response, target is alive
             return any(r is True for r in results if not isinstance(r, Exception))
-            
+        
         except asyncio.TimeoutError:
             return False
     
@@ -616,29 +720,53 @@ class GossipProtocol:
     # DISSEMINATION
     # ──────────────────────────────────────────────────────────────────────────
     
+    @staticmethod
+    def _update_priority(update: Dict[str, Any]) -> tuple:
+        """Sort key for sending: fewest transmissions first, newest incarnation first."""
+        return (update["transmissions"], -update["incarnation"])
+    
     def _queue_update(self, update: Dict[str, Any]):
-        """Queue an update for dissemination."""
+        """
+        Queue an update for dissemination.
+        
+        Only the latest update per peer is kept: a higher incarnation wins,
+        and at equal incarnation dead > suspect > alive. Past
+        max_pending_updates, the most-transmitted, oldest-incarnation
+        update is evicted.
+        """
         update["transmissions"] = 0
-        self._pending_updates.append(update)
+        current = self._pending_updates.get(update["peer_id"])
+        if current and (current["incarnation"], UPDATE_PRECEDENCE.get(current["type"], 0)) > \
+                (update["incarnation"], UPDATE_PRECEDENCE.get(update["type"], 0)):
+            return
+        self._pending_updates[update["peer_id"]] = update
+        
+        if len(self._pending_updates) > self.config.max_pending_updates:
+            evicted = max(self._pending_updates.values(), key=self._update_priority)
+            del self._pending_updates[evicted["peer_id"]]
     
     async def _disseminate_updates(self):
         """Piggyback updates on protocol messages."""
         if not self._pending_updates:
             return
         
-        members = await self.registry.get_alive_members()
-        if not members:
+        alive = self.registry.count(MemberStatus.ALIVE)
+        if not alive:
             return
         
         # Calculate dissemination target count (Λ * log(n))
-        n = len(members) + 1
+        n = alive + 1
         target_count = self.config.dissemination_multiplier * max(1, int(n.bit_length()))
         
         # Select random members
-        recipients = random.sample(members, min(target_count, len(members)))
+        recipients = await self.registry.get_random_members(target_count, exclude={self.node_id})
         
-        # Send updates
-        updates_to_send = [u for u in self._pending_updates if u["transmissions"] < self.config.max_transmissions]
+        # Send the highest-priority updates
+        updates_to_send = heapq.nsmallest(
+            self.config.max_updates_per_message,
+            self._pending_updates.values(),
+            key=self._update_priority
+        )
         
         for recipient in recipients:
             if self._send_callback:
@@ -650,15 +778,11 @@ class GossipProtocol:
         
         self.metrics["updates_disseminated"] += len(updates_to_send) * len(recipients)
         
-        # Increment transmission count
+        # Increment transmission count, removing fully disseminated updates
         for update in updates_to_send:
             update["transmissions"] += 1
-        
-        # Remove fully disseminated updates
-        self._pending_updates = [
-            u for u in self._pending_updates
-            if u["transmissions"] < self.config.max_transmissions
-        ]
+            if update["transmissions"] >= self.config.max_transmissions:
+                del self._pending_updates[update["peer_id"]]
     
     # ──────────────────────────────────────────────────────────────────────────
     # MESSAGE HANDLING
@@ -699,13 +823,13 @@ class GossipProtocol:
                 member.incarnation = update_incarnation
                 member.mark_alive()
                 await self.registry.update_status(peer_id, MemberStatus.ALIVE)
-                
+            
             elif update_type == "suspect":
                 if member.is_alive:
                     member.incarnation = update_incarnation
                     member.mark_suspect()
                     await self.registry.update_status(peer_id, MemberStatus.SUSPECT)
-                    
+            
             elif update_type == "dead":
                 member.incarnation = update_incarnation
                 member.mark_dead()
@@ -745,8 +869,8 @@ class GossipProtocol:
     
     async def get_membership_hash(self) -> str:
         """Compute hash of current membership for consistency checks."""
-        members = await self.registry.get_all_members()
-        member_ids = sorted([m.peer_id for m in members if m.is_alive])
+        members = await self.registry.get_alive_members()
+        member_ids = sorted([m.peer_id for m in members])
         content = ":".join(member_ids)
         return hashlib.sha256(content.encode()).hexdigest()[:16]
     
@@ -846,5 +970,49 @@ async def _self_test():
     print("\n🔊 The Gossip is ready. Peers will find each other.")
 
 
+async def _benchmark(member_count: int = 5000, rounds: int = 5000):
+    """
+    Benchmark membership queries and protocol periods with member_count
+    simulated members (10% suspect).
+    
+    Usage:
+        python -m modules.mesh.discovery --benchmark
+    """
+    print(f"\nDISCOVERY BENCHMARK - {member_count:,} members, {rounds:,} iterations")
+    registry = PeerRegistry()
+    for n in range(member_count):
+        await registry.add_member(Member(peer_id=f"NODE-{n:05d}", host=f"10.0.{n // 256}.{n % 256}", port=9443))
+    for n in range(0, member_count, 10):
+        await registry.update_status(f"NODE-{n:05d}", MemberStatus.SUSPECT)
+    
+    def scan_sample(k, exclude):
+        # Pre-index behaviour: filter every member, then sample
+        candidates = [m for m in registry._members.values() if m.is_alive and m.peer_id not in exclude]
+        return random.sample(candidates, min(k, len(candidates)))
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        scan_sample(3, {"NODE-ALPHA"})
+    scan_us = (time.perf_counter() - start) / rounds * 1e6
+    
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await registry.get_random_members(3, exclude={"NODE-ALPHA"})
+    index_us = (time.perf_counter() - start) / rounds * 1e6
+    print(f"  get_random_members(3)   scan {scan_us:>9.2f} µs   index {index_us:>7.2f} µs")
+    
+    gossip = GossipProtocol("NODE-ALPHA", registry, send_callback=None)
+    for n in range(member_count):
+        gossip._queue_update({"type": "alive", "peer_id": f"NODE-{n:05d}", "incarnation": n % 7})
+    pending = len(gossip._pending_updates)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await gossip._run_protocol_period()
+    period_us = (time.perf_counter() - start) / rounds * 1e6
+    print(f"  protocol period         {period_us:>9.2f} µs   "
+          f"({member_count:,} updates queued, {pending:,} kept)")
+
+
 if __name__ == "__main__":
-    asyncio.run(_self_test())
+    import sys
+    asyncio.run(_benchmark() if "--benchmark" in sys.argv else _self_test())
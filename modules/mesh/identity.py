@@ -74,6 +74,7 @@ from modules.mesh.identity_pqc import (
     VerificationError,
     migrate_legacy_identity,
     can_migrate,
+    canonical_json,
 )
 
 # Backward compatibility: expose CRYPTO_AVAILABLE flag
@@ -131,6 +132,8 @@ __all__ = [
     # Migration utilities
     "migrate_legacy_identity",
     "can_migrate",
+    # Canonical signing payloads
+    "canonical_json",
     # Backward compatibility
     "MockEd25519",
     "CRYPTO_AVAILABLE",
@@ -22,7 +22,7 @@ Version: 4.0.0
 FIPS 204: ML-DSA-65 (Dilithium)
 """
 
-from .core import HybridIdentity, HybridKeyPair, PQCKeyPair, ED25519KeyPair
+from .core import HybridIdentity, HybridKeyPair, PQCKeyPair, ED25519KeyPair, canonical_json
 from .signatures import HybridSignature, SignatureMode
 from .errors import (
     PQCError,
@@ -76,4 +76,5 @@ __all__ = [
     "can_migrate",
     "validate_public_key",
     "validate_signature",
+    "canonical_json",
 ]
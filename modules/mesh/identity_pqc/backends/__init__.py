@@ -6,11 +6,12 @@
 ╚══════════════════════════════════════════════════════════════════════════════╝
 
 Abstract base class for pluggable PQC crypto backends.
-Allows swapping dilithium-py → liboqs without code changes.
+Allows swapping dilithium-py → liboqs without code changes; see
+registry.py for how the default ML-DSA-65 backend is chosen.
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional
+from typing import Any, Tuple, Optional
 from dataclasses import dataclass
 
 
@@ -115,6 +116,28 @@ class PQCBackend(ABC):
             Public key bytes, or None if not supported
         """
         return None
+    
+    def keygen_from_seed(self, seed: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Derive a key pair from a 32-byte seed (FIPS 204 KeyGen_internal).
+        
+        Used by the backend registry's known-answer test.
+        
+        Returns:
+            Tuple of (public_key, private_key), or None if not supported
+        """
+        return None
+    
+    def sign_deterministic(self, private_key: bytes, message: bytes) -> Optional[bytes]:
+        """
+        Sign with the deterministic variant (all-zero rnd), if supported.
+        
+        Used by the backend registry's known-answer test.
+        
+        Returns:
+            Signature bytes, or None if not supported
+        """
+        return None
 
 
 class ED25519Backend(ABC):
@@ -150,9 +173,18 @@ class ED25519Backend(ABC):
         """Generate ED25519 key pair."""
         pass
     
+    def load_private_key(self, private_key: bytes) -> Any:
+        """
+        Parse a private key once for repeated signing.
+        
+        The result may be passed to sign() in place of the raw bytes.
+        Backends without a parsed form return the bytes unchanged.
+        """
+        return private_key
+    
     @abstractmethod
     def sign(self, private_key: bytes, message: bytes) -> bytes:
-        """Sign with ED25519."""
+        """Sign with ED25519 (raw key bytes or a load_private_key() result)."""
         pass
     
     @abstractmethod
@@ -176,14 +208,31 @@ def get_ed25519_backend() -> ED25519Backend:
 
 
 def get_pqc_backend() -> PQCBackend:
-    """Get the default PQC backend (dilithium-py ML-DSA-65)."""
+    """
+    Get the default PQC backend (ML-DSA-65).
+    
+    Chosen on first use by the registry: every available provider runs
+    the known-answer test and a micro-benchmark, and the fastest
+    conformant one wins. Set CHAINBRIDGE_PQC_BACKEND to a backend name
+    to override the choice.
+    """
     global _pqc_backend
     if _pqc_backend is None:
-        from .dilithium_py import DilithiumPyBackend
-        _pqc_backend = DilithiumPyBackend()
+        from .registry import select_pqc_backend
+        _pqc_backend = select_pqc_backend()
     return _pqc_backend
 
 
+def pqc_available() -> bool:
+    """True if the registry can supply a conformant ML-DSA-65 backend."""
+    from ..errors import BackendNotAvailableError
+    try:
+        get_pqc_backend()
+    except BackendNotAvailableError:
+        return False
+    return True
+
+
 def set_ed25519_backend(backend: ED25519Backend) -> None:
     """Set a custom ED25519 backend."""
     global _ed25519_backend
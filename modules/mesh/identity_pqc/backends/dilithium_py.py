@@ -212,6 +212,24 @@ class DilithiumPyBackend(PQCBackend):
             return self._ml_dsa.pk_from_sk(private_key)
         except Exception:
             return None
+    
+    def keygen_from_seed(self, seed: bytes) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Derive an ML-DSA-65 key pair from a 32-byte seed.
+        
+        Returns:
+            Tuple of (public_key, private_key) as bytes
+        """
+        return self._ml_dsa.key_derive(seed)
+    
+    def sign_deterministic(self, private_key: bytes, message: bytes) -> Optional[bytes]:
+        """
+        Sign with the deterministic ML-DSA-65 variant.
+        
+        Returns:
+            Signature (3309 bytes)
+        """
+        return self._ml_dsa.sign(private_key, message, deterministic=True)
 
 
 def get_mldsa65_backend() -> PQCBackend:
@@ -9,14 +9,17 @@ ED25519 backend using cryptography library.
 Provides the classical crypto component of hybrid signatures.
 """
 
-from typing import Tuple
+from collections import OrderedDict
+from typing import Tuple, Union
 import logging
+import threading
 
 from . import ED25519Backend, BackendInfo
 from ..constants import (
     ED25519_PUBLIC_KEY_SIZE,
     ED25519_PRIVATE_KEY_SIZE,
     ED25519_SIGNATURE_SIZE,
+    PUBLIC_KEY_CACHE_SIZE,
 )
 from ..errors import (
     BackendNotAvailableError,
@@ -54,15 +57,21 @@ class CryptographyED25519Backend(ED25519Backend):
       - Signature:   64 bytes
     
     Security Level: ~128-bit classical security
+    
+    Parsed public keys are kept in a bounded LRU cache, so verifying
+    repeatedly against the same peer skips point decompression.
     """
     
-    def __init__(self):
+    def __init__(self, public_key_cache_size: int = PUBLIC_KEY_CACHE_SIZE):
         """Initialize cryptography ED25519 backend."""
         if not CRYPTOGRAPHY_AVAILABLE:
             raise BackendNotAvailableError(
                 backend_name="cryptography",
                 install_hint="pip install cryptography>=46.0.0",
             )
+        self._public_keys: "OrderedDict[bytes, Ed25519PublicKey]" = OrderedDict()
+        self._public_key_cache_size = public_key_cache_size
+        self._cache_lock = threading.Lock()
         logger.debug("CryptographyED25519Backend initialized")
     
     @property
@@ -83,7 +92,7 @@ class CryptographyED25519Backend(ED25519Backend):
         
         Returns:
             Tuple of (public_key, private_key) as bytes
-            
+        
         Raises:
             KeyGenerationError: If key generation fails
         """
@@ -103,40 +112,62 @@ class CryptographyED25519Backend(ED25519Backend):
             
             logger.debug("Generated ED25519 key pair")
             return public_key_bytes, private_key_bytes
-            
+        
         except Exception as e:
             raise KeyGenerationError(
                 message=f"ED25519 keygen failed: {e}",
                 algorithm="ED25519",
             )
     
-    def sign(self, private_key: bytes, message: bytes) -> bytes:
+    def load_private_key(self, private_key: bytes) -> "Ed25519PrivateKey":
         """
-        Sign a message with ED25519.
+        Parse a private key once for repeated signing.
         
         Args:
             private_key: ED25519 private key (32 bytes seed)
+        
+        Returns:
+            Key object accepted by sign() in place of the raw bytes
+        
+        Raises:
+            SignatureError: If the key is malformed
+        """
+        if len(private_key) != ED25519_PRIVATE_KEY_SIZE:
+            raise SignatureError(
+                message=f"Invalid private key size: {len(private_key)} != {ED25519_PRIVATE_KEY_SIZE}",
+                algorithm="ED25519",
+            )
+        try:
+            return Ed25519PrivateKey.from_private_bytes(private_key)
+        except Exception as e:
+            raise SignatureError(
+                message=f"ED25519 private key load failed: {e}",
+                algorithm="ED25519",
+            )
+    
+    def sign(self, private_key: Union[bytes, "Ed25519PrivateKey"], message: bytes) -> bytes:
+        """
+        Sign a message with ED25519.
+        
+        Args:
+            private_key: ED25519 private key (32 bytes seed), or a key
+                object from load_private_key() to skip re-parsing
             message: Message to sign
-            
+        
         Returns:
             Signature (64 bytes)
-            
+        
         Raises:
             SignatureError: If signing fails
         """
         try:
-            # Validate private key size
-            if len(private_key) != ED25519_PRIVATE_KEY_SIZE:
-                raise SignatureError(
-                    message=f"Invalid private key size: {len(private_key)} != {ED25519_PRIVATE_KEY_SIZE}",
-                    algorithm="ED25519",
-                )
-            
-            key_obj = Ed25519PrivateKey.from_private_bytes(private_key)
-            signature = key_obj.sign(message)
-            
-            return signature
+            if isinstance(private_key, (bytes, bytearray)):
+                key_obj = self.load_private_key(bytes(private_key))
+            else:
+                key_obj = private_key
             
+            return key_obj.sign(message)
+        
         except SignatureError:
             raise
         except Exception as e:
@@ -153,7 +184,7 @@ class CryptographyED25519Backend(ED25519Backend):
             public_key: ED25519 public key (32 bytes)
             message: Original message
             signature: Signature to verify (64 bytes)
-            
+        
         Returns:
             True if valid, False otherwise
         """
@@ -166,15 +197,31 @@ class CryptographyED25519Backend(ED25519Backend):
                 logger.warning(f"Invalid signature size: {len(signature)}")
                 return False
             
-            key_obj = Ed25519PublicKey.from_public_bytes(public_key)
+            key_obj = self._load_public_key(bytes(public_key))
             key_obj.verify(signature, message)
             return True
-            
+        
         except InvalidSignature:
             return False
         except Exception as e:
             logger.warning(f"ED25519 verify error: {e}")
             return False
+    
+    def _load_public_key(self, public_key: bytes) -> "Ed25519PublicKey":
+        """Parse a public key, reusing the cached object when possible."""
+        with self._cache_lock:
+            key_obj = self._public_keys.get(public_key)
+            if key_obj is not None:
+                self._public_keys.move_to_end(public_key)
+                return key_obj
+        
+        key_obj = Ed25519PublicKey.from_public_bytes(public_key)
+        if self._public_key_cache_size > 0:
+            with self._cache_lock:
+                self._public_keys[public_key] = key_obj
+                if len(self._public_keys) > self._public_key_cache_size:
+                    self._public_keys.popitem(last=False)
+        return key_obj
 
 
 def get_ed25519_backend() -> ED25519Backend:
@@ -183,7 +230,7 @@ def get_ed25519_backend() -> ED25519Backend:
     
     Returns:
         CryptographyED25519Backend instance
-        
+    
     Raises:
         BackendNotAvailableError: If cryptography is not installed
     """
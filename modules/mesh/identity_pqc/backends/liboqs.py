@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     PQC CRYPTO BACKEND - liboqs                              ║
+║                    PAC-SEC-P819 Implementation                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+ML-DSA-65 through the liboqs native library (liboqs-python binding).
+
+Library: liboqs-python (import name "oqs"), liboqs >= 0.10 built with ML-DSA
+License: MIT
+Status: Native C, constant-time reference/AVX2 implementations
+
+Only the FIPS 204 "ML-DSA-65" mechanism is used; the round-3 "Dilithium3"
+mechanism has different encodings and is not interoperable. Whether the
+installed liboqs signs with an empty FIPS 204 context (and so verifies
+against dilithium-py) is checked by the registry's known-answer test.
+"""
+
+from typing import Tuple
+import logging
+
+from . import PQCBackend, BackendInfo
+from ..constants import (
+    BACKEND_LIBOQS,
+    MLDSA65_PUBLIC_KEY_SIZE,
+    MLDSA65_PRIVATE_KEY_SIZE,
+    MLDSA65_SIGNATURE_SIZE,
+    MLDSA65_SECURITY_LEVEL,
+)
+from ..errors import (
+    BackendNotAvailableError,
+    KeyGenerationError,
+    SignatureError,
+)
+
+logger = logging.getLogger(__name__)
+
+MECHANISM = "ML-DSA-65"
+
+# Try to import liboqs-python; it raises at import time if liboqs is missing
+try:
+    import oqs
+    LIBOQS_AVAILABLE = MECHANISM in oqs.get_enabled_sig_mechanisms()
+except Exception:
+    oqs = None
+    LIBOQS_AVAILABLE = False
+
+
+class LibOQSBackend(PQCBackend):
+    """
+    ML-DSA-65 backend using the liboqs native library.
+    
+    Key Sizes (FIPS 204):
+      - Public Key:  1952 bytes
+      - Private Key: 4032 bytes
+      - Signature:   3309 bytes
+    """
+    
+    def __init__(self):
+        """Initialize liboqs backend."""
+        if not LIBOQS_AVAILABLE:
+            raise BackendNotAvailableError(
+                backend_name=BACKEND_LIBOQS,
+                install_hint="Install liboqs with ML-DSA enabled, then pip install liboqs-python",
+            )
+        logger.debug("LibOQSBackend initialized")
+    
+    @property
+    def info(self) -> BackendInfo:
+        """Get backend information."""
+        return BackendInfo(
+            name=BACKEND_LIBOQS,
+            version=oqs.oqs_version(),
+            algorithm="ML-DSA-65",
+            security_level=MLDSA65_SECURITY_LEVEL,
+            constant_time=True,
+            fips_compliant=True,
+        )
+    
+    @property
+    def public_key_size(self) -> int:
+        """Size of public key in bytes."""
+        return MLDSA65_PUBLIC_KEY_SIZE
+    
+    @property
+    def private_key_size(self) -> int:
+        """Size of private key in bytes."""
+        return MLDSA65_PRIVATE_KEY_SIZE
+    
+    @property
+    def signature_size(self) -> int:
+        """Size of signature in bytes."""
+        return MLDSA65_SIGNATURE_SIZE
+    
+    def keygen(self) -> Tuple[bytes, bytes]:
+        """
+        Generate ML-DSA-65 key pair.
+        
+        Raises:
+            KeyGenerationError: If key generation fails
+        """
+        try:
+            with oqs.Signature(MECHANISM) as signer:
+                public_key = bytes(signer.generate_keypair())
+                private_key = bytes(signer.export_secret_key())
+        except Exception as e:
+            raise KeyGenerationError(
+                message=f"liboqs ML-DSA-65 keygen failed: {e}",
+                algorithm="ML-DSA-65",
+            )
+        
+        if len(public_key) != MLDSA65_PUBLIC_KEY_SIZE or len(private_key) != MLDSA65_PRIVATE_KEY_SIZE:
+            raise KeyGenerationError(
+                message=f"liboqs key size mismatch: {len(public_key)}/{len(private_key)}",
+                algorithm="ML-DSA-65",
+            )
+        return public_key, private_key
+    
+    def sign(self, private_key: bytes, message: bytes) -> bytes:
+        """
+        Sign a message with ML-DSA-65.
+        
+        Raises:
+            SignatureError: If signing fails
+        """
+        if len(private_key) != MLDSA65_PRIVATE_KEY_SIZE:
+            raise SignatureError(
+                message=f"Invalid private key size: {len(private_key)} != {MLDSA65_PRIVATE_KEY_SIZE}",
+                algorithm="ML-DSA-65",
+            )
+        try:
+            with oqs.Signature(MECHANISM, secret_key=private_key) as signer:
+                signature = bytes(signer.sign(message))
+        except Exception as e:
+            raise SignatureError(
+                message=f"liboqs ML-DSA-65 signing failed: {e}",
+                algorithm="ML-DSA-65",
+            )
+        
+        if len(signature) != MLDSA65_SIGNATURE_SIZE:
+            raise SignatureError(
+                message=f"Signature size mismatch: {len(signature)} != {MLDSA65_SIGNATURE_SIZE}",
+                algorithm="ML-DSA-65",
+            )
+        return signature
+    
+    def verify(self, public_key: bytes, message: bytes, signature: bytes) -> bool:
+        """
+        Verify ML-DSA-65 signature.
+        
+        Returns:
+            True if valid, False otherwise
+        """
+        if len(public_key) != MLDSA65_PUBLIC_KEY_SIZE:
+            logger.warning(f"Invalid public key size: {len(public_key)}")
+            return False
+        if len(signature) != MLDSA65_SIGNATURE_SIZE:
+            logger.warning(f"Invalid signature size: {len(signature)}")
+            return False
+        try:
+            with oqs.Signature(MECHANISM) as verifier:
+                return bool(verifier.verify(message, signature, public_key))
+        except Exception as e:
+            logger.warning(f"liboqs ML-DSA-65 verify error: {e}")
+            return False
+
+
+def is_available() -> bool:
+    """Check if liboqs with ML-DSA-65 is available."""
+    return LIBOQS_AVAILABLE
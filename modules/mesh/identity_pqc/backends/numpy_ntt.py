@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                 PQC CRYPTO BACKEND - NumPy NTT (dilithium-py)                ║
+║                    PAC-SEC-P819 Implementation                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+ML-DSA-65 on dilithium-py with the NTT-heavy arithmetic vectorised in NumPy.
+
+dilithium-py does the number-theoretic transform, the NTT-domain
+matrix-vector product and the rejection sampling of the public matrix
+A one coefficient at a time in Python. This backend keeps dilithium-py's
+FIPS 204 algorithm code and replaces only those primitives:
+
+  - forward/inverse NTT: one vectorised butterfly per layer (8 layers)
+  - A_hat @ v: a single einsum over the (k, l, 256) coefficient tensor
+  - ExpandA: whole-buffer rejection sampling of SHAKE128 output
+  - A_hat is cached per public seed rho, so repeat verifications for a
+    peer skip ExpandA entirely
+
+Outputs are bit-identical to dilithium-py (same keys, same signatures
+for the same randomness), which the backend registry checks at startup.
+
+Library: dilithium-py==1.4.0, numpy
+Status: Not constant-time (same caveat as dilithium-py)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+import logging
+
+from . import BackendInfo
+from .dilithium_py import DilithiumPyBackend, DILITHIUM_PY_AVAILABLE
+from ..constants import BACKEND_NUMPY_NTT, MLDSA65_SECURITY_LEVEL
+from ..errors import BackendNotAvailableError
+
+logger = logging.getLogger(__name__)
+
+# Try to import numpy and the dilithium-py internals this backend extends
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+if DILITHIUM_PY_AVAILABLE and NUMPY_AVAILABLE:
+    from dilithium_py.ml_dsa.ml_dsa import ML_DSA
+    from dilithium_py.ml_dsa.default_parameters import DEFAULT_PARAMETERS
+    from dilithium_py.modules.modules import Matrix, Module, Vector
+    from dilithium_py.polynomials.polynomials import (
+        Polynomial,
+        PolynomialNTT,
+        PolynomialRing,
+    )
+
+Q = 8380417
+N = 256
+MATRIX_CACHE_SIZE = 64      # Expanded A_hat matrices kept per backend
+
+
+if DILITHIUM_PY_AVAILABLE and NUMPY_AVAILABLE:
+
+    class _NTTRing(PolynomialRing):
+        """Polynomial ring whose elements transform with vectorised NTT layers."""
+        
+        def __init__(self):
+            super().__init__()
+            self.element = _NTTPolynomial
+            self.element_ntt = _NTTPolynomialNTT
+            zetas = np.array(self.ntt_zetas, dtype=np.int64)
+            # Layer with half-length h has 128 // h blocks using zetas[128//h : 256//h]
+            self.forward_layers = [
+                (h, zetas[128 // h:256 // h].reshape(-1, 1)) for h in (128, 64, 32, 16, 8, 4, 2, 1)
+            ]
+            self.inverse_layers = [
+                (h, ((Q - zetas[128 // h:256 // h][::-1]) % Q).reshape(-1, 1))
+                for h in (1, 2, 4, 8, 16, 32, 64, 128)
+            ]
+        
+        def rejection_sample_ntt_poly(self, rho, i, j):
+            """ExpandA entry: the first 256 23-bit SHAKE128 samples below q."""
+            seed = rho + bytes([j, i])
+            length = 3 * 280
+            while True:
+                raw = np.frombuffer(hashlib.shake_128(seed).digest(length), dtype=np.uint8)
+                raw = raw.reshape(-1, 3).astype(np.int64)
+                samples = raw[:, 0] | (raw[:, 1] << 8) | ((raw[:, 2] & 0x7F) << 16)
+                samples = samples[samples < Q]
+                if len(samples) >= N:
+                    return self(samples[:N].tolist(), is_ntt=True)
+                length *= 2
+    
+    class _NTTPolynomial(Polynomial):
+        """Polynomial with a vectorised forward NTT."""
+        
+        def to_ntt(self):
+            a = np.array(self.coeffs, dtype=np.int64) % Q
+            for half, zetas in self.parent.forward_layers:
+                blocks = a.reshape(-1, 2, half)
+                lo, hi = blocks[:, 0, :], blocks[:, 1, :]
+                t = (zetas * hi) % Q
+                np.subtract(lo, t, out=hi)
+                lo += t
+                a %= Q
+            return self.parent(a.tolist(), is_ntt=True)
+    
+    class _NTTPolynomialNTT(PolynomialNTT, _NTTPolynomial):
+        """NTT-domain polynomial with vectorised inverse NTT and pointwise product."""
+        
+        def from_ntt(self):
+            a = np.array(self.coeffs, dtype=np.int64) % Q
+            for half, zetas in self.parent.inverse_layers:
+                blocks = a.reshape(-1, 2, half)
+                lo, hi = blocks[:, 0, :], blocks[:, 1, :]
+                diff = lo - hi
+                lo += hi
+                np.multiply(zetas, diff, out=hi)
+                a %= Q
+            a = (a * self.parent.ntt_f) % Q
+            return self.parent(a.tolist(), is_ntt=False)
+        
+        def ntt_coefficient_multiplication(self, f_coeffs, g_coeffs):
+            f = np.array(f_coeffs, dtype=np.int64) % Q
+            g = np.array(g_coeffs, dtype=np.int64) % Q
+            return ((f * g) % Q).tolist()
+    
+    class _NTTMatrix(Matrix):
+        """Matrix whose NTT-domain product is one einsum."""
+        
+        def __matmul__(self, other):
+            m, n = self.dim()
+            n_, cols = other.dim()
+            ntt = self.parent.ring.element_ntt
+            if (
+                n != n_
+                or not all(isinstance(p, ntt) for row in self._data for p in row)
+                or not all(isinstance(other[k, j], ntt) for k in range(n_) for j in range(cols))
+            ):
+                return super().__matmul__(other)
+            
+            a = np.array([[self[i, k].coeffs for k in range(n)] for i in range(m)], dtype=np.int64) % Q
+            b = np.array([[other[k, j].coeffs for j in range(cols)] for k in range(n)], dtype=np.int64) % Q
+            # Products are < 2^46 and at most 8 are summed, so int64 cannot overflow
+            product = np.einsum("ikc,kjc->ijc", a, b) % Q
+            ring = self.parent.ring
+            return self.parent(
+                [[ring(product[i, j].tolist(), is_ntt=True) for j in range(cols)] for i in range(m)]
+            )
+    
+    class _NTTModule(Module):
+        """Module over the vectorised ring."""
+        
+        def __init__(self):
+            self.ring = _NTTRing()
+            self.matrix_element = _NTTMatrix
+            self.vector_element = Vector
+    
+    class _NumpyML_DSA(ML_DSA):
+        """dilithium-py ML-DSA over the vectorised module, with ExpandA cached by rho."""
+        
+        def __init__(self, parameter_set: dict):
+            super().__init__(parameter_set)
+            self.M = _NTTModule()
+            self.R = self.M.ring
+            self._matrices: "OrderedDict[bytes, Matrix]" = OrderedDict()
+            self._matrices_lock = threading.Lock()
+        
+        def _expand_matrix_from_seed(self, rho: bytes):
+            with self._matrices_lock:
+                matrix = self._matrices.get(rho)
+                if matrix is not None:
+                    self._matrices.move_to_end(rho)
+                    return matrix
+            matrix = super()._expand_matrix_from_seed(rho)
+            with self._matrices_lock:
+                self._matrices[rho] = matrix
+                if len(self._matrices) > MATRIX_CACHE_SIZE:
+                    self._matrices.popitem(last=False)
+            return matrix
+
+
+class NumpyMLDSABackend(DilithiumPyBackend):
+    """
+    ML-DSA-65 backend: dilithium-py with NumPy-vectorised NTT arithmetic.
+    
+    Same key and signature formats as DilithiumPyBackend; only the
+    arithmetic underneath is replaced.
+    """
+    
+    def __init__(self):
+        """Initialize NumPy-accelerated backend."""
+        if not is_available():
+            raise BackendNotAvailableError(
+                backend_name=BACKEND_NUMPY_NTT,
+                install_hint="pip install dilithium-py==1.4.0 numpy",
+            )
+        self._ml_dsa = _NumpyML_DSA(DEFAULT_PARAMETERS["ML_DSA_65"])
+        logger.debug("NumpyMLDSABackend initialized")
+    
+    def __getstate__(self):
+        # The A_hat cache and its lock stay behind when shipped to pool workers
+        return {}
+    
+    def __setstate__(self, state):
+        self.__init__()
+    
+    @property
+    def info(self) -> BackendInfo:
+        """Get backend information."""
+        return BackendInfo(
+            name=BACKEND_NUMPY_NTT,
+            version=f"dilithium-py 1.4.0 / numpy {np.__version__}",
+            algorithm="ML-DSA-65",
+            security_level=MLDSA65_SECURITY_LEVEL,
+            constant_time=False,
+            fips_compliant=True,
+        )
+
+
+def is_available() -> bool:
+    """Check if the NumPy-accelerated backend is available."""
+    return DILITHIUM_PY_AVAILABLE and NUMPY_AVAILABLE
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                    PQC CRYPTO BACKEND - REGISTRY                             ║
+║                    PAC-SEC-P819 Implementation                               ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Startup selection of the ML-DSA-65 backend.
+
+Providers are probed in preference order (native first):
+
+  1. liboqs        - native C binding, if liboqs-python is installed
+  2. numpy-ntt     - dilithium-py with NumPy-vectorised NTT arithmetic
+  3. dilithium-py  - pure-Python reference, always the fallback
+
+Each available provider must pass a known-answer test (KAT) before it is
+eligible:
+
+  - a backend with deterministic key derivation/signing must reproduce
+    the pinned FIPS 204 key pair and signature digests exactly
+  - every backend must accept the pinned signature, reject a tampered
+    copy, and produce signatures the reference backend accepts
+
+Eligible backends then sign once and verify PQC_BENCHMARK_VERIFIES times;
+the one with the lowest verify time wins (verification dominates mesh
+traffic). Setting CHAINBRIDGE_PQC_BACKEND to a backend name skips the
+benchmark, but the named backend must still pass the KAT.
+
+Usage:
+    python -m modules.mesh.identity_pqc.backends.registry
+"""
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from . import PQCBackend
+from ..constants import (
+    BACKEND_AUTO,
+    BACKEND_DILITHIUM_PY,
+    BACKEND_LIBOQS,
+    BACKEND_NUMPY_NTT,
+    MLDSA65_KAT_MESSAGE,
+    MLDSA65_KAT_PK_SHA256,
+    MLDSA65_KAT_SEED,
+    MLDSA65_KAT_SIG_SHA256,
+    MLDSA65_KAT_SK_SHA256,
+    PQC_BACKEND_ENV,
+    PQC_BENCHMARK_VERIFIES,
+)
+from ..errors import BackendNotAvailableError, BackendOperationError
+
+logger = logging.getLogger(__name__)
+
+# KAT outcomes recorded on a probe
+KAT_PASSED = "PASSED"              # Matched the pinned vectors / reference backend
+KAT_UNANCHORED = "UNANCHORED"      # Self-consistent, but no reference to check against
+KAT_FAILED = "FAILED"
+KAT_SKIPPED = "SKIPPED"            # Backend not available
+
+
+@dataclass
+class BackendProbe:
+    """Outcome of probing one PQC backend at startup."""
+    name: str
+    available: bool
+    kat: str = KAT_SKIPPED
+    sign_ms: Optional[float] = None
+    verify_ms: Optional[float] = None
+    error: Optional[str] = None
+    
+    @property
+    def conformant(self) -> bool:
+        """True if the backend may be selected."""
+        return self.kat in (KAT_PASSED, KAT_UNANCHORED)
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for logging/metrics."""
+        data = asdict(self)
+        data["conformant"] = self.conformant
+        return data
+
+
+def _dilithium_py_factory() -> PQCBackend:
+    from .dilithium_py import DilithiumPyBackend
+    return DilithiumPyBackend()
+
+
+def _numpy_ntt_factory() -> PQCBackend:
+    from .numpy_ntt import NumpyMLDSABackend
+    return NumpyMLDSABackend()
+
+
+def _liboqs_factory() -> PQCBackend:
+    from .liboqs import LibOQSBackend
+    return LibOQSBackend()
+
+
+# Preference order: earlier entries win ties in the benchmark
+_providers: Dict[str, Callable[[], PQCBackend]] = {
+    BACKEND_LIBOQS: _liboqs_factory,
+    BACKEND_NUMPY_NTT: _numpy_ntt_factory,
+    BACKEND_DILITHIUM_PY: _dilithium_py_factory,
+}
+
+_last_probes: List[BackendProbe] = []
+
+
+def register_pqc_backend(name: str, factory: Callable[[], PQCBackend]) -> None:
+    """
+    Register (or replace) a PQC backend provider.
+    
+    New providers are probed before the built-in ones. The factory
+    should raise BackendNotAvailableError if its library is missing.
+    """
+    global _providers
+    others = {key: value for key, value in _providers.items() if key != name}
+    _providers = {name: factory, **others}
+
+
+def list_pqc_backends() -> List[str]:
+    """Registered backend names in preference order."""
+    return list(_providers)
+
+
+def last_probe_results() -> List[BackendProbe]:
+    """Probes from the most recent selection or probe run."""
+    return list(_last_probes)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# KNOWN-ANSWER TEST
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _tampered(signature: bytes) -> bytes:
+    return bytes([signature[0] ^ 0x01]) + signature[1:]
+
+
+def _kat_vectors(backend: PQCBackend) -> Optional[Tuple[bytes, bytes, bytes]]:
+    """The pinned (pk, sk, sig) as produced by backend, or None if it cannot."""
+    keys = backend.keygen_from_seed(MLDSA65_KAT_SEED)
+    if keys is None:
+        return None
+    public_key, private_key = keys
+    signature = backend.sign_deterministic(private_key, MLDSA65_KAT_MESSAGE)
+    if signature is None:
+        return None
+    return public_key, private_key, signature
+
+
+def _vectors_match(vectors: Tuple[bytes, bytes, bytes]) -> bool:
+    public_key, private_key, signature = vectors
+    return (
+        _sha256(public_key) == MLDSA65_KAT_PK_SHA256
+        and _sha256(private_key) == MLDSA65_KAT_SK_SHA256
+        and _sha256(signature) == MLDSA65_KAT_SIG_SHA256
+    )
+
+
+def _reference_vectors(backends: Dict[str, PQCBackend]) -> Optional[Tuple[Tuple[bytes, bytes, bytes], PQCBackend]]:
+    """KAT vectors and the backend that reproduced them, from any capable backend."""
+    for backend in backends.values():
+        try:
+            vectors = _kat_vectors(backend)
+        except Exception:
+            continue
+        if vectors is not None and _vectors_match(vectors):
+            return vectors, backend
+    return None
+
+
+def run_kat(
+    backend: PQCBackend,
+    reference: Optional[Tuple[Tuple[bytes, bytes, bytes], PQCBackend]] = None,
+) -> str:
+    """
+    Run the ML-DSA-65 known-answer test against backend.
+    
+    Args:
+        backend: Backend under test
+        reference: (vectors, backend) from _reference_vectors, if any
+    
+    Returns:
+        KAT_PASSED or KAT_UNANCHORED
+    
+    Raises:
+        BackendOperationError: If the backend fails any check
+    """
+    name = backend.info.name
+    
+    def fail(operation: str, reason: str):
+        raise BackendOperationError(operation=operation, backend=name, reason=reason)
+    
+    own = _kat_vectors(backend)
+    if own is not None and not _vectors_match(own):
+        fail("kat", "deterministic keygen/sign does not match FIPS 204 vectors")
+    
+    if reference is None and own is None:
+        # Nothing to anchor against: require a self-consistent roundtrip
+        public_key, private_key = backend.keygen()
+        signature = backend.sign(private_key, MLDSA65_KAT_MESSAGE)
+        if not backend.verify(public_key, MLDSA65_KAT_MESSAGE, signature):
+            fail("verify", "rejects its own signature")
+        if backend.verify(public_key, MLDSA65_KAT_MESSAGE, _tampered(signature)):
+            fail("verify", "accepts a tampered signature")
+        return KAT_UNANCHORED
+    
+    vectors, reference_backend = reference if reference is not None else (own, backend)
+    public_key, private_key, signature = vectors
+    
+    if not backend.verify(public_key, MLDSA65_KAT_MESSAGE, signature):
+        fail("verify", "rejects the known-answer signature")
+    if backend.verify(public_key, MLDSA65_KAT_MESSAGE, _tampered(signature)):
+        fail("verify", "accepts a tampered signature")
+    
+    # Randomised signatures must interoperate with the reference
+    fresh = backend.sign(private_key, MLDSA65_KAT_MESSAGE)
+    if not reference_backend.verify(public_key, MLDSA65_KAT_MESSAGE, fresh):
+        fail("sign", "signature rejected by reference backend")
+    return KAT_PASSED
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PROBING AND SELECTION
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _instantiate(names: List[str]) -> Tuple[Dict[str, PQCBackend], Dict[str, BackendProbe]]:
+    backends: Dict[str, PQCBackend] = {}
+    probes: Dict[str, BackendProbe] = {}
+    for name in names:
+        try:
+            backends[name] = _providers[name]()
+            probes[name] = BackendProbe(name=name, available=True)
+        except Exception as e:
+            probes[name] = BackendProbe(name=name, available=False, error=str(e))
+    return backends, probes
+
+
+def _benchmark(backend: PQCBackend, probe: BackendProbe, verifies: int) -> None:
+    public_key, private_key = backend.keygen()
+    message = MLDSA65_KAT_MESSAGE
+    
+    start = time.perf_counter()
+    signature = backend.sign(private_key, message)
+    probe.sign_ms = (time.perf_counter() - start) * 1000
+    
+    start = time.perf_counter()
+    for _ in range(verifies):
+        backend.verify(public_key, message, signature)
+    probe.verify_ms = (time.perf_counter() - start) * 1000 / max(verifies, 1)
+
+
+def probe_pqc_backends(
+    names: Optional[List[str]] = None,
+    verifies: int = PQC_BENCHMARK_VERIFIES,
+) -> Tuple[List[BackendProbe], Dict[str, PQCBackend]]:
+    """
+    Probe registered backends: availability, KAT, then benchmark.
+    
+    Args:
+        names: Backends to probe (default: all registered)
+        verifies: Verifications per backend in the benchmark (0 skips it)
+    
+    Returns:
+        Tuple of (probes in preference order, conformant backends by name)
+    """
+    global _last_probes
+    names = list_pqc_backends() if names is None else names
+    backends, probes = _instantiate(names)
+    
+    # The reference may come from a backend outside `names` (e.g. an override)
+    reference_pool = dict(backends)
+    if BACKEND_DILITHIUM_PY not in reference_pool:
+        extra, _ = _instantiate([BACKEND_DILITHIUM_PY])
+        reference_pool.update(extra)
+    reference = _reference_vectors(reference_pool)
+    
+    conformant: Dict[str, PQCBackend] = {}
+    for name, backend in backends.items():
+        probe = probes[name]
+        try:
+            probe.kat = run_kat(backend, reference)
+            if verifies:
+                _benchmark(backend, probe, verifies)
+            conformant[name] = backend
+        except Exception as e:
+            probe.kat = KAT_FAILED
+            probe.error = str(e)
+            logger.warning(f"PQC backend {name} failed conformance: {e}")
+    
+    _last_probes = [probes[name] for name in names]
+    return list(_last_probes), conformant
+
+
+def select_pqc_backend(override: Optional[str] = None) -> PQCBackend:
+    """
+    Select the ML-DSA-65 backend for this process.
+    
+    Args:
+        override: Backend name, or "auto". Defaults to the
+            CHAINBRIDGE_PQC_BACKEND environment variable, then "auto".
+    
+    Returns:
+        The fastest conformant backend, or the named one
+    
+    Raises:
+        BackendNotAvailableError: If the named backend is unknown or missing,
+            or no backend is available at all
+        BackendOperationError: If the named backend fails the KAT
+    """
+    choice = override or os.environ.get(PQC_BACKEND_ENV) or BACKEND_AUTO
+    choice = choice.strip().lower()
+    
+    if choice != BACKEND_AUTO:
+        if choice not in _providers:
+            raise BackendNotAvailableError(
+                backend_name=choice,
+                install_hint=f"{PQC_BACKEND_ENV} must be one of: {', '.join([BACKEND_AUTO] + list_pqc_backends())}",
+            )
+        probes, conformant = probe_pqc_backends([choice], verifies=0)
+        probe = probes[0]
+        if not probe.available:
+            raise BackendNotAvailableError(backend_name=choice, install_hint=probe.error)
+        if choice not in conformant:
+            raise BackendOperationError(operation="kat", backend=choice, reason=probe.error or "failed")
+        logger.info(f"PQC backend {choice} selected by {PQC_BACKEND_ENV} (KAT {probe.kat})")
+        return conformant[choice]
+    
+    probes, conformant = probe_pqc_backends()
+    if not conformant:
+        raise BackendNotAvailableError(
+            backend_name="ML-DSA-65",
+            install_hint="pip install dilithium-py==1.4.0",
+        )
+    
+    timed = [probe for probe in probes if probe.name in conformant]
+    best = min(timed, key=lambda probe: probe.verify_ms)
+    logger.info(
+        f"PQC backend {best.name} selected "
+        f"(sign {best.sign_ms:.1f} ms, verify {best.verify_ms:.1f} ms, KAT {best.kat}); "
+        + ", ".join(f"{p.name}={'ok' if p.conformant else 'unavailable' if not p.available else 'failed'}" for p in probes)
+    )
+    return conformant[best.name]
+
+
+def _report(rounds: int = 10) -> None:
+    """Print a cross-backend conformance and throughput table."""
+    probes, conformant = probe_pqc_backends(verifies=rounds)
+    print(f"{'backend':<14} {'KAT':<11} {'sign ms':>9} {'verify ms':>10} {'verify/s':>9}")
+    for probe in probes:
+        if probe.name not in conformant:
+            print(f"{probe.name:<14} {probe.kat:<11} {'-':>9} {'-':>10} {'-':>9}  {probe.error or ''}")
+            continue
+        print(
+            f"{probe.name:<14} {probe.kat:<11} {probe.sign_ms:>9.1f} "
+            f"{probe.verify_ms:>10.1f} {1000 / probe.verify_ms:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    _report()
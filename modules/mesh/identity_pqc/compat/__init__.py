@@ -24,7 +24,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..core import HybridIdentity, HybridKeyPair, ED25519KeyPair, PQCKeyPair
+from ..core import HybridIdentity, HybridKeyPair, ED25519KeyPair, PQCKeyPair, canonical_json
 from ..signatures import HybridSignature, SignatureMode
 from ..constants import (
     NODE_ID_LENGTH,
@@ -33,7 +33,7 @@ from ..constants import (
 )
 from ..errors import NoPrivateKeyError
 from ..backends.ed25519 import CryptographyED25519Backend
-from ..backends.dilithium_py import DilithiumPyBackend
+from ..backends import get_pqc_backend
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +104,7 @@ class NodeIdentity:
         
         # Backends
         self._ed25519_backend = CryptographyED25519Backend()
+        self._ed25519_key = None    # Parsed private key, loaded on first sign
     
     def _ensure_hybrid(self) -> HybridIdentity:
         """Ensure HybridIdentity is initialized."""
@@ -116,7 +117,7 @@ class NodeIdentity:
             
             # Generate PQC keys if we have ED25519 private key but no PQC keys
             if self.private_key_bytes and not self._pqc_public_key:
-                pqc_backend = DilithiumPyBackend()
+                pqc_backend = get_pqc_backend()
                 self._pqc_public_key, self._pqc_private_key = pqc_backend.keygen()
                 logger.info(f"Generated PQC keys for {self.node_id[:16]}...")
             
@@ -128,7 +129,7 @@ class NodeIdentity:
             else:
                 # Generate minimal PQC keys for public-key-only identity
                 # (verification only, cannot sign with PQC)
-                pqc_backend = DilithiumPyBackend()
+                pqc_backend = get_pqc_backend()
                 pqc_pub, _ = pqc_backend.keygen()
                 pqc_keys = PQCKeyPair(public_key=pqc_pub, private_key=None)
             
@@ -215,7 +216,9 @@ class NodeIdentity:
         if not self.has_private_key:
             raise ValueError("Cannot sign: no private key")
         
-        return self._ed25519_backend.sign(self.private_key_bytes, message)
+        if self._ed25519_key is None:
+            self._ed25519_key = self._ed25519_backend.load_private_key(self.private_key_bytes)
+        return self._ed25519_backend.sign(self._ed25519_key, message)
     
     def sign_hybrid(self, message: bytes) -> bytes:
         """
@@ -227,11 +230,14 @@ class NodeIdentity:
         signature = hybrid.sign(message)
         return signature.to_bytes()
     
+    def sign_canonical(self, payload: bytes) -> str:
+        """Sign already-serialized canonical bytes (see canonical_json)."""
+        signature = self.sign(payload)
+        return base64.b64encode(signature).decode("ascii")
+    
     def sign_dict(self, data: Dict[str, Any]) -> str:
         """Sign a dictionary (JSON-serialized)."""
-        message = json.dumps(data, sort_keys=True).encode("utf-8")
-        signature = self.sign(message)
-        return base64.b64encode(signature).decode("ascii")
+        return self.sign_canonical(canonical_json(data))
     
     def verify(self, message: bytes, signature: bytes) -> bool:
         """
@@ -254,14 +260,21 @@ class NodeIdentity:
             except Exception:
                 return False
     
+    def verify_canonical(self, payload: bytes, signature_b64: str) -> bool:
+        """Verify a signature over already-serialized canonical bytes."""
+        try:
+            signature = base64.b64decode(signature_b64)
+            return self.verify(payload, signature)
+        except Exception:
+            return False
+    
     def verify_dict(self, data: Dict[str, Any], signature_b64: str) -> bool:
         """Verify a signed dictionary."""
         try:
-            message = json.dumps(data, sort_keys=True).encode("utf-8")
-            signature = base64.b64decode(signature_b64)
-            return self.verify(message, signature)
+            payload = canonical_json(data)
         except Exception:
             return False
+        return self.verify_canonical(payload, signature_b64)
     
     @staticmethod
     def verify_peer(
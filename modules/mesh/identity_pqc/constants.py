@@ -91,13 +91,43 @@ MAX_MESSAGE_SIZE: Final[int] = 100 * 1024 * 1024  # 100 MB
 MAX_NODE_NAME_LENGTH: Final[int] = 256
 MAX_FEDERATION_ID_LENGTH: Final[int] = 256
 
+# ══════════════════════════════════════════════════════════════════════════════
+# VERIFICATION CACHES
+# ══════════════════════════════════════════════════════════════════════════════
+
+PUBLIC_KEY_CACHE_SIZE: Final[int] = 1024     # Parsed ED25519 public keys per backend
+VERIFY_CACHE_SIZE: Final[int] = 4096         # Verified (pk, msg, sig) digests per verifier
+
+# ══════════════════════════════════════════════════════════════════════════════
+# BATCH SIGNING
+# ══════════════════════════════════════════════════════════════════════════════
+
+BATCH_PROOF_VERSION: Final[int] = 0xB1        # Leading byte of a serialized batch proof
+BATCH_SIGNATURE_PREFIX: Final[str] = "B1:"    # Marks a batch proof in a signature string
+BATCH_ROOT_DOMAIN: Final[bytes] = b"CHAINBRIDGE-BATCH-ROOT-V1"
+BATCH_MAX_SIZE: Final[int] = 64               # Messages per signed Merkle root
+BATCH_WINDOW_MS: Final[int] = 5               # Max wait for a batch to fill
+BATCH_ROOT_CACHE_SIZE: Final[int] = 1024      # Verified batch roots per verifier
+
 # ══════════════════════════════════════════════════════════════════════════════
 # BACKEND IDENTIFIERS
 # ══════════════════════════════════════════════════════════════════════════════
 
 BACKEND_DILITHIUM_PY: Final[str] = "dilithium-py"
+BACKEND_NUMPY_NTT: Final[str] = "numpy-ntt"
 BACKEND_LIBOQS: Final[str] = "liboqs"
-DEFAULT_PQC_BACKEND: Final[str] = BACKEND_DILITHIUM_PY
+BACKEND_AUTO: Final[str] = "auto"
+DEFAULT_PQC_BACKEND: Final[str] = BACKEND_DILITHIUM_PY   # Reference / last-resort fallback
+
+PQC_BACKEND_ENV: Final[str] = "CHAINBRIDGE_PQC_BACKEND"  # Backend name, or "auto"
+PQC_BENCHMARK_VERIFIES: Final[int] = 3        # Verifies per backend in the startup benchmark
+
+# ML-DSA-65 known answer: key_derive(seed) and a deterministic signature (empty context)
+MLDSA65_KAT_SEED: Final[bytes] = bytes(range(32))
+MLDSA65_KAT_MESSAGE: Final[bytes] = b"CHAINBRIDGE ML-DSA-65 KNOWN ANSWER"
+MLDSA65_KAT_PK_SHA256: Final[str] = "d666806e11cee19a7c989f7445f90dd419cf4d2d51db8c0fdb4c0f0a542238c9"
+MLDSA65_KAT_SK_SHA256: Final[str] = "9f1e24f47795fe50040384e3d6183988047170fa2d866406b70fe0a3f8216063"
+MLDSA65_KAT_SIG_SHA256: Final[str] = "8fdc572dded59af6d4674ccec78815d8fc0c44626306b5fc84cf5683837c357b"
 
 
 class SignatureMode(Enum):
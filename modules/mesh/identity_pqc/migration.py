@@ -40,7 +40,7 @@ from .errors import (
     MigrationIntegrityError,
     SerializationError,
 )
-from .backends.dilithium_py import DilithiumPyBackend, is_available as pqc_available
+from .backends import get_pqc_backend, pqc_available
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ def can_migrate(identity_path: str) -> Tuple[bool, str]:
         
         # Check PQC backend availability
         if not pqc_available():
-            return False, "PQC backend (dilithium-py) not available"
+            return False, "No conformant PQC (ML-DSA-65) backend available"
         
         return True, "Ready for migration"
         
@@ -141,7 +141,7 @@ def migrate_legacy_identity(
     # Generate new ML-DSA-65 key pair
     if ed_private is not None:
         # Full migration with signing capability
-        pqc_backend = DilithiumPyBackend()
+        pqc_backend = get_pqc_backend()
         pqc_public, pqc_private = pqc_backend.keygen()
         logger.info("Generated new ML-DSA-65 key pair for migration")
     else:
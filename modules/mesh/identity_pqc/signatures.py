@@ -18,11 +18,23 @@ This provides:
   - Classical security from ED25519
   - Quantum resistance from ML-DSA-65
   - Backward compatibility (can extract ED25519 component)
+
+Verification is cached: a (public keys, message, signature) tuple that
+verified once is answered from an LRU of digests. verify_many() checks
+a batch with the ML-DSA-65 halves on a process pool while the ED25519
+halves run in the caller.
 """
 
+import hashlib
+import multiprocessing
+import os
 import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 import logging
 
 from .constants import (
@@ -35,6 +47,7 @@ from .constants import (
     SIGNATURE_MODE_HYBRID,
     SIGNATURE_MODE_LEGACY,
     SIGNATURE_MODE_PQC_ONLY,
+    VERIFY_CACHE_SIZE,
 )
 from .errors import (
     SignatureError,
@@ -279,11 +292,39 @@ class HybridSigner:
         )
 
 
+class VerificationRequest(NamedTuple):
+    """One signature to check with HybridVerifier.verify_many()."""
+    ed25519_public_key: Optional[bytes]
+    pqc_public_key: Optional[bytes]
+    message: bytes
+    signature: HybridSignature
+
+
+# Process pool workers live at module level so they can be pickled by name;
+# the PQC backend is shipped once per worker by the pool initializer.
+_worker_pqc_backend = None
+
+
+def _init_pqc_worker(pqc_backend) -> None:
+    global _worker_pqc_backend
+    _worker_pqc_backend = pqc_backend
+
+
+def _verify_pqc_in_worker(public_key: bytes, message: bytes, signature: bytes) -> bool:
+    return _worker_pqc_backend.verify(public_key, message, signature)
+
+
 class HybridVerifier:
     """
     Verifies hybrid signatures.
     
     For HYBRID mode, BOTH signatures must be valid (AND logic).
+    
+    Successful verifications are remembered by the SHA-256 of
+    (public keys, message, signature) in a bounded LRU, so gossip and
+    consensus re-checking the same signed payload cost one hash. Only
+    valid results are cached: a flood of bad signatures cannot evict
+    good ones, and a failure is always re-checked.
     """
     
     def __init__(
@@ -291,6 +332,8 @@ class HybridVerifier:
         ed25519_backend,
         pqc_backend,
         minimum_mode: SignatureMode = SignatureMode.HYBRID,
+        cache_size: int = VERIFY_CACHE_SIZE,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize hybrid verifier.
@@ -299,10 +342,22 @@ class HybridVerifier:
             ed25519_backend: ED25519 backend instance
             pqc_backend: PQC (ML-DSA-65) backend instance
             minimum_mode: Minimum acceptable signature mode
+            cache_size: Verified digests to remember (0 disables caching)
+            max_workers: verify_many() process pool size (None = CPU count,
+                0 = check ML-DSA-65 halves in the calling thread)
         """
         self._ed25519 = ed25519_backend
         self._pqc = pqc_backend
         self._minimum_mode = minimum_mode
+        
+        self._cache: "OrderedDict[bytes, None]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        self._max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self._pool: Optional[Executor] = None
     
     def verify(
         self,
@@ -333,7 +388,185 @@ class HybridVerifier:
                 )
                 return False
         
-        # Verify based on mode
+        key = self._cache_key(ed25519_public_key, pqc_public_key, message, signature)
+        if self._cache_lookup(key):
+            return True
+        
+        valid = self._verify_uncached(ed25519_public_key, pqc_public_key, message, signature)
+        if valid:
+            self._cache_store(key)
+        return valid
+    
+    def verify_many(
+        self,
+        requests: Sequence[VerificationRequest],
+        enforce_minimum_mode: bool = True,
+    ) -> List[bool]:
+        """
+        Verify a batch of signatures.
+        
+        Cached and duplicate requests are answered once. ML-DSA-65 halves
+        are submitted to the process pool first; the ED25519 halves are
+        then checked in this thread while the pool works, and the ML-DSA
+        job of any request whose ED25519 half failed is cancelled.
+        
+        Args:
+            requests: VerificationRequest tuples
+            enforce_minimum_mode: Enforce minimum signature mode
+        
+        Returns:
+            One bool per request, in order
+        """
+        results: List[bool] = [False] * len(requests)
+        pending: Dict[bytes, List[int]] = {}
+        
+        for i, (ed_pk, pqc_pk, message, signature) in enumerate(requests):
+            if enforce_minimum_mode and not self._meets_minimum_mode(signature.mode):
+                continue
+            key = self._cache_key(ed_pk, pqc_pk, message, signature)
+            if self._cache_lookup(key):
+                results[i] = True
+            else:
+                pending.setdefault(key, []).append(i)
+        
+        # Phase 1: queue ML-DSA-65 halves
+        pqc_jobs: Dict[bytes, Future] = {}
+        if self._max_workers > 0:
+            for key, indices in pending.items():
+                ed_pk, pqc_pk, message, signature = requests[indices[0]]
+                if self._has_keys_for(signature.mode, ed_pk, pqc_pk) and signature.mode != SignatureMode.LEGACY:
+                    try:
+                        pqc_jobs[key] = self._executor().submit(
+                            _verify_pqc_in_worker, pqc_pk, message, signature.mldsa65_sig
+                        )
+                    except BrokenProcessPool as e:
+                        # Remaining ML-DSA-65 halves are checked in-process
+                        logger.warning(f"ML-DSA-65 pool broken, verifying in-process: {e}")
+                        self._discard_pool()
+                        break
+        
+        # Phase 2: ED25519 halves here, then collect
+        for key, indices in pending.items():
+            ed_pk, pqc_pk, message, signature = requests[indices[0]]
+            job = pqc_jobs.get(key)
+            valid = self._has_keys_for(signature.mode, ed_pk, pqc_pk)
+            if valid and signature.mode != SignatureMode.PQC_ONLY:
+                valid = self._ed25519.verify(ed_pk, message, signature.ed25519_sig)
+            if valid and signature.mode != SignatureMode.LEGACY:
+                valid = self._collect_pqc(job, pqc_pk, message, signature)
+            elif job is not None:
+                job.cancel()
+            
+            if valid:
+                self._cache_store(key)
+            for i in indices:
+                results[i] = valid
+        
+        return results
+    
+    def close(self) -> None:
+        """Shut down the verify_many() process pool."""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+    
+    def _discard_pool(self) -> None:
+        """Drop a broken pool; the next verify_many() starts a fresh one."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    def cache_info(self) -> Dict[str, int]:
+        """Verification cache statistics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+        }
+    
+    def _executor(self) -> Executor:
+        """Process pool for ML-DSA-65 checks (created on first use)."""
+        if self._pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=context,
+                initializer=_init_pqc_worker,
+                initargs=(self._pqc,),
+            )
+        return self._pool
+    
+    def _collect_pqc(
+        self,
+        job: Optional[Future],
+        pqc_pk: bytes,
+        message: bytes,
+        signature: HybridSignature,
+    ) -> bool:
+        """ML-DSA-65 result from the pool, or checked here without one."""
+        if job is not None:
+            try:
+                return job.result()
+            except BrokenProcessPool as e:
+                logger.warning(f"ML-DSA-65 pool worker crashed, verifying in-process: {e}")
+                self._discard_pool()
+            except Exception as e:
+                # e.g. a backend that cannot be pickled
+                logger.warning(f"ML-DSA-65 pool verification failed, verifying in-process: {e}")
+        return self._pqc.verify(pqc_pk, message, signature.mldsa65_sig)
+    
+    @staticmethod
+    def _has_keys_for(mode: SignatureMode, ed_pk: Optional[bytes], pqc_pk: Optional[bytes]) -> bool:
+        """Check the public keys a mode needs are present."""
+        if mode == SignatureMode.HYBRID:
+            return ed_pk is not None and pqc_pk is not None
+        if mode == SignatureMode.LEGACY:
+            return ed_pk is not None
+        if mode == SignatureMode.PQC_ONLY:
+            return pqc_pk is not None
+        return False
+    
+    @staticmethod
+    def _cache_key(
+        ed_pk: Optional[bytes],
+        pqc_pk: Optional[bytes],
+        message: bytes,
+        signature: HybridSignature,
+    ) -> bytes:
+        """SHA-256 over length-prefixed keys, message and signature (mode included)."""
+        digest = hashlib.sha256()
+        for part in (ed_pk or b"", pqc_pk or b"", message, signature.to_bytes()):
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+        return digest.digest()
+    
+    def _cache_lookup(self, key: bytes) -> bool:
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return True
+            self.cache_misses += 1
+            return False
+    
+    def _cache_store(self, key: bytes) -> None:
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = None
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
+    def _verify_uncached(
+        self,
+        ed25519_public_key: Optional[bytes],
+        pqc_public_key: Optional[bytes],
+        message: bytes,
+        signature: HybridSignature,
+    ) -> bool:
+        """Verify by mode, without consulting the cache."""
         if signature.mode == SignatureMode.HYBRID:
             return self._verify_hybrid(
                 ed25519_public_key, pqc_public_key, message, signature
@@ -410,3 +643,64 @@ class HybridVerifier:
             return False
         
         return self._pqc.verify(pqc_pk, message, signature.mldsa65_sig)
+
+
+_default_verifier: Optional[HybridVerifier] = None
+
+
+def get_default_verifier() -> HybridVerifier:
+    """
+    Process-wide verifier over the default backends.
+    
+    Shared by every HybridIdentity so the verification cache is shared too.
+    """
+    global _default_verifier
+    if _default_verifier is None:
+        from .backends import get_ed25519_backend, get_pqc_backend
+        _default_verifier = HybridVerifier(get_ed25519_backend(), get_pqc_backend())
+    return _default_verifier
+
+
+def _benchmark(count: int = 40):
+    """
+    Benchmark verifications/sec for each HybridVerifier mode.
+    
+    Usage:
+        python -m modules.mesh.identity_pqc.signatures
+    """
+    import time
+    from .backends import get_ed25519_backend, get_pqc_backend
+    
+    ed25519, pqc = get_ed25519_backend(), get_pqc_backend()
+    ed_pk, ed_sk = ed25519.keygen()
+    pqc_pk, pqc_sk = pqc.keygen()
+    signer = HybridSigner(ed25519, pqc)
+    requests = [
+        VerificationRequest(ed_pk, pqc_pk, message, signer.sign(ed_sk, pqc_sk, message))
+        for message in (f"attestation {n}".encode() for n in range(count))
+    ]
+    
+    def rate(run) -> float:
+        start = time.perf_counter()
+        run()
+        return count / (time.perf_counter() - start)
+    
+    print(f"HYBRID VERIFY BENCHMARK - {count} distinct signatures, {os.cpu_count()} CPU(s)")
+    uncached = HybridVerifier(ed25519, pqc, cache_size=0)
+    print(f"  verify(), sequential        {rate(lambda: [uncached.verify(*r) for r in requests]):>10,.1f} /s")
+    
+    cached = HybridVerifier(ed25519, pqc)
+    [cached.verify(*r) for r in requests]
+    print(f"  verify(), cached repeat     {rate(lambda: [cached.verify(*r) for r in requests]):>10,.1f} /s")
+    
+    for label, workers in (("in-thread", 0), (f"{os.cpu_count()} process(es)", None), ("4 processes", 4)):
+        verifier = HybridVerifier(ed25519, pqc, cache_size=0, max_workers=workers)
+        verifier.verify_many(requests[:1])      # Start the pool outside the timing
+        print(f"  verify_many(), {label:<12} {rate(lambda: verifier.verify_many(requests)):>10,.1f} /s")
+        verifier.close()
+
+
+if __name__ == "__main__":
+    # Run the package copy of this module so pool workers unpickle by package path
+    from .signatures import _benchmark as benchmark
+    benchmark()
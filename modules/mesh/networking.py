@@ -14,6 +14,9 @@ The Listener provides:
   - HTTP/2 transport for efficient streaming
   - Peer connection management
   - Heartbeat monitoring
+  - Negotiated binary wire codec (JSON fallback; wire version checked at handshake)
+  - Per-type handler pools (PING/PONG never wait behind workload)
+  - Digest-first delta gossip of the peer list
 
 INVARIANTS:
   INV-NET-001 (Zero Trust Transport): All traffic encrypted + authenticated
@@ -42,11 +45,17 @@ import logging
 import ssl
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, List, Optional, Set
+
+from .wire import (
+    CODEC_BINARY, CODEC_JSON, WIRE_BINARY, WIRE_JSON, WIRE_VERSION, WireError,
+    decode_frame, encode_body, is_binary_frame, seal
+)
 
 __version__ = "3.0.0"
 
@@ -69,6 +78,19 @@ class PeerState(Enum):
     DISCONNECTED = "disconnected"
 
 
+class OverflowPolicy(Enum):
+    """What a peer's full outbound queue does with one more frame."""
+    DROP_NEWEST = "drop_newest"    # Reject the new frame
+    DROP_OLDEST = "drop_oldest"    # Evict the oldest queued frame
+    DISCONNECT = "disconnect"      # Drop the peer; it reconnects and catches up
+
+
+class DispatchOverflow(Enum):
+    """What a full inbound dispatch queue does with one more message."""
+    BLOCK = "block"    # Await space, pushing back on the peer's read loop
+    DROP = "drop"      # Drop the message (only for periodically resent gossip)
+
+
 class MessageType(Enum):
     """Mesh protocol message types."""
     # Handshake
@@ -91,6 +113,55 @@ class MessageType(Enum):
     # Topology
     TOPOLOGY_UPDATE = "TOPOLOGY_UPDATE" # Network state change
     ROUTE_ANNOUNCE = "ROUTE_ANNOUNCE"   # Routing information
+    
+    # Membership gossip (DELTA_GOSSIP capability)
+    PEER_DIGEST = "PEER_DIGEST"    # Membership version + digest
+    PEER_SYNC = "PEER_SYNC"        # Request PEER_LIST delta since a version
+
+
+# One-byte type codes for the binary envelope (append only, never renumber)
+MESSAGE_TYPE_CODES: Dict[MessageType, int] = {
+    MessageType.HELLO: 1,
+    MessageType.HELLO_ACK: 2,
+    MessageType.WHO_IS_THERE: 3,
+    MessageType.I_AM_HERE: 4,
+    MessageType.PEER_LIST: 5,
+    MessageType.PING: 6,
+    MessageType.PONG: 7,
+    MessageType.ATTEST_REQUEST: 8,
+    MessageType.ATTEST_RESPONSE: 9,
+    MessageType.TOPOLOGY_UPDATE: 10,
+    MessageType.ROUTE_ANNOUNCE: 11,
+    MessageType.PEER_DIGEST: 12,
+    MessageType.PEER_SYNC: 13,
+}
+MESSAGE_TYPES_BY_CODE: Dict[int, MessageType] = {code: t for t, code in MESSAGE_TYPE_CODES.items()}
+
+# Bulk list payloads decode faster through the C json parser than the
+# pure-Python tagged decoder, so they travel as canonical JSON inside the
+# binary envelope (see scripts/test_p300_mesh.py --benchmark).
+PAYLOAD_CODECS: Dict[MessageType, int] = {
+    MessageType.PEER_LIST: CODEC_JSON,
+    MessageType.TOPOLOGY_UPDATE: CODEC_JSON,
+    MessageType.ROUTE_ANNOUNCE: CODEC_JSON,
+}
+
+# Gossip and liveness types are resent every round, so a full dispatch queue
+# may drop them. Every other type (attestation, consensus RPCs carried over
+# the mesh) blocks the read loop instead, as the inline handlers did.
+DROPPABLE_MESSAGE_TYPES = frozenset({
+    MessageType.WHO_IS_THERE,
+    MessageType.I_AM_HERE,
+    MessageType.PEER_LIST,
+    MessageType.PEER_DIGEST,
+    MessageType.PEER_SYNC,
+    MessageType.PING,
+    MessageType.PONG,
+    MessageType.ROUTE_ANNOUNCE,
+})
+
+# Advertised in HELLO / HELLO_ACK; peers without DELTA_GOSSIP get full PEER_LISTs
+NODE_CAPABILITIES = ["ATTEST", "RELAY", "GOSSIP", "DELTA_GOSSIP"]
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -128,6 +199,20 @@ class MeshConfig:
     max_peers: int = 100
     max_message_size: int = 1024 * 1024  # 1MB
     
+    # Wire formats offered in HELLO, most preferred first
+    wire_formats: List[str] = field(default_factory=lambda: [WIRE_BINARY, WIRE_JSON])
+    
+    # Outbound queues (one writer task per peer)
+    send_queue_size: int = 1024          # Frames buffered per peer
+    send_overflow_policy: OverflowPolicy = OverflowPolicy.DISCONNECT
+    max_coalesced_frames: int = 64       # Frames per writelines()/drain()
+    close_flush_timeout_ms: int = 1000   # Grace period to flush on close
+    
+    # Inbound dispatch (one worker pool per MessageType with handlers)
+    dispatch_workers: int = 8            # Workers per type; 0 = run handlers on the read loop
+    dispatch_queue_size: int = 1024      # Messages buffered per type before overflow
+    dispatch_overflow: Dict[MessageType, DispatchOverflow] = field(default_factory=dict)  # Per-type overrides
+    
     # Federation
     federation_id: str = "CHAINBRIDGE-FEDERATION"
     node_region: str = "US-WEST"
@@ -144,6 +229,14 @@ class MeshConfig:
                     "mTLS paths not configured - running in DEV mode. "
                     "INV-NET-001 requires mTLS in production!"
                 )
+    
+    def dispatch_overflow_for(self, message_type: MessageType) -> DispatchOverflow:
+        """Overflow policy for a type's dispatch queue (gossip drops, the rest blocks)."""
+        if message_type in self.dispatch_overflow:
+            return self.dispatch_overflow[message_type]
+        if message_type in DROPPABLE_MESSAGE_TYPES:
+            return DispatchOverflow.DROP
+        return DispatchOverflow.BLOCK
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -156,6 +249,11 @@ class MeshMessage:
     Wire format for mesh protocol messages.
     
     All messages are signed and timestamped for auditability.
+    
+    The canonical binary body (everything but the signature) is encoded
+    once and cached, so hashing, signing and broadcasting to many peers
+    share one serialization. Reassigning a field re-encodes; mutate
+    payload in place only before the first to_bytes()/compute_hash().
     """
     message_id: str
     message_type: MessageType
@@ -163,6 +261,12 @@ class MeshMessage:
     timestamp: str
     payload: Dict[str, Any]
     signature: Optional[str] = None
+    _body: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _body_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _signed_fields(self) -> tuple:
+        """The fields the cached body was encoded from."""
+        return (self.message_id, self.message_type, self.sender_id, self.timestamp, self.payload)
     
     @classmethod
     def create(
@@ -203,19 +307,69 @@ class MeshMessage:
             signature=data.get("signature")
         )
     
-    def to_bytes(self) -> bytes:
-        """Serialize to wire format."""
+    def signed_body(self) -> bytes:
+        """Canonical binary encoding of everything the signature covers."""
+        key = self._signed_fields()
+        if self._body is None or self._body_key != key:
+            self._body = encode_body(
+                MESSAGE_TYPE_CODES[self.message_type],
+                self.message_id,
+                self.sender_id,
+                self.timestamp,
+                self.payload,
+                PAYLOAD_CODECS.get(self.message_type, CODEC_BINARY)
+            )
+            self._body_key = key
+        return self._body
+    
+    def to_bytes(self, wire_format: str = WIRE_JSON) -> bytes:
+        """Serialize to wire format (binary envelope or legacy JSON)."""
+        if wire_format == WIRE_BINARY:
+            return seal(self.signed_body(), self.signature)
         return json.dumps(self.to_dict()).encode("utf-8")
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> "MeshMessage":
-        """Deserialize from wire format."""
-        return cls.from_dict(json.loads(data.decode("utf-8")))
+    def from_bytes(cls, data) -> "MeshMessage":
+        """
+        Deserialize from wire format (bytes or memoryview).
+        
+        The format is detected from the first byte. Binary frames keep
+        the received signed region, so compute_hash() covers exactly the
+        bytes that came off the wire.
+        
+        Raises:
+            WireError: If a binary frame is corrupt or has an unknown type
+        """
+        if not is_binary_frame(data):
+            return cls.from_dict(json.loads(str(data, "utf-8")))
+        
+        view = data if isinstance(data, memoryview) else memoryview(data)
+        frame = decode_frame(view)
+        message_type = MESSAGE_TYPES_BY_CODE.get(frame.type_code)
+        if message_type is None:
+            raise WireError(f"Unknown message type code {frame.type_code}")
+        
+        message = cls(
+            message_id=frame.message_id,
+            message_type=message_type,
+            sender_id=frame.sender_id,
+            timestamp=frame.timestamp,
+            payload=frame.payload,
+            signature=frame.signature
+        )
+        message._body = frame.signed
+        message._body_key = message._signed_fields()
+        return message
     
     def compute_hash(self) -> str:
-        """Compute message hash for signing."""
-        content = f"{self.message_id}:{self.message_type.value}:{self.sender_id}:{self.timestamp}:{json.dumps(self.payload, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()
+        """
+        Compute message hash for signing (SHA-256 of the canonical binary body).
+        
+        The hash is the same whichever wire format carries the message.
+        It changed with wire version 2; version 1 nodes hash differently
+        and are refused at handshake (see wire.WIRE_VERSION).
+        """
+        return hashlib.sha256(self.signed_body()).hexdigest()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -246,13 +400,21 @@ class PeerConnection:
       - Message send/receive
       - Heartbeat monitoring
       - State transitions
+    
+    Outbound frames go through a bounded queue drained by one writer
+    task, which coalesces whatever is pending into a single writelines()
+    and drain(). Senders never wait on the socket, so a slow peer only
+    fills its own queue; overflow is handled by the OverflowPolicy.
     """
     
     def __init__(
         self,
         peer_info: PeerInfo,
         reader: Optional[asyncio.StreamReader] = None,
-        writer: Optional[asyncio.StreamWriter] = None
+        writer: Optional[asyncio.StreamWriter] = None,
+        send_queue_size: int = 1024,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DISCONNECT,
+        max_coalesced_frames: int = 64
     ):
         self.peer_info = peer_info
         self.reader = reader
@@ -261,8 +423,25 @@ class PeerConnection:
         self.last_ping = 0.0
         self.last_pong = 0.0
         self.latency_ms = 0.0
+        self.wire_format = WIRE_JSON     # Until negotiated in HELLO / HELLO_ACK
         self._message_handlers: Dict[MessageType, Callable] = {}
-        self._lock = asyncio.Lock()
+        
+        # Outbound queue
+        self.overflow_policy = overflow_policy
+        self.max_coalesced_frames = max_coalesced_frames
+        self._outbound: Deque[bytes] = deque()
+        self._send_queue_size = send_queue_size
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._writer_task: Optional[asyncio.Task] = None
+        
+        # Send metrics
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.flushes = 0
+        self.frames_dropped = 0
+        self.queue_high_watermark = 0
     
     @property
     def peer_id(self) -> str:
@@ -272,25 +451,98 @@ class PeerConnection:
     def is_connected(self) -> bool:
         return self.state in (PeerState.AUTHENTICATED, PeerState.HEALTHY)
     
-    async def send(self, message: MeshMessage) -> bool:
-        """Send a message to the peer."""
+    @property
+    def send_queue_depth(self) -> int:
+        """Frames waiting for the writer task."""
+        return len(self._outbound)
+    
+    @staticmethod
+    def frame(data: bytes) -> bytes:
+        """Length-prefix a serialized message."""
+        return len(data).to_bytes(4, "big") + data
+    
+    def enqueue(self, message: MeshMessage) -> bool:
+        """
+        Queue a message for the writer task without waiting on the socket.
+        
+        The message is serialized immediately in the current wire format.
+        
+        Returns:
+            False if there is no writer, the peer has failed, or the frame
+            was dropped by the overflow policy
+        """
+        return self.enqueue_frame(self.frame(message.to_bytes(self.wire_format)))
+    
+    def enqueue_frame(self, frame: bytes) -> bool:
+        """Queue an already length-prefixed frame (see enqueue)."""
         if not self.writer:
             logger.warning(f"Cannot send to {self.peer_id}: no writer")
             return False
+        if self.state == PeerState.FAILED:
+            return False
         
-        async with self._lock:
-            try:
-                data = message.to_bytes()
-                # Length-prefix framing
-                length = len(data)
-                self.writer.write(length.to_bytes(4, "big") + data)
-                await self.writer.drain()
-                logger.debug(f"Sent {message.message_type.value} to {self.peer_id}")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to send to {self.peer_id}: {e}")
-                self.state = PeerState.FAILED
+        if len(self._outbound) >= self._send_queue_size:
+            self.frames_dropped += 1
+            if self.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                return False
+            if self.overflow_policy == OverflowPolicy.DISCONNECT:
+                logger.warning(f"Send queue overflow for {self.peer_id}: disconnecting slow peer")
+                self._fail()
                 return False
+            self._outbound.popleft()
+        
+        self._outbound.append(frame)
+        self.queue_high_watermark = max(self.queue_high_watermark, len(self._outbound))
+        self._drained.clear()
+        self._wakeup.set()
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._writer_loop())
+        return True
+    
+    async def send(self, message: MeshMessage) -> bool:
+        """Send a message to the peer (queued; see enqueue)."""
+        return self.enqueue(message)
+    
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued frame has been written and drained."""
+        try:
+            await asyncio.wait_for(self._drained.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _writer_loop(self):
+        """Drain the outbound queue, coalescing pending frames per write."""
+        try:
+            while True:
+                if not self._outbound:
+                    self._drained.set()
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+                    continue
+                
+                count = min(len(self._outbound), self.max_coalesced_frames)
+                frames = [self._outbound.popleft() for _ in range(count)]
+                self.writer.writelines(frames)
+                await self.writer.drain()
+                
+                self.frames_sent += count
+                self.bytes_sent += sum(len(f) for f in frames)
+                self.flushes += 1
+                logger.debug(f"Flushed {count} frames to {self.peer_id}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to send to {self.peer_id}: {e}")
+            self._fail()
+    
+    def _fail(self):
+        """Mark the peer failed, discard its queue and abort the transport."""
+        self.state = PeerState.FAILED
+        self._outbound.clear()
+        self._drained.set()
+        if self.writer:
+            self.writer.transport.abort()
     
     async def receive(self) -> Optional[MeshMessage]:
         """Receive a message from the peer."""
@@ -307,16 +559,16 @@ class PeerConnection:
                 logger.warning(f"Message too large from {self.peer_id}: {length}")
                 return None
             
-            # Read message
+            # Read message (decoded in place from the read buffer)
             data = await self.reader.readexactly(length)
-            message = MeshMessage.from_bytes(data)
+            message = MeshMessage.from_bytes(memoryview(data))
             
             # Update last seen
             self.peer_info.last_seen = datetime.now(timezone.utc).isoformat()
             
             logger.debug(f"Received {message.message_type.value} from {self.peer_id}")
             return message
-            
+        
         except asyncio.IncompleteReadError:
             logger.info(f"Connection closed by {self.peer_id}")
             self.state = PeerState.DISCONNECTED
@@ -342,8 +594,17 @@ class PeerConnection:
         if self.state == PeerState.SUSPECT:
             self.state = PeerState.HEALTHY
     
-    async def close(self):
-        """Close the connection."""
+    async def close(self, flush_timeout: float = 1.0):
+        """Close the connection, giving queued frames flush_timeout seconds to go out."""
+        if self._writer_task is not None:
+            if self.state != PeerState.FAILED and not await self.flush(flush_timeout):
+                self._fail()            # Slow peer: don't wait on its socket buffer either
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
         if self.writer:
             try:
                 self.writer.close()
@@ -353,6 +614,117 @@ class PeerConnection:
         self.state = PeerState.DISCONNECTED
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# MESSAGE DISPATCH
+# ══════════════════════════════════════════════════════════════════════════════
+
+class DispatchPool:
+    """
+    Bounded worker pool running the registered handlers for one MessageType.
+    
+    Messages are sharded onto workers by sending peer, so each worker's FIFO
+    queue preserves arrival order per (peer, type) while messages from
+    different peers are handled concurrently. When a queue is full,
+    dispatch() follows the pool's DispatchOverflow: DROP discards the
+    message, BLOCK waits for space and so applies backpressure to the
+    connection's read loop.
+    """
+    
+    def __init__(
+        self,
+        message_type: MessageType,
+        handlers: List[Callable],
+        workers: int = 8,
+        queue_size: int = 1024,
+        overflow: DispatchOverflow = DispatchOverflow.DROP
+    ):
+        self.message_type = message_type
+        self.handlers = handlers        # Shared with MeshNode, so later on_message() calls apply
+        self.overflow = overflow
+        self._queues: List[asyncio.Queue] = [
+            asyncio.Queue(maxsize=max(1, queue_size // workers)) for _ in range(workers)
+        ]
+        self._workers = [asyncio.create_task(self._worker(queue)) for queue in self._queues]
+        
+        # Metrics
+        self.dispatched = 0
+        self.dropped = 0
+        self.blocked = 0
+        self.handled = 0
+        self.errors = 0
+        self.latency_total_ms = 0.0
+        self.latency_max_ms = 0.0
+    
+    @property
+    def queue_depth(self) -> int:
+        """Messages waiting for a worker."""
+        return sum(queue.qsize() for queue in self._queues)
+    
+    async def dispatch(self, message: MeshMessage, conn: "PeerConnection") -> bool:
+        """Queue a message under the overflow policy; False if it was dropped."""
+        if self.overflow == DispatchOverflow.DROP:
+            return self.submit(message, conn)
+        
+        queue = self._queues[hash(conn.peer_id) % len(self._queues)]
+        if queue.full():
+            self.blocked += 1
+        await queue.put((message, conn))
+        self.dispatched += 1
+        return True
+    
+    def submit(self, message: MeshMessage, conn: "PeerConnection") -> bool:
+        """Queue a message for its peer's worker without waiting; False if that queue is full."""
+        queue = self._queues[hash(conn.peer_id) % len(self._queues)]
+        try:
+            queue.put_nowait((message, conn))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"Dispatch queue full for {self.message_type.value}: dropped message from {conn.peer_id}")
+            return False
+        self.dispatched += 1
+        return True
+    
+    async def _worker(self, queue: asyncio.Queue):
+        """Run handlers for queued messages one at a time."""
+        while True:
+            message, conn = await queue.get()
+            start = time.perf_counter()
+            for handler in self.handlers:
+                try:
+                    await handler(message, conn)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Handler error for {message.message_type}: {e}")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.handled += 1
+            self.latency_total_ms += elapsed_ms
+            self.latency_max_ms = max(self.latency_max_ms, elapsed_ms)
+            queue.task_done()
+    
+    async def join(self):
+        """Wait until every queued message has been handled."""
+        await asyncio.gather(*[queue.join() for queue in self._queues])
+    
+    async def stop(self):
+        """Cancel the workers, abandoning queued messages."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth and handler latency for this type."""
+        return {
+            "queue_depth": self.queue_depth,
+            "dispatched": self.dispatched,
+            "dropped": self.dropped,
+            "blocked": self.blocked,
+            "handled": self.handled,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.latency_total_ms / self.handled, 3) if self.handled else 0.0,
+            "max_latency_ms": round(self.latency_max_ms, 3)
+        }
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # MESH NODE - THE CORE
 # ══════════════════════════════════════════════════════════════════════════════
@@ -392,6 +764,13 @@ class MeshNode:
         self.peers: Dict[str, PeerConnection] = {}
         self.known_peers: Dict[str, PeerInfo] = {}
         
+        # Membership versioning (see MEMBERSHIP below)
+        self._membership_epoch = uuid.uuid4().hex[:16]
+        self._membership_log: List[str] = []           # peer_ids in the order they were learned
+        self._membership_digest = self._peer_digest(self.node_id)
+        self._gossip_synced: Dict[str, tuple] = {}     # peer_id -> (epoch, version) merged from it
+        self._learned_from: Dict[str, tuple] = {}      # peer_id -> (node_id, epoch) that told us
+        
         # Server
         self._server: Optional[asyncio.Server] = None
         self._ssl_context: Optional[ssl.SSLContext] = None
@@ -399,6 +778,7 @@ class MeshNode:
         # Event handlers
         self._message_handlers: Dict[MessageType, List[Callable]] = {}
         self._event_handlers: Dict[str, List[Callable]] = {}
+        self._dispatch: Dict[MessageType, DispatchPool] = {}
         
         # State
         self._running = False
@@ -408,10 +788,13 @@ class MeshNode:
         self.metrics = {
             "messages_sent": 0,
             "messages_received": 0,
+            "messages_dropped": 0,
             "connections_accepted": 0,
             "connections_initiated": 0,
             "handshakes_completed": 0,
             "handshakes_failed": 0,
+            "gossip_digests_sent": 0,
+            "gossip_entries_sent": 0,
             "start_time": None
         }
         
@@ -458,7 +841,7 @@ class MeshNode:
             
             logger.info("SSL context created with mTLS enabled")
             return context
-            
+        
         except Exception as e:
             logger.error(f"Failed to create SSL context: {e}")
             return None
@@ -537,9 +920,13 @@ class MeshNode:
                 pass
         self._tasks.clear()
         
-        # Close all peer connections
-        for peer_id, conn in list(self.peers.items()):
-            await conn.close()
+        # Stop handler pools
+        await asyncio.gather(*[pool.stop() for pool in self._dispatch.values()])
+        self._dispatch.clear()
+        
+        # Close all peer connections (flushing queued frames)
+        flush_timeout = self.config.close_flush_timeout_ms / 1000
+        await asyncio.gather(*[conn.close(flush_timeout) for conn in self.peers.values()])
         self.peers.clear()
         
         # Stop server
@@ -584,7 +971,7 @@ class MeshNode:
                 version="unknown",
                 certificate_fingerprint=cert_fingerprint
             )
-            conn = PeerConnection(temp_peer, reader, writer)
+            conn = self._new_connection(temp_peer, reader, writer)
             conn.state = PeerState.HANDSHAKING
             
             # Set handshake timeout
@@ -621,10 +1008,17 @@ class MeshNode:
                 self.metrics["handshakes_failed"] += 1
                 return
             
+            # Signatures only verify between nodes on the same wire version
+            if not self._wire_version_ok(peer_info.peer_id, payload):
+                await conn.close()
+                self.metrics["handshakes_failed"] += 1
+                return
+            
             # Update connection with real peer info
             conn.peer_info = peer_info
+            wire_format = self._negotiate_wire_format(payload.get("codecs", [WIRE_JSON]))
             
-            # Send HELLO_ACK
+            # Send HELLO_ACK (still JSON; the peer switches on receipt)
             await conn.send(MeshMessage.create(
                 MessageType.HELLO_ACK,
                 self.node_id,
@@ -632,14 +1026,18 @@ class MeshNode:
                     "accepted": True,
                     "node_id": self.node_id,
                     "federation_id": self.config.federation_id,
-                    "version": __version__
+                    "version": __version__,
+                    "capabilities": NODE_CAPABILITIES,
+                    "wire_version": WIRE_VERSION,
+                    "codec": wire_format
                 }
             ))
+            conn.wire_format = wire_format
             
             # Register peer
             conn.state = PeerState.AUTHENTICATED
             self.peers[peer_info.peer_id] = conn
-            self.known_peers[peer_info.peer_id] = peer_info
+            self._remember_peer(peer_info, replace=True)
             self.metrics["handshakes_completed"] += 1
             
             logger.info(f"Peer {peer_info.peer_id} authenticated (cert: {cert_fingerprint})")
@@ -652,7 +1050,7 @@ class MeshNode:
             
             # Start message handler loop
             asyncio.create_task(self._message_loop(conn))
-            
+        
         except asyncio.TimeoutError:
             logger.warning(f"Handshake timeout for {peername}")
             writer.close()
@@ -662,6 +1060,38 @@ class MeshNode:
             writer.close()
             self.metrics["handshakes_failed"] += 1
     
+    def _new_connection(
+        self,
+        peer_info: PeerInfo,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> PeerConnection:
+        """Create a peer connection with this node's outbound queue settings."""
+        return PeerConnection(
+            peer_info, reader, writer,
+            send_queue_size=self.config.send_queue_size,
+            overflow_policy=self.config.send_overflow_policy,
+            max_coalesced_frames=self.config.max_coalesced_frames
+        )
+    
+    def _wire_version_ok(self, peer: str, payload: Dict[str, Any]) -> bool:
+        """Check a HELLO / HELLO_ACK wire version (absent means version 1)."""
+        version = payload.get("wire_version", 1)
+        if version != WIRE_VERSION:
+            logger.warning(
+                f"Rejected peer {peer}: wire version {version}, "
+                f"this node speaks {WIRE_VERSION}"
+            )
+            return False
+        return True
+    
+    def _negotiate_wire_format(self, offered: List[str]) -> str:
+        """Pick our most preferred wire format that the peer also offers."""
+        for wire_format in self.config.wire_formats:
+            if wire_format in offered:
+                return wire_format
+        return WIRE_JSON
+    
     async def connect_to_peer(self, host: str, port: int) -> bool:
         """
         Connect to a peer node.
@@ -707,7 +1137,7 @@ class MeshNode:
                 version="unknown",
                 certificate_fingerprint=cert_fingerprint
             )
-            conn = PeerConnection(temp_peer, reader, writer)
+            conn = self._new_connection(temp_peer, reader, writer)
             conn.state = PeerState.HANDSHAKING
             
             # Send HELLO
@@ -720,7 +1150,9 @@ class MeshNode:
                     "federation_id": self.config.federation_id,
                     "region": self.config.node_region,
                     "version": __version__,
-                    "capabilities": ["ATTEST", "RELAY", "GOSSIP"]
+                    "capabilities": NODE_CAPABILITIES,
+                    "wire_version": WIRE_VERSION,
+                    "codecs": self.config.wire_formats
                 }
             ))
             
@@ -742,6 +1174,11 @@ class MeshNode:
                 self.metrics["handshakes_failed"] += 1
                 return False
             
+            if not self._wire_version_ok(peer_addr, message.payload):
+                await conn.close()
+                self.metrics["handshakes_failed"] += 1
+                return False
+            
             # Update peer info
             peer_id = message.payload.get("node_id", f"peer-{host}")
             peer_info = PeerInfo(
@@ -751,14 +1188,19 @@ class MeshNode:
                 federation_id=message.payload.get("federation_id", "unknown"),
                 region="unknown",
                 version=message.payload.get("version", "unknown"),
+                capabilities=message.payload.get("capabilities", []),
                 certificate_fingerprint=cert_fingerprint
             )
             conn.peer_info = peer_info
             conn.state = PeerState.AUTHENTICATED
             
+            # Peers that do not offer binary omit "codec" and keep JSON
+            codec = message.payload.get("codec", WIRE_JSON)
+            conn.wire_format = codec if codec in self.config.wire_formats else WIRE_JSON
+            
             # Register
             self.peers[peer_id] = conn
-            self.known_peers[peer_id] = peer_info
+            self._remember_peer(peer_info, replace=True)
             self.metrics["handshakes_completed"] += 1
             
             logger.info(f"Connected to peer {peer_id} at {peer_addr}")
@@ -773,7 +1215,7 @@ class MeshNode:
             asyncio.create_task(self._message_loop(conn))
             
             return True
-            
+        
         except asyncio.TimeoutError:
             logger.warning(f"Connection timeout to {peer_addr}")
             return False
@@ -821,35 +1263,59 @@ class MeshNode:
                     ))
                 
                 elif message.message_type == MessageType.PEER_LIST:
-                    # Merge peer list (gossip)
-                    peers = message.payload.get("peers", [])
-                    for peer_data in peers:
-                        peer_id = peer_data.get("peer_id")
-                        if peer_id and peer_id not in self.known_peers and peer_id != self.node_id:
-                            self.known_peers[peer_id] = PeerInfo(**peer_data)
-                            logger.debug(f"Learned about peer {peer_id} via gossip")
+                    self._merge_peer_list(message)
                 
-                # Dispatch to registered handlers
-                handlers = self._message_handlers.get(message.message_type, [])
-                for handler in handlers:
-                    try:
-                        await handler(message, conn)
-                    except Exception as e:
-                        logger.error(f"Handler error for {message.message_type}: {e}")
+                elif message.message_type == MessageType.PEER_DIGEST:
+                    await self._handle_peer_digest(message, conn)
                 
+                elif message.message_type == MessageType.PEER_SYNC:
+                    await self._handle_peer_sync(message, conn)
+                
+                # Dispatch to registered handlers (off the read loop)
+                if message.message_type in self._message_handlers:
+                    await self._dispatch_message(message, conn)
+            
             except Exception as e:
                 logger.error(f"Message loop error for {conn.peer_id}: {e}")
                 break
         
-        # Clean up disconnected peer
-        if conn.peer_id in self.peers:
+        # Clean up disconnected peer (stops its writer task)
+        if self.peers.get(conn.peer_id) is conn:
             del self.peers[conn.peer_id]
+        await conn.close(flush_timeout=0)
         
         await self._emit_event("peer_disconnected", {"peer_id": conn.peer_id})
         logger.info(f"Peer {conn.peer_id} disconnected")
     
+    async def _dispatch_message(self, message: MeshMessage, conn: PeerConnection):
+        """Hand a message to its type's worker pool (or run handlers inline)."""
+        if self.config.dispatch_workers <= 0:
+            for handler in self._message_handlers[message.message_type]:
+                try:
+                    await handler(message, conn)
+                except Exception as e:
+                    logger.error(f"Handler error for {message.message_type}: {e}")
+            return
+        
+        pool = self._dispatch.get(message.message_type)
+        if pool is None:
+            pool = self._dispatch[message.message_type] = DispatchPool(
+                message.message_type,
+                self._message_handlers[message.message_type],
+                workers=self.config.dispatch_workers,
+                queue_size=self.config.dispatch_queue_size,
+                overflow=self.config.dispatch_overflow_for(message.message_type)
+            )
+        if not await pool.dispatch(message, conn):
+            self.metrics["messages_dropped"] += 1
+    
     def on_message(self, message_type: MessageType, handler: Callable):
-        """Register a message handler."""
+        """
+        Register a message handler.
+        
+        Handlers run on the type's worker pool, in arrival order per peer;
+        PING/PONG liveness is answered before any handler runs.
+        """
         if message_type not in self._message_handlers:
             self._message_handlers[message_type] = []
         self._message_handlers[message_type].append(handler)
@@ -905,45 +1371,186 @@ class MeshNode:
         while self._running:
             await asyncio.sleep(self.config.gossip_interval_ms / 1000)
             
-            if not self.peers:
+            if self.peers:
+                await self._gossip_round()
+    
+    async def _gossip_round(self):
+        """
+        Gossip membership to a random subset of peers (SWIM-lite).
+        
+        DELTA_GOSSIP peers get a PEER_DIGEST (constant size); they pull a
+        PEER_LIST delta only when their digest differs. Legacy peers get
+        the full peer list.
+        """
+        import random
+        recipients = list(self.peers.values())
+        random.shuffle(recipients)
+        
+        full_list = None
+        for conn in recipients[:3]:  # Gossip to up to 3 peers
+            if not conn.is_connected:
                 continue
-            
-            # Build peer list
-            peer_list = [
-                {
-                    "peer_id": p.peer_id,
-                    "host": p.host,
-                    "port": p.port,
-                    "federation_id": p.federation_id,
-                    "region": p.region,
-                    "version": p.version
-                }
-                for p in self.known_peers.values()
-            ]
-            
-            # Send to random subset of peers (SWIM-lite)
-            import random
-            recipients = list(self.peers.values())
-            random.shuffle(recipients)
-            
-            for conn in recipients[:3]:  # Gossip to up to 3 peers
-                if conn.is_connected:
-                    await conn.send(MeshMessage.create(
-                        MessageType.PEER_LIST,
-                        self.node_id,
-                        {"peers": peer_list}
-                    ))
+            if "DELTA_GOSSIP" in conn.peer_info.capabilities:
+                await conn.send(self._digest_message())
+                self.metrics["gossip_digests_sent"] += 1
+            else:
+                if full_list is None:
+                    full_list = self._peer_entries(0)
+                await conn.send(MeshMessage.create(
+                    MessageType.PEER_LIST,
+                    self.node_id,
+                    {"peers": full_list}
+                ))
+                self.metrics["gossip_entries_sent"] += len(full_list)
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # MEMBERSHIP
+    # ──────────────────────────────────────────────────────────────────────────
+    #
+    # Membership only grows: a peer_id is appended to _membership_log the
+    # first time it is learned, so the log length is a monotonic version
+    # and "changes since version v" is the slice log[v:]. The digest is the
+    # XOR of per-id hashes (this node included), updated in O(1), so two
+    # nodes with the same membership have the same digest regardless of
+    # the order they learned it in. The epoch changes on restart, telling
+    # peers that versions they hold from the previous run are meaningless.
+    # Entries are never sent back to the node (and epoch) they came from.
+    
+    @staticmethod
+    def _peer_digest(peer_id: str) -> int:
+        """128-bit hash of a peer_id, XORed into the membership digest."""
+        return int.from_bytes(hashlib.sha256(peer_id.encode("utf-8")).digest()[:16], "big")
+    
+    @property
+    def membership_version(self) -> int:
+        """Number of membership changes this node has seen (monotonic)."""
+        return len(self._membership_log)
+    
+    @property
+    def membership_digest(self) -> str:
+        """Order-independent digest of the peer_ids this node knows, itself included."""
+        return f"{self._membership_digest:032x}"
+    
+    def _remember_peer(self, peer_info: PeerInfo, replace: bool = False) -> bool:
+        """
+        Record a peer in known_peers, versioning it if new.
+        
+        Returns:
+            True if the peer was not known before
+        """
+        peer_id = peer_info.peer_id
+        if peer_id == self.node_id:
+            return False
+        if peer_id in self.known_peers:
+            if replace:
+                self.known_peers[peer_id] = peer_info
+            return False
+        self.known_peers[peer_id] = peer_info
+        self._membership_log.append(peer_id)
+        self._membership_digest ^= self._peer_digest(peer_id)
+        return True
+    
+    def _peer_entries(self, since: int, exclude_source: Optional[tuple] = None) -> List[Dict[str, Any]]:
+        """PEER_LIST entries for peers learned after version `since`, minus those from exclude_source."""
+        entries = []
+        for peer_id in self._membership_log[since:]:
+            if exclude_source and self._learned_from.get(peer_id) == exclude_source:
+                continue
+            p = self.known_peers[peer_id]
+            entries.append({
+                "peer_id": p.peer_id,
+                "host": p.host,
+                "port": p.port,
+                "federation_id": p.federation_id,
+                "region": p.region,
+                "version": p.version
+            })
+        return entries
+    
+    def _digest_message(self, reply: bool = False) -> MeshMessage:
+        """PEER_DIGEST announcing this node's membership version and digest."""
+        return MeshMessage.create(MessageType.PEER_DIGEST, self.node_id, {
+            "epoch": self._membership_epoch,
+            "version": self.membership_version,
+            "digest": self.membership_digest,
+            "reply": reply
+        })
+    
+    def _merge_peer_list(self, message: MeshMessage):
+        """Merge a (full or delta) PEER_LIST and remember how far we are synced."""
+        epoch = message.payload.get("epoch")       # Delta lists only; legacy full lists omit it
+        for peer_data in message.payload.get("peers", []):
+            if peer_data.get("peer_id") and self._remember_peer(PeerInfo(**peer_data)):
+                if epoch:
+                    self._learned_from[peer_data["peer_id"]] = (message.sender_id, epoch)
+                logger.debug(f"Learned about peer {peer_data['peer_id']} via gossip")
+        
+        if epoch:
+            self._gossip_synced[message.sender_id] = (epoch, message.payload["version"])
+    
+    async def _handle_peer_digest(self, message: MeshMessage, conn: PeerConnection):
+        """Pull the sender's delta if its membership differs from ours (push-pull)."""
+        payload = message.payload
+        if payload.get("digest") == self.membership_digest:
+            return
+        
+        epoch, version = self._gossip_synced.get(message.sender_id, (None, 0))
+        since = version if epoch == payload.get("epoch") else 0
+        if since < payload.get("version", 0):
+            await conn.send(MeshMessage.create(MessageType.PEER_SYNC, self.node_id, {
+                "epoch": payload.get("epoch"),
+                "since": since,
+                "requester_epoch": self._membership_epoch
+            }))
+        
+        # The sender may be missing peers we know: let it pull from us too
+        if not payload.get("reply"):
+            await conn.send(self._digest_message(reply=True))
+            self.metrics["gossip_digests_sent"] += 1
+    
+    async def _handle_peer_sync(self, message: MeshMessage, conn: PeerConnection):
+        """Answer a PEER_SYNC with the peers learned since the requested version."""
+        since = message.payload.get("since", 0)
+        if message.payload.get("epoch") != self._membership_epoch or since > self.membership_version:
+            since = 0
+        source = (message.sender_id, message.payload.get("requester_epoch"))
+        entries = self._peer_entries(since, exclude_source=source)
+        await conn.send(MeshMessage.create(MessageType.PEER_LIST, self.node_id, {
+            "peers": entries,
+            "epoch": self._membership_epoch,
+            "version": self.membership_version
+        }))
+        self.metrics["gossip_entries_sent"] += len(entries)
     
     # ──────────────────────────────────────────────────────────────────────────
     # PUBLIC API
     # ──────────────────────────────────────────────────────────────────────────
     
-    async def broadcast(self, message: MeshMessage):
-        """Broadcast a message to all connected peers."""
-        for conn in self.peers.values():
-            if conn.is_connected:
-                await conn.send(message)
-                self.metrics["messages_sent"] += 1
+    async def broadcast(self, message: MeshMessage) -> int:
+        """
+        Broadcast a message to all connected peers.
+        
+        Queues one frame per peer without waiting on any socket, so a slow
+        peer cannot delay the others. The message is serialized once per
+        wire format in use.
+        
+        Returns:
+            Number of peers the message was queued for
+        """
+        frames: Dict[str, bytes] = {}
+        queued = 0
+        for conn in list(self.peers.values()):
+            if not conn.is_connected:
+                continue
+            frame = frames.get(conn.wire_format)
+            if frame is None:
+                frame = frames[conn.wire_format] = PeerConnection.frame(message.to_bytes(conn.wire_format))
+            if conn.enqueue_frame(frame):
+                queued += 1
+            else:
+                self.metrics["messages_dropped"] += 1
+        self.metrics["messages_sent"] += queued
+        return queued
     
     async def send_to_peer(self, peer_id: str, message: MeshMessage) -> bool:
         """Send a message to a specific peer."""
@@ -955,6 +1562,8 @@ class MeshNode:
         result = await conn.send(message)
         if result:
             self.metrics["messages_sent"] += 1
+        else:
+            self.metrics["messages_dropped"] += 1
         return result
     
     def get_peer_count(self) -> int:
@@ -975,6 +1584,9 @@ class MeshNode:
                     "peer_id": conn.peer_id,
                     "state": conn.state.value,
                     "latency_ms": round(conn.latency_ms, 2),
+                    "wire_format": conn.wire_format,
+                    "send_queue_depth": conn.send_queue_depth,
+                    "frames_dropped": conn.frames_dropped,
                     "last_seen": conn.peer_info.last_seen
                 }
                 for conn in self.peers.values()
@@ -991,7 +1603,12 @@ class MeshNode:
                 else 0
             ),
             "peer_count": self.get_peer_count(),
-            "known_peers": len(self.known_peers)
+            "known_peers": len(self.known_peers),
+            "membership_version": self.membership_version,
+            "membership_digest": self.membership_digest,
+            "send_queue_depth": sum(c.send_queue_depth for c in self.peers.values()),
+            "frames_flushed": sum(c.flushes for c in self.peers.values()),
+            "dispatch": {t.value: pool.get_metrics() for t, pool in self._dispatch.items()}
         }
 
 
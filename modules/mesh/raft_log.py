@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     MESH RAFT LOG - THE ARCHIVE                              ║
+║                   PAC-CON-P310-CONSENSUS-ENGINE                              ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  Append-only Segmented Log Store for Raft                                    ║
+║                                                                              ║
+║  "What the Parliament decrees is never rewritten, only appended."            ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+The Log Store provides:
+  - Length-prefixed, CRC-checked binary records
+  - Append-only segment files with size-based rotation
+  - Group commit: many appends, one fsync
+  - Torn-write recovery on load (truncates at the first bad record)
+  - Prefix truncation of whole segments after snapshot compaction
+
+Record Layout (big-endian):
+  [4B body length][4B CRC32(body)] + body
+  body = [8B index][8B term][compact JSON {"command", "timestamp"}]
+
+Segment files are named by the index of their first record, so the
+segments of a log sort lexically in log order:
+  00000000000000000001.seg, 00000000000000004097.seg, ...
+
+Usage:
+    from modules.mesh.raft_log import SegmentedLogStore
+    
+    store = SegmentedLogStore("data/consensus/NODE-ALPHA_log")
+    entries = store.load()          # Recover after restart
+    
+    store.append(new_entries)       # Buffered
+    store.sync()                    # One fsync for the whole group
+"""
+
+import json
+import logging
+import os
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
+
+__version__ = "3.0.0"
+
+logger = logging.getLogger(__name__)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ══════════════════════════════════════════════════════════════════════════════
+
+RECORD_HEADER = struct.Struct(">II")    # body length, CRC32(body)
+ENTRY_HEADER = struct.Struct(">QQ")     # index, term
+SEGMENT_SUFFIX = ".seg"
+DEFAULT_SEGMENT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class LogStoreError(Exception):
+    """Raised when the on-disk log is inconsistent with a requested operation."""
+    pass
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# RECORD CODEC
+# ══════════════════════════════════════════════════════════════════════════════
+
+def encode_record(index: int, term: int, command: Dict[str, Any], timestamp: str) -> bytes:
+    """Encode one log entry as a length-prefixed, CRC-checked record."""
+    payload = json.dumps(
+        {"command": command, "timestamp": timestamp},
+        separators=(",", ":")
+    ).encode("utf-8")
+    body = ENTRY_HEADER.pack(index, term) + payload
+    return RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
+
+
+def decode_body(body: bytes) -> Dict[str, Any]:
+    """Decode a record body into a LogEntry-compatible dictionary."""
+    index, term = ENTRY_HEADER.unpack_from(body, 0)
+    payload = json.loads(body[ENTRY_HEADER.size:])
+    return {
+        "index": index,
+        "term": term,
+        "command": payload["command"],
+        "timestamp": payload["timestamp"]
+    }
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SEGMENT
+# ══════════════════════════════════════════════════════════════════════════════
+
+@dataclass
+class LogSegment:
+    """One append-only segment file."""
+    
+    first_index: int
+    path: Path
+    offsets: List[int] = field(default_factory=list)   # Byte offset of each record
+    size: int = 0
+    
+    @property
+    def last_index(self) -> int:
+        """Index of the last record (first_index - 1 if empty)."""
+        return self.first_index + len(self.offsets) - 1
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# SEGMENTED LOG STORE
+# ══════════════════════════════════════════════════════════════════════════════
+
+class SegmentedLogStore:
+    """
+    Append-only Raft log persisted as binary segment files.
+    
+    Writes are buffered until sync(), which flushes and fsyncs the
+    active segment once for every record appended since the last sync
+    (group commit). The caller MUST sync() before acknowledging an RPC.
+    
+    Entries passed to append() only need index, term, command and
+    timestamp attributes, so the store has no dependency on consensus.py.
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+        fsync: bool = True
+    ):
+        """
+        Initialize log store.
+        
+        Args:
+            directory: Directory holding this log's segment files
+            segment_max_bytes: Rotate to a new segment beyond this size
+            fsync: Whether sync() calls os.fsync (disable only for tests)
+        """
+        self.directory = Path(directory)
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync = fsync
+        
+        self._segments: List[LogSegment] = []
+        self._handle: Optional[BinaryIO] = None
+        self._dirty = False
+        self._directory_dirty = False   # Segment files created or removed
+        
+        # Metrics
+        self._records_appended = 0
+        self._bytes_written = 0
+        self._syncs = 0
+        self._rotations = 0
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # PROPERTIES
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    @property
+    def first_index(self) -> int:
+        """Index of the first stored record (0 if empty)."""
+        for segment in self._segments:
+            if segment.offsets:
+                return segment.first_index
+        return 0
+    
+    @property
+    def last_index(self) -> int:
+        """Index of the last stored record (0 if empty)."""
+        for segment in reversed(self._segments):
+            if segment.offsets:
+                return segment.last_index
+        return 0
+    
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files."""
+        return len(self._segments)
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # RECOVERY
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        Read every segment and return the stored entries in order.
+        
+        A torn or corrupt record (crash mid-write) ends the log: the
+        segment is truncated there and any later segments are removed.
+        
+        Returns:
+            List of LogEntry-compatible dictionaries
+        """
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._segments = []
+        
+        entries: List[Dict[str, Any]] = []
+        paths = sorted(self.directory.glob(f"*{SEGMENT_SUFFIX}"))
+        
+        for position, path in enumerate(paths):
+            segment = LogSegment(first_index=int(path.stem), path=path)
+            if self._segments and segment.first_index != self._segments[-1].last_index + 1:
+                raise LogStoreError(f"Segment {path.name} does not follow index {self._segments[-1].last_index}")
+            data = path.read_bytes()
+            offset = 0
+            torn = False
+            
+            while offset < len(data):
+                if offset + RECORD_HEADER.size > len(data):
+                    torn = True
+                    break
+                length, crc = RECORD_HEADER.unpack_from(data, offset)
+                start = offset + RECORD_HEADER.size
+                body = data[start:start + length]
+                if len(body) < length or zlib.crc32(body) != crc:
+                    torn = True
+                    break
+                
+                entry = decode_body(body)
+                expected = segment.first_index + len(segment.offsets)
+                if entry["index"] != expected:
+                    raise LogStoreError(f"Log gap in {path.name}: expected index {expected}, "
+                                        f"found {entry['index']}")
+                
+                segment.offsets.append(offset)
+                entries.append(entry)
+                offset = start + length
+            
+            if not segment.offsets:
+                path.unlink()
+            else:
+                segment.size = offset
+                self._segments.append(segment)
+            
+            if torn:
+                logger.warning(f"Torn record in {path.name} at offset {offset}; truncating log")
+                if segment.offsets:
+                    with open(path, "r+b") as f:
+                        f.truncate(offset)
+                        os.fsync(f.fileno())
+                for later in paths[position + 1:]:
+                    later.unlink()
+                break
+        
+        return entries
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # WRITES
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    def append(self, entries: Iterable[Any]):
+        """
+        Append entries to the active segment (buffered until sync()).
+        
+        Raises:
+            LogStoreError: If an entry does not directly follow the log tail
+        """
+        for entry in entries:
+            last = self.last_index
+            if last and entry.index != last + 1:
+                raise LogStoreError(f"Non-contiguous append: expected index {last + 1}, got {entry.index}")
+            
+            record = encode_record(entry.index, entry.term, entry.command, entry.timestamp)
+            
+            segment = self._segments[-1] if self._segments else None
+            if segment is None or (segment.offsets and segment.size + len(record) > self.segment_max_bytes):
+                segment = self._rotate(entry.index)
+            
+            handle = self._active_handle()
+            handle.write(record)
+            segment.offsets.append(segment.size)
+            segment.size += len(record)
+            
+            self._records_appended += 1
+            self._bytes_written += len(record)
+            self._dirty = True
+    
+    def truncate_suffix(self, index: int):
+        """Remove the entry at index and every entry after it."""
+        if index > self.last_index:
+            return
+        
+        self._flush_handle()
+        
+        while self._segments and self._segments[-1].first_index >= index:
+            segment = self._segments.pop()
+            self.close()
+            segment.path.unlink()
+            self._directory_dirty = True
+        
+        if self._segments:
+            segment = self._segments[-1]
+            keep = index - segment.first_index
+            if keep < len(segment.offsets):
+                offset = segment.offsets[keep]
+                self.close()
+                with open(segment.path, "r+b") as f:
+                    f.truncate(offset)
+                del segment.offsets[keep:]
+                segment.size = offset
+        
+        self._dirty = True
+    
+    def truncate_prefix(self, index: int):
+        """
+        Drop segments whose entries are all at or below index (compaction).
+        
+        A segment straddling index is kept whole; callers skip its
+        compacted entries when loading.
+        """
+        while self._segments and self._segments[0].last_index <= index:
+            segment = self._segments.pop(0)
+            if not self._segments:
+                self.close()
+            segment.path.unlink()
+            self._directory_dirty = True
+            self._dirty = True
+    
+    def sync(self):
+        """Flush buffered records and fsync them (group commit)."""
+        if not self._dirty:
+            return
+        
+        if self._handle is not None:
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+        elif self.fsync and self._segments:
+            with open(self._segments[-1].path, "rb") as f:
+                os.fsync(f.fileno())
+        
+        if self.fsync and self._directory_dirty:
+            self._fsync_directory()
+        
+        self._dirty = False
+        self._directory_dirty = False
+        self._syncs += 1
+    
+    def close(self):
+        """Close the active segment handle (buffered data is flushed, not synced)."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+    
+    def _rotate(self, first_index: int) -> LogSegment:
+        """Seal the active segment and start a new one at first_index."""
+        if self._handle is not None:
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            self.close()
+        
+        self.directory.mkdir(parents=True, exist_ok=True)
+        segment = LogSegment(
+            first_index=first_index,
+            path=self.directory / f"{first_index:020d}{SEGMENT_SUFFIX}"
+        )
+        self._segments.append(segment)
+        self._directory_dirty = True
+        if len(self._segments) > 1:
+            self._rotations += 1
+        return segment
+    
+    def _active_handle(self) -> BinaryIO:
+        """Open the active (last) segment for appending."""
+        if self._handle is None:
+            self._handle = open(self._segments[-1].path, "ab")
+        return self._handle
+    
+    def _flush_handle(self):
+        """Flush Python buffers without fsync."""
+        if self._handle is not None:
+            self._handle.flush()
+    
+    def _fsync_directory(self):
+        """Persist segment creation/removal (POSIX only)."""
+        if os.name != "posix":
+            return
+        fd = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    # ──────────────────────────────────────────────────────────────────────────
+    # STATUS
+    # ──────────────────────────────────────────────────────────────────────────
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store metrics."""
+        return {
+            "first_index": self.first_index,
+            "last_index": self.last_index,
+            "segments": len(self._segments),
+            "records_appended": self._records_appended,
+            "bytes_written": self._bytes_written,
+            "syncs": self._syncs,
+            "rotations": self._rotations
+        }
@@ -55,10 +55,10 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 
 # Import identity module
 try:
-    from modules.mesh.identity import NodeIdentity, IdentityManager
+    from modules.mesh.identity import NodeIdentity, IdentityManager, canonical_json
 except ImportError:
     # Allow standalone testing
-    from identity import NodeIdentity, IdentityManager
+    from identity import NodeIdentity, IdentityManager, canonical_json
 
 __version__ = "3.0.0"
 
@@ -277,12 +277,13 @@ class BanProof:
             federation_id=federation_id
         )
         
-        # Sign with primary signer
-        proof.signature = proof._sign(first_identity)
+        # Sign with primary signer; every signer signs the same payload
+        payload = proof._get_signable_bytes()
+        proof.signature = proof._sign(first_identity, payload)
         
         # Collect supporting signatures
         for identity, level in valid_signers[1:]:
-            sig = proof._sign(identity)
+            sig = proof._sign(identity, payload)
             proof.supporting_signatures.append({
                 "node_id": identity.node_id,
                 "node_name": identity.node_name,
@@ -309,15 +310,17 @@ class BanProof:
             "required_quorum": self.required_quorum
         }
     
-    def _sign(self, identity: NodeIdentity) -> str:
+    def _get_signable_bytes(self) -> bytes:
+        """Canonical serialization of the signable data."""
+        return canonical_json(self._get_signable_data())
+    
+    def _sign(self, identity: NodeIdentity, payload: Optional[bytes] = None) -> str:
         """Sign the ban proof with an identity."""
-        data = self._get_signable_data()
-        return identity.sign_dict(data)
+        return identity.sign_canonical(payload or self._get_signable_bytes())
     
-    def verify_signature(self, issuer_identity: NodeIdentity) -> bool:
+    def verify_signature(self, issuer_identity: NodeIdentity, payload: Optional[bytes] = None) -> bool:
         """Verify the primary signature."""
-        data = self._get_signable_data()
-        return issuer_identity.verify_dict(data, self.signature)
+        return issuer_identity.verify_canonical(payload or self._get_signable_bytes(), self.signature)
     
     def verify_quorum(self, identities: Dict[str, NodeIdentity]) -> Tuple[bool, int]:
         """
@@ -329,10 +332,12 @@ class BanProof:
         Returns:
             Tuple of (is_valid, verified_count)
         """
+        payload = self._get_signable_bytes()
+        
         if self.required_quorum == 0:
             # Single-signer ban, verify primary only
             issuer = identities.get(self.issuer_node_id)
-            if issuer and self.verify_signature(issuer):
+            if issuer and self.verify_signature(issuer, payload):
                 return True, 1
             return False, 0
         
@@ -341,17 +346,16 @@ class BanProof:
         
         # Check primary
         issuer = identities.get(self.issuer_node_id)
-        if issuer and self.verify_signature(issuer):
+        if issuer and self.verify_signature(issuer, payload):
             verified += 1
         
         # Check supporting signatures
-        data = self._get_signable_data()
         for support in self.supporting_signatures:
             signer_id = support["node_id"]
             sig = support["signature"]
             signer = identities.get(signer_id)
             
-            if signer and signer.verify_dict(data, sig):
+            if signer and signer.verify_canonical(payload, sig):
                 verified += 1
         
         return verified >= self.required_quorum, verified
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                     MESH WIRE CODEC - THE TONGUE                             ║
+║                   PAC-NET-P300-MESH-NETWORKING                               ║
+╠══════════════════════════════════════════════════════════════════════════════╣
+║  Canonical Binary Framing for MeshMessage                                    ║
+║                                                                              ║
+║  "Say it once, say it exactly, sign what was said."                          ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+The Wire Codec provides:
+  - A compact binary envelope (struct header + length-prefixed fields)
+  - A canonical tagged value encoding for payloads (msgpack-style types)
+  - Canonical compact JSON as the alternative payload encoding
+  - Decoding straight from a memoryview of the read buffer
+
+Frame Layout (big-endian):
+  [1B magic 0xCB][1B version][1B type code][1B payload codec]
+  [1B id len][2B sender len][1B timestamp len][4B payload len]
+  [message_id][sender_id][timestamp][payload]          ← signed region
+  [2B signature len][signature]
+
+The signed region is canonical: map keys are sorted, integers are fixed
+width and there is no optional whitespace, so the same message always
+encodes to the same bytes. Message hashes and signatures are computed
+over exactly those bytes, and a receiver hashes the slice it read.
+
+This is wire version 2 (WIRE_VERSION). Version 1 nodes spoke JSON only
+and hashed a colon-joined string instead, so even a JSON message from a
+v2 node fails their signature check. Nodes exchange their wire version
+in the handshake and refuse peers on another version.
+
+Value Tags:
+  0x00 nil   0x01 false   0x02 true   0x03 int64   0x04 float64
+  0x05 str (1B len)   0x06 str (4B len)   0x07 bytes (4B len)
+  0x08 array (4B count)   0x09 map (4B count, keys 1B len + UTF-8)
+
+Values the tagged encoding cannot represent (ints beyond 64 bits,
+non-string or long map keys, custom types) fall back to canonical JSON
+for the whole payload; the codec byte tells the receiver which one.
+
+Usage:
+    from modules.mesh.wire import encode_body, seal, decode_frame, CODEC_BINARY
+    
+    body = encode_body(type_code, message_id, sender_id, timestamp, payload, CODEC_BINARY)
+    frame = seal(body, signature)
+    
+    decoded = decode_frame(memoryview(frame))
+    hashlib.sha256(decoded.signed).hexdigest()
+"""
+
+import json
+import struct
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+__version__ = "3.0.0"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# CONSTANTS
+# ══════════════════════════════════════════════════════════════════════════════
+
+FRAME_MAGIC = 0xCB
+
+# Mesh wire version: 1 = JSON only, hashed as "id:type:sender:timestamp:json";
+# 2 = hashed over the canonical signed region. Sent in HELLO / HELLO_ACK.
+WIRE_VERSION = 2
+FRAME_VERSION = WIRE_VERSION
+FRAME_HEADER = struct.Struct(">BBBBBHBI")   # magic, version, type, codec, id/sender/ts/payload lengths
+SIGNATURE_LENGTH = struct.Struct(">H")
+
+# Payload codecs (the codec byte of a frame)
+CODEC_JSON = 0
+CODEC_BINARY = 1
+
+# Wire formats a connection can negotiate (HELLO "codecs" list)
+WIRE_JSON = "json"
+WIRE_BINARY = "binary"
+
+TAG_NIL = 0x00
+TAG_FALSE = 0x01
+TAG_TRUE = 0x02
+TAG_INT = 0x03
+TAG_FLOAT = 0x04
+TAG_STR8 = 0x05
+TAG_STR32 = 0x06
+TAG_BYTES = 0x07
+TAG_ARRAY = 0x08
+TAG_MAP = 0x09
+
+_U32 = struct.Struct(">I")
+_INT = struct.Struct(">q")
+_FLOAT = struct.Struct(">d")
+
+
+class WireError(Exception):
+    """Raised when a frame or value cannot be decoded."""
+    pass
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# VALUE CODEC
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _pack(value: Any, out: bytearray):
+    """Append the canonical tagged encoding of value to out."""
+    kind = type(value)
+    if kind is str:
+        data = value.encode("utf-8")
+        if len(data) < 256:
+            out.append(TAG_STR8)
+            out.append(len(data))
+        else:
+            out.append(TAG_STR32)
+            out += _U32.pack(len(data))
+        out += data
+    elif kind is int:
+        out.append(TAG_INT)
+        out += _INT.pack(value)
+    elif kind is dict:
+        out.append(TAG_MAP)
+        out += _U32.pack(len(value))
+        for key in sorted(value):
+            if type(key) is not str:
+                raise TypeError(f"Map key {key!r} is not a string")
+            data = key.encode("utf-8")
+            out.append(len(data))       # ValueError beyond 255 bytes
+            out += data
+            _pack(value[key], out)
+    elif kind is list or kind is tuple:
+        out.append(TAG_ARRAY)
+        out += _U32.pack(len(value))
+        for item in value:
+            _pack(item, out)
+    elif kind is float:
+        out.append(TAG_FLOAT)
+        out += _FLOAT.pack(value)
+    elif kind is bool:
+        out.append(TAG_TRUE if value else TAG_FALSE)
+    elif value is None:
+        out.append(TAG_NIL)
+    elif kind is bytes:
+        out.append(TAG_BYTES)
+        out += _U32.pack(len(value))
+        out += value
+    else:
+        raise TypeError(f"Cannot encode {kind.__name__}")
+
+
+def _unpack(view: memoryview, offset: int) -> Tuple[Any, int]:
+    """Decode one tagged value at offset; returns (value, next offset)."""
+    tag = view[offset]
+    offset += 1
+    if tag == TAG_STR8:
+        length = view[offset]
+        offset += 1
+        return str(view[offset:offset + length], "utf-8"), offset + length
+    if tag == TAG_INT:
+        return _INT.unpack_from(view, offset)[0], offset + 8
+    if tag == TAG_MAP:
+        count, = _U32.unpack_from(view, offset)
+        offset += 4
+        result = {}
+        for _ in range(count):
+            length = view[offset]
+            offset += 1
+            key = str(view[offset:offset + length], "utf-8")
+            result[key], offset = _unpack(view, offset + length)
+        return result, offset
+    if tag == TAG_ARRAY:
+        count, = _U32.unpack_from(view, offset)
+        offset += 4
+        items = []
+        for _ in range(count):
+            item, offset = _unpack(view, offset)
+            items.append(item)
+        return items, offset
+    if tag == TAG_FLOAT:
+        return _FLOAT.unpack_from(view, offset)[0], offset + 8
+    if tag == TAG_TRUE:
+        return True, offset
+    if tag == TAG_FALSE:
+        return False, offset
+    if tag == TAG_NIL:
+        return None, offset
+    if tag == TAG_STR32:
+        length, = _U32.unpack_from(view, offset)
+        offset += 4
+        return str(view[offset:offset + length], "utf-8"), offset + length
+    if tag == TAG_BYTES:
+        length, = _U32.unpack_from(view, offset)
+        offset += 4
+        return bytes(view[offset:offset + length]), offset + length
+    raise WireError(f"Unknown value tag 0x{tag:02x} at offset {offset - 1}")
+
+
+def pack_value(value: Any) -> bytes:
+    """Encode a value with the canonical tagged encoding."""
+    out = bytearray()
+    _pack(value, out)
+    return bytes(out)
+
+
+def unpack_value(data) -> Any:
+    """Decode a value produced by pack_value (bytes or memoryview)."""
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    try:
+        value, end = _unpack(view, 0)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise WireError(f"Truncated or corrupt value: {e}") from e
+    if end != len(view):
+        raise WireError(f"{len(view) - end} trailing bytes after value")
+    return value
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# PAYLOAD CODEC
+# ══════════════════════════════════════════════════════════════════════════════
+
+def encode_json(payload: Dict[str, Any]) -> bytes:
+    """Canonical compact JSON (sorted keys, no whitespace)."""
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def encode_payload(payload: Dict[str, Any], codec: int = CODEC_BINARY) -> Tuple[int, bytes]:
+    """
+    Encode a payload with the preferred codec.
+    
+    Returns:
+        (codec actually used, encoded bytes); binary falls back to JSON
+        for values the tagged encoding cannot represent
+    """
+    if codec == CODEC_BINARY:
+        out = bytearray()
+        try:
+            _pack(payload, out)
+            return CODEC_BINARY, bytes(out)
+        except (TypeError, ValueError, struct.error):
+            pass
+    return CODEC_JSON, encode_json(payload)
+
+
+def decode_payload(codec: int, view: memoryview) -> Dict[str, Any]:
+    """Decode a payload slice written by encode_payload."""
+    if codec == CODEC_BINARY:
+        return unpack_value(view)
+    if codec == CODEC_JSON:
+        return json.loads(str(view, "utf-8"))
+    raise WireError(f"Unknown payload codec {codec}")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+# FRAMES
+# ══════════════════════════════════════════════════════════════════════════════
+
+class WireFrame(NamedTuple):
+    """A decoded binary frame."""
+    type_code: int
+    message_id: str
+    sender_id: str
+    timestamp: str
+    payload: Dict[str, Any]
+    signature: Optional[str]
+    signed: memoryview          # Exact signed region as read off the wire
+
+
+def is_binary_frame(data) -> bool:
+    """Check whether a frame uses the binary envelope (JSON frames start with '{')."""
+    return len(data) > 0 and data[0] == FRAME_MAGIC
+
+
+def encode_body(
+    type_code: int,
+    message_id: str,
+    sender_id: str,
+    timestamp: str,
+    payload: Dict[str, Any],
+    codec: int = CODEC_BINARY
+) -> bytes:
+    """Encode the signed region of a frame (everything but the signature)."""
+    codec, encoded = encode_payload(payload, codec)
+    id_bytes = message_id.encode("utf-8")
+    sender_bytes = sender_id.encode("utf-8")
+    ts_bytes = timestamp.encode("utf-8")
+    header = FRAME_HEADER.pack(
+        FRAME_MAGIC, FRAME_VERSION, type_code, codec,
+        len(id_bytes), len(sender_bytes), len(ts_bytes), len(encoded)
+    )
+    return b"".join((header, id_bytes, sender_bytes, ts_bytes, encoded))
+
+
+def seal(body: bytes, signature: Optional[str] = None) -> bytes:
+    """Append the signature trailer to a signed region."""
+    data = signature.encode("utf-8") if signature else b""
+    return b"".join((body, SIGNATURE_LENGTH.pack(len(data)), data))
+
+
+def decode_frame(view: memoryview) -> WireFrame:
+    """
+    Decode a binary frame without copying the read buffer.
+    
+    Raises:
+        WireError: If the frame is truncated, corrupt or of an unknown version
+    """
+    try:
+        magic, version, type_code, codec, id_len, sender_len, ts_len, payload_len = \
+            FRAME_HEADER.unpack_from(view, 0)
+        if magic != FRAME_MAGIC or version != FRAME_VERSION:
+            raise WireError(f"Unsupported frame (magic 0x{magic:02x}, version {version})")
+        
+        sender_at = FRAME_HEADER.size + id_len
+        ts_at = sender_at + sender_len
+        payload_at = ts_at + ts_len
+        payload_end = payload_at + payload_len
+        sig_at = payload_end + SIGNATURE_LENGTH.size
+        if sig_at > len(view):
+            raise WireError("Frame truncated before signature")
+        
+        sig_len, = SIGNATURE_LENGTH.unpack_from(view, payload_end)
+        if sig_at + sig_len != len(view):
+            raise WireError(f"Frame length mismatch: {len(view)} bytes, expected {sig_at + sig_len}")
+        
+        message_id = str(view[FRAME_HEADER.size:sender_at], "utf-8")
+        sender_id = str(view[sender_at:ts_at], "utf-8")
+        timestamp = str(view[ts_at:payload_at], "utf-8")
+        signature = str(view[sig_at:], "utf-8") if sig_len else None
+        payload = decode_payload(codec, view[payload_at:payload_end])
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise WireError(f"Corrupt frame: {e}") from e
+    
+    return WireFrame(type_code, message_id, sender_id, timestamp, payload, signature, view[:payload_end])
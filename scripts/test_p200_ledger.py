@@ -254,6 +254,176 @@ def run_tests():
         results.append(("Global Conservation", "FAIL"))
     print()
     
+    # =========================================================================
+    # TEST 10: Batch Posting (Netting)
+    # =========================================================================
+    print("TEST 10: Batch Posting (Netting)")
+    try:
+        alice_before = ledger.get_balance("ALICE-001")
+        bob_before = ledger.get_balance("BOB-001")
+        
+        # Bob is paid before he pays on - only the net position is checked
+        batch = ledger.transfer_batch(
+            [
+                ("ALICE-001", "BOB-001", Decimal("100.00")),
+                ("BOB-001", "ALICE-001", Decimal("40.00")),
+                ("ALICE-001", "BOB-001", Decimal("10.00")),
+            ],
+            description="Nightly netting",
+        )
+        
+        assert ledger.get_balance("ALICE-001") == alice_before - Decimal("70.00")
+        assert ledger.get_balance("BOB-001") == bob_before + Decimal("70.00")
+        assert ledger.posted_transactions[-3:] == batch.transaction_ids
+        assert ledger.last_hash == batch.batch_hash
+        
+        is_valid, message = ledger.verify_chain_integrity()
+        assert is_valid, message
+        
+        # Tampering with a member breaks the batch's Merkle root
+        member = ledger.transactions[batch.transaction_ids[1]]
+        member.entries[0].amount = Decimal("500.00")
+        assert not ledger.verify_chain_integrity()[0]
+        member.entries[0].amount = Decimal("40.00")
+        
+        print(f"   ✅ PASS: 3 transfers posted as one link ({message})")
+        results.append(("Batch Posting", "PASS"))
+    except Exception as e:
+        print(f"   ❌ FAIL: {e}")
+        results.append(("Batch Posting", "FAIL"))
+    print()
+    
+    # =========================================================================
+    # TEST 11: Batch Atomicity
+    # =========================================================================
+    print("TEST 11: Batch Atomicity")
+    try:
+        balances_before = {k: a.balance for k, a in ledger.accounts.items()}
+        posted_before = len(ledger.posted_transactions)
+        last_hash_before = ledger.last_hash
+        
+        ok = ledger.create_transaction(description="Would succeed alone")
+        ok.debit("BOB-001", Decimal("1.00"))
+        ok.credit("ALICE-001", Decimal("1.00"))
+        overdraft = ledger.create_transaction(description="Overdraft")
+        overdraft.debit("ALICE-001", Decimal("100000.00"))
+        overdraft.credit("BOB-001", Decimal("100000.00"))
+        
+        try:
+            ledger.post_batch([ok.transaction_id, overdraft.transaction_id])
+            print("   ❌ FAIL: Batch with overdraft should have been rejected")
+            results.append(("Batch Atomicity", "FAIL"))
+        except InsufficientFundsError:
+            assert {k: a.balance for k, a in ledger.accounts.items()} == balances_before
+            assert len(ledger.posted_transactions) == posted_before
+            assert ledger.last_hash == last_hash_before
+            assert ok.status == TransactionStatus.PENDING
+            print("   ✅ PASS: Whole batch rejected, no balance changed")
+            results.append(("Batch Atomicity", "PASS"))
+    except Exception as e:
+        print(f"   ❌ FAIL: {e}")
+        results.append(("Batch Atomicity", "FAIL"))
+    print()
+    
+    # =========================================================================
+    # TEST 12: Compact Storage (Columnar Accounts + Journal)
+    # =========================================================================
+    print("TEST 12: Compact Storage (Columnar Accounts + Journal)")
+    try:
+        compact = Ledger(ledger_id="TEST-LEDGER-COMPACT", compact=True)
+        carol = compact.create_account("Carol", AccountType.ASSET, account_id="CAROL-001")
+        compact.create_account("Dave", AccountType.ASSET, account_id="DAVE-001")
+        compact.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING-001", allow_negative=True)
+        
+        compact.transfer("FUNDING-001", "CAROL-001", Decimal("100.00"))
+        txn = compact.transfer("CAROL-001", "DAVE-001", Decimal("30.25"))
+        compact.transfer_batch([("CAROL-001", "DAVE-001", Decimal("0.75"))])
+        compact.reverse_transaction(txn.transaction_id)
+        
+        assert carol.balance == Decimal("99.25")
+        assert compact.get_balance("DAVE-001") == Decimal("0.75")
+        assert compact.transactions[txn.transaction_id].status == TransactionStatus.REVERSED
+        assert len(compact.posted_transactions) == 4
+        assert compact.verify_chain_integrity()[0]
+        assert compact.verify_conservation()[0]
+        
+        # Posted transactions come back as copies; edits cannot be stored
+        stored = compact.transactions[txn.transaction_id]
+        stored.entries[0].amount = Decimal("1.00")
+        try:
+            compact.transactions[txn.transaction_id] = stored
+            raise AssertionError("Edited posted transaction was stored")
+        except ImmutabilityViolationError:
+            pass
+        
+        compact.close()
+        print("   ✅ PASS: Balances, reversal and chain match in-memory behaviour")
+        results.append(("Compact Storage", "PASS"))
+    except Exception as e:
+        print(f"   ❌ FAIL: {e}")
+        results.append(("Compact Storage", "FAIL"))
+    print()
+    
+    # =========================================================================
+    # TEST 13: Checkpointed and Parallel Chain Audits
+    # =========================================================================
+    print("TEST 13: Checkpointed and Parallel Chain Audits")
+    try:
+        audited = Ledger(ledger_id="TEST-LEDGER-AUDIT")
+        audited.create_account("Erin", AccountType.ASSET, account_id="ERIN-001")
+        audited.create_account("Frank", AccountType.ASSET, account_id="FRANK-001")
+        audited.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING-001", allow_negative=True)
+        audited.transfer("FUNDING-001", "ERIN-001", Decimal("1000.00"))
+        for _ in range(20):
+            audited.transfer("ERIN-001", "FRANK-001", Decimal("1.00"))
+        audited.transfer_batch([("FRANK-001", "ERIN-001", Decimal("0.50"))] * 4)
+        
+        assert audited.verify_chain_integrity()[0]
+        assert audited.checkpoint.position == 25
+        assert audited.checkpoint.last_hash == audited.last_hash
+        
+        # Only activity since the checkpoint is re-hashed
+        for _ in range(5):
+            audited.transfer("ERIN-001", "FRANK-001", Decimal("1.00"))
+        is_valid, message = audited.verify_chain_integrity(incremental=True)
+        assert is_valid and "5 new transactions" in message, message
+        assert audited.checkpoint.position == 30
+        
+        # History behind the checkpoint is trusted incrementally, not fully
+        old = audited.transactions[audited.posted_transactions[3]]
+        old.description = "Tampered"
+        assert audited.verify_chain_integrity(incremental=True)[0]
+        assert not audited.verify_chain_integrity()[0]
+        assert not audited.verify_chain_parallel(workers=3, min_segment=5)[0]
+        old.description = "Transfer 1.00 from ERIN-001 to FRANK-001"
+        
+        # Parallel full audit agrees with the sequential one
+        digest = audited.checkpoint.digest
+        is_valid, message = audited.verify_chain_parallel(workers=3, min_segment=5)
+        assert is_valid and "3 segments" in message, message
+        assert audited.checkpoint.digest == digest
+        
+        # A checkpoint that disagrees with the re-hashed history is caught
+        audited.checkpoint.digest = "0" * 64
+        assert not audited.verify_chain_integrity()[0]
+        
+        compact = Ledger(ledger_id="TEST-LEDGER-AUDIT-COMPACT", compact=True)
+        compact.create_account("Erin", AccountType.ASSET, account_id="ERIN-001")
+        compact.create_account("Funding", AccountType.LIABILITY, account_id="FUNDING-001", allow_negative=True)
+        for _ in range(10):
+            compact.transfer("FUNDING-001", "ERIN-001", Decimal("2.00"))
+        compact.transfer_batch([("ERIN-001", "FUNDING-001", Decimal("1.00"))] * 3)
+        assert compact.verify_chain_parallel(workers=2, min_segment=5)[0]
+        assert compact.verify_chain_integrity(incremental=True)[0]
+        compact.close()
+        
+        print(f"   ✅ PASS: Incremental, full and parallel audits agree ({message})")
+        results.append(("Checkpointed Audits", "PASS"))
+    except Exception as e:
+        print(f"   ❌ FAIL: {e}")
+        results.append(("Checkpointed Audits", "FAIL"))
+    print()
+    
     # =========================================================================
     # SUMMARY
     # =========================================================================
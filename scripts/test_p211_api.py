@@ -7,10 +7,25 @@ Validates that sovereign_server.py v2.0 has:
 2. FinancialTrace model for transparency
 3. TransactionReceipt with financial_trace
 4. App version 2.0.0
+5. Async controller path (concurrent gates) matches the sync receipts
+6. Async path short-circuits on the first failing gate in blame order
+7. Concurrent in-flight transactions with I/O-bound gates
+8. Batch endpoint streams one NDJSON line per item (200 / 402 / ABORTED)
+9. SovereignClient / AsyncSovereignClient submit_many() over pooled connections
+
+Usage:
+    python scripts/test_p211_api.py
+    python scripts/test_p211_api.py --benchmark    # Batch size throughput
 """
 
+import asyncio
+import json
+import logging
 import sys
+import time
+from decimal import Decimal
 sys.path.insert(0, ".")
+sys.path.insert(0, "clients/python")
 
 from sovereign_server import (
     app,
@@ -91,6 +106,245 @@ def test_transaction_receipt_with_financial_trace():
     assert 'INV-API-003' in tr.invariants_enforced
     print("✅ Test 4 PASSED: TransactionReceipt includes financial_trace")
 
+CLEAN_USER = {
+    "user_id": "USR-ALICE-TRADER", "liveness_score": 0.98, "face_similarity": 0.96,
+    "has_enrolled_template": True, "document_type": "PASSPORT",
+    "is_expired": False, "is_tampered": False, "mrz_valid": True,
+}
+CLEAN_SHIPMENT = {
+    "manifest": {
+        "shipment_id": "SHP-ASYNC", "seal_intact": True,
+        "declared_weight_kg": 5000, "actual_weight_kg": 5050,
+        "bill_of_lading": True, "commercial_invoice": True, "packing_list": True,
+    },
+    "telemetry": {"route_deviation_km": 1.2, "unscheduled_stops": 0, "arrival_delay_min": 15, "gps_gaps": 0},
+}
+
+
+def _payment(payer_id: str, amount: float = 1000.0) -> dict:
+    return {
+        "payer_id": payer_id, "payee_id": "GLOBEX-INC", "payer_country": "US",
+        "payee_country": "DE", "amount": amount, "currency": "USD", "daily_total": 0,
+    }
+
+
+def _slow_gate(gate, delay_s: float, calls: list = None):
+    """Wrap a gate's process() to simulate an I/O-bound external check."""
+    original = gate.process
+    
+    def process(*args):
+        if calls is not None:
+            calls.append(gate.__class__.__name__)
+        time.sleep(delay_s)
+        return original(*args)
+    
+    gate.process = process
+
+
+def test_async_controller_parity():
+    """Test the concurrent-gate path produces the same receipts as the sync path"""
+    from modules.core.chainbridge_controller import ChainBridgeController
+    
+    controller = ChainBridgeController()
+    controller.fund_account("ACME-CORP", Decimal("1000000.00"), "USD")
+    
+    scenarios = [
+        (CLEAN_USER, _payment("ACME-CORP"), CLEAN_SHIPMENT),                               # FINALIZED
+        (CLEAN_USER, _payment("BROKE-LLC"), CLEAN_SHIPMENT),                               # SETTLEMENT
+        (CLEAN_USER, _payment("SANCTIONED-ENTITY-001"), CLEAN_SHIPMENT),                   # AML
+        ({**CLEAN_USER, "is_deepfake": True}, _payment("SANCTIONED-ENTITY-001"), CLEAN_SHIPMENT),  # BIOMETRIC
+    ]
+    
+    for user, payment, shipment in scenarios:
+        sync = controller.process_transaction(user, payment, shipment)
+        concurrent = asyncio.run(controller.process_transaction_async(user, payment, shipment))
+        assert concurrent["status"] == sync["status"], (sync["status"], concurrent["status"])
+        assert concurrent.get("blame") == sync.get("blame"), (sync.get("blame"), concurrent.get("blame"))
+        assert concurrent["gates"] == sync["gates"]
+    
+    controller.shutdown()
+    print("✅ Test 5 PASSED: Async controller path matches sync receipts (status, blame, gates)")
+
+
+def test_async_short_circuit():
+    """Test a biometric failure returns without waiting for slower gates"""
+    from modules.core.chainbridge_controller import ChainBridgeController
+    
+    controller = ChainBridgeController(gate_workers=1)
+    calls = []
+    _slow_gate(controller.aml_gate, 0.3, calls)
+    _slow_gate(controller.customs_gate, 0.3, calls)
+    
+    start = time.perf_counter()
+    result = asyncio.run(controller.process_transaction_async(
+        {**CLEAN_USER, "is_deepfake": True}, _payment("ACME-CORP"), CLEAN_SHIPMENT
+    ))
+    elapsed = time.perf_counter() - start
+    
+    assert result["blame"]["gate"] == "BIOMETRIC"
+    assert elapsed < 0.25, f"short-circuit took {elapsed:.3f}s"
+    assert "SmartCustomsGate" not in calls, "queued customs gate should have been cancelled"
+    controller.shutdown()
+    print(f"✅ Test 6 PASSED: BIOMETRIC failure short-circuits in {elapsed * 1000:.0f}ms (customs cancelled)")
+
+
+def test_async_concurrent_throughput():
+    """Test many in-flight transactions with I/O-bound gates"""
+    from modules.core.chainbridge_controller import ChainBridgeController
+    
+    delay_s, count = 0.05, 20
+    controller = ChainBridgeController(gate_workers=3 * count)
+    controller.fund_account("ACME-CORP", Decimal("1000000.00"), "USD")
+    for gate in (controller.bio_gate, controller.aml_gate, controller.customs_gate):
+        _slow_gate(gate, delay_s)
+    
+    async def run_batch():
+        return await asyncio.gather(*[
+            controller.process_transaction_async(CLEAN_USER, _payment("ACME-CORP", 10.0), CLEAN_SHIPMENT)
+            for _ in range(count)
+        ])
+    
+    start = time.perf_counter()
+    results = asyncio.run(run_batch())
+    elapsed = time.perf_counter() - start
+    sequential = 3 * delay_s * count
+    
+    assert all(r["status"] == "FINALIZED" for r in results)
+    assert len({r["transaction_id"] for r in results}) == count
+    assert elapsed < sequential / 4, f"{elapsed:.2f}s vs sequential {sequential:.2f}s"
+    controller.shutdown()
+    print(f"✅ Test 7 PASSED: {count} concurrent transactions in {elapsed:.2f}s "
+          f"(sequential gates: {sequential:.2f}s)")
+
+
+def _batch_item(payer_id: str, user: dict = None) -> dict:
+    return {"user_data": user or CLEAN_USER, "payment_data": _payment(payer_id, 10.0), "shipment_data": CLEAN_SHIPMENT}
+
+
+def test_batch_endpoint_ndjson():
+    """Test POST /v1/transactions/batch streams per-item results"""
+    import sovereign_server
+    from fastapi.testclient import TestClient
+    
+    with TestClient(app) as http:
+        sovereign_server.controller.fund_account("ACME-CORP", Decimal("1000000.00"), "USD")
+        items = [
+            _batch_item("ACME-CORP"),
+            _batch_item("BROKE-LLC"),
+            _batch_item("ACME-CORP", {**CLEAN_USER, "is_deepfake": True}),
+        ]
+        response = http.post("/v1/transactions/batch", json={"transactions": items})
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        by_index = {line["index"]: line for line in lines}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0]["status_code"] == 200 and by_index[0]["receipt"]["status"] == "FINALIZED"
+        assert by_index[0]["receipt"]["financial_trace"]["ledger_committed"] is True
+        assert by_index[1]["status_code"] == 402 and by_index[1]["error"]["error"] == "SETTLEMENT_FAILED"
+        assert by_index[2]["receipt"]["blame"]["gate"] == "BIOMETRIC"
+        
+        # Whole-batch validation (INV-API-001)
+        bad = [_batch_item("ACME-CORP"), {"user_data": CLEAN_USER}]
+        assert http.post("/v1/transactions/batch", json={"transactions": bad}).status_code == 422
+        assert http.post("/v1/transactions/batch", json={"transactions": []}).status_code == 422
+        assert sovereign_server.controller.transactions_processed == 3
+    
+    print("✅ Test 8 PASSED: Batch endpoint streams NDJSON (FINALIZED / 402 / ABORTED, 422 on bad item)")
+
+
+def _client_requests(count: int, payer_id: str = "ACME-CORP") -> list:
+    from sovereign_client import (
+        SovereignTransactionRequest as ClientRequest, UserData, PaymentData as ClientPayment,
+        ShipmentData, ManifestData
+    )
+    
+    return [
+        ClientRequest(
+            user_data=UserData(user_id=f"USR-{n:05d}"),
+            payment_data=ClientPayment(payer_id=payer_id, payee_id="GLOBEX-INC", amount=10.0),
+            shipment_data=ShipmentData(manifest=ManifestData(
+                shipment_id=f"SHP-{n:05d}", declared_weight_kg=5000, actual_weight_kg=5050
+            ))
+        )
+        for n in range(count)
+    ]
+
+
+def test_client_submit_many():
+    """Test pooled sync and async clients reassemble batches in request order"""
+    import httpx
+    import sovereign_server
+    from fastapi.testclient import TestClient
+    from sovereign_client import SovereignClient, AsyncSovereignClient, PaymentRequiredError
+    
+    requests = _client_requests(23) + _client_requests(2, payer_id="BROKE-LLC")
+    
+    with TestClient(app) as http:
+        sovereign_server.controller.fund_account("ACME-CORP", Decimal("1000000.00"), "USD")
+        with SovereignClient("http://testserver", http_client=http) as client:
+            results = client.submit_many(requests, batch_size=10)
+    
+    assert [r.index for r in results] == list(range(25))
+    assert all(r.ok and r.receipt.is_finalized for r in results[:23])
+    assert all(isinstance(r.error, PaymentRequiredError) for r in results[23:])
+    
+    async def run_async():
+        async with sovereign_server.lifespan(app):
+            sovereign_server.controller.fund_account("ACME-CORP", Decimal("1000000.00"), "USD")
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport) as http:
+                async with AsyncSovereignClient("http://testserver", http_client=http) as client:
+                    return await client.submit_many(requests, batch_size=7, max_in_flight=3)
+    
+    async_results = asyncio.run(run_async())
+    assert [r.status_code for r in async_results] == [r.status_code for r in results]
+    assert [r.index for r in async_results] == list(range(25))
+    print("✅ Test 9 PASSED: submit_many() returns 25 results in request order (sync + pipelined async)")
+
+
+def benchmark_batch_throughput(total: int = 2000):
+    """
+    Benchmark in-process API throughput: one POST per transaction vs
+    AsyncSovereignClient.submit_many() at batch sizes 1/10/100/1000.
+    
+    Runs over httpx.ASGITransport, so it measures HTTP framing, validation
+    and routing overhead per request; connection setup (TCP/TLS) saved by
+    the pooled client comes on top of this against a real server.
+    
+    Usage:
+        python scripts/test_p211_api.py --benchmark
+    """
+    import httpx
+    import sovereign_server
+    from sovereign_client import AsyncSovereignClient
+    
+    print(f"\nBATCH THROUGHPUT BENCHMARK - transactions/sec ({total} transactions)")
+    logging.disable(logging.WARNING)   # Per-transaction INFO logs would dominate
+    requests = _client_requests(total)
+    
+    async def run(batch_size: int = None) -> float:
+        async with sovereign_server.lifespan(app):
+            sovereign_server.controller.fund_account("ACME-CORP", Decimal("1000000000.00"), "USD")
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport) as http:
+                client = AsyncSovereignClient("http://testserver", http_client=http)
+                start = time.perf_counter()
+                if batch_size is None:
+                    for request in requests:
+                        await client.submit_transaction(request.user_data, request.payment_data, request.shipment_data)
+                else:
+                    results = await client.submit_many(requests, batch_size=batch_size)
+                    assert all(r.ok for r in results)
+                return total / (time.perf_counter() - start)
+    
+    print(f"  POST /v1/transaction x{total}: {asyncio.run(run()):>10,.0f} tx/s")
+    for batch_size in (1, 10, 100, 1000):
+        print(f"  submit_many(batch_size={batch_size:<4}):  {asyncio.run(run(batch_size)):>10,.0f} tx/s")
+    logging.disable(logging.NOTSET)
+
+
 def run_all_tests():
     print()
     print("╔══════════════════════════════════════════════════════════════════════╗")
@@ -103,10 +357,15 @@ def run_all_tests():
     test_payment_data_fee_strategy()
     test_financial_trace_model()
     test_transaction_receipt_with_financial_trace()
+    test_async_controller_parity()
+    test_async_short_circuit()
+    test_async_concurrent_throughput()
+    test_batch_endpoint_ndjson()
+    test_client_submit_many()
     
     print()
     print("╔══════════════════════════════════════════════════════════════════════╗")
-    print("║                    ALL 4 TESTS PASSED ✅                              ║")
+    print("║                    ALL 9 TESTS PASSED ✅                              ║")
     print("║                                                                      ║")
     print("║  SOVEREIGN SERVER v2.0 VALIDATED:                                    ║")
     print("║    • PaymentData.fee_strategy: ✅                                    ║")
@@ -119,12 +378,15 @@ def run_all_tests():
     print("╚══════════════════════════════════════════════════════════════════════╝")
     
     return {
-        "tests_run": 4,
-        "tests_passed": 4,
+        "tests_run": 9,
+        "tests_passed": 9,
         "api_version": "2.0.0",
         "attestation": "MASTER-BER-P211-UPGRADE"
     }
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_batch_throughput()
+        sys.exit(0)
     result = run_all_tests()
     print(f"\n✅ RESULT: {result}")
@@ -4,15 +4,27 @@ PAC-NET-P300: Mesh Networking Integration Test
 
 Simulates a handshake between Node A (local) and Node B (simulated).
 Validates the full mesh networking stack.
+
+Usage:
+    python scripts/test_p300_mesh.py
+    python scripts/test_p300_mesh.py --benchmark    # Wire codec, broadcast, dispatch, gossip
 """
 
 import asyncio
+import hashlib
+import json
+import socket
 import sys
+import time
 sys.path.insert(0, "/Users/johnbozza/Documents/Projects/ChainBridge-local-repo")
 
 from modules.mesh.networking import (
     MeshNode, MeshConfig, MeshMessage, MessageType,
-    PeerInfo, PeerConnection, PeerState
+    PeerInfo, PeerConnection, PeerState, OverflowPolicy, DispatchPool, DispatchOverflow
+)
+from modules.mesh.wire import (
+    WIRE_BINARY, WIRE_JSON, CODEC_BINARY, CODEC_JSON, WireError,
+    pack_value, unpack_value
 )
 from modules.mesh.discovery import (
     GossipProtocol, PeerRegistry, Member, MemberStatus
@@ -201,6 +213,137 @@ async def simulate_handshake():
     assert not is_valid
     print(f"   ✅ INV-NET-001 Zero Trust: ENFORCED (rogue node rejected)")
     
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 7: Binary Wire Codec
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 7] Testing Binary Wire Codec...")
+    
+    value = {"s": "ünïcode", "long": "x" * 300, "i": -2**63, "f": 0.1, "t": True,
+             "n": None, "raw": b"\x00\xff", "list": [1, "two", [3.0], {"k": False}]}
+    assert unpack_value(pack_value(value)) == {**value, "list": [1, "two", [3.0], {"k": False}]}
+    assert pack_value({"b": 1, "a": 2}) == pack_value({"a": 2, "b": 1})
+    
+    attest = MeshMessage.create(MessageType.ATTEST_REQUEST, "NODE-ALPHA",
+                                {"tx_hash": "ab" * 32, "amount": 125000, "parties": ["A", "B"]})
+    attest.signature = "SIG-ALPHA"
+    frame = attest.to_bytes(WIRE_BINARY)
+    legacy = attest.to_bytes(WIRE_JSON)
+    restored = MeshMessage.from_bytes(memoryview(frame))
+    assert restored.payload == attest.payload and restored.signature == "SIG-ALPHA"
+    assert restored.signed_body() == frame[:len(frame) - 2 - len("SIG-ALPHA")]
+    assert restored.compute_hash() == attest.compute_hash() == MeshMessage.from_bytes(legacy).compute_hash()
+    assert restored.compute_hash() == hashlib.sha256(frame[:len(restored.signed_body())]).hexdigest()
+    assert frame[3] == CODEC_BINARY
+    
+    # Values the tagged encoding cannot hold fall back to canonical JSON
+    huge = MeshMessage.create(MessageType.PING, "NODE-ALPHA", {"n": 2**80, "ok": [1, 2]})
+    assert huge.to_bytes(WIRE_BINARY)[3] == CODEC_JSON
+    assert MeshMessage.from_bytes(huge.to_bytes(WIRE_BINARY)).payload == {"n": 2**80, "ok": [1, 2]}
+    
+    # Field changes invalidate the cached signed body
+    before = attest.compute_hash()
+    attest.payload = {"tx_hash": "cd" * 32}
+    assert attest.compute_hash() != before
+    
+    corrupt_rejected = 0
+    for bad in (frame[:-4], frame[:10], bytes([0xCB, 9]) + frame[2:], frame[:3] + b"\x07" + frame[4:]):
+        try:
+            MeshMessage.from_bytes(bad)
+        except WireError:
+            corrupt_rejected += 1
+    assert corrupt_rejected == 4
+    
+    print(f"   Binary frame: {len(frame)} bytes (legacy JSON: {len(legacy)} bytes)")
+    print("   ✅ Canonical encoding, wire-exact hash, JSON fallback, corrupt frames rejected")
+    
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 8: Codec Negotiation over Loopback
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 8] Testing Codec Negotiation over Loopback...")
+    
+    negotiated = await negotiate_over_loopback()
+    assert negotiated["modern"] == (WIRE_BINARY, WIRE_BINARY)
+    assert negotiated["legacy"] == (WIRE_JSON, WIRE_JSON)
+    assert negotiated["hash_matches"]
+    assert negotiated["v1_refused"]
+    print(f"   Modern ↔ Modern: {negotiated['modern'][0]}, Modern ↔ Legacy: {negotiated['legacy'][0]}")
+    print("   ✅ Negotiated codec used both ways; receiver hash matches sender; v1 peer refused")
+    
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 9: Outbound Queues and Write Coalescing
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 9] Testing Outbound Queues and Write Coalescing...")
+    
+    queues = await outbound_queue_behaviour()
+    assert queues["delivered"] == 200 and queues["flushes"] < 20
+    assert queues["drop_newest"] == (8, 12)
+    assert queues["drop_oldest"] == (20, 12, True)
+    assert queues["disconnect"] == (8, PeerState.FAILED)
+    assert queues["broadcast_queued"] == 3
+    print(f"   200 frames in {queues['flushes']} writelines/drain calls")
+    print("   Queue of 8 + 20 frames: DROP_NEWEST kept first 8, DROP_OLDEST kept last 8, DISCONNECT failed peer")
+    print("   ✅ Bounded per-peer queues with coalesced writes")
+    
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 10: Per-Type Dispatch Pools
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 10] Testing Per-Type Dispatch Pools...")
+    
+    dispatch = await dispatch_over_loopback(clients=3, messages_per_client=5, handler_delay_s=0.05)
+    assert dispatch["handled"] == 15 and dispatch["ordered"]
+    assert dispatch["pong_ms"] < 50, "PONG waited behind a slow handler"
+    assert dispatch["metrics"]["ATTEST_REQUEST"]["handled"] == 15
+    
+    async def blocked(message, conn):
+        await asyncio.Event().wait()
+    
+    pool = DispatchPool(MessageType.ATTEST_REQUEST, [blocked], workers=1, queue_size=2)
+    probe = MeshMessage.create(MessageType.ATTEST_REQUEST, "NODE-BETA", {})
+    accepted = [pool.submit(probe, conn) for _ in range(5)]
+    await pool.stop()
+    assert accepted == [True, True, False, False, False] and pool.dropped == 3
+    
+    # Consensus-carrying types block the read loop instead of dropping
+    blocking = await blocking_dispatch(conn, queue_size=2, count=20)
+    assert blocking["handled"] == list(range(20)) and blocking["dropped"] == 0
+    assert blocking["blocked"] > 0 and blocking["waited"]
+    defaults = MeshConfig(node_id="NODE-ALPHA", require_client_cert=False)
+    assert defaults.dispatch_overflow_for(MessageType.ATTEST_REQUEST) == DispatchOverflow.BLOCK
+    assert defaults.dispatch_overflow_for(MessageType.PEER_LIST) == DispatchOverflow.DROP
+    print(f"   PONG in {dispatch['pong_ms']:.1f}ms behind 15 x 50ms handlers; per-peer order kept")
+    print(f"   Full BLOCK queue (size 2): 20/20 handled in order, sender waited {blocking['blocked']} times")
+    print("   ✅ Liveness on the fast path; gossip drops when full, everything else blocks")
+    
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 11: Delta Membership Gossip
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 11] Testing Delta Membership Gossip...")
+    
+    gossip = await gossip_over_loopback(known=100)
+    assert gossip["converged"] == [True, True, True]
+    assert gossip["initial_entries"] == 102      # 101 to BETA, ALPHA's own entry back
+    assert gossip["steady_entries"] == 0
+    assert gossip["join_entries"] == 1
+    assert gossip["legacy_entries"] == 102
+    print(f"   Initial sync {gossip['initial_entries']} entries, steady state digest only, one join = 1 entry")
+    print("   ✅ Digest-first gossip sends only deltas; legacy peers still get full lists")
+    
+    # ──────────────────────────────────────────────────────────────────────
+    # TEST 12: SWIM Membership Index
+    # ──────────────────────────────────────────────────────────────────────
+    print("\n[TEST 12] Testing SWIM Membership Index...")
+    
+    swim = await swim_membership()
+    assert swim["suspects"] == ["NODE-GAMMA"] and swim["alive_count"] == 2
+    assert swim["sampled"] == ["NODE-DELTA"]
+    assert sorted(swim["cycle"][:2]) == ["NODE-BETA", "NODE-DELTA"]
+    assert sorted(swim["cycle"][2:]) == sorted(swim["cycle"][:2])
+    assert swim["probes_ahead"] == ["NODE-GAMMA"]
+    assert swim["coalesced"] == ("alive", 4)
+    assert swim["pending_bounded"]
+    print(f"   Suspect index {swim['suspects']}, probe cycle {swim['cycle'][:2]}")
+    print("   ✅ Status index, one probe per member per cycle (flapping included), coalesced updates")
+    
     # ──────────────────────────────────────────────────────────────────────
     # SUMMARY
     # ──────────────────────────────────────────────────────────────────────
@@ -215,6 +358,12 @@ RESULTS:
    ✅ TEST 4: Gossip Protocol - PASSED
    ✅ TEST 5: Topology Awareness - PASSED
    ✅ TEST 6: Federation Validation - PASSED
+   ✅ TEST 7: Binary Wire Codec - PASSED
+   ✅ TEST 8: Codec Negotiation - PASSED
+   ✅ TEST 9: Outbound Queues - PASSED
+   ✅ TEST 10: Dispatch Pools - PASSED
+   ✅ TEST 11: Delta Gossip - PASSED
+   ✅ TEST 12: SWIM Membership - PASSED
 
 INVARIANTS:
    ✅ INV-NET-001 (Zero Trust Transport): ENFORCED
@@ -233,6 +382,516 @@ ATTESTATION: MASTER-BER-P300-MESH
     return True
 
 
+async def negotiate_over_loopback() -> dict:
+    """Connect real nodes on 127.0.0.1 and report the negotiated wire formats."""
+    def loopback_node(node_id: str, wire_formats: list) -> MeshNode:
+        return MeshNode(MeshConfig(
+            node_id=node_id, listen_host="127.0.0.1", listen_port=0,
+            wire_formats=wire_formats, heartbeat_interval_ms=60000, gossip_interval_ms=60000
+        ))
+    
+    hub = loopback_node("NODE-HUB", [WIRE_BINARY, WIRE_JSON])
+    modern = loopback_node("NODE-MODERN", [WIRE_BINARY, WIRE_JSON])
+    legacy = loopback_node("NODE-LEGACY", [WIRE_JSON])
+    
+    received = asyncio.Queue()
+    
+    async def on_attest(message, conn):
+        await received.put((message, conn.wire_format))
+    
+    hub.on_message(MessageType.ATTEST_REQUEST, on_attest)
+    for node in (hub, modern, legacy):
+        await node.start()
+    port = hub._server.sockets[0].getsockname()[1]
+    
+    result = {"hash_matches": True}
+    try:
+        for name, node in (("modern", modern), ("legacy", legacy)):
+            assert await node.connect_to_peer("127.0.0.1", port)
+            await asyncio.sleep(0.05)
+            sent = MeshMessage.create(MessageType.ATTEST_REQUEST, node.node_id, {"tx_hash": "ef" * 32, "n": 7})
+            await node.send_to_peer("NODE-HUB", sent)
+            message, hub_side = await asyncio.wait_for(received.get(), timeout=2)
+            result[name] = (node.peers["NODE-HUB"].wire_format, hub_side)
+            result["hash_matches"] &= message.compute_hash() == sent.compute_hash()
+        
+        # A wire version 1 node sends no "wire_version" and gets no HELLO_ACK
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        hello = MeshMessage.create(MessageType.HELLO, "NODE-V1", {
+            "federation_id": hub.config.federation_id, "version": "2.0.0", "codecs": [WIRE_JSON]
+        })
+        writer.write(PeerConnection.frame(hello.to_bytes(WIRE_JSON)))
+        result["v1_refused"] = await asyncio.wait_for(reader.read(), timeout=2) == b""
+        writer.close()
+    finally:
+        for node in (modern, legacy, hub):
+            await node.stop()
+    return result
+
+
+async def blocking_dispatch(conn: PeerConnection, queue_size: int, count: int) -> dict:
+    """Overfill a BLOCK dispatch pool while its worker is held back."""
+    release = asyncio.Event()
+    handled = []
+    
+    async def consensus_handler(message, conn):
+        await release.wait()
+        handled.append(message.payload["n"])
+    
+    pool = DispatchPool(MessageType.ATTEST_REQUEST, [consensus_handler], workers=1,
+                        queue_size=queue_size, overflow=DispatchOverflow.BLOCK)
+    
+    async def sender():
+        for n in range(count):
+            await pool.dispatch(MeshMessage.create(MessageType.ATTEST_REQUEST, "NODE-BETA", {"n": n}), conn)
+    
+    task = asyncio.create_task(sender())
+    await asyncio.sleep(0.05)
+    waited = not task.done()
+    release.set()
+    await task
+    await pool.join()
+    await pool.stop()
+    return {"handled": handled, "dropped": pool.dropped, "blocked": pool.blocked, "waited": waited}
+
+
+async def dispatch_over_loopback(
+    clients: int,
+    messages_per_client: int,
+    handler_delay_s: float,
+    workers: int = 4,
+    message_types: tuple = (MessageType.ATTEST_REQUEST,)
+) -> dict:
+    """
+    Flood a hub with slow-handler messages from several loopback clients,
+    then ping it from each client.
+    
+    Returns PONG latency, handling time and whether per-(peer, type) order held.
+    """
+    def loopback_node(node_id: str, dispatch_workers: int = 4) -> MeshNode:
+        return MeshNode(MeshConfig(
+            node_id=node_id, listen_host="127.0.0.1", listen_port=0, dispatch_workers=dispatch_workers,
+            heartbeat_interval_ms=60000, gossip_interval_ms=60000
+        ))
+    
+    hub = loopback_node("NODE-HUB", workers)
+    senders = [loopback_node(f"NODE-C{n}") for n in range(clients)]
+    expected = clients * messages_per_client * len(message_types)
+    seen = {}
+    done = asyncio.Event()
+    
+    async def slow_handler(message, conn):
+        await asyncio.sleep(handler_delay_s)
+        seen.setdefault((conn.peer_id, message.message_type), []).append(message.payload["n"])
+        if sum(len(v) for v in seen.values()) == expected:
+            done.set()
+    
+    for message_type in message_types:
+        hub.on_message(message_type, slow_handler)
+    await hub.start()
+    port = hub._server.sockets[0].getsockname()[1]
+    
+    try:
+        for node in senders:
+            await node.start()
+            assert await node.connect_to_peer("127.0.0.1", port)
+        await asyncio.sleep(0.05)
+        
+        start = time.perf_counter()
+        for n in range(messages_per_client):
+            for node in senders:
+                for message_type in message_types:
+                    await node.send_to_peer("NODE-HUB", MeshMessage.create(message_type, node.node_id, {"n": n}))
+        for node in senders:
+            await node.peers["NODE-HUB"].ping()
+        
+        pong_ms = 0.0
+        while any(node.peers["NODE-HUB"].last_pong == 0 for node in senders):
+            await asyncio.sleep(0.001)
+        pong_ms = (time.perf_counter() - start) * 1000
+        await asyncio.wait_for(done.wait(), timeout=60)
+        elapsed = time.perf_counter() - start
+        
+        return {
+            "pong_ms": pong_ms,
+            "elapsed_s": elapsed,
+            "handled": sum(len(v) for v in seen.values()),
+            "ordered": all(v == sorted(v) for v in seen.values()),
+            "metrics": hub.get_metrics()["dispatch"]
+        }
+    finally:
+        for node in senders + [hub]:
+            await node.stop()
+
+
+def benchmark_dispatch(clients: int = 8, messages_per_client: int = 50, handler_delay_s: float = 0.002):
+    """
+    Benchmark inbound dispatch: inline handlers vs per-type worker pools.
+    
+    Each client interleaves ATTEST_REQUEST and ROUTE_ANNOUNCE messages whose
+    handlers take 2ms, then pings the hub.
+    """
+    types = (MessageType.ATTEST_REQUEST, MessageType.ROUTE_ANNOUNCE)
+    total = clients * messages_per_client * len(types)
+    print(f"\nDISPATCH BENCHMARK - {clients} peers x {messages_per_client * len(types)} messages, "
+          f"{handler_delay_s * 1000:.0f}ms handlers")
+    for label, workers in (("inline (read loop)", 0), ("pools, 4 workers", 4), ("pools, 8 workers", 8)):
+        r = asyncio.run(dispatch_over_loopback(clients, messages_per_client, handler_delay_s, workers, types))
+        print(f"  {label:<20} {total / r['elapsed_s']:>8,.0f} msgs/s   PONG after {r['pong_ms']:>7.1f}ms   "
+              f"order kept: {r['ordered']}")
+
+
+def _fake_peer(n: int) -> PeerInfo:
+    return PeerInfo(peer_id=f"NODE-{n:04d}", host=f"10.0.{n // 256}.{n % 256}", port=9443,
+                    federation_id="CHAINBRIDGE-FEDERATION", region="US-WEST", version="3.0.0")
+
+
+async def gossip_over_loopback(known: int) -> dict:
+    """
+    Gossip between two loopback nodes where one already knows `known` peers.
+    
+    Returns PEER_LIST entries sent for the initial sync, a steady-state
+    round, a round after one join and a round to a legacy peer.
+    """
+    def loopback_node(node_id: str) -> MeshNode:
+        return MeshNode(MeshConfig(
+            node_id=node_id, listen_host="127.0.0.1", listen_port=0,
+            heartbeat_interval_ms=60000, gossip_interval_ms=60000
+        ))
+    
+    alpha, beta = loopback_node("NODE-ALPHA"), loopback_node("NODE-BETA")
+    for n in range(known):
+        alpha._remember_peer(_fake_peer(n))
+    await alpha.start()
+    await beta.start()
+    
+    async def gossip_round() -> tuple:
+        before = alpha.metrics["gossip_entries_sent"] + beta.metrics["gossip_entries_sent"]
+        await alpha._gossip_round()
+        for _ in range(200):
+            await asyncio.sleep(0.005)
+            if alpha.membership_digest == beta.membership_digest:
+                break
+        await asyncio.sleep(0.02)   # let any trailing PEER_SYNC/PEER_LIST land
+        sent = alpha.metrics["gossip_entries_sent"] + beta.metrics["gossip_entries_sent"] - before
+        return alpha.membership_digest == beta.membership_digest, sent
+    
+    try:
+        assert await beta.connect_to_peer("127.0.0.1", alpha._server.sockets[0].getsockname()[1])
+        await asyncio.sleep(0.05)
+        
+        initial = await gossip_round()
+        steady = await gossip_round()
+        alpha._remember_peer(_fake_peer(known))
+        joined = await gossip_round()
+        
+        alpha.peers["NODE-BETA"].peer_info.capabilities = ["ATTEST", "RELAY", "GOSSIP"]
+        _, legacy_entries = await gossip_round()
+        
+        return {
+            "converged": [initial[0], steady[0], joined[0]],
+            "initial_entries": initial[1],
+            "steady_entries": steady[1],
+            "join_entries": joined[1],
+            "legacy_entries": legacy_entries
+        }
+    finally:
+        await beta.stop()
+        await alpha.stop()
+
+
+async def swim_membership() -> dict:
+    """Exercise the registry's status index, probe order and update coalescing."""
+    registry = PeerRegistry()
+    for n, peer_id in enumerate(("NODE-BETA", "NODE-GAMMA", "NODE-DELTA")):
+        await registry.add_member(Member(peer_id=peer_id, host=f"192.168.1.{100 + n}", port=9443))
+    
+    result = {}
+    await registry.update_status("NODE-GAMMA", MemberStatus.SUSPECT)
+    result["suspects"] = [m.peer_id for m in await registry.get_suspect_members()]
+    result["alive_count"] = registry.count(MemberStatus.ALIVE)
+    result["sampled"] = [m.peer_id for m in await registry.get_random_members(5, exclude={"NODE-BETA"})]
+    result["cycle"] = [(await registry.next_probe_target()).peer_id for _ in range(4)]
+    
+    # Alive -> suspect -> alive before its turn comes up: still one slot
+    await registry.update_status("NODE-GAMMA", MemberStatus.ALIVE)
+    await registry.update_status("NODE-GAMMA", MemberStatus.SUSPECT)
+    await registry.update_status("NODE-GAMMA", MemberStatus.ALIVE)
+    result["probes_ahead"] = registry._probe_order[registry._probe_cursor:]
+    
+    gossip = GossipProtocol("NODE-ALPHA", registry)
+    gossip._queue_update({"type": "suspect", "peer_id": "NODE-GAMMA", "incarnation": 3})
+    gossip._queue_update({"type": "alive", "peer_id": "NODE-GAMMA", "incarnation": 3})   # Loses to suspect
+    gossip._queue_update({"type": "alive", "peer_id": "NODE-GAMMA", "incarnation": 4})   # Refutes it
+    update = gossip._pending_updates["NODE-GAMMA"]
+    result["coalesced"] = (update["type"], update["incarnation"])
+    gossip.config.max_pending_updates = 2
+    gossip._queue_update({"type": "dead", "peer_id": "NODE-X", "incarnation": 9})
+    result["pending_bounded"] = len(gossip._pending_updates) == 2 and "NODE-X" in gossip._pending_updates
+    return result
+
+
+def benchmark_gossip(sizes=(50, 100, 200, 400, 800)):
+    """
+    Benchmark gossip bytes per round (3 recipients) as the federation grows:
+    full PEER_LIST vs digest in steady state vs digest + one-join delta.
+    """
+    print("\nGOSSIP BENCHMARK - bytes per round to 3 peers (binary wire)")
+    print(f"  {'peers':>6} {'full list':>12} {'digest':>10} {'1 join':>10}")
+    for size in sizes:
+        node = MeshNode(MeshConfig(node_id="NODE-ALPHA", listen_host="127.0.0.1", listen_port=0))
+        for n in range(size):
+            node._remember_peer(_fake_peer(n))
+        full = MeshMessage.create(MessageType.PEER_LIST, node.node_id, {"peers": node._peer_entries(0)})
+        digest = node._digest_message()
+        sync = MeshMessage.create(MessageType.PEER_SYNC, "NODE-BETA", {"epoch": "e" * 16, "since": size - 1,
+                                                                  "requester_epoch": "f" * 16})
+        delta = MeshMessage.create(MessageType.PEER_LIST, node.node_id, {
+            "peers": node._peer_entries(size - 1), "epoch": "e" * 16, "version": size
+        })
+        def size_of(message):
+            return len(message.to_bytes(WIRE_BINARY)) + 4
+        
+        join = size_of(digest) + size_of(sync) + size_of(delta)
+        print(f"  {size:>6} {3 * size_of(full):>12,} {3 * size_of(digest):>10,} {3 * join:>10,}")
+
+
+class FrameSink:
+    """Loopback TCP server that counts length-prefixed frames (optionally slowly)."""
+    
+    def __init__(self, read_delay_s: float = 0.0, rcvbuf: int = 0):
+        self.read_delay_s = read_delay_s
+        self.rcvbuf = rcvbuf
+        self.frames = 0
+        self.server = None
+    
+    async def start(self) -> int:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if self.rcvbuf:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.rcvbuf)
+        sock.bind(("127.0.0.1", 0))
+        self.server = await asyncio.start_server(self._handle, sock=sock)
+        return sock.getsockname()[1]
+    
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                length = int.from_bytes(await reader.readexactly(4), "big")
+                await reader.readexactly(length)
+                self.frames += 1
+                if self.read_delay_s:
+                    await asyncio.sleep(self.read_delay_s)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+    
+    async def stop(self):
+        self.server.close()
+    
+    async def connect(self, port: int, peer_id: str, sndbuf: int = 0, **queue_options) -> PeerConnection:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        if sndbuf:
+            writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+        conn = PeerConnection(
+            PeerInfo(peer_id=peer_id, host="127.0.0.1", port=port,
+                     federation_id="CHAINBRIDGE-FEDERATION", region="US-WEST", version="3.0.0"),
+            reader, writer, **queue_options
+        )
+        conn.state = PeerState.HEALTHY
+        conn.wire_format = WIRE_BINARY
+        return conn
+
+
+async def outbound_queue_behaviour() -> dict:
+    """Exercise coalescing and each overflow policy against loopback sinks."""
+    sink = FrameSink()
+    port = await sink.start()
+    
+    def ping(n):
+        return MeshMessage.create(MessageType.PING, "NODE-ALPHA", {"timestamp": float(n)})
+    
+    result = {}
+    
+    conn = await sink.connect(port, "FAST")
+    for n in range(200):
+        conn.enqueue(ping(n))
+    await conn.flush(timeout=2)
+    for _ in range(100):
+        if sink.frames >= 200:
+            break
+        await asyncio.sleep(0.01)
+    result["delivered"], result["flushes"] = sink.frames, conn.flushes
+    await conn.close()
+    
+    # Overflow policies: 20 frames into a queue of 8 without yielding to the writer
+    for policy in (OverflowPolicy.DROP_NEWEST, OverflowPolicy.DROP_OLDEST, OverflowPolicy.DISCONNECT):
+        conn = await sink.connect(port, policy.value, send_queue_size=8, overflow_policy=policy)
+        messages = [ping(n) for n in range(20)]
+        accepted = sum(conn.enqueue(m) for m in messages)
+        if policy == OverflowPolicy.DROP_NEWEST:
+            result["drop_newest"] = (accepted, conn.frames_dropped)
+        elif policy == OverflowPolicy.DROP_OLDEST:
+            kept_last = list(conn._outbound) == [PeerConnection.frame(m.to_bytes(WIRE_BINARY)) for m in messages[-8:]]
+            result["drop_oldest"] = (accepted, conn.frames_dropped, kept_last)
+        else:
+            result["disconnect"] = (accepted, conn.state)
+        await conn.close()
+    
+    # Broadcast queues to every connected peer and returns immediately
+    node = MeshNode(MeshConfig(node_id="NODE-ALPHA", listen_host="127.0.0.1", listen_port=0))
+    for n in range(3):
+        node.peers[f"PEER-{n}"] = await sink.connect(port, f"PEER-{n}")
+    result["broadcast_queued"] = await node.broadcast(ping(0))
+    for conn in node.peers.values():
+        await conn.close()
+    
+    await sink.stop()
+    return result
+
+
+async def _broadcast_rate(
+    peer_count: int,
+    duration_s: float,
+    queued: bool,
+    policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
+) -> dict:
+    """Broadcast PINGs to peer_count loopback peers, one of them slow."""
+    fast, slow = FrameSink(), FrameSink(read_delay_s=0.05, rcvbuf=4096)
+    fast_port, slow_port = await fast.start(), await slow.start()
+    
+    node = MeshNode(MeshConfig(node_id="NODE-ALPHA", listen_host="127.0.0.1", listen_port=0,
+                               send_queue_size=256, send_overflow_policy=policy))
+    for n in range(peer_count):
+        slow_peer = n == 0
+        node.peers[f"PEER-{n:02d}"] = await (slow if slow_peer else fast).connect(
+            slow_port if slow_peer else fast_port, f"PEER-{n:02d}",
+            sndbuf=4096 if slow_peer else 0,
+            send_queue_size=node.config.send_queue_size, overflow_policy=policy
+        )
+    
+    message = MeshMessage.create(MessageType.ATTEST_REQUEST, "NODE-ALPHA", {"tx_hash": "ab" * 32, "n": 1})
+    frame = PeerConnection.frame(message.to_bytes(WIRE_BINARY))
+    broadcasts = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < duration_s:
+        if queued:
+            await node.broadcast(message)
+            await asyncio.sleep(0)
+        else:
+            # Pre-queue behaviour: write + drain each peer in turn
+            for conn in node.peers.values():
+                conn.writer.write(frame)
+                await conn.writer.drain()
+        broadcasts += 1
+    elapsed = time.perf_counter() - start
+    
+    slow_conn = node.peers["PEER-00"]
+    result = {
+        "broadcasts_per_s": broadcasts / elapsed,
+        "fast_frames_per_s": fast.frames / elapsed,
+        "slow_state": slow_conn.state.value,
+        "slow_dropped": slow_conn.frames_dropped
+    }
+    for conn in node.peers.values():
+        await conn.close(flush_timeout=0)
+    await fast.stop()
+    await slow.stop()
+    return result
+
+
+def benchmark_broadcast(peer_count: int = 50, duration_s: float = 2.0):
+    """
+    Benchmark broadcast throughput from one node to 50 loopback peers,
+    one of which reads 4KB-buffered frames only every 50ms.
+    
+    Usage:
+        python scripts/test_p300_mesh.py --benchmark
+    """
+    print(f"\nBROADCAST BENCHMARK - {peer_count} peers, 1 slow, {duration_s:.0f}s each")
+    runs = [
+        ("sequential send+drain", False, OverflowPolicy.DROP_OLDEST),
+        ("queued, DROP_OLDEST", True, OverflowPolicy.DROP_OLDEST),
+        ("queued, DISCONNECT", True, OverflowPolicy.DISCONNECT),
+    ]
+    for label, queued, policy in runs:
+        r = asyncio.run(_broadcast_rate(peer_count, duration_s, queued, policy))
+        print(f"  {label:<22} {r['broadcasts_per_s']:>9,.0f} broadcasts/s  "
+              f"{r['fast_frames_per_s']:>10,.0f} frames/s to fast peers  "
+              f"(slow peer: {r['slow_state']}, {r['slow_dropped']} dropped)")
+
+
+def _legacy_hash(message: MeshMessage) -> str:
+    """Pre-binary compute_hash (payload re-serialized with sort_keys)."""
+    content = (f"{message.message_id}:{message.message_type.value}:{message.sender_id}:"
+               f"{message.timestamp}:{json.dumps(message.payload, sort_keys=True)}")
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def benchmark_wire_codec(rounds: int = 2000):
+    """
+    Benchmark encode+hash and decode per MessageType: legacy JSON
+    envelope vs the binary envelope.
+    
+    Usage:
+        python scripts/test_p300_mesh.py --benchmark
+    """
+    peer = {"peer_id": "NODE-0000", "host": "10.0.0.1", "port": 9443,
+            "federation_id": "CHAINBRIDGE-FEDERATION", "region": "US-WEST", "version": "3.0.0"}
+    payloads = {
+        MessageType.HELLO: {"host": "0.0.0.0", "port": 9443, "federation_id": "CHAINBRIDGE-FEDERATION",
+                            "region": "US-WEST", "version": "3.0.0",
+                            "capabilities": ["ATTEST", "RELAY", "GOSSIP"], "codecs": ["binary", "json"]},
+        MessageType.HELLO_ACK: {"accepted": True, "node_id": "NODE-BETA", "federation_id": "CHAINBRIDGE-FEDERATION",
+                                "version": "3.0.0", "codec": "binary"},
+        MessageType.WHO_IS_THERE: {},
+        MessageType.I_AM_HERE: {"node_id": "NODE-BETA", "federation_id": "CHAINBRIDGE-FEDERATION",
+                                "region": "US-EAST", "version": "3.0.0"},
+        MessageType.PEER_LIST: {"peers": [{**peer, "peer_id": f"NODE-{n:04d}"} for n in range(50)]},
+        MessageType.PING: {"timestamp": time.time()},
+        MessageType.PONG: {"timestamp": time.time()},
+        MessageType.ATTEST_REQUEST: {"tx_hash": "ab" * 32, "amount": 125000, "currency": "USD",
+                                     "parties": ["ACME-CORP", "GLOBEX-INC"], "nonce": 42},
+        MessageType.ATTEST_RESPONSE: {"tx_hash": "ab" * 32, "attested": True, "signature": "cd" * 64,
+                                      "node_id": "NODE-BETA"},
+        MessageType.TOPOLOGY_UPDATE: {"peers": [{"peer_id": f"NODE-{n:04d}", "state": "healthy",
+                                                 "latency_ms": 1.25} for n in range(50)]},
+        MessageType.ROUTE_ANNOUNCE: {"routes": [{"dest": f"NODE-{n:04d}", "via": "NODE-BETA", "hops": 2}
+                                                for n in range(50)]},
+    }
+    
+    print(f"\nWIRE CODEC BENCHMARK - µs per message ({rounds} rounds, encode includes hash)")
+    print(f"  {'MessageType':<16} {'json enc':>9} {'bin enc':>9} {'json dec':>9} {'bin dec':>9} "
+          f"{'json B':>7} {'bin B':>7}")
+    for message_type, payload in payloads.items():
+        messages = [MeshMessage.create(message_type, "NODE-ALPHA", payload) for _ in range(rounds)]
+        
+        start = time.perf_counter()
+        legacy = [(m.to_bytes(WIRE_JSON), _legacy_hash(m)) for m in messages]
+        json_enc = (time.perf_counter() - start) / rounds * 1e6
+        
+        start = time.perf_counter()
+        binary = [(m.to_bytes(WIRE_BINARY), m.compute_hash()) for m in messages]
+        bin_enc = (time.perf_counter() - start) / rounds * 1e6
+        
+        start = time.perf_counter()
+        for data, _ in legacy:
+            MeshMessage.from_bytes(data)
+        json_dec = (time.perf_counter() - start) / rounds * 1e6
+        
+        start = time.perf_counter()
+        for data, _ in binary:
+            MeshMessage.from_bytes(memoryview(data))
+        bin_dec = (time.perf_counter() - start) / rounds * 1e6
+        
+        print(f"  {message_type.value:<16} {json_enc:>9.2f} {bin_enc:>9.2f} {json_dec:>9.2f} {bin_dec:>9.2f} "
+              f"{len(legacy[0][0]):>7} {len(binary[0][0]):>7}")
+
+
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_wire_codec()
+        benchmark_broadcast()
+        benchmark_dispatch()
+        benchmark_gossip()
+        sys.exit(0)
     success = asyncio.run(simulate_handshake())
     sys.exit(0 if success else 1)
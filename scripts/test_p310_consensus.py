@@ -12,6 +12,8 @@
 
 import sys
 import asyncio
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -19,13 +21,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from modules.mesh.consensus import (
-    ConsensusEngine, RaftState, LogEntry, ClusterSimulator
+    ConsensusEngine, RaftState, LogEntry, ClusterSimulator, LogStorage
 )
+from modules.data.replication import ReplicationEngine, StateSnapshot, CommandType
 
 
 async def test_1_cluster_creation():
     """Test 1: Create a 3-node Raft cluster"""
-    print("\n[1/6] Testing cluster creation...")
+    print("\n[1/11] Testing cluster creation...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -45,7 +48,7 @@ async def test_1_cluster_creation():
 
 async def test_2_leader_election():
     """Test 2: Leader election in 3-node cluster"""
-    print("\n[2/6] Testing leader election...")
+    print("\n[2/11] Testing leader election...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -75,7 +78,7 @@ async def test_2_leader_election():
 
 async def test_3_log_replication():
     """Test 3: Log replication across cluster"""
-    print("\n[3/6] Testing log replication...")
+    print("\n[3/11] Testing log replication...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -122,7 +125,7 @@ async def test_3_log_replication():
 
 async def test_4_leader_failure():
     """Test 4: Leader failure and re-election"""
-    print("\n[4/6] Testing leader failure and re-election...")
+    print("\n[4/11] Testing leader failure and re-election...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -167,7 +170,7 @@ async def test_4_leader_failure():
 
 async def test_5_leader_rejoins():
     """Test 5: Old leader rejoins cluster"""
-    print("\n[5/6] Testing old leader rejoin...")
+    print("\n[5/11] Testing old leader rejoin...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -233,7 +236,7 @@ async def test_5_leader_rejoins():
 
 async def test_6_safety_invariant():
     """Test 6: Safety invariant - no conflicting commits"""
-    print("\n[6/6] Testing safety invariant (INV-CON-001)...")
+    print("\n[6/11] Testing safety invariant (INV-CON-001)...")
     
     cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"])
     
@@ -280,6 +283,268 @@ async def test_6_safety_invariant():
     print(f"      ✓ SAFETY INVARIANT VERIFIED")
 
 
+async def _elect_leader(cluster: ClusterSimulator) -> str:
+    """Tick the cluster until a leader is elected."""
+    for _ in range(100):
+        await cluster.tick_all(1)
+        leader = cluster.get_leader()
+        if leader:
+            return leader
+    raise AssertionError("Should elect a leader")
+
+
+async def test_7_segmented_log_recovery():
+    """Test 7: Segmented log survives restart and torn writes"""
+    print("\n[7/11] Testing segmented log crash recovery...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cluster = ClusterSimulator(
+            ["NODE-A", "NODE-B", "NODE-C"],
+            persistence_path=tmp,
+            segment_max_bytes=1024
+        )
+        leader = await _elect_leader(cluster)
+        
+        for i in range(50):
+            success, msg = await cluster.nodes[leader].propose_command({"seq": i})
+            assert success, msg
+        
+        for node_id, node in cluster.nodes.items():
+            await node.stop()
+            restarted = ConsensusEngine(node_id=node_id, peers=node.peers, persistence_path=tmp)
+            assert restarted.current_term == node.current_term, f"{node_id} term not recovered"
+            assert [e.command for e in restarted.log] == [e.command for e in node.log], \
+                f"{node_id} log not recovered"
+        
+        store = cluster.nodes[leader]._log_store
+        assert store.segment_count > 1, "Small segments should rotate"
+        print("      ✓ Terms and logs recovered after restart")
+        print(f"      ✓ Segments rotated: {store.segment_count} segment files")
+        
+        # Simulate a crash mid-append: partial record at the tail
+        last_segment = sorted((Path(tmp) / f"{leader}_log").glob("*.seg"))[-1]
+        with open(last_segment, "ab") as f:
+            f.write(b"\x00\x00\x01\x00torn")
+        
+        restarted = ConsensusEngine(node_id=leader, peers=[], persistence_path=tmp)
+        assert len(restarted.log) == 50, "Torn tail should be dropped, committed entries kept"
+        assert restarted.log[-1].command == {"seq": 49}
+        print(f"      ✓ Torn tail record discarded, {len(restarted.log)} entries intact")
+
+
+async def test_8_batched_proposals():
+    """Test 8: Concurrent proposals coalesce into batches"""
+    print("\n[8/11] Testing batched proposals...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cluster = ClusterSimulator(
+            ["NODE-A", "NODE-B", "NODE-C"],
+            persistence_path=tmp,
+            batch_proposals=True
+        )
+        leader = await _elect_leader(cluster)
+        leader_node = cluster.nodes[leader]
+        
+        results = await asyncio.gather(*[
+            leader_node.propose_command({"seq": i}) for i in range(200)
+        ])
+        
+        assert all(success for success, _ in results), "All proposals should succeed"
+        batches = leader_node.get_status()["proposal_batches"]
+        assert batches < 200, "Proposals should share batches"
+        
+        for node_id, node in cluster.nodes.items():
+            assert [e.command["seq"] for e in node.log] == list(range(200)), f"{node_id} log mismatch"
+        assert leader_node.get_status()["commit_index"] == 200
+        
+        print(f"      ✓ 200 proposals committed in {batches} batch(es)")
+        print("      ✓ Log order preserved on all nodes")
+
+
+async def test_9_compaction_and_install_snapshot():
+    """Test 9: Log compaction and InstallSnapshot catch-up"""
+    print("\n[9/11] Testing log compaction and InstallSnapshot...")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"], persistence_path=tmp)
+        
+        # Wire each node to its own state machine
+        machines = {}
+        for node_id, node in cluster.nodes.items():
+            machine = ReplicationEngine(node_id=node_id)
+            machines[node_id] = machine
+            node.on_commit = lambda e, m=machine: m.apply_log_entry(e.index, e.term, e.command)
+            node.snapshot_provider = machine.create_snapshot
+            node.on_install_snapshot = lambda d, m=machine: m.restore_from_snapshot(StateSnapshot.from_dict(d))
+            node.snapshot_threshold = 25
+            node.SNAPSHOT_CHUNK_SIZE = 256
+        
+        leader = await _elect_leader(cluster)
+        leader_node = cluster.nodes[leader]
+        lagging = next(n for n in cluster.nodes if n != leader)
+        cluster.partition(lagging)
+        
+        for i in range(200):
+            success, msg = await leader_node.propose_command(
+                {"type": CommandType.DEPOSIT, "account": f"ACCT-{i % 40}", "amount": i + 1}
+            )
+            assert success, msg
+        
+        assert leader_node.snapshot_index >= 175, "Leader should have compacted"
+        assert len(leader_node.log) < 25, f"Log should stay bounded, has {len(leader_node.log)}"
+        print(f"      ✓ Leader compacted through index {leader_node.snapshot_index}, "
+              f"{len(leader_node.log)} entries retained")
+        
+        # Rejoin: the lagging node needs entries the leader no longer has
+        cluster.heal(lagging)
+        await leader_node._send_heartbeats()
+        await leader_node._replicators[lagging]
+        
+        lagging_node = cluster.nodes[lagging]
+        assert lagging_node.last_log_index == leader_node.last_log_index, "Lagging node should catch up"
+        assert lagging_node.snapshot_index == leader_node.snapshot_index, "Catch-up should use the snapshot"
+        assert machines[lagging].state_root == machines[leader].state_root, "State roots must match"
+        print(f"      ✓ {lagging} caught up via InstallSnapshot in one heartbeat")
+        print(f"      ✓ State roots match: {machines[leader].state_root[:24]}...")
+        
+        # Restart from disk: snapshot + retained log restore the state machine
+        await leader_node.stop()
+        machine = ReplicationEngine(node_id="RESTARTED")
+        restarted = ConsensusEngine(
+            node_id=leader, peers=leader_node.peers, persistence_path=tmp,
+            on_install_snapshot=lambda d: machine.restore_from_snapshot(StateSnapshot.from_dict(d))
+        )
+        assert restarted.snapshot_index == leader_node.snapshot_index
+        assert restarted.last_log_index == leader_node.last_log_index
+        assert machine.last_applied_index == restarted.snapshot_index
+        print(f"      ✓ Restart restored snapshot at index {restarted.snapshot_index}")
+
+
+async def test_10_conflict_term_backtracking():
+    """Test 10: Rejected AppendEntries jumps back a whole term"""
+    print("\n[10/11] Testing conflict-term backtracking...")
+    
+    leader = ConsensusEngine(node_id="NODE-A", peers=["NODE-B"])
+    follower = ConsensusEngine(node_id="NODE-B", peers=["NODE-A"])
+    
+    # Shared prefix in term 1, then divergent histories
+    leader._persistent.log = [LogEntry(index=i, term=1, command={"i": i}) for i in range(1, 6)]
+    leader._persistent.log += [LogEntry(index=i, term=3, command={"i": i}) for i in range(6, 56)]
+    follower._persistent.log = [LogEntry(index=i, term=1, command={"i": i}) for i in range(1, 6)]
+    follower._persistent.log += [LogEntry(index=i, term=2, command={"stale": i}) for i in range(6, 106)]
+    leader._persistent.current_term = 3
+    leader._transition_to(RaftState.LEADER)
+    
+    calls = []
+    
+    async def send_rpc(peer, method, params):
+        calls.append(method)
+        return follower.handle_rpc(method, params)
+    
+    leader.set_rpc_sender(send_rpc)
+    await leader._send_append_entries("NODE-B")
+    
+    assert [e.term for e in follower.log] == [e.term for e in leader.log], "Follower log should match leader"
+    assert len(calls) <= 3, f"Expected at most 3 round trips, took {len(calls)}"
+    print(f"      ✓ 100 conflicting entries resolved in {len(calls)} round trips")
+
+
+async def test_11_parallel_fanout():
+    """Test 11: Slow follower does not stall commit; RPCs are size-capped"""
+    print("\n[11/11] Testing parallel AppendEntries fan-out...")
+    
+    cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C", "NODE-D", "NODE-E"])
+    leader = await _elect_leader(cluster)
+    leader_node = cluster.nodes[leader]
+    followers = [n for n in cluster.nodes if n != leader]
+    slow, lagging = followers[0], followers[1]
+    
+    route = leader_node._send_rpc
+    batch_sizes = []
+    
+    async def send_rpc(peer, method, params):
+        if peer == slow:
+            await asyncio.sleep(0.25)
+        if peer == lagging and method == "AppendEntries":
+            batch_sizes.append(len(params["entries"]))
+        return await route(peer, method, params)
+    
+    leader_node.set_rpc_sender(send_rpc)
+    
+    start = time.perf_counter()
+    success, msg = await leader_node.propose_command({"seq": 0})
+    elapsed = time.perf_counter() - start
+    
+    assert success, msg
+    assert leader_node.get_status()["commit_index"] == leader_node.last_log_index, "Quorum should commit"
+    assert elapsed < 0.25, f"Commit waited for the slow follower ({elapsed * 1000:.0f} ms)"
+    print(f"      ✓ Committed in {elapsed * 1000:.1f} ms with a 250 ms follower")
+    
+    await leader_node._replicators[slow]
+    assert cluster.nodes[slow].last_log_index == leader_node.last_log_index
+    print("      ✓ Slow follower caught up in its own task")
+    
+    # Lagging follower receives the backlog in capped, pipelined batches
+    cluster.partition(lagging)
+    for i in range(1, 700):
+        await leader_node.propose_command({"seq": i})
+    cluster.heal(lagging)
+    batch_sizes.clear()
+    
+    await leader_node._send_heartbeats()
+    await leader_node._replicators[lagging]
+    
+    assert cluster.nodes[lagging].last_log_index == leader_node.last_log_index
+    assert max(batch_sizes) <= leader_node.MAX_ENTRIES_PER_RPC, "Batches must respect the cap"
+    print(f"      ✓ Backlog of 699 entries sent as batches of {batch_sizes}")
+
+
+async def benchmark_proposals(total: int = 1000, concurrency: int = 100):
+    """
+    Benchmark proposal throughput and commit latency per storage mode.
+    
+    Usage:
+        python scripts/test_p310_consensus.py --benchmark [TOTAL]
+    """
+    print("\n" + "=" * 70)
+    print(f"PROPOSAL BENCHMARK - {total} proposals, {concurrency} concurrent clients")
+    print("=" * 70)
+    print(f"\n   {'mode':>20}  {'proposals/s':>12}  {'p50 ms':>10}  {'p99 ms':>10}")
+    
+    modes = [
+        ("json (legacy)", {"storage": LogStorage.JSON}),
+        ("segmented", {"storage": LogStorage.SEGMENTED}),
+        ("segmented+batched", {"storage": LogStorage.SEGMENTED, "batch_proposals": True}),
+    ]
+    
+    for name, kwargs in modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            cluster = ClusterSimulator(["NODE-A", "NODE-B", "NODE-C"], persistence_path=tmp, **kwargs)
+            leader_node = cluster.nodes[await _elect_leader(cluster)]
+            
+            started: dict = {}
+            latencies = []
+            leader_node.on_commit = lambda entry: latencies.append(
+                time.perf_counter() - started[entry.command["seq"]]
+            )
+            
+            async def client(worker: int):
+                for seq in range(worker, total, concurrency):
+                    started[seq] = time.perf_counter()
+                    success, msg = await leader_node.propose_command({"seq": seq})
+                    assert success, msg
+            
+            start = time.perf_counter()
+            await asyncio.gather(*[client(w) for w in range(concurrency)])
+            elapsed = time.perf_counter() - start
+            
+            assert len(latencies) == total, f"{name}: only {len(latencies)}/{total} committed"
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+            print(f"   {name:>20}  {total / elapsed:>12,.1f}  {p50:>10.2f}  {p99:>10.2f}")
+
+
 async def main():
     """Run all P310 tests."""
     print("=" * 70)
@@ -294,6 +559,11 @@ async def main():
         ("Leader Failure", test_4_leader_failure),
         ("Leader Rejoin", test_5_leader_rejoins),
         ("Safety Invariant", test_6_safety_invariant),
+        ("Segmented Log Recovery", test_7_segmented_log_recovery),
+        ("Batched Proposals", test_8_batched_proposals),
+        ("Compaction + InstallSnapshot", test_9_compaction_and_install_snapshot),
+        ("Conflict-Term Backtracking", test_10_conflict_term_backtracking),
+        ("Parallel Fan-out", test_11_parallel_fanout),
     ]
     
     passed = 0
@@ -335,5 +605,10 @@ async def main():
 
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        args = sys.argv[sys.argv.index("--benchmark") + 1:]
+        asyncio.run(benchmark_proposals(int(args[0]) if args else 1000))
+        sys.exit(0)
+    
     success = asyncio.run(main())
     sys.exit(0 if success else 1)
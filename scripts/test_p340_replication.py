@@ -11,9 +11,11 @@ INV-DATA-001: State roots must match at every index across all nodes.
 """
 
 import sys
+import time
 sys.path.insert(0, "/Users/johnbozza/Documents/Projects/ChainBridge-local-repo")
 
 from modules.data import MerkleTree, MerkleProof, ReplicationEngine, StateSnapshot
+from modules.data.merkle import StateRootStrategy
 from modules.data.replication import CommandType
 
 
@@ -181,15 +183,105 @@ def test_merkle_proof_verification():
     return True
 
 
+def test_rollback_restores_state_tree():
+    """Test a failed apply leaves the sparse state tree matching the balances."""
+    print("\n" + "=" * 70)
+    print("ROLLBACK STATE TREE TEST")
+    print("=" * 70)
+    
+    def failing_callback(state_root):
+        raise RuntimeError("callback failed")
+    
+    engine = ReplicationEngine(
+        "NODE-ROLLBACK",
+        initial_balances={"ALICE": 1000, "BOB": 500},
+        root_strategy=StateRootStrategy.SPARSE,
+        on_state_change=failing_callback,
+    )
+    before = engine.state_root
+    
+    commands = [
+        {"type": CommandType.TRANSFER, "from": "ALICE", "to": "BOB", "amount": 100},
+        {"type": CommandType.CREATE_ACCOUNT, "account": "CAROL", "initial_balance": 50},
+    ]
+    for command in commands:
+        success, msg, root = engine.apply_log_entry(engine.last_applied_index + 1, 1, command)
+        print(f"   {command['type']}: success={success} ({msg})")
+        if success or root != before:
+            print("   Failed apply was not rolled back ✗")
+            return False
+    
+    consistent = (
+        engine._state_tree.root_hash == engine._calculate_state_root() == before
+        and engine.get_all_balances() == {"ALICE": 1000, "BOB": 500}
+    )
+    print(f"   State tree matches balances after rollback: {consistent} {'✓' if consistent else '✗'}")
+    
+    print("\n" + "=" * 70)
+    print("ROLLBACK STATE TREE TEST " + ("PASSED ✅" if consistent else "FAILED ❌"))
+    print("=" * 70)
+    return consistent
+
+
+def benchmark_state_root_strategies(account_counts=(1_000, 10_000, 100_000), duration_s: float = 2.0):
+    """
+    Benchmark apply_log_entry throughput for each state root strategy.
+    
+    Usage:
+        python scripts/test_p340_replication.py --benchmark [ACCOUNTS ...]
+    """
+    print("\n" + "=" * 70)
+    print("STATE ROOT BENCHMARK - apply_log_entry throughput")
+    print("=" * 70)
+    print(f"\n   {'accounts':>10}  {'strategy':>8}  {'applies':>8}  {'applies/s':>12}  {'ms/apply':>10}")
+    
+    results = {}
+    for count in account_counts:
+        balances = {f"ACCT-{i:07d}": 1_000_000 for i in range(count)}
+        
+        for strategy in (StateRootStrategy.SORTED, StateRootStrategy.SPARSE):
+            engine = ReplicationEngine(f"BENCH-{strategy}", initial_balances=balances, root_strategy=strategy)
+            
+            applied = 0
+            start = time.perf_counter()
+            while time.perf_counter() - start < duration_s:
+                cmd = {
+                    "type": CommandType.TRANSFER,
+                    "from": f"ACCT-{(applied * 7919) % count:07d}",
+                    "to": f"ACCT-{(applied * 104729 + 1) % count:07d}",
+                    "amount": 1
+                }
+                success, msg, _ = engine.apply_log_entry(applied + 1, 1, cmd)
+                assert success, msg
+                applied += 1
+            elapsed = time.perf_counter() - start
+            
+            rate = applied / elapsed
+            results[(count, strategy)] = rate
+            print(f"   {count:>10,}  {strategy:>8}  {applied:>8}  {rate:>12,.1f}  {1000 / rate:>10.3f}")
+    
+    for count in account_counts:
+        speedup = results[(count, StateRootStrategy.SPARSE)] / results[(count, StateRootStrategy.SORTED)]
+        print(f"\n   {count:>10,} accounts: sparse is {speedup:,.1f}x sorted")
+    
+    return results
+
+
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        counts = [int(arg) for arg in sys.argv[sys.argv.index("--benchmark") + 1:]]
+        benchmark_state_root_strategies(tuple(counts) if counts else (1_000, 10_000, 100_000))
+        exit(0)
+    
     test1 = test_multi_node_replication()
     test2 = test_merkle_proof_verification()
+    test3 = test_rollback_restores_state_tree()
     
     print("\n" + "=" * 70)
     print("P340 INTEGRATION TESTS COMPLETE")
     print("=" * 70)
     
-    if test1 and test2:
+    if test1 and test2 and test3:
         print("STATUS: ALL TESTS PASSED ✅")
         exit(0)
     else:
@@ -8,6 +8,10 @@ Tests:
 2. Data persistence (write → close → reopen → verify)
 3. Shard isolation (INV-DATA-003)
 4. Crash recovery simulation (INV-DATA-004)
+5. Encryption at rest
+6. LRU / idle eviction of open shards
+7. Pooled readers do not wait on the writer lock
+8. Bulk ledger writes and streaming reads
 
 PAC Reference: PAC-OCC-P920-SHARDING
 """
@@ -19,6 +23,7 @@ import time
 import signal
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -63,7 +68,7 @@ def test_shard_creation(manager: ShardManager, tenant_ids: list) -> dict:
                 "success": True,
             })
             print(f"  {GREEN}✓{RESET} {tenant_id}: entry_id={entry_id}")
-            
+        
         except Exception as e:
             results["passed"] = False
             results["details"].append({
@@ -116,7 +121,7 @@ def test_persistence(manager: ShardManager, tenant_ids: list) -> dict:
             else:
                 print(f"  {RED}✗{RESET} {tenant_id}: Data mismatch!")
                 results["passed"] = False
-                
+        
         except Exception as e:
             results["passed"] = False
             results["details"].append({
@@ -238,7 +243,7 @@ def test_crash_recovery(manager: ShardManager, base_dir: Path) -> dict:
         
         # Cleanup
         new_manager.close_all()
-        
+    
     except Exception as e:
         results["passed"] = False
         results["details"] = {"error": str(e)}
@@ -303,6 +308,228 @@ def test_encryption(manager: ShardManager) -> dict:
     return results
 
 
+def test_shard_eviction(base_dir: Path) -> dict:
+    """Test the LRU-bounded open-shard cache and idle eviction."""
+    print(f"\n{YELLOW}[TEST 6]{RESET} Open-Shard Cache (LRU + Idle Eviction)")
+    
+    results = {"passed": True, "details": {}}
+    manager = ShardManager(
+        base_dir=str(base_dir / "lru"),
+        use_encryption=CRYPTO_AVAILABLE,
+        max_open_shards=3,
+    )
+    tenants = [f"lru-{i}" for i in range(6)]
+    
+    for tenant_id in tenants:
+        manager.get_shard(tenant_id).write_ledger("LRU", {"tenant": tenant_id})
+    
+    stats = manager.get_total_stats()
+    open_ids = [entry["tenant_id"] for entry in manager.list_shards()]
+    bounded = stats["open_shards"] == 3 and stats["evictions"] == 3 and open_ids == tenants[3:]
+    results["details"]["lru"] = {"open": open_ids, "evictions": stats["evictions"]}
+    print(f"  {GREEN if bounded else RED}{'✓' if bounded else '✗'}{RESET} "
+          f"open={stats['open_shards']}/{stats['max_open_shards']}, evictions={stats['evictions']}")
+    
+    # An evicted shard was checkpointed on close and reopens with its data
+    shard = manager.get_shard(tenants[0], create=False)
+    entries = shard.read_ledger(entry_type="LRU")
+    reopened = len(entries) == 1 and entries[0]["payload"] == {"tenant": tenants[0]}
+    print(f"  {GREEN if reopened else RED}{'✓' if reopened else '✗'}{RESET} "
+          f"Evicted shard reopened with data intact")
+    
+    # A busy shard is never evicted
+    busy = manager.get_shard(tenants[4])
+    with busy.read_cursor():
+        for tenant_id in tenants[1:4]:
+            manager.get_shard(tenant_id)
+        busy_kept = busy.state == ShardState.OPEN
+    print(f"  {GREEN if busy_kept else RED}{'✓' if busy_kept else '✗'}{RESET} Busy shard not evicted")
+    
+    # A shard from use_shard() is pinned from lookup, before any cursor opens
+    with manager.use_shard(tenants[5]) as pinned:
+        for tenant_id in tenants[:4]:
+            manager.get_shard(tenant_id)
+        pinned_kept = pinned.state == ShardState.OPEN
+        pinned.write_ledger("LRU", {"tenant": tenants[5], "pinned": True})
+    print(f"  {GREEN if pinned_kept else RED}{'✓' if pinned_kept else '✗'}{RESET} "
+          f"Pinned shard not evicted between lookup and use")
+    
+    # A stale unpinned handle fails cleanly once evicted
+    stale = manager.get_shard(tenants[0])
+    for tenant_id in tenants[1:4]:
+        manager.get_shard(tenant_id)
+    try:
+        stale.read_ledger()
+        stale_ok = False
+    except RuntimeError:
+        stale_ok = stale.state == ShardState.CLOSED
+    print(f"  {GREEN if stale_ok else RED}{'✓' if stale_ok else '✗'}{RESET} "
+          f"Evicted handle raises 'Shard not open'")
+    
+    # Idle eviction closes everything unused
+    closed = manager.evict_idle(idle_timeout_s=0)
+    idle_ok = closed == manager.get_total_stats()["idle_evictions"] and not manager.list_shards()
+    print(f"  {GREEN if idle_ok else RED}{'✓' if idle_ok else '✗'}{RESET} Idle eviction closed {closed} shards")
+    
+    manager.close_all()
+    results["passed"] = bounded and reopened and busy_kept and pinned_kept and stale_ok and idle_ok
+    return results
+
+
+def test_concurrent_reads(base_dir: Path) -> dict:
+    """Test that pooled read cursors proceed while a write transaction is open."""
+    print(f"\n{YELLOW}[TEST 7]{RESET} Concurrent Readers (WAL Read Pool)")
+    
+    manager = ShardManager(base_dir=str(base_dir / "readers"), use_encryption=CRYPTO_AVAILABLE)
+    shard = manager.get_shard("reader-tenant")
+    shard.write_ledger("COMMITTED", {"n": 1})
+    
+    read_results = []
+    
+    def reader():
+        read_results.append(len(shard.read_ledger(entry_type="COMMITTED")))
+    
+    # Hold the writer lock with an uncommitted insert while readers run
+    with shard.transaction() as cursor:
+        cursor.execute(
+            "INSERT INTO ledger (timestamp, entry_type, payload) VALUES (?, ?, ?)",
+            (datetime.now(timezone.utc).isoformat(), "COMMITTED", b"{}"),
+        )
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=2.0)
+        unblocked = len(read_results) == 4
+    
+    isolated = read_results == [1, 1, 1, 1]
+    stats = shard.get_stats()
+    print(f"  {GREEN if unblocked else RED}{'✓' if unblocked else '✗'}{RESET} "
+          f"{len(read_results)}/4 readers finished while the writer held its lock")
+    print(f"  {GREEN if isolated else RED}{'✓' if isolated else '✗'}{RESET} "
+          f"Readers saw committed state only (read_connections={stats['read_connections']})")
+    
+    manager.close_all()
+    return {"passed": unblocked and isolated, "details": {"reads": read_results}}
+
+
+def test_bulk_ledger(base_dir: Path) -> dict:
+    """Test write_ledger_many ID ranges and iter_ledger keyset pagination."""
+    print(f"\n{YELLOW}[TEST 8]{RESET} Bulk Ledger Writes and Streaming Reads")
+    
+    manager = ShardManager(base_dir=str(base_dir / "bulk"), use_encryption=CRYPTO_AVAILABLE)
+    shard = manager.get_shard("bulk-tenant")
+    first = shard.write_ledger("SINGLE", {"n": -1})
+    
+    total = 2500
+    entries = (
+        ("EVEN" if i % 2 == 0 else "ODD", {"n": i}, b"sig" if i == 7 else None)
+        for i in range(total)
+    )
+    ranges = shard.write_ledger_many(entries, chunk_size=1000)
+    
+    expected = [(first + 1, first + 1000), (first + 1001, first + 2000), (first + 2001, first + total)]
+    ranges_ok = ranges == expected
+    print(f"  {GREEN if ranges_ok else RED}{'✓' if ranges_ok else '✗'}{RESET} "
+          f"{len(ranges)} chunks committed, id ranges {ranges}")
+    
+    streamed = list(shard.iter_ledger(page_size=300))
+    order_ok = (
+        [e["id"] for e in streamed] == list(range(first, first + total + 1))
+        and [e["payload"]["n"] for e in streamed[1:]] == list(range(total))
+        and streamed[8]["signature"] == b"sig"
+    )
+    print(f"  {GREEN if order_ok else RED}{'✓' if order_ok else '✗'}{RESET} "
+          f"iter_ledger streamed {len(streamed)} entries in id order (page_size=300)")
+    
+    odd = list(shard.iter_ledger(entry_type="ODD", after_id=first + 2000, page_size=64))
+    newest = next(shard.iter_ledger(reverse=True))
+    filter_ok = (
+        len(odd) == 250 and all(e["entry_type"] == "ODD" for e in odd)
+        and newest["id"] == first + total
+    )
+    print(f"  {GREEN if filter_ok else RED}{'✓' if filter_ok else '✗'}{RESET} "
+          f"Filtered/resumed/reversed iteration ({len(odd)} ODD after id {first + 2000})")
+    
+    manager.close_all()
+    return {"passed": ranges_ok and order_ok and filter_ok, "details": {"ranges": ranges}}
+
+
+def benchmark_bulk_writes(total: int = 5000):
+    """Benchmark write_ledger (one commit per entry) vs write_ledger_many."""
+    print(f"\n{BOLD}BULK WRITE BENCHMARK - ledger entries/sec ({total} entries){RESET}")
+    
+    payload = {"amount_cents": 125000, "currency": "USD", "memo": "settlement" * 8}
+    base_dir = Path(tempfile.mkdtemp(prefix="sharding_bench_"))
+    manager = ShardManager(base_dir=str(base_dir), use_encryption=CRYPTO_AVAILABLE)
+    shard = manager.get_shard("bulk-bench")
+    
+    start = time.perf_counter()
+    for _ in range(total):
+        shard.write_ledger("SETTLEMENT", payload)
+    single = total / (time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    shard.write_ledger_many(("SETTLEMENT", payload) for _ in range(total))
+    bulk = total / (time.perf_counter() - start)
+    
+    start = time.perf_counter()
+    streamed = sum(1 for _ in shard.iter_ledger(entry_type="SETTLEMENT"))
+    reads = streamed / (time.perf_counter() - start)
+    
+    print(f"  write_ledger:      {single:>10,.0f} entries/s")
+    print(f"  write_ledger_many: {bulk:>10,.0f} entries/s")
+    print(f"  iter_ledger:       {reads:>10,.0f} entries/s")
+    manager.close_all()
+
+
+def benchmark_reads_under_writes(duration_s: float = 2.0):
+    """
+    Benchmark read throughput (4 threads) against a continuous writer,
+    with and without the read pool.
+    
+    Usage:
+        python scripts/test_sharding.py --benchmark
+    """
+    print(f"\n{BOLD}READ POOL BENCHMARK - reads/sec under write load{RESET}")
+    
+    for pool_size in (0, 4):
+        base_dir = Path(tempfile.mkdtemp(prefix="sharding_bench_"))
+        manager = ShardManager(base_dir=str(base_dir), use_encryption=CRYPTO_AVAILABLE,
+                               read_pool_size=pool_size)
+        shard = manager.get_shard("bench-tenant")
+        for i in range(100):
+            shard.write_ledger("BENCH", {"i": i})
+        
+        stop = threading.Event()
+        reads = [0] * 4
+        writes = [0]
+        
+        def reader(slot):
+            while not stop.is_set():
+                shard.read_ledger(entry_type="BENCH", limit=10)
+                reads[slot] += 1
+        
+        def writer():
+            while not stop.is_set():
+                shard.write_ledger("BENCH", {"i": writes[0]})
+                writes[0] += 1
+        
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(4)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(duration_s)
+        stop.set()
+        for t in threads:
+            t.join()
+        
+        stats = shard.get_stats()
+        print(f"  read_pool_size={pool_size}: {sum(reads) / duration_s:>10,.0f} reads/s, "
+              f"{writes[0] / duration_s:>8,.0f} writes/s, lock_wait={stats['lock_wait_ms']:.0f}ms")
+        manager.close_all()
+
+
 def main():
     print(f"\n{BOLD}{'='*70}{RESET}")
     print(f"{BOLD}{CYAN}  PAC-OCC-P920-SHARDING VERIFICATION TEST{RESET}")
@@ -332,6 +559,9 @@ def main():
     test_results["isolation"] = test_isolation(manager, tenant_ids)
     test_results["crash_recovery"] = test_crash_recovery(manager, base_dir)
     test_results["encryption"] = test_encryption(manager)
+    test_results["eviction"] = test_shard_eviction(base_dir)
+    test_results["concurrent_reads"] = test_concurrent_reads(base_dir)
+    test_results["bulk_ledger"] = test_bulk_ledger(base_dir)
     
     # Cleanup
     manager.close_all()
@@ -354,6 +584,9 @@ def main():
             "isolation": test_results["isolation"]["passed"],
             "crash_recovery": test_results["crash_recovery"]["passed"],
             "encryption": test_results["encryption"].get("passed", True),
+            "eviction": test_results["eviction"]["passed"],
+            "concurrent_reads": test_results["concurrent_reads"]["passed"],
+            "bulk_ledger": test_results["bulk_ledger"]["passed"],
         },
         "invariants": {
             "INV-DATA-003": test_results["isolation"]["passed"],
@@ -393,5 +626,9 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark_reads_under_writes()
+        benchmark_bulk_writes()
+        sys.exit(0)
     results = main()
     sys.exit(0 if results.get("verdict") == "PASSED" else 1)
@@ -30,7 +30,7 @@ from modules.data.schemas import (
 )
 from modules.data.sxt_bridge import (
     SxTBridge, SxTConfig, AsyncAnchor, AnchorRequest, AnchorState,
-    MockSxTClient, create_sxt_bridge,
+    MockSxTClient, LiveSxTClient, create_sxt_bridge,
 )
 
 
@@ -304,12 +304,12 @@ def test_async_anchor():
         on_anchor_complete=on_complete,
     )
     
-    # Test 4.1: Start workers
+    # Test 4.1: Start the anchor loop (one thread, worker_count batches in flight)
     anchor.start()
     results.append((
-        "Workers started",
-        len(anchor._workers) == 2,
-        f"worker_count={len(anchor._workers)}"
+        "Anchor loop started",
+        len(anchor._workers) == 1 and anchor._workers[0].is_alive(),
+        f"threads={len(anchor._workers)}, max_inflight={config.worker_count}"
     ))
     
     # Test 4.2: Enqueue latency < 50ms
@@ -370,6 +370,13 @@ def test_async_anchor():
         f"queued={metrics['queued']}, anchored={metrics['anchored']}, failed={metrics['failed']}"
     ))
     
+    # Test 4.6: Requests were micro-batched
+    results.append((
+        "Requests micro-batched",
+        metrics["batched_requests"] == 10 and metrics["batches"] < 10,
+        f"batches={metrics['batches']}, max_batch={metrics['max_batch_size']}"
+    ))
+    
     # Cleanup
     anchor.stop()
     
@@ -480,6 +487,23 @@ def test_sxt_bridge():
         "verify_integrity() method available"
     ))
     
+    # Test 5.5: Pre-encoded canonical bytes must encode tx_data
+    tx_data = {"tx_id": "bridge_tx_canon", "tx_type": "SETTLEMENT", "amount_cents": 500}
+    forged = SxTBridge.canonical_bytes({**tx_data, "amount_cents": 5})
+    try:
+        bridge.anchor_transaction("tenant_canon", tx_data, canonical=forged)
+        rejected = False
+    except ValueError:
+        rejected = True
+    req_id = bridge.anchor_transaction(
+        "tenant_canon", tx_data, canonical=SxTBridge.canonical_bytes(tx_data)
+    )
+    results.append((
+        "Canonical bytes checked",
+        rejected and bridge.get_anchor_status(req_id) is not None,
+        f"mismatch_rejected={rejected}"
+    ))
+    
     # Cleanup
     bridge.stop()
     
@@ -495,6 +519,337 @@ def test_sxt_bridge():
     return all(r[1] for r in results)
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEST 6: BATCH RETRIES AND BACKPRESSURE
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class FlakyBatchClient(MockSxTClient):
+    """Mock client that rejects each listed tx_id a fixed number of times."""
+    
+    def __init__(self, config: SxTConfig, failures: dict):
+        super().__init__(config)
+        self.failures = dict(failures)
+        self.batch_calls = 0
+    
+    async def batch_insert(self, schemas):
+        self.batch_calls += 1
+        results = await super().batch_insert(schemas)
+        flaky = []
+        for tx_id, success, proof_id in results:
+            if self.failures.get(tx_id, 0) > 0:
+                self.failures[tx_id] -= 1
+                self.records.pop(tx_id, None)
+                flaky.append((tx_id, False, None))
+            else:
+                flaky.append((tx_id, success, proof_id))
+        return flaky
+
+
+class StubSession:
+    """Stands in for aiohttp.ClientSession; every POST returns one canned response."""
+    
+    def __init__(self, status: int, body: dict):
+        self.status = status
+        self.body = body
+    
+    def post(self, url, **kwargs):
+        return self
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    async def json(self):
+        return self.body
+    
+    async def text(self):
+        return str(self.body)
+
+
+def live_batch_insert(body: dict, rows: int = 3):
+    """Run LiveSxTClient.batch_insert against a stubbed 200 response."""
+    client = LiveSxTClient(SxTConfig(api_key="test"))
+    client._session = StubSession(200, body)
+    now_ms = int(time.time() * 1000)
+    schemas = [
+        TransactionSchema(
+            tx_id=f"live_tx_{i}",
+            tenant_hash="tenant",
+            tx_type="TRANSFER",
+            amount_cents=100,
+            currency="USD",
+            sender_hash="s",
+            receiver_hash="r",
+            created_at=now_ms,
+            finalized_at=now_ms,
+            anchor_time=now_ms,
+            tx_hash=f"hash_{i}",
+            state_root_after=f"state_{i}",
+            node_id="node",
+            node_signature="sig",
+        )
+        for i in range(rows)
+    ]
+    return asyncio.run(client.batch_insert(schemas))
+
+
+def test_batch_retry_backpressure():
+    """Test per-request retries inside batches and queue backpressure."""
+    print_header("BATCH RETRIES AND BACKPRESSURE")
+    
+    results = []
+    done = []
+    all_done = threading.Event()
+    total = 50
+    
+    def on_complete(request):
+        done.append(request)
+        if len(done) >= total:
+            all_done.set()
+    
+    config = SxTConfig(
+        api_key="test",
+        batch_size=20,
+        flush_interval_ms=20,
+        max_retry_attempts=3,
+        retry_backoff_ms=10,
+    )
+    # tx 3 recovers on its second attempt, tx 7 never does
+    client = FlakyBatchClient(config, {"retry_tx_3": 1, "retry_tx_7": 99})
+    anchor = AsyncAnchor(config=config, client=client, on_anchor_complete=on_complete)
+    anchor.start()
+    
+    ids = {}
+    for i in range(total):
+        ids[i] = anchor.enqueue("tenant_retry", {"tx_id": f"retry_tx_{i}", "amount_cents": i})
+    
+    all_done.wait(timeout=5.0)
+    
+    # Test 6.1: Every request reached a terminal state exactly once
+    results.append((
+        "Terminal callbacks only",
+        len(done) == total and len({r.request_id for r in done}) == total,
+        f"callbacks={len(done)}/{total}"
+    ))
+    
+    # Test 6.2: Few batch calls for many requests
+    results.append((
+        "One batch_insert per batch",
+        client.batch_calls < total // 2,
+        f"batch_calls={client.batch_calls} for {total} requests"
+    ))
+    
+    # Test 6.3: A transient failure is retried on its own and succeeds
+    recovered = anchor.get_status(ids[3])
+    results.append((
+        "Transient failure retried",
+        recovered.state == AnchorState.ANCHORED and recovered.attempts == 2,
+        f"state={recovered.state.value}, attempts={recovered.attempts}"
+    ))
+    
+    # Test 6.4: A permanent failure stops at max_retry_attempts
+    failed = anchor.get_status(ids[7])
+    results.append((
+        "Permanent failure bounded",
+        failed.state == AnchorState.FAILED and failed.attempts == config.max_retry_attempts,
+        f"state={failed.state.value}, attempts={failed.attempts}, error={failed.last_error}"
+    ))
+    
+    metrics = anchor.metrics
+    results.append((
+        "Retry metrics",
+        metrics["anchored"] == total - 1 and metrics["failed"] == 1 and metrics["retried"] == 3,
+        f"anchored={metrics['anchored']}, failed={metrics['failed']}, retried={metrics['retried']}"
+    ))
+    anchor.stop()
+    
+    # Test 6.5: A full queue rejects instead of blocking the caller
+    small = AsyncAnchor(config=SxTConfig(api_key="test", queue_max_size=5))
+    start = time.perf_counter()
+    for i in range(8):
+        small.enqueue("tenant_bp", {"tx_id": f"bp_tx_{i}"})
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    pressure = small.get_backpressure()
+    results.append((
+        "Backpressure reported",
+        pressure["rejected"] == 3 and pressure["queue_depth"] == 5
+        and pressure["queue_high_watermark"] == 5 and elapsed_ms < 50,
+        f"rejected={pressure['rejected']}, depth={pressure['queue_depth']}, {elapsed_ms:.2f}ms"
+    ))
+    
+    # Test 6.6: A 200 without a proof id for every row is not an insert
+    rejected = []
+    for body in ({}, {"proofIds": ["p0", "p1"]}, {"proofIds": ["p0", None, "p2"]}):
+        try:
+            live_batch_insert(body)
+        except ValueError:
+            rejected.append(body)
+    accepted = live_batch_insert({"proofIds": ["p0", "p1", "p2"]})
+    results.append((
+        "Missing proof ids rejected",
+        len(rejected) == 3 and [proof_id for _, _, proof_id in accepted] == ["p0", "p1", "p2"],
+        f"rejected={len(rejected)}/3 malformed responses"
+    ))
+    
+    for name, passed, detail in results:
+        print_result(name, passed, detail)
+    
+    return all(r[1] for r in results)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# TEST 7: DURABLE JOURNAL AND CRASH RECOVERY
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def test_journal_recovery():
+    """Test that queued anchors survive a restart and finished ones expire."""
+    print_header("DURABLE JOURNAL AND CRASH RECOVERY")
+    
+    import tempfile
+    
+    results = []
+    total = 20
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = os.path.join(tmp, "anchors.db")
+        config = SxTConfig(
+            api_key="test",
+            journal_path=journal_path,
+            batch_size=50,
+            flush_interval_ms=10,
+            completed_max_entries=5,
+        )
+        
+        # Test 7.1: Enqueue with the journal still meets the <50ms budget
+        crashed = AsyncAnchor(config=config)
+        latencies = []
+        ids = []
+        for i in range(total):
+            start = time.perf_counter()
+            ids.append(crashed.enqueue("tenant_journal", {"tx_id": f"journal_tx_{i}", "amount_cents": i}))
+            latencies.append((time.perf_counter() - start) * 1000)
+        results.append((
+            "Journaled enqueue < 50ms",
+            max(latencies) < 50,
+            f"avg={sum(latencies) / total:.3f}ms, max={max(latencies):.3f}ms"
+        ))
+        
+        # Simulate a crash before the loop ran: no stop(), no checkpoint
+        crashed.journal._conn.close()
+        del crashed
+        
+        # Test 7.2: A fresh process replays every unfinished request
+        done = []
+        all_done = threading.Event()
+        
+        def on_complete(request):
+            done.append(request)
+            if len(done) >= total:
+                all_done.set()
+        
+        recovered = AsyncAnchor(config=config, on_anchor_complete=on_complete)
+        recovered.start()
+        all_done.wait(timeout=5.0)
+        results.append((
+            "Unfinished requests replayed",
+            recovered.metrics["replayed"] == total
+            and sorted(r.request_id for r in done) == sorted(ids)
+            and all(r.state == AnchorState.ANCHORED for r in done),
+            f"replayed={recovered.metrics['replayed']}, anchored={len(done)}/{total}"
+        ))
+        
+        # Test 7.3: Finished requests are capped in memory and in the journal
+        recovered._last_expire = 0.0
+        recovered._maybe_expire()
+        stats = recovered.journal.get_stats()
+        results.append((
+            "Finished requests expire",
+            len(recovered._completed) == 5 and recovered.metrics["expired"] == total - 5
+            and stats["rows"].get(AnchorState.ANCHORED.value) == 5,
+            f"in_memory={len(recovered._completed)}, journal_rows={stats['rows']}"
+        ))
+        
+        # Test 7.4: Recent finished requests still resolve; nothing replays twice
+        latest = recovered.get_status(done[-1].request_id)
+        recovered.stop()
+        
+        again = AsyncAnchor(config=config)
+        again.start()
+        replayed_again = again.metrics["replayed"]
+        again.stop()
+        results.append((
+            "Acknowledged requests not replayed",
+            latest is not None and latest.state == AnchorState.ANCHORED and replayed_again == 0,
+            f"replayed_on_restart={replayed_again}"
+        ))
+    
+    for name, passed, detail in results:
+        print_result(name, passed, detail)
+    
+    return all(r[1] for r in results)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# BENCHMARK
+# ═══════════════════════════════════════════════════════════════════════════════
+
+class LoopbackSxTClient(MockSxTClient):
+    """
+    Local stand-in for LiveSxTClient: one simulated round trip per call
+    plus a small per-row server cost, without storing proofs.
+    """
+    
+    ROUND_TRIP_MS = 2.0
+    PER_ROW_MS = 0.02
+    
+    async def insert_transaction(self, schema):
+        await asyncio.sleep((self.ROUND_TRIP_MS + self.PER_ROW_MS) / 1000.0)
+        return (True, f"proof_{schema.tx_id}", None)
+    
+    async def batch_insert(self, schemas):
+        await asyncio.sleep((self.ROUND_TRIP_MS + self.PER_ROW_MS * len(schemas)) / 1000.0)
+        return [(schema.tx_id, True, f"proof_{schema.tx_id}") for schema in schemas]
+
+
+def benchmark_anchor_throughput(total: int = 2_000):
+    """
+    Benchmark anchored tx/sec for unbatched (batch_size=1) vs batched anchoring.
+    
+    Usage:
+        python scripts/test_sxt_bridge.py --benchmark [TOTAL]
+    """
+    print("\n" + "=" * 70)
+    print("ANCHOR BENCHMARK - anchored tx/sec")
+    print("=" * 70)
+    
+    for client_cls in (MockSxTClient, LoopbackSxTClient):
+        for batch_size in (1, 100):
+            config = SxTConfig(api_key="bench", batch_size=batch_size, flush_interval_ms=5)
+            finished = threading.Event()
+            count = [0]
+            
+            def on_complete(request, count=count, finished=finished):
+                count[0] += 1
+                if count[0] >= total:
+                    finished.set()
+            
+            anchor = AsyncAnchor(config=config, client=client_cls(config), on_anchor_complete=on_complete)
+            anchor.start()
+            
+            start = time.perf_counter()
+            for i in range(total):
+                anchor.enqueue("tenant_bench", {"tx_id": f"bench_{i}", "amount_cents": i})
+            finished.wait(timeout=120)
+            elapsed = time.perf_counter() - start
+            anchor.stop()
+            
+            print(f"  {client_cls.__name__:<18} batch_size={batch_size:<4} "
+                  f"{count[0] / elapsed:>10,.0f} tx/s  "
+                  f"(batches={anchor.metrics['batches']})")
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # INVARIANT VERIFICATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -544,6 +899,8 @@ def main():
         ("Mock SxT Client", test_mock_client),
         ("Async Anchor Worker", test_async_anchor),
         ("SxT Bridge Integration", test_sxt_bridge),
+        ("Batch Retries and Backpressure", test_batch_retry_backpressure),
+        ("Journal Crash Recovery", test_journal_recovery),
     ]
     
     results = []
@@ -592,4 +949,8 @@ def main():
 
 
 if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        args = sys.argv[sys.argv.index("--benchmark") + 1:]
+        benchmark_anchor_throughput(int(args[0]) if args else 2_000)
+        sys.exit(0)
     sys.exit(main())
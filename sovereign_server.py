@@ -26,12 +26,16 @@ THE SOVEREIGN API v2.0:
   │   │  Validation: Pydantic Schema Enforcement                    │      │
   │   │  Output: TransactionReceipt + financial_trace               │      │
   │   │          (200 OK / 402 Payment Required / 422 Error)        │      │
+  │   │                                                             │      │
+  │   │  POST /v1/transactions/batch                                │      │
+  │   │  Input: { transactions: [ ...up to 1000 requests ] }        │      │
+  │   │  Output: NDJSON stream, one receipt/error line per item     │      │
   │   └─────────────────────────────────────────────────────────────┘      │
   │         │                                                               │
   │         ▼                                                               │
   │   ┌─────────────────────────────────────────────────────────────┐      │
   │   │          CHAINBRIDGE CONTROLLER v2.0 (P80 + P210)           │      │
-  │   │    [BIOMETRIC] → [AML] → [CUSTOMS] → [INVISIBLE BANK]       │      │
+  │   │    [BIOMETRIC ∥ AML ∥ CUSTOMS] → [INVISIBLE BANK]           │      │
   │   │         Trinity Gates      +      Financial Execution       │      │
   │   └─────────────────────────────────────────────────────────────┘      │
   │                                                                         │
@@ -46,6 +50,7 @@ TRAINING SIGNAL:
   "The Voice now speaks the language of Money."
 """
 
+import asyncio
 import logging
 import json
 import sys
@@ -56,7 +61,7 @@ from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_validator
 
@@ -75,6 +80,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger("SovereignServer")
 
+# Batch endpoint limits
+MAX_BATCH_SIZE = 1000           # Transactions accepted per batch request
+BATCH_MAX_IN_FLIGHT = 64        # Batch items awaiting the controller at once
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 # PYDANTIC MODELS - TRINITY SCHEMA ENFORCEMENT
@@ -291,6 +300,28 @@ class TransactionReceipt(BaseModel):
     invariants_enforced: Optional[List[str]] = Field(None, description="List of invariants enforced")
 
 
+class SovereignBatchRequest(BaseModel):
+    """
+    Batch of Sovereign Transaction Requests.
+    Every item is validated against the Trinity contract before any is processed.
+    """
+    transactions: List[SovereignTransactionRequest] = Field(
+        ..., min_length=1, max_length=MAX_BATCH_SIZE,
+        description=f"Transactions to process (1-{MAX_BATCH_SIZE})"
+    )
+
+
+class BatchItemResult(BaseModel):
+    """
+    One NDJSON line of a batch response.
+    status_code mirrors what POST /v1/transaction would have returned.
+    """
+    index: int = Field(..., description="Position of the transaction in the batch")
+    status_code: int = Field(..., description="200, 402 or 500")
+    receipt: Optional[TransactionReceipt] = None
+    error: Optional[Dict[str, Any]] = None
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
     status: str
@@ -347,6 +378,7 @@ async def lifespan(app: FastAPI):
     logger.info("╔══════════════════════════════════════════════════════════════╗")
     logger.info("║        SOVEREIGN SERVER SHUTTING DOWN...                     ║")
     logger.info("╚══════════════════════════════════════════════════════════════╝")
+    controller.shutdown()
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -390,6 +422,123 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
+# ══════════════════════════════════════════════════════════════════════════════
+# TRANSACTION EXECUTION
+# ══════════════════════════════════════════════════════════════════════════════
+
+async def _execute_transaction(request: SovereignTransactionRequest) -> Dict[str, Any]:
+    """Run one validated request through the Trinity Controller v2.0."""
+    # Convert Pydantic models to dicts for Controller
+    user_dict = request.user_data.model_dump()
+    payment_dict = request.payment_data.model_dump()
+    shipment_dict = {
+        "manifest": request.shipment_data.manifest.model_dump(),
+        "telemetry": request.shipment_data.telemetry.model_dump()
+    }
+    
+    # Gates run concurrently, settlement off the event loop
+    return await controller.process_transaction_async(
+        user_data=user_dict,
+        payment_data=payment_dict,
+        shipment_data=shipment_dict
+    )
+
+
+def _settlement_error(result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the 402 error detail if settlement failed, else None."""
+    blame = result.get("blame", {})
+    if blame.get("gate") != "SETTLEMENT" and blame.get("component") != "SETTLEMENT":
+        return None
+    
+    logger.warning(f"❌ SETTLEMENT FAILED: {result['transaction_id']} | Reason: {blame.get('reason')}")
+    return {
+        "error": "SETTLEMENT_FAILED",
+        "reason": blame.get("reason", "Insufficient funds or settlement error"),
+        "transaction_id": result["transaction_id"],
+        "gates_passed": True,
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }
+
+
+def _build_receipt(request: SovereignTransactionRequest, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a controller result onto the TransactionReceipt shape (INV-API-003)."""
+    # Map financial_execution to financial_trace for API response
+    if "financial_execution" in result:
+        fe = result["financial_execution"]
+        result["financial_trace"] = {
+            "settlement_intent_id": fe.get("settlement_intent_id"),
+            "settlement_status": fe.get("settlement_status"),
+            "gross_amount": fe.get("gross_amount"),
+            "currency": fe.get("currency"),
+            "fees": fe.get("fees"),
+            "net_amount": fe.get("net_amount"),
+            # Hide internal account IDs, use public aliases
+            "payer_account": request.payment_data.payer_id,
+            "payee_account": request.payment_data.payee_id,
+            "ledger_committed": fe.get("settlement_status") == "captured"
+        }
+        # Remove internal financial_execution from response
+        del result["financial_execution"]
+    
+    # Log outcome
+    if result["status"] == TransactionStatus.FINALIZED.value:
+        logger.info(f"✅ TRANSACTION FINALIZED: {result['transaction_id']}")
+        if "financial_trace" in result:
+            ft = result["financial_trace"]
+            logger.info(f"   Financial: {ft.get('gross_amount')} {ft.get('currency')} (Net: {ft.get('net_amount')})")
+    else:
+        logger.warning(f"❌ TRANSACTION ABORTED: {result['transaction_id']} | Blame: {result.get('blame', {}).get('gate')}")
+    
+    return result
+
+
+async def _execute_batch_item(index: int, request: SovereignTransactionRequest) -> BatchItemResult:
+    """Process one batch item; failures become result lines, never exceptions."""
+    try:
+        result = await _execute_transaction(request)
+    except Exception as exc:
+        # INV-API-002: No stack trace exposure, other items keep going
+        logger.error(f"Batch item {index} failed: {type(exc).__name__}: {exc}")
+        return BatchItemResult(
+            index=index,
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error={
+                "error": "INTERNAL_SERVER_ERROR",
+                "detail": "An unexpected error occurred. The Ledger remains intact.",
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        )
+    
+    settlement_error = _settlement_error(result)
+    if settlement_error is not None:
+        return BatchItemResult(index=index, status_code=status.HTTP_402_PAYMENT_REQUIRED, error=settlement_error)
+    
+    return BatchItemResult(
+        index=index,
+        status_code=status.HTTP_200_OK,
+        receipt=TransactionReceipt.model_validate(_build_receipt(request, result))
+    )
+
+
+async def _stream_batch(transactions: List[SovereignTransactionRequest]):
+    """Yield one NDJSON line per transaction, in completion order."""
+    in_flight = asyncio.Semaphore(BATCH_MAX_IN_FLIGHT)
+    
+    async def run(index: int, request: SovereignTransactionRequest) -> BatchItemResult:
+        async with in_flight:
+            return await _execute_batch_item(index, request)
+    
+    tasks = [asyncio.create_task(run(index, request)) for index, request in enumerate(transactions)]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            item = await completed
+            yield item.model_dump_json(exclude_none=True) + "\n"
+    finally:
+        # Client disconnected mid-stream: drop items not yet started
+        for task in tasks:
+            task.cancel()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 # API ENDPOINTS
 # ══════════════════════════════════════════════════════════════════════════════
@@ -478,64 +627,62 @@ async def process_transaction(request: SovereignTransactionRequest):
     logger.info(f"Shipment: {request.shipment_data.manifest.shipment_id}")
     logger.info("=" * 70)
     
-    # Convert Pydantic models to dicts for Controller
-    user_dict = request.user_data.model_dump()
-    payment_dict = request.payment_data.model_dump()
-    shipment_dict = {
-        "manifest": request.shipment_data.manifest.model_dump(),
-        "telemetry": request.shipment_data.telemetry.model_dump()
-    }
-    
-    # Process through Trinity Controller v2.0
-    result = controller.process_transaction(
-        user_data=user_dict,
-        payment_data=payment_dict,
-        shipment_data=shipment_dict
-    )
+    result = await _execute_transaction(request)
     
     # Check for settlement failure (402 Payment Required)
-    blame = result.get("blame", {})
-    if blame.get("gate") == "SETTLEMENT" or blame.get("component") == "SETTLEMENT":
-        logger.warning(f"❌ SETTLEMENT FAILED: {result['transaction_id']} | Reason: {blame.get('reason')}")
+    settlement_error = _settlement_error(result)
+    if settlement_error is not None:
         raise HTTPException(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
-            detail={
-                "error": "SETTLEMENT_FAILED",
-                "reason": blame.get("reason", "Insufficient funds or settlement error"),
-                "transaction_id": result["transaction_id"],
-                "gates_passed": True,
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            }
+            detail=settlement_error
         )
     
-    # Map financial_execution to financial_trace for API response (INV-API-003)
-    if "financial_execution" in result:
-        fe = result["financial_execution"]
-        result["financial_trace"] = {
-            "settlement_intent_id": fe.get("settlement_intent_id"),
-            "settlement_status": fe.get("settlement_status"),
-            "gross_amount": fe.get("gross_amount"),
-            "currency": fe.get("currency"),
-            "fees": fe.get("fees"),
-            "net_amount": fe.get("net_amount"),
-            # Hide internal account IDs, use public aliases
-            "payer_account": request.payment_data.payer_id,
-            "payee_account": request.payment_data.payee_id,
-            "ledger_committed": fe.get("settlement_status") == "captured"
-        }
-        # Remove internal financial_execution from response
-        del result["financial_execution"]
+    return _build_receipt(request, result)
+
+
+@app.post(
+    "/v1/transactions/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "NDJSON stream of BatchItemResult lines, in completion order",
+            "content": {"application/x-ndjson": {}}
+        },
+        422: {"description": "Validation error - schema mismatch in any item", "model": ErrorResponse},
+        503: {"description": "Controller not initialized", "model": ErrorResponse}
+    },
+    tags=["Transactions"]
+)
+async def process_transaction_batch(batch: SovereignBatchRequest):
+    """
+    Process up to 1000 Sovereign Transactions in one request.
     
-    # Log outcome
-    if result["status"] == TransactionStatus.FINALIZED.value:
-        logger.info(f"✅ TRANSACTION FINALIZED: {result['transaction_id']}")
-        if "financial_trace" in result:
-            ft = result["financial_trace"]
-            logger.info(f"   Financial: {ft.get('gross_amount')} {ft.get('currency')} (Net: {ft.get('net_amount')})")
-    else:
-        logger.warning(f"❌ TRANSACTION ABORTED: {result['transaction_id']} | Blame: {result.get('blame', {}).get('gate')}")
+    Items run concurrently through the Trinity Gates (at most
+    BATCH_MAX_IN_FLIGHT at once); settlement stays serialized in the
+    controller. Each item's outcome is streamed back as one JSON line as
+    soon as it completes, so callers should match lines by **index**:
     
-    return result
+    - **status_code 200**: `receipt` holds the TransactionReceipt (FINALIZED or ABORTED)
+    - **status_code 402**: `error` holds the settlement failure detail
+    - **status_code 500**: `error` holds a generic error; other items are unaffected
+    
+    A schema violation in any item rejects the whole batch with 422
+    before anything is processed (INV-API-001).
+    """
+    global controller
+    
+    if controller is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Controller not initialized"
+        )
+    
+    logger.info(f"INCOMING SOVEREIGN BATCH REQUEST: {len(batch.transactions)} transactions")
+    
+    return StreamingResponse(
+        _stream_batch(batch.transactions),
+        media_type="application/x-ndjson"
+    )
 
 
 @app.get("/v1/stats", tags=["Statistics"])
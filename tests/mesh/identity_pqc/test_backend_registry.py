@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                  PAC-SEC-P819: BACKEND REGISTRY TESTS                        ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Cross-backend conformance, KAT and startup selection for ML-DSA-65.
+"""
+
+import hashlib
+import pickle
+
+import pytest
+
+from modules.mesh.identity_pqc.backends import registry
+from modules.mesh.identity_pqc.backends.dilithium_py import DilithiumPyBackend
+from modules.mesh.identity_pqc.backends.numpy_ntt import NumpyMLDSABackend
+from modules.mesh.identity_pqc.constants import (
+    BACKEND_DILITHIUM_PY,
+    BACKEND_NUMPY_NTT,
+    MLDSA65_KAT_MESSAGE,
+    MLDSA65_KAT_PK_SHA256,
+    MLDSA65_KAT_SEED,
+    MLDSA65_KAT_SIG_SHA256,
+    MLDSA65_SIGNATURE_SIZE,
+    PQC_BACKEND_ENV,
+)
+from modules.mesh.identity_pqc.errors import BackendNotAvailableError, BackendOperationError
+
+
+@pytest.fixture(scope="module")
+def backends():
+    """Every conformant backend on this machine."""
+    _, conformant = registry.probe_pqc_backends(verifies=0)
+    return conformant
+
+
+class BrokenBackend(DilithiumPyBackend):
+    """Backend whose signatures do not verify anywhere."""
+    
+    def sign(self, private_key, message):
+        return bytes(MLDSA65_SIGNATURE_SIZE)
+    
+    def sign_deterministic(self, private_key, message):
+        return None
+
+
+class LenientBackend(DilithiumPyBackend):
+    """Backend that accepts any signature."""
+    
+    def verify(self, public_key, message, signature):
+        return True
+
+
+@pytest.fixture
+def restore_providers():
+    """Undo register_pqc_backend calls."""
+    saved = dict(registry._providers)
+    yield
+    registry._providers = saved
+
+
+class TestKnownAnswer:
+    """Tests for the FIPS 204 known-answer vectors."""
+    
+    @pytest.mark.parametrize("backend_cls", [DilithiumPyBackend, NumpyMLDSABackend])
+    def test_deterministic_vectors(self, backend_cls):
+        """Test deterministic keygen/sign reproduce the pinned digests."""
+        backend = backend_cls()
+        public_key, private_key = backend.keygen_from_seed(MLDSA65_KAT_SEED)
+        signature = backend.sign_deterministic(private_key, MLDSA65_KAT_MESSAGE)
+        
+        assert hashlib.sha256(public_key).hexdigest() == MLDSA65_KAT_PK_SHA256
+        assert hashlib.sha256(signature).hexdigest() == MLDSA65_KAT_SIG_SHA256
+    
+    def test_reference_backend_passes(self):
+        """Test the reference backend passes its own KAT."""
+        assert registry.run_kat(DilithiumPyBackend()) == registry.KAT_PASSED
+    
+    def test_broken_signer_fails(self):
+        """Test a backend whose signatures do not interoperate is rejected."""
+        reference = registry._reference_vectors({"ref": DilithiumPyBackend()})
+        with pytest.raises(BackendOperationError):
+            registry.run_kat(BrokenBackend(), reference)
+    
+    def test_lenient_verifier_fails(self):
+        """Test a backend that accepts tampered signatures is rejected."""
+        with pytest.raises(BackendOperationError):
+            registry.run_kat(LenientBackend())
+
+
+class TestCrossBackendConformance:
+    """Every backend must accept every other backend's signatures."""
+    
+    def test_mutual_verification(self, backends):
+        """Test sign on one backend, verify on all others."""
+        for signer_name, signer in backends.items():
+            public_key, private_key = signer.keygen()
+            message = f"signed by {signer_name}".encode()
+            signature = signer.sign(private_key, message)
+            for verifier_name, verifier in backends.items():
+                assert verifier.verify(public_key, message, signature), (signer_name, verifier_name)
+                assert not verifier.verify(public_key, message + b"!", signature), (signer_name, verifier_name)
+    
+    def test_numpy_matches_reference_bit_for_bit(self):
+        """Test the vectorised backend derives identical keys and signatures."""
+        seed = bytes(range(100, 132))
+        reference, vectorised = DilithiumPyBackend(), NumpyMLDSABackend()
+        assert reference.keygen_from_seed(seed) == vectorised.keygen_from_seed(seed)
+        _, private_key = reference.keygen_from_seed(seed)
+        for message in (b"", b"a", bytes(range(256)) * 4):
+            assert reference.sign_deterministic(private_key, message) == vectorised.sign_deterministic(private_key, message)
+    
+    def test_numpy_backend_pickles(self):
+        """Test the vectorised backend can be shipped to pool workers."""
+        backend = NumpyMLDSABackend()
+        public_key, private_key = backend.keygen()
+        signature = backend.sign(private_key, b"m")
+        assert pickle.loads(pickle.dumps(backend)).verify(public_key, b"m", signature)
+
+
+class TestSelection:
+    """Tests for startup backend selection."""
+    
+    def test_auto_selects_fastest_conformant(self, monkeypatch):
+        """Test auto picks the conformant backend with the lowest verify time."""
+        monkeypatch.delenv(PQC_BACKEND_ENV, raising=False)
+        backend = registry.select_pqc_backend()
+        probes = registry.last_probe_results()
+        timed = [probe for probe in probes if probe.conformant]
+        
+        assert backend.info.name == min(timed, key=lambda probe: probe.verify_ms).name
+        assert {BACKEND_DILITHIUM_PY, BACKEND_NUMPY_NTT} <= {probe.name for probe in timed}
+    
+    def test_env_override(self, monkeypatch):
+        """Test CHAINBRIDGE_PQC_BACKEND pins the backend."""
+        monkeypatch.setenv(PQC_BACKEND_ENV, BACKEND_DILITHIUM_PY)
+        assert registry.select_pqc_backend().info.name == BACKEND_DILITHIUM_PY
+    
+    def test_unknown_override_rejected(self):
+        """Test an unknown backend name raises."""
+        with pytest.raises(BackendNotAvailableError):
+            registry.select_pqc_backend("no-such-backend")
+    
+    def test_override_must_pass_kat(self, restore_providers):
+        """Test an overridden backend is still subject to the KAT."""
+        registry.register_pqc_backend("broken", BrokenBackend)
+        with pytest.raises(BackendOperationError):
+            registry.select_pqc_backend("broken")
+    
+    def test_failing_backend_skipped_in_auto(self, restore_providers, monkeypatch):
+        """Test a registered backend that fails conformance is never selected."""
+        monkeypatch.delenv(PQC_BACKEND_ENV, raising=False)
+        registry.register_pqc_backend("lenient", LenientBackend)
+        backend = registry.select_pqc_backend()
+        
+        probes = {probe.name: probe for probe in registry.last_probe_results()}
+        assert probes["lenient"].kat == registry.KAT_FAILED
+        assert not isinstance(backend, LenientBackend)
+    
+    def test_missing_backend_reported(self, restore_providers):
+        """Test an unavailable provider is probed as unavailable."""
+        def missing():
+            raise BackendNotAvailableError("missing")
+        
+        registry.register_pqc_backend("missing", missing)
+        probes, _ = registry.probe_pqc_backends(["missing"], verifies=0)
+        assert not probes[0].available
+        with pytest.raises(BackendNotAvailableError):
+            registry.select_pqc_backend("missing")
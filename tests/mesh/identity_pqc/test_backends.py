@@ -16,6 +16,7 @@ from modules.mesh.identity_pqc.backends import (
 )
 from modules.mesh.identity_pqc.backends.dilithium_py import DilithiumPyBackend
 from modules.mesh.identity_pqc.backends.ed25519 import CryptographyED25519Backend
+from modules.mesh.identity_pqc.errors import SignatureError
 from modules.mesh.identity_pqc.constants import (
     ED25519_PUBLIC_KEY_SIZE,
     ED25519_PRIVATE_KEY_SIZE,
@@ -244,6 +245,22 @@ class TestCryptographyED25519Backend:
         backend = CryptographyED25519Backend()
         # Backend should have info available
         assert backend.info is not None
+    
+    def test_sign_with_loaded_key(self):
+        """Test a parsed private key signs identically to the raw bytes."""
+        backend = CryptographyED25519Backend()
+        public_key, private_key = backend.keygen()
+        key_obj = backend.load_private_key(private_key)
+        
+        message = b"Parsed key"
+        assert backend.sign(key_obj, message) == backend.sign(private_key, message)
+        assert backend.verify(public_key, message, backend.sign(key_obj, message)) is True
+    
+    def test_load_private_key_rejects_bad_size(self):
+        """Test malformed private keys are refused at load time."""
+        backend = CryptographyED25519Backend()
+        with pytest.raises(SignatureError):
+            backend.load_private_key(b"\x00" * 31)
 
 
 class TestBackendInteroperability:
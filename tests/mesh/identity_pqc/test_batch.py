@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+╔══════════════════════════════════════════════════════════════════════════════╗
+║                  PAC-SEC-P819: BATCH SIGNATURE TESTS                         ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+
+Tests for BatchProof, BatchSigner, BatchVerifier.
+"""
+
+import asyncio
+
+import pytest
+
+from modules.mesh.identity_pqc import HybridIdentity
+from modules.mesh.identity_pqc.batch import (
+    BatchProof,
+    BatchSigner,
+    BatchVerifier,
+    is_batch_signature,
+)
+from modules.mesh.identity_pqc.errors import SignatureError, SignatureMalformedError
+from modules.mesh.identity_pqc.signatures import HybridVerifier
+
+
+@pytest.fixture(scope="module")
+def identity() -> HybridIdentity:
+    """Signing identity shared by the module (ML-DSA keygen is slow)."""
+    return HybridIdentity.generate("BATCH-NODE")
+
+
+@pytest.fixture
+def verifier(identity) -> BatchVerifier:
+    """Batch verifier with a private root cache."""
+    return BatchVerifier(HybridVerifier(identity._ed25519_backend, identity._pqc_backend))
+
+
+def keys(identity):
+    return identity.ed25519_public_key, identity.pqc_public_key
+
+
+class TestBatchProof:
+    """Tests for batch proof shape and serialization."""
+    
+    @pytest.mark.parametrize("count", [1, 2, 3, 7, 8])
+    def test_roundtrip(self, identity, count):
+        """Test proofs survive to_bytes/from_bytes and encode/decode."""
+        proofs = BatchSigner(identity).sign_batch([bytes([n]) for n in range(count)])
+        for proof in proofs:
+            assert BatchProof.from_bytes(proof.to_bytes()) == proof
+            assert BatchProof.decode(proof.encode()) == proof
+            assert is_batch_signature(proof.encode())
+    
+    def test_detached_proof_is_compact(self, identity):
+        """Test a detached proof drops the 3,374-byte root signature."""
+        proof = BatchSigner(identity).sign_batch([b"a", b"b", b"c", b"d"])[0]
+        detached = proof.detached()
+        assert detached.is_detached
+        assert proof.size - detached.size == proof.root_signature.size
+        assert BatchProof.from_bytes(detached.to_bytes()) == detached
+    
+    def test_rejects_inconsistent_shape(self, identity):
+        """Test out-of-range indices and wrong path lengths are refused."""
+        proof = BatchSigner(identity).sign_batch([b"a", b"b", b"c"])[2]
+        with pytest.raises(SignatureError):
+            BatchProof(proof.root_hash, 3, 3, proof.siblings)
+        with pytest.raises(SignatureError):
+            BatchProof(proof.root_hash, 3, 2, proof.siblings[:1])
+    
+    def test_rejects_trailing_bytes(self, identity):
+        """Test serialized proofs must be exact."""
+        proof = BatchSigner(identity).sign_batch([b"a"])[0]
+        with pytest.raises(SignatureMalformedError):
+            BatchProof.from_bytes(proof.to_bytes() + b"\x00")
+
+
+class TestBatchSigner:
+    """Tests for batch signing."""
+    
+    def test_one_root_per_max_batch(self, identity):
+        """Test batches are split at max_batch with one signature each."""
+        signer = BatchSigner(identity, max_batch=4)
+        proofs = signer.sign_batch([bytes([n]) for n in range(10)])
+        
+        assert len(proofs) == 10
+        assert len({proof.root_hash for proof in proofs}) == 3
+        assert [proof.tree_size for proof in proofs] == [4] * 8 + [2] * 2
+        assert signer.get_metrics()["batches_signed"] == 3
+    
+    def test_async_sign_collects_concurrent_callers(self, identity, verifier):
+        """Test concurrent sign() calls within the window share one root."""
+        signer = BatchSigner(identity, max_batch=16, window_ms=50)
+        messages = [f"entry {n}".encode() for n in range(5)]
+        
+        async def run():
+            return await asyncio.gather(*(signer.sign(m) for m in messages))
+        
+        proofs = asyncio.run(run())
+        assert len({proof.root_hash for proof in proofs}) == 1
+        assert signer.get_metrics()["batches_signed"] == 1
+        for message, proof in zip(messages, proofs):
+            assert verifier.verify(*keys(identity), message, proof)
+    
+    def test_async_sign_flushes_full_batch(self, identity):
+        """Test a full batch is signed without waiting for the window."""
+        signer = BatchSigner(identity, max_batch=2, window_ms=60_000)
+        
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(signer.sign(b"a"), signer.sign(b"b")), timeout=30
+            )
+        
+        proofs = asyncio.run(run())
+        assert proofs[0].root_hash == proofs[1].root_hash
+
+
+class TestBatchVerifier:
+    """Tests for batch verification."""
+    
+    def test_root_verified_once(self, identity, verifier):
+        """Test the root signature is checked once for the whole batch."""
+        messages = [f"entry {n}".encode() for n in range(8)]
+        proofs = BatchSigner(identity).sign_batch(messages)
+        
+        assert all(verifier.verify(*keys(identity), m, p) for m, p in zip(messages, proofs))
+        assert verifier.cache_info()["root_verifications"] == 1
+        assert verifier.cache_info()["root_hits"] == 7
+    
+    def test_wrong_message_rejected(self, identity, verifier):
+        """Test a message not in the batch fails its path check."""
+        proofs = BatchSigner(identity).sign_batch([b"a", b"b"])
+        assert not verifier.verify(*keys(identity), b"c", proofs[0])
+        assert not verifier.verify(*keys(identity), b"b", proofs[0])
+    
+    def test_wrong_signer_rejected(self, identity, verifier):
+        """Test a batch does not verify under another identity's keys."""
+        other = HybridIdentity.generate("OTHER-NODE")
+        proof = BatchSigner(identity).sign_batch([b"a"])[0]
+        assert not verifier.verify(*keys(other), b"a", proof)
+    
+    def test_detached_needs_known_root(self, identity, verifier):
+        """Test a detached proof verifies only after its root was verified."""
+        messages = [b"a", b"b", b"c"]
+        proofs = BatchSigner(identity).sign_batch(messages)
+        
+        assert not verifier.verify(*keys(identity), b"b", proofs[1].detached())
+        assert verifier.verify(*keys(identity), b"a", proofs[0])
+        assert verifier.verify(*keys(identity), b"b", proofs[1].detached())
+    
+    def test_root_signature_not_a_message_signature(self, identity, verifier):
+        """Test a root signature cannot be replayed as a plain signature on the root."""
+        proof = BatchSigner(identity).sign_batch([b"a", b"b"])[0]
+        assert not identity.verify(bytes.fromhex(proof.root_hash), proof.root_signature)
+
+
+class TestIdentityBatchSigning:
+    """Tests for the HybridIdentity batch API."""
+    
+    def test_sign_dict_batch_verifies_with_verify_dict(self, identity):
+        """Test batch signatures are accepted by verify_dict."""
+        items = [{"seq": n, "op": "APPEND"} for n in range(3)]
+        signatures = identity.sign_dict_batch(items)
+        
+        peer = HybridIdentity.from_public_keys(*keys(identity))
+        assert all(peer.verify_dict(item, sig) for item, sig in zip(items, signatures))
+        assert not peer.verify_dict({"seq": 9, "op": "APPEND"}, signatures[0])
+    
+    def test_sign_messages_sets_signature(self, identity):
+        """Test MeshMessages are batch-signed over their canonical hash."""
+        from modules.mesh.networking import MeshMessage, MessageType
+        
+        messages = [
+            MeshMessage.create(MessageType.ATTEST_RESPONSE, identity.node_id, {"n": n}) for n in range(3)
+        ]
+        BatchSigner(identity).sign_messages(messages)
+        
+        verifier = BatchVerifier()
+        for message in messages:
+            proof = BatchProof.decode(message.signature)
+            assert verifier.verify_hash(*keys(identity), message.compute_hash(), proof)
@@ -12,7 +12,7 @@ import pytest
 import os
 
 from modules.mesh.identity_pqc.compat import NodeIdentity
-from modules.mesh.identity_pqc import HybridIdentity
+from modules.mesh.identity_pqc import HybridIdentity, canonical_json
 from modules.mesh.identity_pqc.constants import (
     ED25519_PUBLIC_KEY_SIZE,
     MLDSA65_PUBLIC_KEY_SIZE,
@@ -94,6 +94,16 @@ class TestNodeIdentitySignatures:
         corrupted = bytes([b ^ 0x01 for b in signature[:10]]) + signature[10:]
         
         assert node.verify(message, corrupted) is False
+    
+    def test_sign_canonical_matches_sign_dict(self):
+        """Test pre-serialized payloads verify as signed dictionaries."""
+        node = NodeIdentity.generate("TEST-NODE")
+        data = {"target": "NODE-X", "quorum": 3}
+        payload = canonical_json(data)
+        
+        assert node.verify_dict(data, node.sign_canonical(payload)) is True
+        assert node.verify_canonical(payload, node.sign_dict(data)) is True
+        assert node.verify_canonical(payload + b" ", node.sign_dict(data)) is False
 
 
 class TestNodeIdentityPersistence:
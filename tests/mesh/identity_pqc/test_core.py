@@ -17,6 +17,7 @@ from modules.mesh.identity_pqc import (
     ED25519KeyPair,
     PQCKeyPair,
     SignatureMode,
+    canonical_json,
 )
 from modules.mesh.identity_pqc.constants import (
     ED25519_PUBLIC_KEY_SIZE,
@@ -251,3 +252,38 @@ class TestHybridIdentityRepr:
         repr_str = repr(hybrid_identity)
         # Full public keys should not appear
         assert hybrid_identity.ed25519_public_key_b64 not in repr_str
+
+
+class TestCanonicalSigning:
+    """Tests for canonical-bytes signing and lazily parsed keys."""
+    
+    def test_sign_canonical_matches_sign_dict(self, hybrid_identity):
+        """Test sign_dict and sign_canonical sign the same bytes."""
+        data = {"b": 2, "a": [1, "x"]}
+        payload = canonical_json(data)
+        
+        assert payload == b'{"a": [1, "x"], "b": 2}'
+        assert hybrid_identity.verify_dict(data, hybrid_identity.sign_canonical(payload))
+        assert hybrid_identity.verify_canonical(payload, hybrid_identity.sign_dict(data))
+    
+    def test_verify_canonical_rejects_other_payload(self, hybrid_identity):
+        """Test a canonical signature does not cover other bytes."""
+        signature = hybrid_identity.sign_canonical(b'{"a": 1}')
+        assert not hybrid_identity.verify_canonical(b'{"a": 2}', signature)
+        assert not hybrid_identity.verify_canonical(b'{"a": 1}', "not base64!")
+    
+    def test_signing_key_parsed_once(self, hybrid_identity):
+        """Test the ED25519 private key is parsed on first sign and reused."""
+        assert hybrid_identity._ed25519_signing_key is None
+        hybrid_identity.sign(b"first", mode=SignatureMode.LEGACY)
+        key_obj = hybrid_identity._ed25519_signing_key
+        
+        assert key_obj is not None
+        hybrid_identity.sign(b"second", mode=SignatureMode.LEGACY)
+        assert hybrid_identity._ed25519_signing_key is key_obj
+    
+    def test_public_identity_has_no_signing_key(self):
+        """Test public-only identities never load a signing key."""
+        peer = HybridIdentity.generate("NODE")
+        public = HybridIdentity.from_public_keys(peer.ed25519_public_key, peer.pqc_public_key)
+        assert public._ed25519_private() is None
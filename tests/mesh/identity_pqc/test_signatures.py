@@ -10,6 +10,7 @@ Updated to use correct API: backends instead of identity.
 
 import pytest
 import os
+import multiprocessing
 
 from modules.mesh.identity_pqc import (
     HybridIdentity,
@@ -19,6 +20,7 @@ from modules.mesh.identity_pqc import (
 from modules.mesh.identity_pqc.signatures import (
     HybridSigner,
     HybridVerifier,
+    VerificationRequest,
 )
 from modules.mesh.identity_pqc.backends import (
     get_ed25519_backend,
@@ -333,6 +335,130 @@ class TestHybridVerifier:
         assert result is True
 
 
+class TestVerificationCache:
+    """Tests for the HybridVerifier verified-digest cache."""
+    
+    def test_repeat_verification_hits_cache(self, ed_backend, pqc_backend, ed_keys, pqc_keys, test_message):
+        """Test a re-verified signature is answered from the cache."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, pqc_backend)
+        ed_pk, ed_sk = ed_keys
+        pqc_pk, pqc_sk = pqc_keys
+        
+        signature = signer.sign(ed_sk, pqc_sk, test_message)
+        assert verifier.verify(ed_pk, pqc_pk, test_message, signature) is True
+        assert verifier.verify(ed_pk, pqc_pk, test_message, signature) is True
+        
+        assert verifier.cache_info()["hits"] == 1
+        assert verifier.cache_info()["size"] == 1
+    
+    def test_failures_not_cached(self, ed_backend, pqc_backend, ed_keys, pqc_keys, test_message):
+        """Test invalid signatures are re-checked rather than remembered."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, pqc_backend)
+        ed_pk, ed_sk = ed_keys
+        pqc_pk, pqc_sk = pqc_keys
+        
+        signature = signer.sign(ed_sk, pqc_sk, test_message)
+        for _ in range(2):
+            assert verifier.verify(ed_pk, pqc_pk, b"wrong message", signature) is False
+        
+        assert verifier.cache_info()["hits"] == 0
+        assert verifier.cache_info()["size"] == 0
+    
+    def test_cached_result_still_enforces_minimum_mode(self, ed_backend, pqc_backend, ed_keys, test_message):
+        """Test a cached LEGACY signature is still rejected by a HYBRID-minimum check."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, pqc_backend)
+        ed_pk, ed_sk = ed_keys
+        
+        signature = signer.sign(ed_sk, None, test_message, mode=SignatureMode.LEGACY)
+        assert verifier.verify(ed_pk, None, test_message, signature, enforce_minimum_mode=False) is True
+        assert verifier.verify(ed_pk, None, test_message, signature) is False
+    
+    def test_cache_is_bounded(self, ed_backend, pqc_backend, ed_keys, test_message):
+        """Test the cache evicts least recently used digests."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, pqc_backend, minimum_mode=SignatureMode.LEGACY, cache_size=2)
+        ed_pk, ed_sk = ed_keys
+        
+        for n in range(3):
+            message = test_message + bytes([n])
+            signature = signer.sign(ed_sk, None, message, mode=SignatureMode.LEGACY)
+            assert verifier.verify(ed_pk, None, message, signature) is True
+        
+        assert verifier.cache_info()["size"] == 2
+
+
+class CrashingPQCBackend:
+    """ML-DSA-65 backend whose verify() kills pool workers (in-process it delegates)."""
+    
+    def __init__(self, backend):
+        self._backend = backend
+    
+    def verify(self, public_key: bytes, message: bytes, signature: bytes) -> bool:
+        if multiprocessing.parent_process() is not None:
+            os._exit(1)
+        return self._backend.verify(public_key, message, signature)
+
+
+class TestVerifyMany:
+    """Tests for batch verification."""
+    
+    @pytest.mark.parametrize("max_workers", [0, 2])
+    def test_verify_many_matches_verify(self, ed_backend, pqc_backend, ed_keys, pqc_keys, test_message, max_workers):
+        """Test batch results match one-at-a-time verification, in order."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, pqc_backend, max_workers=max_workers)
+        ed_pk, ed_sk = ed_keys
+        pqc_pk, pqc_sk = pqc_keys
+        
+        good = signer.sign(ed_sk, pqc_sk, test_message)
+        pqc_only = signer.sign(None, pqc_sk, test_message, mode=SignatureMode.PQC_ONLY)
+        legacy = signer.sign(ed_sk, None, test_message, mode=SignatureMode.LEGACY)
+        bad_ed = HybridSignature(bytes(64), good.mldsa65_sig, SignatureMode.HYBRID)
+        bad_pqc = HybridSignature(good.ed25519_sig, bytes(3309), SignatureMode.HYBRID)
+        requests = [
+            VerificationRequest(ed_pk, pqc_pk, test_message, good),
+            VerificationRequest(ed_pk, pqc_pk, b"wrong message", good),
+            VerificationRequest(None, pqc_pk, test_message, pqc_only),
+            VerificationRequest(ed_pk, None, test_message, legacy),     # Below minimum mode
+            VerificationRequest(ed_pk, pqc_pk, test_message, bad_ed),
+            VerificationRequest(ed_pk, pqc_pk, test_message, bad_pqc),
+            VerificationRequest(ed_pk, pqc_pk, test_message, good),     # Duplicate
+        ]
+        try:
+            results = verifier.verify_many(requests)
+        finally:
+            verifier.close()
+        
+        assert results == [True, False, True, False, False, False, True]
+        assert results == [verifier.verify(*request) for request in requests]
+    
+    def test_verify_many_survives_crashed_worker(self, ed_backend, pqc_backend, ed_keys, pqc_keys, test_message):
+        """Test a crashed pool worker falls back in-process, now and on later batches."""
+        signer = HybridSigner(ed_backend, pqc_backend)
+        verifier = HybridVerifier(ed_backend, CrashingPQCBackend(pqc_backend), cache_size=0, max_workers=1)
+        ed_pk, ed_sk = ed_keys
+        pqc_pk, pqc_sk = pqc_keys
+        
+        good = signer.sign(ed_sk, pqc_sk, test_message)
+        bad_pqc = HybridSignature(good.ed25519_sig, bytes(3309), SignatureMode.HYBRID)
+        requests = [
+            VerificationRequest(ed_pk, pqc_pk, test_message, good),
+            VerificationRequest(ed_pk, pqc_pk, test_message, bad_pqc),
+        ]
+        try:
+            assert verifier.verify_many(requests) == [True, False]
+            assert verifier.verify_many(requests) == [True, False]
+            
+            # A pool left broken between batches is replaced, not reused
+            verifier._executor().submit(os._exit, 1).exception()
+            assert verifier.verify_many(requests) == [True, False]
+        finally:
+            verifier.close()
+
+
 class TestSignAndVerifyRoundtrip:
     """Integration tests for complete sign/verify workflow."""
     